@@ -20,7 +20,7 @@ _sym_db = _symbol_database.Default()
 
 
 DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(
-    b'\n\x11pdf_service.proto\x12\tgrpclient"\xf0\x02\n\x1eGenerateAppointmentCardRequest\x12\n\n\x02id\x18\x01 \x01(\x03\x12\x13\n\x0b\x63lient_name\x18\x02 \x01(\t\x12\x0c\n\x04\x64\x61te\x18\x03 \x01(\t\x12\x0e\n\x06mentor\x18\x04 \x01(\t\x12\x1b\n\x13general_information\x18\x05 \x03(\t\x12\x1a\n\x12important_contacts\x18\x06 \x03(\t\x12\x16\n\x0ehousehold_info\x18\x07 \x03(\t\x12\x1f\n\x17organization_agreements\x18\x08 \x03(\t\x12 \n\x18youth_officer_agreements\x18\t \x03(\t\x12\x1c\n\x14treatment_agreements\x18\n \x03(\t\x12\x15\n\rsmoking_rules\x18\x0b \x03(\t\x12\x0c\n\x04work\x18\x0c \x03(\t\x12\x19\n\x11school_internship\x18\r \x03(\t\x12\x0e\n\x06travel\x18\x0e \x03(\t\x12\r\n\x05leave\x18\x0f \x03(\t"7\n\x1fGenerateAppointmentCardResponse\x12\x14\n\x0cpdf_file_key\x18\x01 \x01(\t"\xa7\x04\n\x17GenerateContractRequest\x12\x13\n\x0b\x63ontract_id\x18\x01 \x01(\x03\x12\x0e\n\x06status\x18\x02 \x01(\t\x12\x12\n\nstart_date\x18\x03 \x01(\t\x12\x10\n\x08\x65nd_date\x18\x04 \x01(\t\x12\x17\n\x0freminder_period\x18\x05 \x01(\x05\x12\x13\n\x0bsender_name\x18\x06 \x01(\t\x12\x16\n\x0esender_address\x18\x07 \x01(\t\x12\x1b\n\x13sender_contact_info\x18\x08 \x01(\t\x12\x19\n\x11\x63lient_first_name\x18\t \x01(\t\x12\x18\n\x10\x63lient_last_name\x18\n \x01(\t\x12\x16\n\x0e\x63lient_address\x18\x0b \x01(\t\x12\x1b\n\x13\x63lient_contact_info\x18\x0c \x01(\t\x12\x11\n\tcare_type\x18\r \x01(\t\x12\x11\n\tcare_name\x18\x0e \x01(\t\x12\x15\n\rfinancing_act\x18\x0f \x01(\t\x12\x18\n\x10\x66inancing_option\x18\x10 \x01(\t\x12\r\n\x05hours\x18\x11 \x01(\x01\x12\x12\n\nhours_type\x18\x12 \x01(\t\x12\x19\n\x11\x61mbulante_display\x18\x13 \x01(\t\x12\r\n\x05price\x18\x14 \x01(\x01\x12\x17\n\x0fprice_time_unit\x18\x15 \x01(\t\x12\x0b\n\x03vat\x18\x16 \x01(\x01\x12\x11\n\ttype_name\x18\x17 \x01(\t\x12\x17\n\x0fgeneration_date\x18\x18 \x01(\t"0\n\x18GenerateContractResponse\x12\x14\n\x0cpdf_file_key\x18\x01 \x01(\t"\x90\t\n\x1dGenerateIncidentReportRequest\x12\n\n\x02id\x18\x01 \x01(\x03\x12\x13\n\x0b\x65mployee_id\x18\x02 \x01(\x03\x12\x1b\n\x13\x65mployee_first_name\x18\x03 \x01(\t\x12\x1a\n\x12\x65mployee_last_name\x18\x04 \x01(\t\x12\x13\n\x0blocation_id\x18\x05 \x01(\x03\x12\x1c\n\x14reporter_involvement\x18\x06 \x01(\t\x12\x12\n\ninform_who\x18\x07 \x03(\t\x12\x15\n\rincident_date\x18\x08 \x01(\t\x12\x18\n\x10runtime_incident\x18\t \x01(\t\x12\x15\n\rincident_type\x18\n \x01(\t\x12\x14\n\x0cpassing_away\x18\x0b \x01(\x08\x12\x11\n\tself_harm\x18\x0c \x01(\x08\x12\x10\n\x08violence\x18\r \x01(\x08\x12\x19\n\x11\x66ire_water_damage\x18\x0e \x01(\x08\x12\x10\n\x08\x61\x63\x63ident\x18\x0f \x01(\x08\x12\x16\n\x0e\x63lient_absence\x18\x10 \x01(\x08\x12\x11\n\tmedicines\x18\x11 \x01(\x08\x12\x14\n\x0corganization\x18\x12 \x01(\x08\x12!\n\x19use_prohibited_substances\x18\x13 \x01(\x08\x12\x1b\n\x13other_notifications\x18\x14 \x01(\x08\x12\x1c\n\x14severity_of_incident\x18\x15 \x01(\t\x12\x1c\n\x14incident_explanation\x18\x16 \x01(\t\x12\x17\n\x0frecurrence_risk\x18\x17 \x01(\t\x12\x1e\n\x16incident_prevent_steps\x18\x18 \x01(\t\x12\x1f\n\x17incident_taken_measures\x18\x19 \x01(\t\x12\x11\n\ttechnical\x18\x1a \x03(\t\x12\x16\n\x0eorganizational\x18\x1b \x03(\t\x12\x13\n\x0bmese_worker\x18\x1c \x03(\t\x12\x16\n\x0e\x63lient_options\x18\x1d \x03(\t\x12\x13\n\x0bother_cause\x18\x1e \x01(\t\x12\x19\n\x11\x63\x61use_explanation\x18\x1f \x01(\t\x12\x17\n\x0fphysical_injury\x18  \x01(\t\x12\x1c\n\x14physical_injury_desc\x18! \x01(\t\x12\x1c\n\x14psychological_damage\x18" \x01(\t\x12!\n\x19psychological_damage_desc\x18# \x01(\t\x12\x1b\n\x13needed_consultation\x18$ \x01(\t\x12\x12\n\nsuccession\x18% \x03(\t\x12\x17\n\x0fsuccession_desc\x18& \x01(\t\x12\r\n\x05other\x18\' \x01(\x08\x12\x12\n\nother_desc\x18( \x01(\t\x12\x1f\n\x17\x61\x64\x64itional_appointments\x18) \x01(\t\x12\x1c\n\x14\x65mployee_absenteeism\x18* \x01(\t\x12\x11\n\tclient_id\x18+ \x01(\x03\x12\x18\n\x10\x63lient_firstname\x18, \x01(\t\x12\x17\n\x0f\x63lient_lastname\x18- \x01(\t\x12\x15\n\rlocation_name\x18. \x01(\t"6\n\x1eGenerateIncidentReportResponse\x12\x14\n\x0cpdf_file_key\x18\x01 \x01(\t"x\n\rInvoicePeriod\x12\x12\n\nstart_date\x18\x01 \x01(\t\x12\x10\n\x08\x65nd_date\x18\x02 \x01(\t\x12 \n\x18\x61\x63\x63ommodation_time_frame\x18\x03 \x01(\t\x12\x1f\n\x17\x61mbulante_total_minutes\x18\x04 \x01(\x01"\x9b\x01\n\rInvoiceDetail\x12\x11\n\tcare_type\x18\x01 \x01(\t\x12)\n\x07periods\x18\x02 \x03(\x0b\x32\x18.grpclient.InvoicePeriod\x12\r\n\x05price\x18\x03 \x01(\x01\x12\x17\n\x0fprice_time_unit\x18\x04 \x01(\t\x12\x15\n\rpre_vat_total\x18\x05 \x01(\x01\x12\r\n\x05total\x18\x06 \x01(\x01"\xa1\x03\n\x19GenerateInvoicePdfRequest\x12\n\n\x02id\x18\x01 \x01(\x03\x12\x13\n\x0bsender_name\x18\x02 \x01(\t\x12\x1d\n\x15sender_contact_person\x18\x03 \x01(\t\x12\x1c\n\x14sender_address_line1\x18\x04 \x01(\t\x12\x1f\n\x17sender_postal_code_city\x18\x05 \x01(\t\x12\x16\n\x0einvoice_number\x18\x06 \x01(\t\x12\x14\n\x0cinvoice_date\x18\x07 \x01(\t\x12\x10\n\x08\x64ue_date\x18\x08 \x01(\t\x12\x31\n\x0finvoice_details\x18\t \x03(\x0b\x32\x18.grpclient.InvoiceDetail\x12\x14\n\x0ctotal_amount\x18\n \x01(\x01\x12I\n\x0b\x65xtra_items\x18\x0b \x03(\x0b\x32\x34.grpclient.GenerateInvoicePdfRequest.ExtraItemsEntry\x1a\x31\n\x0f\x45xtraItemsEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01"@\n\x1aGenerateInvoicePdfResponse\x12\x14\n\x0cpdf_file_key\x18\x01 \x01(\t\x12\x0c\n\x04size\x18\x02 \x01(\x03\x32\xb6\x03\n\nPdfService\x12s\n\x1aGenerateAppointmentCardPdf\x12).grpclient.GenerateAppointmentCardRequest\x1a*.grpclient.GenerateAppointmentCardResponse\x12^\n\x13GenerateContractPdf\x12".grpclient.GenerateContractRequest\x1a#.grpclient.GenerateContractResponse\x12p\n\x19GenerateIncidentReportPdf\x12(.grpclient.GenerateIncidentReportRequest\x1a).grpclient.GenerateIncidentReportResponse\x12\x61\n\x12GenerateInvoicePdf\x12$.grpclient.GenerateInvoicePdfRequest\x1a%.grpclient.GenerateInvoicePdfResponseB\x16Z\x14maicare_go/grpclientb\x06proto3'
+    b'\n\x11pdf_service.proto\x12\tgrpclient"\xf0\x02\n\x1eGenerateAppointmentCardRequest\x12\n\n\x02id\x18\x01 \x01(\x03\x12\x13\n\x0b\x63lient_name\x18\x02 \x01(\t\x12\x0c\n\x04\x64\x61te\x18\x03 \x01(\t\x12\x0e\n\x06mentor\x18\x04 \x01(\t\x12\x1b\n\x13general_information\x18\x05 \x03(\t\x12\x1a\n\x12important_contacts\x18\x06 \x03(\t\x12\x16\n\x0ehousehold_info\x18\x07 \x03(\t\x12\x1f\n\x17organization_agreements\x18\x08 \x03(\t\x12 \n\x18youth_officer_agreements\x18\t \x03(\t\x12\x1c\n\x14treatment_agreements\x18\n \x03(\t\x12\x15\n\rsmoking_rules\x18\x0b \x03(\t\x12\x0c\n\x04work\x18\x0c \x03(\t\x12\x19\n\x11school_internship\x18\r \x03(\t\x12\x0e\n\x06travel\x18\x0e \x03(\t\x12\r\n\x05leave\x18\x0f \x03(\t"7\n\x1fGenerateAppointmentCardResponse\x12\x14\n\x0cpdf_file_key\x18\x01 \x01(\t"\xa7\x04\n\x17GenerateContractRequest\x12\x13\n\x0b\x63ontract_id\x18\x01 \x01(\x03\x12\x0e\n\x06status\x18\x02 \x01(\t\x12\x12\n\nstart_date\x18\x03 \x01(\t\x12\x10\n\x08\x65nd_date\x18\x04 \x01(\t\x12\x17\n\x0freminder_period\x18\x05 \x01(\x05\x12\x13\n\x0bsender_name\x18\x06 \x01(\t\x12\x16\n\x0esender_address\x18\x07 \x01(\t\x12\x1b\n\x13sender_contact_info\x18\x08 \x01(\t\x12\x19\n\x11\x63lient_first_name\x18\t \x01(\t\x12\x18\n\x10\x63lient_last_name\x18\n \x01(\t\x12\x16\n\x0e\x63lient_address\x18\x0b \x01(\t\x12\x1b\n\x13\x63lient_contact_info\x18\x0c \x01(\t\x12\x11\n\tcare_type\x18\r \x01(\t\x12\x11\n\tcare_name\x18\x0e \x01(\t\x12\x15\n\rfinancing_act\x18\x0f \x01(\t\x12\x18\n\x10\x66inancing_option\x18\x10 \x01(\t\x12\r\n\x05hours\x18\x11 \x01(\x01\x12\x12\n\nhours_type\x18\x12 \x01(\t\x12\x19\n\x11\x61mbulante_display\x18\x13 \x01(\t\x12\r\n\x05price\x18\x14 \x01(\x01\x12\x17\n\x0fprice_time_unit\x18\x15 \x01(\t\x12\x0b\n\x03vat\x18\x16 \x01(\x01\x12\x11\n\ttype_name\x18\x17 \x01(\t\x12\x17\n\x0fgeneration_date\x18\x18 \x01(\t"0\n\x18GenerateContractResponse\x12\x14\n\x0cpdf_file_key\x18\x01 \x01(\t"\x90\t\n\x1dGenerateIncidentReportRequest\x12\n\n\x02id\x18\x01 \x01(\x03\x12\x13\n\x0b\x65mployee_id\x18\x02 \x01(\x03\x12\x1b\n\x13\x65mployee_first_name\x18\x03 \x01(\t\x12\x1a\n\x12\x65mployee_last_name\x18\x04 \x01(\t\x12\x13\n\x0blocation_id\x18\x05 \x01(\x03\x12\x1c\n\x14reporter_involvement\x18\x06 \x01(\t\x12\x12\n\ninform_who\x18\x07 \x03(\t\x12\x15\n\rincident_date\x18\x08 \x01(\t\x12\x18\n\x10runtime_incident\x18\t \x01(\t\x12\x15\n\rincident_type\x18\n \x01(\t\x12\x14\n\x0cpassing_away\x18\x0b \x01(\x08\x12\x11\n\tself_harm\x18\x0c \x01(\x08\x12\x10\n\x08violence\x18\r \x01(\x08\x12\x19\n\x11\x66ire_water_damage\x18\x0e \x01(\x08\x12\x10\n\x08\x61\x63\x63ident\x18\x0f \x01(\x08\x12\x16\n\x0e\x63lient_absence\x18\x10 \x01(\x08\x12\x11\n\tmedicines\x18\x11 \x01(\x08\x12\x14\n\x0corganization\x18\x12 \x01(\x08\x12!\n\x19use_prohibited_substances\x18\x13 \x01(\x08\x12\x1b\n\x13other_notifications\x18\x14 \x01(\x08\x12\x1c\n\x14severity_of_incident\x18\x15 \x01(\t\x12\x1c\n\x14incident_explanation\x18\x16 \x01(\t\x12\x17\n\x0frecurrence_risk\x18\x17 \x01(\t\x12\x1e\n\x16incident_prevent_steps\x18\x18 \x01(\t\x12\x1f\n\x17incident_taken_measures\x18\x19 \x01(\t\x12\x11\n\ttechnical\x18\x1a \x03(\t\x12\x16\n\x0eorganizational\x18\x1b \x03(\t\x12\x13\n\x0bmese_worker\x18\x1c \x03(\t\x12\x16\n\x0e\x63lient_options\x18\x1d \x03(\t\x12\x13\n\x0bother_cause\x18\x1e \x01(\t\x12\x19\n\x11\x63\x61use_explanation\x18\x1f \x01(\t\x12\x17\n\x0fphysical_injury\x18  \x01(\t\x12\x1c\n\x14physical_injury_desc\x18! \x01(\t\x12\x1c\n\x14psychological_damage\x18" \x01(\t\x12!\n\x19psychological_damage_desc\x18# \x01(\t\x12\x1b\n\x13needed_consultation\x18$ \x01(\t\x12\x12\n\nsuccession\x18% \x03(\t\x12\x17\n\x0fsuccession_desc\x18& \x01(\t\x12\r\n\x05other\x18\' \x01(\x08\x12\x12\n\nother_desc\x18( \x01(\t\x12\x1f\n\x17\x61\x64\x64itional_appointments\x18) \x01(\t\x12\x1c\n\x14\x65mployee_absenteeism\x18* \x01(\t\x12\x11\n\tclient_id\x18+ \x01(\x03\x12\x18\n\x10\x63lient_firstname\x18, \x01(\t\x12\x17\n\x0f\x63lient_lastname\x18- \x01(\t\x12\x15\n\rlocation_name\x18. \x01(\t"6\n\x1eGenerateIncidentReportResponse\x12\x14\n\x0cpdf_file_key\x18\x01 \x01(\t"x\n\rInvoicePeriod\x12\x12\n\nstart_date\x18\x01 \x01(\t\x12\x10\n\x08\x65nd_date\x18\x02 \x01(\t\x12 \n\x18\x61\x63\x63ommodation_time_frame\x18\x03 \x01(\t\x12\x1f\n\x17\x61mbulante_total_minutes\x18\x04 \x01(\x01"\x9b\x01\n\rInvoiceDetail\x12\x11\n\tcare_type\x18\x01 \x01(\t\x12)\n\x07periods\x18\x02 \x03(\x0b\x32\x18.grpclient.InvoicePeriod\x12\r\n\x05price\x18\x03 \x01(\x01\x12\x17\n\x0fprice_time_unit\x18\x04 \x01(\t\x12\x15\n\rpre_vat_total\x18\x05 \x01(\x01\x12\r\n\x05total\x18\x06 \x01(\x01"\xa1\x03\n\x19GenerateInvoicePdfRequest\x12\n\n\x02id\x18\x01 \x01(\x03\x12\x13\n\x0bsender_name\x18\x02 \x01(\t\x12\x1d\n\x15sender_contact_person\x18\x03 \x01(\t\x12\x1c\n\x14sender_address_line1\x18\x04 \x01(\t\x12\x1f\n\x17sender_postal_code_city\x18\x05 \x01(\t\x12\x16\n\x0einvoice_number\x18\x06 \x01(\t\x12\x14\n\x0cinvoice_date\x18\x07 \x01(\t\x12\x10\n\x08\x64ue_date\x18\x08 \x01(\t\x12\x31\n\x0finvoice_details\x18\t \x03(\x0b\x32\x18.grpclient.InvoiceDetail\x12\x14\n\x0ctotal_amount\x18\n \x01(\x01\x12I\n\x0b\x65xtra_items\x18\x0b \x03(\x0b\x32\x34.grpclient.GenerateInvoicePdfRequest.ExtraItemsEntry\x1a\x31\n\x0f\x45xtraItemsEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01"@\n\x1aGenerateInvoicePdfResponse\x12\x14\n\x0cpdf_file_key\x18\x01 \x01(\t\x12\x0c\n\x04size\x18\x02 \x01(\x03"o\n\x1fGenerateInvoicePdfBatchResponse\x12\r\n\x05index\x18\x01 \x01(\x05\x12\n\n\x02id\x18\x02 \x01(\x03\x12\x14\n\x0cpdf_file_key\x18\x03 \x01(\t\x12\x0c\n\x04size\x18\x04 \x01(\x03\x12\r\n\x05\x65rror\x18\x05 \x01(\t2\xa7\x04\n\nPdfService\x12s\n\x1aGenerateAppointmentCardPdf\x12).grpclient.GenerateAppointmentCardRequest\x1a*.grpclient.GenerateAppointmentCardResponse\x12^\n\x13GenerateContractPdf\x12".grpclient.GenerateContractRequest\x1a#.grpclient.GenerateContractResponse\x12p\n\x19GenerateIncidentReportPdf\x12(.grpclient.GenerateIncidentReportRequest\x1a).grpclient.GenerateIncidentReportResponse\x12\x61\n\x12GenerateInvoicePdf\x12$.grpclient.GenerateInvoicePdfRequest\x1a%.grpclient.GenerateInvoicePdfResponse\x12o\n\x17GenerateInvoicePdfBatch\x12$.grpclient.GenerateInvoicePdfRequest\x1a*.grpclient.GenerateInvoicePdfBatchResponse(\x01\x30\x01\x42\x16Z\x14maicare_go/grpclientb\x06proto3'
 )
 
 _globals = globals()
@@ -55,6 +55,8 @@ if not _descriptor._USE_C_DESCRIPTORS:
     _globals["_GENERATEINVOICEPDFREQUEST_EXTRAITEMSENTRY"]._serialized_end = 2989
     _globals["_GENERATEINVOICEPDFRESPONSE"]._serialized_start = 2991
     _globals["_GENERATEINVOICEPDFRESPONSE"]._serialized_end = 3055
-    _globals["_PDFSERVICE"]._serialized_start = 3058
-    _globals["_PDFSERVICE"]._serialized_end = 3496
+    _globals["_GENERATEINVOICEPDFBATCHRESPONSE"]._serialized_start = 3057
+    _globals["_GENERATEINVOICEPDFBATCHRESPONSE"]._serialized_end = 3168
+    _globals["_PDFSERVICE"]._serialized_start = 3171
+    _globals["_PDFSERVICE"]._serialized_end = 3722
 # @@protoc_insertion_point(module_scope)
@@ -509,3 +509,24 @@ class GenerateInvoicePdfResponse(_message.Message):
     def __init__(
         self, pdf_file_key: _Optional[str] = ..., size: _Optional[int] = ...
     ) -> None: ...
+
+class GenerateInvoicePdfBatchResponse(_message.Message):
+    __slots__ = ("index", "id", "pdf_file_key", "size", "error")
+    INDEX_FIELD_NUMBER: _ClassVar[int]
+    ID_FIELD_NUMBER: _ClassVar[int]
+    PDF_FILE_KEY_FIELD_NUMBER: _ClassVar[int]
+    SIZE_FIELD_NUMBER: _ClassVar[int]
+    ERROR_FIELD_NUMBER: _ClassVar[int]
+    index: int
+    id: int
+    pdf_file_key: str
+    size: int
+    error: str
+    def __init__(
+        self,
+        index: _Optional[int] = ...,
+        id: _Optional[int] = ...,
+        pdf_file_key: _Optional[str] = ...,
+        size: _Optional[int] = ...,
+        error: _Optional[str] = ...,
+    ) -> None: ...
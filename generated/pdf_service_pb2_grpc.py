@@ -61,6 +61,12 @@ class PdfServiceStub(object):
             response_deserializer=pdf__service__pb2.GenerateInvoicePdfResponse.FromString,
             _registered_method=True,
         )
+        self.GenerateInvoicePdfBatch = channel.stream_stream(
+            "/grpclient.PdfService/GenerateInvoicePdfBatch",
+            request_serializer=pdf__service__pb2.GenerateInvoicePdfRequest.SerializeToString,
+            response_deserializer=pdf__service__pb2.GenerateInvoicePdfBatchResponse.FromString,
+            _registered_method=True,
+        )
 
 
 class PdfServiceServicer(object):
@@ -90,6 +96,12 @@ class PdfServiceServicer(object):
         context.set_details("Method not implemented!")
         raise NotImplementedError("Method not implemented!")
 
+    def GenerateInvoicePdfBatch(self, request_iterator, context):
+        """Responses arrive in completion order; a failed invoice does not end the stream"""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details("Method not implemented!")
+        raise NotImplementedError("Method not implemented!")
+
 
 def add_PdfServiceServicer_to_server(servicer, server):
     rpc_method_handlers = {
@@ -113,6 +125,11 @@ def add_PdfServiceServicer_to_server(servicer, server):
             request_deserializer=pdf__service__pb2.GenerateInvoicePdfRequest.FromString,
             response_serializer=pdf__service__pb2.GenerateInvoicePdfResponse.SerializeToString,
         ),
+        "GenerateInvoicePdfBatch": grpc.stream_stream_rpc_method_handler(
+            servicer.GenerateInvoicePdfBatch,
+            request_deserializer=pdf__service__pb2.GenerateInvoicePdfRequest.FromString,
+            response_serializer=pdf__service__pb2.GenerateInvoicePdfBatchResponse.SerializeToString,
+        ),
     }
     generic_handler = grpc.method_handlers_generic_handler(
         "grpclient.PdfService", rpc_method_handlers
@@ -244,3 +261,33 @@ class PdfService(object):
             metadata,
             _registered_method=True,
         )
+
+    @staticmethod
+    def GenerateInvoicePdfBatch(
+        request_iterator,
+        target,
+        options=(),
+        channel_credentials=None,
+        call_credentials=None,
+        insecure=False,
+        compression=None,
+        wait_for_ready=None,
+        timeout=None,
+        metadata=None,
+    ):
+        return grpc.experimental.stream_stream(
+            request_iterator,
+            target,
+            "/grpclient.PdfService/GenerateInvoicePdfBatch",
+            pdf__service__pb2.GenerateInvoicePdfRequest.SerializeToString,
+            pdf__service__pb2.GenerateInvoicePdfBatchResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True,
+        )
@@ -20,7 +20,7 @@ _sym_db = _symbol_database.Default()
 
 
 DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(
-    b'\n\x16schedule_service.proto\x12\tgrpclient"\x7f\n\x17GenerateScheduleRequest\x12&\n\temployees\x18\x01 \x03(\x0b\x32\x13.grpclient.Employee\x12 \n\x06shifts\x18\x02 \x03(\x0b\x32\x10.grpclient.Shift\x12\x0c\n\x04week\x18\x03 \x01(\x05\x12\x0c\n\x04year\x18\x04 \x01(\x05"S\n\x08\x45mployee\x12\n\n\x02id\x18\x01 \x01(\t\x12\x12\n\nfirst_name\x18\x02 \x01(\t\x12\x11\n\tlast_name\x18\x03 \x01(\t\x12\x14\n\x0ctarget_hours\x18\x04 \x01(\x01"M\n\x05Shift\x12\n\n\x02id\x18\x01 \x01(\x05\x12\x12\n\nshift_name\x18\x02 \x01(\t\x12\x12\n\nstart_time\x18\x03 \x01(\t\x12\x10\n\x08\x65nd_time\x18\x04 \x01(\t"\xc6\x01\n\x18GenerateScheduleResponse\x12\x0e\n\x06status\x18\x01 \x01(\t\x12\x0c\n\x04week\x18\x02 \x01(\x05\x12\x0c\n\x04year\x18\x03 \x01(\x05\x12)\n\x06shifts\x18\x04 \x03(\x0b\x32\x19.grpclient.ScheduledShift\x12&\n\tgrid_view\x18\x05 \x01(\x0b\x32\x13.grpclient.GridView\x12+\n\x07summary\x18\x06 \x03(\x0b\x32\x1a.grpclient.EmployeeSummary"\xbb\x01\n\x0eScheduledShift\x12\x0c\n\x04\x64\x61te\x18\x01 \x01(\t\x12\x10\n\x08\x64\x61y_name\x18\x02 \x01(\t\x12\x10\n\x08shift_id\x18\x03 \x01(\x05\x12\x12\n\nshift_name\x18\x04 \x01(\t\x12\x12\n\nstart_time\x18\x05 \x01(\t\x12\x10\n\x08\x65nd_time\x18\x06 \x01(\t\x12\r\n\x05hours\x18\x07 \x01(\x01\x12.\n\temployees\x18\x08 \x03(\x0b\x32\x1b.grpclient.AssignedEmployee",\n\x10\x41ssignedEmployee\x12\n\n\x02id\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t"\xac\x01\n\x08GridView\x12\x0c\n\x04\x64\x61ys\x18\x01 \x03(\t\x12\r\n\x05\x64\x61tes\x18\x02 \x03(\t\x12;\n\rshifts_by_day\x18\x03 \x03(\x0b\x32$.grpclient.GridView.ShiftsByDayEntry\x1a\x46\n\x10ShiftsByDayEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12!\n\x05value\x18\x02 \x01(\x0b\x32\x12.grpclient.GridDay:\x02\x38\x01"\x8c\x01\n\x07GridDay\x12\x0c\n\x04\x64\x61te\x18\x01 \x01(\t\x12.\n\x06shifts\x18\x02 \x03(\x0b\x32\x1e.grpclient.GridDay.ShiftsEntry\x1a\x43\n\x0bShiftsEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12#\n\x05value\x18\x02 \x01(\x0b\x32\x14.grpclient.GridShift:\x02\x38\x01"I\n\tGridShift\x12\x11\n\temployees\x18\x01 \x03(\t\x12\r\n\x05hours\x18\x02 \x01(\x01\x12\r\n\x05start\x18\x03 \x01(\t\x12\x0b\n\x03\x65nd\x18\x04 \x01(\t"\xee\x01\n\x0f\x45mployeeSummary\x12\n\n\x02id\x18\x01 \x01(\t\x12\x12\n\nfirst_name\x18\x02 \x01(\t\x12\x11\n\tlast_name\x18\x03 \x01(\t\x12\x0e\n\x06target\x18\x04 \x01(\x01\x12\x0e\n\x06\x61\x63tual\x18\x05 \x01(\x01\x12\x11\n\tdeviation\x18\x06 \x01(\x01\x12\x0e\n\x06status\x18\x07 \x01(\t\x12\x36\n\x06shifts\x18\x08 \x03(\x0b\x32&.grpclient.EmployeeSummary.ShiftsEntry\x1a-\n\x0bShiftsEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\x05:\x02\x38\x01\x32n\n\x0fScheduleService\x12[\n\x10GenerateSchedule\x12".grpclient.GenerateScheduleRequest\x1a#.grpclient.GenerateScheduleResponseB\x16Z\x14maicare_go/grpclientb\x06proto3'
+    b'\n\x16schedule_service.proto\x12\tgrpclient"\xfd\x01\n\x17GenerateScheduleRequest\x12&\n\temployees\x18\x01 \x03(\x0b\x32\x13.grpclient.Employee\x12 \n\x06shifts\x18\x02 \x03(\x0b\x32\x10.grpclient.Shift\x12\x0c\n\x04week\x18\x03 \x01(\x05\x12\x0c\n\x04year\x18\x04 \x01(\x05\x12\x16\n\x0esolver_profile\x18\x05 \x01(\t\x12\x19\n\x11max_solve_seconds\x18\x06 \x01(\x01\x12\x13\n\x0bnum_workers\x18\x07 \x01(\x05\x12\x34\n\x11previous_schedule\x18\x08 \x03(\x0b\x32\x19.grpclient.ScheduledShift"\xb0\x01\n\x1eGenerateHorizonScheduleRequest\x12&\n\tlocations\x18\x01 \x03(\x0b\x32\x13.grpclient.Location\x12\x12\n\nstart_week\x18\x02 \x01(\x05\x12\x0c\n\x04year\x18\x03 \x01(\x05\x12\x11\n\tnum_weeks\x18\x04 \x01(\x05\x12\x16\n\x0esolver_profile\x18\x05 \x01(\t\x12\x19\n\x11max_solve_seconds\x18\x06 \x01(\x01"n\n\x08Location\x12\n\n\x02id\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12&\n\temployees\x18\x03 \x03(\x0b\x32\x13.grpclient.Employee\x12 \n\x06shifts\x18\x04 \x03(\x0b\x32\x10.grpclient.Shift"S\n\x08\x45mployee\x12\n\n\x02id\x18\x01 \x01(\t\x12\x12\n\nfirst_name\x18\x02 \x01(\t\x12\x11\n\tlast_name\x18\x03 \x01(\t\x12\x14\n\x0ctarget_hours\x18\x04 \x01(\x01"M\n\x05Shift\x12\n\n\x02id\x18\x01 \x01(\x05\x12\x12\n\nshift_name\x18\x02 \x01(\t\x12\x12\n\nstart_time\x18\x03 \x01(\t\x12\x10\n\x08\x65nd_time\x18\x04 \x01(\t"\xf2\x01\n\x18GenerateScheduleResponse\x12\x0e\n\x06status\x18\x01 \x01(\t\x12\x0c\n\x04week\x18\x02 \x01(\x05\x12\x0c\n\x04year\x18\x03 \x01(\x05\x12)\n\x06shifts\x18\x04 \x03(\x0b\x32\x19.grpclient.ScheduledShift\x12&\n\tgrid_view\x18\x05 \x01(\x0b\x32\x13.grpclient.GridView\x12+\n\x07summary\x18\x06 \x03(\x0b\x32\x1a.grpclient.EmployeeSummary\x12*\n\x0bsolve_stats\x18\x07 \x01(\x0b\x32\x15.grpclient.SolveStats"\xf4\x01\n\nSolveStats\x12\x0f\n\x07profile\x18\x01 \x01(\t\x12\x12\n\nsize_class\x18\x02 \x01(\t\x12\x13\n\x0bnum_workers\x18\x03 \x01(\x05\x12\x19\n\x11wall_time_seconds\x18\x04 \x01(\x01\x12\x17\n\x0fobjective_value\x18\x05 \x01(\x01\x12\x12\n\nbest_bound\x18\x06 \x01(\x01\x12\x1e\n\x16\x66irst_solution_seconds\x18\x07 \x01(\x01\x12\x11\n\thint_used\x18\x08 \x01(\x08\x12\x15\n\rhint_feasible\x18\t \x01(\x08\x12\x1a\n\x12time_saved_seconds\x18\n \x01(\x01"\xa1\x01\n\x1fGenerateHorizonScheduleResponse\x12\x12\n\nstart_week\x18\x01 \x01(\x05\x12\x0c\n\x04year\x18\x02 \x01(\x05\x12\x11\n\tnum_weeks\x18\x03 \x01(\x05\x12.\n\tlocations\x18\x04 \x03(\x0b\x32\x1b.grpclient.LocationSchedule\x12\x19\n\x11wall_time_seconds\x18\x05 \x01(\x01"k\n\x10LocationSchedule\x12\x13\n\x0blocation_id\x18\x01 \x01(\t\x12\x0e\n\x06status\x18\x02 \x01(\t\x12\x32\n\x05weeks\x18\x03 \x03(\x0b\x32#.grpclient.GenerateScheduleResponse"n\n\x0eScheduleUpdate\x12\x35\n\x08schedule\x18\x01 \x01(\x0b\x32#.grpclient.GenerateScheduleResponse\x12\x16\n\x0esolution_index\x18\x02 \x01(\x05\x12\r\n\x05\x66inal\x18\x03 \x01(\x08"\xbb\x01\n\x0eScheduledShift\x12\x0c\n\x04\x64\x61te\x18\x01 \x01(\t\x12\x10\n\x08\x64\x61y_name\x18\x02 \x01(\t\x12\x10\n\x08shift_id\x18\x03 \x01(\x05\x12\x12\n\nshift_name\x18\x04 \x01(\t\x12\x12\n\nstart_time\x18\x05 \x01(\t\x12\x10\n\x08\x65nd_time\x18\x06 \x01(\t\x12\r\n\x05hours\x18\x07 \x01(\x01\x12.\n\temployees\x18\x08 \x03(\x0b\x32\x1b.grpclient.AssignedEmployee",\n\x10\x41ssignedEmployee\x12\n\n\x02id\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t"\xac\x01\n\x08GridView\x12\x0c\n\x04\x64\x61ys\x18\x01 \x03(\t\x12\r\n\x05\x64\x61tes\x18\x02 \x03(\t\x12;\n\rshifts_by_day\x18\x03 \x03(\x0b\x32$.grpclient.GridView.ShiftsByDayEntry\x1a\x46\n\x10ShiftsByDayEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12!\n\x05value\x18\x02 \x01(\x0b\x32\x12.grpclient.GridDay:\x02\x38\x01"\x8c\x01\n\x07GridDay\x12\x0c\n\x04\x64\x61te\x18\x01 \x01(\t\x12.\n\x06shifts\x18\x02 \x03(\x0b\x32\x1e.grpclient.GridDay.ShiftsEntry\x1a\x43\n\x0bShiftsEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12#\n\x05value\x18\x02 \x01(\x0b\x32\x14.grpclient.GridShift:\x02\x38\x01"I\n\tGridShift\x12\x11\n\temployees\x18\x01 \x03(\t\x12\r\n\x05hours\x18\x02 \x01(\x01\x12\r\n\x05start\x18\x03 \x01(\t\x12\x0b\n\x03\x65nd\x18\x04 \x01(\t"\xee\x01\n\x0f\x45mployeeSummary\x12\n\n\x02id\x18\x01 \x01(\t\x12\x12\n\nfirst_name\x18\x02 \x01(\t\x12\x11\n\tlast_name\x18\x03 \x01(\t\x12\x0e\n\x06target\x18\x04 \x01(\x01\x12\x0e\n\x06\x61\x63tual\x18\x05 \x01(\x01\x12\x11\n\tdeviation\x18\x06 \x01(\x01\x12\x0e\n\x06status\x18\x07 \x01(\t\x12\x36\n\x06shifts\x18\x08 \x03(\x0b\x32&.grpclient.EmployeeSummary.ShiftsEntry\x1a-\n\x0bShiftsEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\x05:\x02\x38\x01\x32\xb3\x02\n\x0fScheduleService\x12[\n\x10GenerateSchedule\x12".grpclient.GenerateScheduleRequest\x1a#.grpclient.GenerateScheduleResponse\x12Q\n\x0eStreamSchedule\x12".grpclient.GenerateScheduleRequest\x1a\x19.grpclient.ScheduleUpdate0\x01\x12p\n\x17GenerateHorizonSchedule\x12).grpclient.GenerateHorizonScheduleRequest\x1a*.grpclient.GenerateHorizonScheduleResponseB\x16Z\x14maicare_go/grpclientb\x06proto3'
 )
 
 _globals = globals()
@@ -35,32 +35,44 @@ if not _descriptor._USE_C_DESCRIPTORS:
     _globals["_GRIDDAY_SHIFTSENTRY"]._serialized_options = b"8\001"
     _globals["_EMPLOYEESUMMARY_SHIFTSENTRY"]._loaded_options = None
     _globals["_EMPLOYEESUMMARY_SHIFTSENTRY"]._serialized_options = b"8\001"
-    _globals["_GENERATESCHEDULEREQUEST"]._serialized_start = 37
-    _globals["_GENERATESCHEDULEREQUEST"]._serialized_end = 164
-    _globals["_EMPLOYEE"]._serialized_start = 166
-    _globals["_EMPLOYEE"]._serialized_end = 249
-    _globals["_SHIFT"]._serialized_start = 251
-    _globals["_SHIFT"]._serialized_end = 328
-    _globals["_GENERATESCHEDULERESPONSE"]._serialized_start = 331
-    _globals["_GENERATESCHEDULERESPONSE"]._serialized_end = 529
-    _globals["_SCHEDULEDSHIFT"]._serialized_start = 532
-    _globals["_SCHEDULEDSHIFT"]._serialized_end = 719
-    _globals["_ASSIGNEDEMPLOYEE"]._serialized_start = 721
-    _globals["_ASSIGNEDEMPLOYEE"]._serialized_end = 765
-    _globals["_GRIDVIEW"]._serialized_start = 768
-    _globals["_GRIDVIEW"]._serialized_end = 940
-    _globals["_GRIDVIEW_SHIFTSBYDAYENTRY"]._serialized_start = 870
-    _globals["_GRIDVIEW_SHIFTSBYDAYENTRY"]._serialized_end = 940
-    _globals["_GRIDDAY"]._serialized_start = 943
-    _globals["_GRIDDAY"]._serialized_end = 1083
-    _globals["_GRIDDAY_SHIFTSENTRY"]._serialized_start = 1016
-    _globals["_GRIDDAY_SHIFTSENTRY"]._serialized_end = 1083
-    _globals["_GRIDSHIFT"]._serialized_start = 1085
-    _globals["_GRIDSHIFT"]._serialized_end = 1158
-    _globals["_EMPLOYEESUMMARY"]._serialized_start = 1161
-    _globals["_EMPLOYEESUMMARY"]._serialized_end = 1399
-    _globals["_EMPLOYEESUMMARY_SHIFTSENTRY"]._serialized_start = 1354
-    _globals["_EMPLOYEESUMMARY_SHIFTSENTRY"]._serialized_end = 1399
-    _globals["_SCHEDULESERVICE"]._serialized_start = 1401
-    _globals["_SCHEDULESERVICE"]._serialized_end = 1511
+    _globals["_GENERATESCHEDULEREQUEST"]._serialized_start = 38
+    _globals["_GENERATESCHEDULEREQUEST"]._serialized_end = 291
+    _globals["_GENERATEHORIZONSCHEDULEREQUEST"]._serialized_start = 294
+    _globals["_GENERATEHORIZONSCHEDULEREQUEST"]._serialized_end = 470
+    _globals["_LOCATION"]._serialized_start = 472
+    _globals["_LOCATION"]._serialized_end = 582
+    _globals["_EMPLOYEE"]._serialized_start = 584
+    _globals["_EMPLOYEE"]._serialized_end = 667
+    _globals["_SHIFT"]._serialized_start = 669
+    _globals["_SHIFT"]._serialized_end = 746
+    _globals["_GENERATESCHEDULERESPONSE"]._serialized_start = 749
+    _globals["_GENERATESCHEDULERESPONSE"]._serialized_end = 991
+    _globals["_SOLVESTATS"]._serialized_start = 994
+    _globals["_SOLVESTATS"]._serialized_end = 1238
+    _globals["_GENERATEHORIZONSCHEDULERESPONSE"]._serialized_start = 1241
+    _globals["_GENERATEHORIZONSCHEDULERESPONSE"]._serialized_end = 1402
+    _globals["_LOCATIONSCHEDULE"]._serialized_start = 1404
+    _globals["_LOCATIONSCHEDULE"]._serialized_end = 1511
+    _globals["_SCHEDULEUPDATE"]._serialized_start = 1513
+    _globals["_SCHEDULEUPDATE"]._serialized_end = 1623
+    _globals["_SCHEDULEDSHIFT"]._serialized_start = 1626
+    _globals["_SCHEDULEDSHIFT"]._serialized_end = 1813
+    _globals["_ASSIGNEDEMPLOYEE"]._serialized_start = 1815
+    _globals["_ASSIGNEDEMPLOYEE"]._serialized_end = 1859
+    _globals["_GRIDVIEW"]._serialized_start = 1862
+    _globals["_GRIDVIEW"]._serialized_end = 2034
+    _globals["_GRIDVIEW_SHIFTSBYDAYENTRY"]._serialized_start = 1964
+    _globals["_GRIDVIEW_SHIFTSBYDAYENTRY"]._serialized_end = 2034
+    _globals["_GRIDDAY"]._serialized_start = 2037
+    _globals["_GRIDDAY"]._serialized_end = 2177
+    _globals["_GRIDDAY_SHIFTSENTRY"]._serialized_start = 2110
+    _globals["_GRIDDAY_SHIFTSENTRY"]._serialized_end = 2177
+    _globals["_GRIDSHIFT"]._serialized_start = 2179
+    _globals["_GRIDSHIFT"]._serialized_end = 2252
+    _globals["_EMPLOYEESUMMARY"]._serialized_start = 2255
+    _globals["_EMPLOYEESUMMARY"]._serialized_end = 2493
+    _globals["_EMPLOYEESUMMARY_SHIFTSENTRY"]._serialized_start = 2448
+    _globals["_EMPLOYEESUMMARY_SHIFTSENTRY"]._serialized_end = 2493
+    _globals["_SCHEDULESERVICE"]._serialized_start = 2496
+    _globals["_SCHEDULESERVICE"]._serialized_end = 2803
 # @@protoc_insertion_point(module_scope)
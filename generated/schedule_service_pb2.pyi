@@ -7,21 +7,91 @@ from typing import ClassVar as _ClassVar, Optional as _Optional, Union as _Union
 DESCRIPTOR: _descriptor.FileDescriptor
 
 class GenerateScheduleRequest(_message.Message):
-    __slots__ = ("employees", "shifts", "week", "year")
+    __slots__ = (
+        "employees",
+        "shifts",
+        "week",
+        "year",
+        "solver_profile",
+        "max_solve_seconds",
+        "num_workers",
+        "previous_schedule",
+    )
     EMPLOYEES_FIELD_NUMBER: _ClassVar[int]
     SHIFTS_FIELD_NUMBER: _ClassVar[int]
     WEEK_FIELD_NUMBER: _ClassVar[int]
     YEAR_FIELD_NUMBER: _ClassVar[int]
+    SOLVER_PROFILE_FIELD_NUMBER: _ClassVar[int]
+    MAX_SOLVE_SECONDS_FIELD_NUMBER: _ClassVar[int]
+    NUM_WORKERS_FIELD_NUMBER: _ClassVar[int]
+    PREVIOUS_SCHEDULE_FIELD_NUMBER: _ClassVar[int]
     employees: _containers.RepeatedCompositeFieldContainer[Employee]
     shifts: _containers.RepeatedCompositeFieldContainer[Shift]
     week: int
     year: int
+    solver_profile: str
+    max_solve_seconds: float
+    num_workers: int
+    previous_schedule: _containers.RepeatedCompositeFieldContainer[ScheduledShift]
     def __init__(
         self,
         employees: _Optional[_Iterable[_Union[Employee, _Mapping]]] = ...,
         shifts: _Optional[_Iterable[_Union[Shift, _Mapping]]] = ...,
         week: _Optional[int] = ...,
         year: _Optional[int] = ...,
+        solver_profile: _Optional[str] = ...,
+        max_solve_seconds: _Optional[float] = ...,
+        num_workers: _Optional[int] = ...,
+        previous_schedule: _Optional[_Iterable[_Union[ScheduledShift, _Mapping]]] = ...,
+    ) -> None: ...
+
+class GenerateHorizonScheduleRequest(_message.Message):
+    __slots__ = (
+        "locations",
+        "start_week",
+        "year",
+        "num_weeks",
+        "solver_profile",
+        "max_solve_seconds",
+    )
+    LOCATIONS_FIELD_NUMBER: _ClassVar[int]
+    START_WEEK_FIELD_NUMBER: _ClassVar[int]
+    YEAR_FIELD_NUMBER: _ClassVar[int]
+    NUM_WEEKS_FIELD_NUMBER: _ClassVar[int]
+    SOLVER_PROFILE_FIELD_NUMBER: _ClassVar[int]
+    MAX_SOLVE_SECONDS_FIELD_NUMBER: _ClassVar[int]
+    locations: _containers.RepeatedCompositeFieldContainer[Location]
+    start_week: int
+    year: int
+    num_weeks: int
+    solver_profile: str
+    max_solve_seconds: float
+    def __init__(
+        self,
+        locations: _Optional[_Iterable[_Union[Location, _Mapping]]] = ...,
+        start_week: _Optional[int] = ...,
+        year: _Optional[int] = ...,
+        num_weeks: _Optional[int] = ...,
+        solver_profile: _Optional[str] = ...,
+        max_solve_seconds: _Optional[float] = ...,
+    ) -> None: ...
+
+class Location(_message.Message):
+    __slots__ = ("id", "name", "employees", "shifts")
+    ID_FIELD_NUMBER: _ClassVar[int]
+    NAME_FIELD_NUMBER: _ClassVar[int]
+    EMPLOYEES_FIELD_NUMBER: _ClassVar[int]
+    SHIFTS_FIELD_NUMBER: _ClassVar[int]
+    id: str
+    name: str
+    employees: _containers.RepeatedCompositeFieldContainer[Employee]
+    shifts: _containers.RepeatedCompositeFieldContainer[Shift]
+    def __init__(
+        self,
+        id: _Optional[str] = ...,
+        name: _Optional[str] = ...,
+        employees: _Optional[_Iterable[_Union[Employee, _Mapping]]] = ...,
+        shifts: _Optional[_Iterable[_Union[Shift, _Mapping]]] = ...,
     ) -> None: ...
 
 class Employee(_message.Message):
@@ -61,19 +131,29 @@ class Shift(_message.Message):
     ) -> None: ...
 
 class GenerateScheduleResponse(_message.Message):
-    __slots__ = ("status", "week", "year", "shifts", "grid_view", "summary")
+    __slots__ = (
+        "status",
+        "week",
+        "year",
+        "shifts",
+        "grid_view",
+        "summary",
+        "solve_stats",
+    )
     STATUS_FIELD_NUMBER: _ClassVar[int]
     WEEK_FIELD_NUMBER: _ClassVar[int]
     YEAR_FIELD_NUMBER: _ClassVar[int]
     SHIFTS_FIELD_NUMBER: _ClassVar[int]
     GRID_VIEW_FIELD_NUMBER: _ClassVar[int]
     SUMMARY_FIELD_NUMBER: _ClassVar[int]
+    SOLVE_STATS_FIELD_NUMBER: _ClassVar[int]
     status: str
     week: int
     year: int
     shifts: _containers.RepeatedCompositeFieldContainer[ScheduledShift]
     grid_view: GridView
     summary: _containers.RepeatedCompositeFieldContainer[EmployeeSummary]
+    solve_stats: SolveStats
     def __init__(
         self,
         status: _Optional[str] = ...,
@@ -82,6 +162,105 @@ class GenerateScheduleResponse(_message.Message):
         shifts: _Optional[_Iterable[_Union[ScheduledShift, _Mapping]]] = ...,
         grid_view: _Optional[_Union[GridView, _Mapping]] = ...,
         summary: _Optional[_Iterable[_Union[EmployeeSummary, _Mapping]]] = ...,
+        solve_stats: _Optional[_Union[SolveStats, _Mapping]] = ...,
+    ) -> None: ...
+
+class SolveStats(_message.Message):
+    __slots__ = (
+        "profile",
+        "size_class",
+        "num_workers",
+        "wall_time_seconds",
+        "objective_value",
+        "best_bound",
+        "first_solution_seconds",
+        "hint_used",
+        "hint_feasible",
+        "time_saved_seconds",
+    )
+    PROFILE_FIELD_NUMBER: _ClassVar[int]
+    SIZE_CLASS_FIELD_NUMBER: _ClassVar[int]
+    NUM_WORKERS_FIELD_NUMBER: _ClassVar[int]
+    WALL_TIME_SECONDS_FIELD_NUMBER: _ClassVar[int]
+    OBJECTIVE_VALUE_FIELD_NUMBER: _ClassVar[int]
+    BEST_BOUND_FIELD_NUMBER: _ClassVar[int]
+    FIRST_SOLUTION_SECONDS_FIELD_NUMBER: _ClassVar[int]
+    HINT_USED_FIELD_NUMBER: _ClassVar[int]
+    HINT_FEASIBLE_FIELD_NUMBER: _ClassVar[int]
+    TIME_SAVED_SECONDS_FIELD_NUMBER: _ClassVar[int]
+    profile: str
+    size_class: str
+    num_workers: int
+    wall_time_seconds: float
+    objective_value: float
+    best_bound: float
+    first_solution_seconds: float
+    hint_used: bool
+    hint_feasible: bool
+    time_saved_seconds: float
+    def __init__(
+        self,
+        profile: _Optional[str] = ...,
+        size_class: _Optional[str] = ...,
+        num_workers: _Optional[int] = ...,
+        wall_time_seconds: _Optional[float] = ...,
+        objective_value: _Optional[float] = ...,
+        best_bound: _Optional[float] = ...,
+        first_solution_seconds: _Optional[float] = ...,
+        hint_used: bool = ...,
+        hint_feasible: bool = ...,
+        time_saved_seconds: _Optional[float] = ...,
+    ) -> None: ...
+
+class GenerateHorizonScheduleResponse(_message.Message):
+    __slots__ = ("start_week", "year", "num_weeks", "locations", "wall_time_seconds")
+    START_WEEK_FIELD_NUMBER: _ClassVar[int]
+    YEAR_FIELD_NUMBER: _ClassVar[int]
+    NUM_WEEKS_FIELD_NUMBER: _ClassVar[int]
+    LOCATIONS_FIELD_NUMBER: _ClassVar[int]
+    WALL_TIME_SECONDS_FIELD_NUMBER: _ClassVar[int]
+    start_week: int
+    year: int
+    num_weeks: int
+    locations: _containers.RepeatedCompositeFieldContainer[LocationSchedule]
+    wall_time_seconds: float
+    def __init__(
+        self,
+        start_week: _Optional[int] = ...,
+        year: _Optional[int] = ...,
+        num_weeks: _Optional[int] = ...,
+        locations: _Optional[_Iterable[_Union[LocationSchedule, _Mapping]]] = ...,
+        wall_time_seconds: _Optional[float] = ...,
+    ) -> None: ...
+
+class LocationSchedule(_message.Message):
+    __slots__ = ("location_id", "status", "weeks")
+    LOCATION_ID_FIELD_NUMBER: _ClassVar[int]
+    STATUS_FIELD_NUMBER: _ClassVar[int]
+    WEEKS_FIELD_NUMBER: _ClassVar[int]
+    location_id: str
+    status: str
+    weeks: _containers.RepeatedCompositeFieldContainer[GenerateScheduleResponse]
+    def __init__(
+        self,
+        location_id: _Optional[str] = ...,
+        status: _Optional[str] = ...,
+        weeks: _Optional[_Iterable[_Union[GenerateScheduleResponse, _Mapping]]] = ...,
+    ) -> None: ...
+
+class ScheduleUpdate(_message.Message):
+    __slots__ = ("schedule", "solution_index", "final")
+    SCHEDULE_FIELD_NUMBER: _ClassVar[int]
+    SOLUTION_INDEX_FIELD_NUMBER: _ClassVar[int]
+    FINAL_FIELD_NUMBER: _ClassVar[int]
+    schedule: GenerateScheduleResponse
+    solution_index: int
+    final: bool
+    def __init__(
+        self,
+        schedule: _Optional[_Union[GenerateScheduleResponse, _Mapping]] = ...,
+        solution_index: _Optional[int] = ...,
+        final: bool = ...,
     ) -> None: ...
 
 class ScheduledShift(_message.Message):
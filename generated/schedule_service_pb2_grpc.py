@@ -48,6 +48,18 @@ class ScheduleServiceStub(object):
             response_deserializer=schedule__service__pb2.GenerateScheduleResponse.FromString,
             _registered_method=True,
         )
+        self.StreamSchedule = channel.unary_stream(
+            "/grpclient.ScheduleService/StreamSchedule",
+            request_serializer=schedule__service__pb2.GenerateScheduleRequest.SerializeToString,
+            response_deserializer=schedule__service__pb2.ScheduleUpdate.FromString,
+            _registered_method=True,
+        )
+        self.GenerateHorizonSchedule = channel.unary_unary(
+            "/grpclient.ScheduleService/GenerateHorizonSchedule",
+            request_serializer=schedule__service__pb2.GenerateHorizonScheduleRequest.SerializeToString,
+            response_deserializer=schedule__service__pb2.GenerateHorizonScheduleResponse.FromString,
+            _registered_method=True,
+        )
 
 
 class ScheduleServiceServicer(object):
@@ -63,6 +75,18 @@ class ScheduleServiceServicer(object):
         context.set_details("Method not implemented!")
         raise NotImplementedError("Method not implemented!")
 
+    def StreamSchedule(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details("Method not implemented!")
+        raise NotImplementedError("Method not implemented!")
+
+    def GenerateHorizonSchedule(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details("Method not implemented!")
+        raise NotImplementedError("Method not implemented!")
+
 
 def add_ScheduleServiceServicer_to_server(servicer, server):
     rpc_method_handlers = {
@@ -71,6 +95,16 @@ def add_ScheduleServiceServicer_to_server(servicer, server):
             request_deserializer=schedule__service__pb2.GenerateScheduleRequest.FromString,
             response_serializer=schedule__service__pb2.GenerateScheduleResponse.SerializeToString,
         ),
+        "StreamSchedule": grpc.unary_stream_rpc_method_handler(
+            servicer.StreamSchedule,
+            request_deserializer=schedule__service__pb2.GenerateScheduleRequest.FromString,
+            response_serializer=schedule__service__pb2.ScheduleUpdate.SerializeToString,
+        ),
+        "GenerateHorizonSchedule": grpc.unary_unary_rpc_method_handler(
+            servicer.GenerateHorizonSchedule,
+            request_deserializer=schedule__service__pb2.GenerateHorizonScheduleRequest.FromString,
+            response_serializer=schedule__service__pb2.GenerateHorizonScheduleResponse.SerializeToString,
+        ),
     }
     generic_handler = grpc.method_handlers_generic_handler(
         "grpclient.ScheduleService", rpc_method_handlers
@@ -118,3 +152,63 @@ class ScheduleService(object):
             metadata,
             _registered_method=True,
         )
+
+    @staticmethod
+    def StreamSchedule(
+        request,
+        target,
+        options=(),
+        channel_credentials=None,
+        call_credentials=None,
+        insecure=False,
+        compression=None,
+        wait_for_ready=None,
+        timeout=None,
+        metadata=None,
+    ):
+        return grpc.experimental.unary_stream(
+            request,
+            target,
+            "/grpclient.ScheduleService/StreamSchedule",
+            schedule__service__pb2.GenerateScheduleRequest.SerializeToString,
+            schedule__service__pb2.ScheduleUpdate.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True,
+        )
+
+    @staticmethod
+    def GenerateHorizonSchedule(
+        request,
+        target,
+        options=(),
+        channel_credentials=None,
+        call_credentials=None,
+        insecure=False,
+        compression=None,
+        wait_for_ready=None,
+        timeout=None,
+        metadata=None,
+    ):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            "/grpclient.ScheduleService/GenerateHorizonSchedule",
+            schedule__service__pb2.GenerateHorizonScheduleRequest.SerializeToString,
+            schedule__service__pb2.GenerateHorizonScheduleResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True,
+        )
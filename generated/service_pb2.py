@@ -20,7 +20,7 @@ _sym_db = _symbol_database.Default()
 
 
 DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(
-    b'\n\rservice.proto\x12\tgrpclient"\xf7\x01\n\x1bPersonalizedCarePlanRequest\x12*\n\x0b\x63lient_data\x18\x02 \x01(\x0b\x32\x15.grpclient.ClientData\x12Y\n\x12\x64omain_definitions\x18\x03 \x03(\x0b\x32=.grpclient.PersonalizedCarePlanRequest.DomainDefinitionsEntry\x1aQ\n\x16\x44omainDefinitionsEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12&\n\x05value\x18\x02 \x01(\x0b\x32\x17.grpclient.DomainLevels:\x02\x38\x01"\x93\x01\n\nClientData\x12\x0b\n\x03\x61ge\x18\x01 \x01(\x05\x12\x18\n\x10living_situation\x18\x02 \x01(\t\x12\x17\n\x0f\x65\x64ucation_level\x18\x03 \x01(\t\x12\x13\n\x0b\x64omain_name\x18\x04 \x01(\t\x12\x15\n\rcurrent_level\x18\x05 \x01(\x05\x12\x19\n\x11level_description\x18\x06 \x01(\t"r\n\x0c\x44omainLevels\x12\x33\n\x06levels\x18\x01 \x03(\x0b\x32#.grpclient.DomainLevels.LevelsEntry\x1a-\n\x0bLevelsEntry\x12\x0b\n\x03key\x18\x01 \x01(\x05\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01"\x94\x04\n\x1cPersonalizedCarePlanResponse\x12\x30\n\x0e\x63lient_profile\x18\x01 \x01(\x0b\x32\x18.grpclient.ClientProfile\x12\x1a\n\x12\x61ssessment_summary\x18\x02 \x01(\t\x12;\n\x14\x63\x61re_plan_objectives\x18\x03 \x01(\x0b\x32\x1d.grpclient.CarePlanObjectives\x12/\n\rinterventions\x18\x04 \x01(\x0b\x32\x18.grpclient.Interventions\x12\x1a\n\x12resources_required\x18\x05 \x03(\t\x12\x31\n\x0fsuccess_metrics\x18\x06 \x03(\x0b\x32\x18.grpclient.SuccessMetric\x12+\n\x0crisk_factors\x18\x07 \x03(\x0b\x32\x15.grpclient.RiskFactor\x12/\n\x0fsupport_network\x18\x08 \x03(\x0b\x32\x16.grpclient.SupportRole\x12\x32\n\x0freview_schedule\x18\t \x01(\x0b\x32\x19.grpclient.ReviewSchedule\x12\x1b\n\x13\x65mergency_protocols\x18\n \x03(\t\x12:\n\x13transition_criteria\x18\x0b \x01(\x0b\x32\x1d.grpclient.TransitionCriteria"\x9c\x01\n\rClientProfile\x12\x0b\n\x03\x61ge\x18\x01 \x01(\x05\x12\x18\n\x10living_situation\x18\x02 \x01(\t\x12\x17\n\x0f\x65\x64ucation_level\x18\x03 \x01(\t\x12\x19\n\x11\x61ssessment_domain\x18\x04 \x01(\t\x12\x15\n\rcurrent_level\x18\x05 \x01(\x05\x12\x19\n\x11level_description\x18\x06 \x01(\t"\x95\x01\n\x12\x43\x61rePlanObjectives\x12)\n\x10short_term_goals\x18\x01 \x03(\x0b\x32\x0f.grpclient.Goal\x12*\n\x11medium_term_goals\x18\x02 \x03(\x0b\x32\x0f.grpclient.Goal\x12(\n\x0flong_term_goals\x18\x03 \x03(\x0b\x32\x0f.grpclient.Goal"\\\n\x04Goal\x12\x11\n\ttimeframe\x18\x01 \x01(\t\x12\x12\n\ngoal_title\x18\x02 \x01(\t\x12\x13\n\x0b\x64\x65scription\x18\x03 \x01(\t\x12\x18\n\x10specific_actions\x18\x04 \x03(\t"`\n\rInterventions\x12\x18\n\x10\x64\x61ily_activities\x18\x01 \x03(\t\x12\x19\n\x11weekly_activities\x18\x02 \x03(\t\x12\x1a\n\x12monthly_activities\x18\x03 \x03(\t"K\n\rSuccessMetric\x12\x0e\n\x06metric\x18\x01 \x01(\t\x12\x0e\n\x06target\x18\x02 \x01(\t\x12\x1a\n\x12measurement_method\x18\x03 \x01(\t"B\n\nRiskFactor\x12\x0c\n\x04risk\x18\x01 \x01(\t\x12\x12\n\nmitigation\x18\x02 \x01(\t\x12\x12\n\nrisk_level\x18\x03 \x01(\t"3\n\x0bSupportRole\x12\x0c\n\x04role\x18\x01 \x01(\t\x12\x16\n\x0eresponsibility\x18\x02 \x01(\t"S\n\x0eReviewSchedule\x12\r\n\x05\x64\x61ily\x18\x01 \x01(\t\x12\x0e\n\x06weekly\x18\x02 \x01(\t\x12\x0f\n\x07monthly\x18\x03 \x01(\t\x12\x11\n\tquarterly\x18\x04 \x01(\t">\n\x12TransitionCriteria\x12\x12\n\nnext_level\x18\x01 \x01(\x05\x12\x14\n\x0crequirements\x18\x02 \x03(\t2r\n\x0b\x43\x61rePlanner\x12\x63\n\x10GenerateCarePlan\x12&.grpclient.PersonalizedCarePlanRequest\x1a\'.grpclient.PersonalizedCarePlanResponseB\x16Z\x14maicare_go/grpclientb\x06proto3'
+    b'\n\rservice.proto\x12\tgrpclient"\xf7\x01\n\x1bPersonalizedCarePlanRequest\x12*\n\x0b\x63lient_data\x18\x02 \x01(\x0b\x32\x15.grpclient.ClientData\x12Y\n\x12\x64omain_definitions\x18\x03 \x03(\x0b\x32=.grpclient.PersonalizedCarePlanRequest.DomainDefinitionsEntry\x1aQ\n\x16\x44omainDefinitionsEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12&\n\x05value\x18\x02 \x01(\x0b\x32\x17.grpclient.DomainLevels:\x02\x38\x01"\x93\x01\n\nClientData\x12\x0b\n\x03\x61ge\x18\x01 \x01(\x05\x12\x18\n\x10living_situation\x18\x02 \x01(\t\x12\x17\n\x0f\x65\x64ucation_level\x18\x03 \x01(\t\x12\x13\n\x0b\x64omain_name\x18\x04 \x01(\t\x12\x15\n\rcurrent_level\x18\x05 \x01(\x05\x12\x19\n\x11level_description\x18\x06 \x01(\t"r\n\x0c\x44omainLevels\x12\x33\n\x06levels\x18\x01 \x03(\x0b\x32#.grpclient.DomainLevels.LevelsEntry\x1a-\n\x0bLevelsEntry\x12\x0b\n\x03key\x18\x01 \x01(\x05\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01"\x94\x04\n\x1cPersonalizedCarePlanResponse\x12\x30\n\x0e\x63lient_profile\x18\x01 \x01(\x0b\x32\x18.grpclient.ClientProfile\x12\x1a\n\x12\x61ssessment_summary\x18\x02 \x01(\t\x12;\n\x14\x63\x61re_plan_objectives\x18\x03 \x01(\x0b\x32\x1d.grpclient.CarePlanObjectives\x12/\n\rinterventions\x18\x04 \x01(\x0b\x32\x18.grpclient.Interventions\x12\x1a\n\x12resources_required\x18\x05 \x03(\t\x12\x31\n\x0fsuccess_metrics\x18\x06 \x03(\x0b\x32\x18.grpclient.SuccessMetric\x12+\n\x0crisk_factors\x18\x07 \x03(\x0b\x32\x15.grpclient.RiskFactor\x12/\n\x0fsupport_network\x18\x08 \x03(\x0b\x32\x16.grpclient.SupportRole\x12\x32\n\x0freview_schedule\x18\t \x01(\x0b\x32\x19.grpclient.ReviewSchedule\x12\x1b\n\x13\x65mergency_protocols\x18\n \x03(\t\x12:\n\x13transition_criteria\x18\x0b \x01(\x0b\x32\x1d.grpclient.TransitionCriteria"\x9c\x01\n\rClientProfile\x12\x0b\n\x03\x61ge\x18\x01 \x01(\x05\x12\x18\n\x10living_situation\x18\x02 \x01(\t\x12\x17\n\x0f\x65\x64ucation_level\x18\x03 \x01(\t\x12\x19\n\x11\x61ssessment_domain\x18\x04 \x01(\t\x12\x15\n\rcurrent_level\x18\x05 \x01(\x05\x12\x19\n\x11level_description\x18\x06 \x01(\t"\x95\x01\n\x12\x43\x61rePlanObjectives\x12)\n\x10short_term_goals\x18\x01 \x03(\x0b\x32\x0f.grpclient.Goal\x12*\n\x11medium_term_goals\x18\x02 \x03(\x0b\x32\x0f.grpclient.Goal\x12(\n\x0flong_term_goals\x18\x03 \x03(\x0b\x32\x0f.grpclient.Goal"\\\n\x04Goal\x12\x11\n\ttimeframe\x18\x01 \x01(\t\x12\x12\n\ngoal_title\x18\x02 \x01(\t\x12\x13\n\x0b\x64\x65scription\x18\x03 \x01(\t\x12\x18\n\x10specific_actions\x18\x04 \x03(\t"`\n\rInterventions\x12\x18\n\x10\x64\x61ily_activities\x18\x01 \x03(\t\x12\x19\n\x11weekly_activities\x18\x02 \x03(\t\x12\x1a\n\x12monthly_activities\x18\x03 \x03(\t"K\n\rSuccessMetric\x12\x0e\n\x06metric\x18\x01 \x01(\t\x12\x0e\n\x06target\x18\x02 \x01(\t\x12\x1a\n\x12measurement_method\x18\x03 \x01(\t"B\n\nRiskFactor\x12\x0c\n\x04risk\x18\x01 \x01(\t\x12\x12\n\nmitigation\x18\x02 \x01(\t\x12\x12\n\nrisk_level\x18\x03 \x01(\t"3\n\x0bSupportRole\x12\x0c\n\x04role\x18\x01 \x01(\t\x12\x16\n\x0eresponsibility\x18\x02 \x01(\t"S\n\x0eReviewSchedule\x12\r\n\x05\x64\x61ily\x18\x01 \x01(\t\x12\x0e\n\x06weekly\x18\x02 \x01(\t\x12\x0f\n\x07monthly\x18\x03 \x01(\t\x12\x11\n\tquarterly\x18\x04 \x01(\t">\n\x12TransitionCriteria\x12\x12\n\nnext_level\x18\x01 \x01(\x05\x12\x14\n\x0crequirements\x18\x02 \x03(\t"^\n\x0f\x43\x61rePlanSection\x12\x0f\n\x07section\x18\x01 \x01(\t\x12:\n\tcare_plan\x18\x02 \x01(\x0b\x32\'.grpclient.PersonalizedCarePlanResponse2\xca\x01\n\x0b\x43\x61rePlanner\x12\x63\n\x10GenerateCarePlan\x12&.grpclient.PersonalizedCarePlanRequest\x1a\'.grpclient.PersonalizedCarePlanResponse\x12V\n\x0eStreamCarePlan\x12&.grpclient.PersonalizedCarePlanRequest\x1a\x1a.grpclient.CarePlanSection0\x01\x42\x16Z\x14maicare_go/grpclientb\x06proto3'
 )
 
 _globals = globals()
@@ -71,6 +71,8 @@ if not _descriptor._USE_C_DESCRIPTORS:
     _globals["_REVIEWSCHEDULE"]._serialized_end = 1863
     _globals["_TRANSITIONCRITERIA"]._serialized_start = 1865
     _globals["_TRANSITIONCRITERIA"]._serialized_end = 1927
-    _globals["_CAREPLANNER"]._serialized_start = 1929
-    _globals["_CAREPLANNER"]._serialized_end = 2043
+    _globals["_CAREPLANSECTION"]._serialized_start = 1929
+    _globals["_CAREPLANSECTION"]._serialized_end = 2023
+    _globals["_CAREPLANNER"]._serialized_start = 2026
+    _globals["_CAREPLANNER"]._serialized_end = 2228
 # @@protoc_insertion_point(module_scope)
@@ -276,3 +276,15 @@ class TransitionCriteria(_message.Message):
         next_level: _Optional[int] = ...,
         requirements: _Optional[_Iterable[str]] = ...,
     ) -> None: ...
+
+class CarePlanSection(_message.Message):
+    __slots__ = ("section", "care_plan")
+    SECTION_FIELD_NUMBER: _ClassVar[int]
+    CARE_PLAN_FIELD_NUMBER: _ClassVar[int]
+    section: str
+    care_plan: PersonalizedCarePlanResponse
+    def __init__(
+        self,
+        section: _Optional[str] = ...,
+        care_plan: _Optional[_Union[PersonalizedCarePlanResponse, _Mapping]] = ...,
+    ) -> None: ...
@@ -48,6 +48,12 @@ class CarePlannerStub(object):
             response_deserializer=service__pb2.PersonalizedCarePlanResponse.FromString,
             _registered_method=True,
         )
+        self.StreamCarePlan = channel.unary_stream(
+            "/grpclient.CarePlanner/StreamCarePlan",
+            request_serializer=service__pb2.PersonalizedCarePlanRequest.SerializeToString,
+            response_deserializer=service__pb2.CarePlanSection.FromString,
+            _registered_method=True,
+        )
 
 
 class CarePlannerServicer(object):
@@ -63,6 +69,12 @@ class CarePlannerServicer(object):
         context.set_details("Method not implemented!")
         raise NotImplementedError("Method not implemented!")
 
+    def StreamCarePlan(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details("Method not implemented!")
+        raise NotImplementedError("Method not implemented!")
+
 
 def add_CarePlannerServicer_to_server(servicer, server):
     rpc_method_handlers = {
@@ -71,6 +83,11 @@ def add_CarePlannerServicer_to_server(servicer, server):
             request_deserializer=service__pb2.PersonalizedCarePlanRequest.FromString,
             response_serializer=service__pb2.PersonalizedCarePlanResponse.SerializeToString,
         ),
+        "StreamCarePlan": grpc.unary_stream_rpc_method_handler(
+            servicer.StreamCarePlan,
+            request_deserializer=service__pb2.PersonalizedCarePlanRequest.FromString,
+            response_serializer=service__pb2.CarePlanSection.SerializeToString,
+        ),
     }
     generic_handler = grpc.method_handlers_generic_handler(
         "grpclient.CarePlanner", rpc_method_handlers
@@ -116,3 +133,33 @@ class CarePlanner(object):
             metadata,
             _registered_method=True,
         )
+
+    @staticmethod
+    def StreamCarePlan(
+        request,
+        target,
+        options=(),
+        channel_credentials=None,
+        call_credentials=None,
+        insecure=False,
+        compression=None,
+        wait_for_ready=None,
+        timeout=None,
+        metadata=None,
+    ):
+        return grpc.experimental.unary_stream(
+            request,
+            target,
+            "/grpclient.CarePlanner/StreamCarePlan",
+            service__pb2.PersonalizedCarePlanRequest.SerializeToString,
+            service__pb2.CarePlanSection.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True,
+        )
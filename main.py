@@ -1,4 +1,5 @@
 # server.py
+import asyncio
 import logging
 import os
 import grpc
@@ -11,18 +12,27 @@ import generated.service_pb2_grpc as care_planner_pb2_grpc
 import generated.spelling_service_pb2_grpc as spelling_service_pb2_grpc
 import generated.reports_service_pb2_grpc as reports_service_pb2_grpc
 import generated.schedule_service_pb2_grpc as schedule_service_pb2_grpc
+import generated.pdf_service_pb2_grpc as pdf_service_pb2_grpc
 
 # Import from new API layer
-from src.api.care_planner import CarePlannerServicer
-from src.api.reports import AutoReportGeneratorServicer
-from src.api.spelling_check import SpellingCheckServicer
-from src.api.schedule import ScheduleServicer
+from src.api.care_planner import AsyncCarePlannerServicer, CarePlannerServicer
+from src.api.reports import (
+    AsyncAutoReportGeneratorServicer,
+    AutoReportGeneratorServicer,
+)
+from src.api.spelling_check import AsyncSpellingCheckServicer, SpellingCheckServicer
+from src.api.schedule import AsyncScheduleServicer, ScheduleServicer
+from src.api.pdf import AsyncPdfServicer, PdfServicer
 
 # Import DI modules
 from src.di.app_module import AppModule, ServiceModule
 
 # Import logging config first
+from src.core.http_transport import HttpTransport
 from src.core.logging import get_logger
+from src.core.process_supervisor import ProcessSupervisor
+from src.services.pdf.pool import PdfRenderPool
+from src.services.schedule.pool import SolverPool
 
 injector = Injector([AppModule(), ServiceModule()])
 # Set up logging before importing other modules
@@ -37,7 +47,33 @@ logger: logging.Logger = injector.get(logging.Logger)
 logger = get_logger(__name__)
 
 
-def serve(port=50051, max_workers=4):
+SERVER_OPTIONS = [
+    ("grpc.keepalive_time_ms", 30000),
+    ("grpc.keepalive_timeout_ms", 5000),
+    ("grpc.keepalive_permit_without_calls", True),
+    ("grpc.http2.max_pings_without_data", 0),
+    ("grpc.http2.min_time_between_pings_ms", 10000),
+    ("grpc.http2.min_ping_interval_without_data_ms", 300000),
+]
+
+
+def register_servicers(server, care_planner, spelling, auto_report, schedule, pdf):
+    """Attach the servicers to a sync or aio gRPC server"""
+    care_planner_pb2_grpc.add_CarePlannerServicer_to_server(care_planner, server)
+    spelling_service_pb2_grpc.add_SpellingCorrectionServicer_to_server(spelling, server)
+    reports_service_pb2_grpc.add_ReportGeneratorServicer_to_server(auto_report, server)
+    schedule_service_pb2_grpc.add_ScheduleServiceServicer_to_server(schedule, server)
+    pdf_service_pb2_grpc.add_PdfServiceServicer_to_server(pdf, server)
+
+
+def server_options(reuse_port=False):
+    """Channel arguments for the server, optionally with SO_REUSEPORT enabled"""
+    if reuse_port:
+        return SERVER_OPTIONS + [("grpc.so_reuseport", 1)]
+    return SERVER_OPTIONS
+
+
+def serve(port=50051, max_workers=4, reuse_port=False):
     """Start the gRPC server"""
     logger.info(f"Starting server with {max_workers} workers on port {port}")
 
@@ -48,30 +84,20 @@ def serve(port=50051, max_workers=4):
     spelling_servicer = injector.get(SpellingCheckServicer)
     auto_report_servicer = injector.get(AutoReportGeneratorServicer)
     schedule_servicer = injector.get(ScheduleServicer)
+    pdf_servicer = injector.get(PdfServicer)
 
     server: grpc.Server = grpc.server(
         futures.ThreadPoolExecutor(max_workers=max_workers),
-        options=[
-            ("grpc.keepalive_time_ms", 30000),
-            ("grpc.keepalive_timeout_ms", 5000),
-            ("grpc.keepalive_permit_without_calls", True),
-            ("grpc.http2.max_pings_without_data", 0),
-            ("grpc.http2.min_time_between_pings_ms", 10000),
-            ("grpc.http2.min_ping_interval_without_data_ms", 300000),
-        ],
+        options=server_options(reuse_port),
     )
 
-    care_planner_pb2_grpc.add_CarePlannerServicer_to_server(
-        care_planner_servicer, server
-    )
-    spelling_service_pb2_grpc.add_SpellingCorrectionServicer_to_server(
-        spelling_servicer, server
-    )
-    reports_service_pb2_grpc.add_ReportGeneratorServicer_to_server(
-        auto_report_servicer, server
-    )
-    schedule_service_pb2_grpc.add_ScheduleServiceServicer_to_server(
-        schedule_servicer, server
+    register_servicers(
+        server,
+        care_planner_servicer,
+        spelling_servicer,
+        auto_report_servicer,
+        schedule_servicer,
+        pdf_servicer,
     )
 
     try:
@@ -85,7 +111,10 @@ def serve(port=50051, max_workers=4):
 
     def signal_handler(signum, frame):
         logger.info("🛑 Received shutdown signal, gracefully stopping...")
-        server.stop(grace=30)  # 30 second grace period
+        server.stop(grace=30).wait()  # 30 second grace period
+        injector.get(HttpTransport).close()
+        injector.get(SolverPool).close()
+        injector.get(PdfRenderPool).close()
         logger.info("🛑 Server stopped")
         sys.exit(0)
 
@@ -101,12 +130,103 @@ def serve(port=50051, max_workers=4):
         logger.info("🛑 Server stopped")
 
 
+async def serve_aio(port=50051, max_workers=4, reuse_port=False):
+    """
+    Start the gRPC server on grpc.aio.
+
+    LLM-bound RPCs are awaited on the event loop, so concurrency is no longer
+    capped by the thread count. max_workers only sizes the executor used for
+    CPU-bound work such as CP-SAT solving.
+    """
+    logger.info(
+        f"Starting asyncio server with {max_workers} executor workers on port {port}"
+    )
+
+    loop = asyncio.get_running_loop()
+    loop.set_default_executor(futures.ThreadPoolExecutor(max_workers=max_workers))
+
+    server = grpc.aio.server(options=server_options(reuse_port))
+
+    register_servicers(
+        server,
+        injector.get(AsyncCarePlannerServicer),
+        injector.get(AsyncSpellingCheckServicer),
+        injector.get(AsyncAutoReportGeneratorServicer),
+        injector.get(AsyncScheduleServicer),
+        injector.get(AsyncPdfServicer),
+    )
+
+    try:
+        listen_address = f"[::]:{port}"
+        server.add_insecure_port(listen_address)
+        await server.start()
+        logger.info(f"✅ Asyncio server started successfully on {listen_address}")
+    except Exception as e:
+        logger.error(f"❌ Failed to start server: {e}", exc_info=True)
+        return
+
+    async def shutdown():
+        logger.info("🛑 Received shutdown signal, gracefully stopping...")
+        await server.stop(grace=30)  # 30 second grace period
+        logger.info("🛑 Server stopped")
+
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, lambda: asyncio.ensure_future(shutdown()))
+
+    logger.info("Server waiting for requests...")
+    await server.wait_for_termination()
+    injector.get(HttpTransport).close()
+    injector.get(SolverPool).close()
+    injector.get(PdfRenderPool).close()
+
+
+def run_worker(port, max_workers, server_mode):
+    """Entry point of a supervised worker process"""
+    if server_mode == "aio":
+        asyncio.run(serve_aio(port=port, max_workers=max_workers, reuse_port=True))
+    else:
+        serve(port=port, max_workers=max_workers, reuse_port=True)
+
+
+def serve_prefork(port=50051, max_workers=4, server_mode="thread", processes=2):
+    """
+    Run one server per worker process, all bound to the same port.
+
+    The supervisor restarts crashed workers and forwards SIGTERM so every
+    worker drains its in-flight RPCs before the container stops.
+    """
+    logger.info(f"Starting {processes} {server_mode} worker processes on port {port}")
+    supervisor = ProcessSupervisor(
+        target=run_worker,
+        num_workers=processes,
+        logger=logger,
+        args=(port, max_workers, server_mode),
+    )
+    supervisor.run()
+
+
 if __name__ == "__main__":
     # You can also pass these as command line arguments
     port = int(os.getenv("PORT", 50051))
-    max_workers = int(os.getenv("MAX_WORKERS", 10))
+    max_workers = config.grpc_max_workers
+    # "thread" (default) or "aio"
+    server_mode = os.getenv("SERVER_MODE", "thread").lower()
+    # 1 runs in-process, 0 starts one worker per CPU core
+    processes = int(os.getenv("WORKER_PROCESSES", 1)) or os.cpu_count() or 1
 
     logger.info(f"Environment: {config.environment}")
     logger.info(f"Log Level: {config.log_level}")
 
-    serve(port=port, max_workers=max_workers)
+    logger.info(f"Server mode: {server_mode}")
+
+    if processes > 1:
+        serve_prefork(
+            port=port,
+            max_workers=max_workers,
+            server_mode=server_mode,
+            processes=processes,
+        )
+    elif server_mode == "aio":
+        asyncio.run(serve_aio(port=port, max_workers=max_workers))
+    else:
+        serve(port=port, max_workers=max_workers)
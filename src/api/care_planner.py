@@ -5,13 +5,14 @@ Migrated from: care_planner/planner.py
 """
 
 from logging import Logger
+from typing import Any
 import grpc
 from injector import inject
 import generated.service_pb2 as pb2
 import generated.service_pb2_grpc as pb2_grpc
 
 from src.services.care_planner.planner import CarePlannerService
-from src.services.care_planner.schemas import LLMPersonalizedCarePlanResponse
+from src.services.care_planner.schemas import Goal, LLMPersonalizedCarePlanResponse
 
 
 class CarePlannerServicer(pb2_grpc.CarePlannerServicer):
@@ -61,6 +62,36 @@ class CarePlannerServicer(pb2_grpc.CarePlannerServicer):
             context.set_details(f"Failed to generate care plan: {str(e)}")
             raise
 
+    def StreamCarePlan(self, request: pb2.PersonalizedCarePlanRequest, context):
+        """
+        Handle gRPC StreamCarePlan request.
+
+        Sends each top-level care plan section as soon as the LLM has
+        finished writing it and it has been validated.
+
+        Args:
+            request: PersonalizedCarePlanRequest protobuf message
+            context: gRPC context
+
+        Yields:
+            CarePlanSection protobuf messages
+        """
+        self.logger.info("Received StreamCarePlan request")
+
+        try:
+            input_data = self._map_request_to_domain(request)
+
+            for name, value in self.business_service.stream_care_plan(input_data):
+                yield self._map_section_to_message(name, value)
+
+            self.logger.info("Care plan streamed successfully")
+
+        except Exception as e:
+            self.logger.error(f"Error in StreamCarePlan: {e}")
+            context.set_code(grpc.StatusCode.INTERNAL)
+            context.set_details(f"Failed to stream care plan: {str(e)}")
+            raise
+
     def _map_request_to_domain(self, request: pb2.PersonalizedCarePlanRequest) -> dict:
         """
         Map protobuf request to domain model.
@@ -99,79 +130,181 @@ class CarePlannerServicer(pb2_grpc.CarePlannerServicer):
             Protobuf response message
         """
         return pb2.PersonalizedCarePlanResponse(
-            client_profile=pb2.ClientProfile(
-                age=care_plan.client_profile.age,
-                living_situation=care_plan.client_profile.living_situation,
-                education_level=care_plan.client_profile.education_level,
-                assessment_domain=care_plan.client_profile.assessment_domain,
-                current_level=care_plan.client_profile.current_level,
-                level_description=care_plan.client_profile.level_description,
-            ),
-            assessment_summary=care_plan.assessment_summary,
-            care_plan_objectives=pb2.CarePlanObjectives(
+            **{
+                name: self._map_section(name, getattr(care_plan, name))
+                for name in LLMPersonalizedCarePlanResponse.model_fields
+            }
+        )
+
+    def _map_section(self, name: str, value: Any) -> Any:
+        """
+        Map one top-level care plan section to its protobuf field value.
+
+        Args:
+            name: Field name on LLMPersonalizedCarePlanResponse
+            value: Validated section value
+
+        Returns:
+            Value accepted by the matching PersonalizedCarePlanResponse field
+        """
+        if name == "client_profile":
+            return pb2.ClientProfile(
+                age=value.age,
+                living_situation=value.living_situation,
+                education_level=value.education_level,
+                assessment_domain=value.assessment_domain,
+                current_level=value.current_level,
+                level_description=value.level_description,
+            )
+        if name == "care_plan_objectives":
+            return pb2.CarePlanObjectives(
                 short_term_goals=[
-                    pb2.Goal(
-                        timeframe=goal.timeframe,
-                        goal_title=goal.goal_title,
-                        description=goal.description,
-                        specific_actions=goal.specific_actions,
-                    )
-                    for goal in care_plan.care_plan_objectives.short_term_goals
+                    self._map_goal(goal) for goal in value.short_term_goals
                 ],
                 medium_term_goals=[
-                    pb2.Goal(
-                        timeframe=goal.timeframe,
-                        goal_title=goal.goal_title,
-                        description=goal.description,
-                        specific_actions=goal.specific_actions,
-                    )
-                    for goal in care_plan.care_plan_objectives.medium_term_goals
+                    self._map_goal(goal) for goal in value.medium_term_goals
                 ],
                 long_term_goals=[
-                    pb2.Goal(
-                        timeframe=goal.timeframe,
-                        goal_title=goal.goal_title,
-                        description=goal.description,
-                        specific_actions=goal.specific_actions,
-                    )
-                    for goal in care_plan.care_plan_objectives.long_term_goals
+                    self._map_goal(goal) for goal in value.long_term_goals
                 ],
-            ),
-            interventions=pb2.Interventions(
-                daily_activities=care_plan.interventions.daily_activities,
-                weekly_activities=care_plan.interventions.weekly_activities,
-                monthly_activities=care_plan.interventions.monthly_activities,
-            ),
-            resources_required=care_plan.resources_required,
-            success_metrics=[
+            )
+        if name == "interventions":
+            return pb2.Interventions(
+                daily_activities=value.daily_activities,
+                weekly_activities=value.weekly_activities,
+                monthly_activities=value.monthly_activities,
+            )
+        if name == "success_metrics":
+            return [
                 pb2.SuccessMetric(
                     metric=metric.metric,
                     target=metric.target,
                     measurement_method=metric.measurement_method,
                 )
-                for metric in care_plan.success_metrics
-            ],
-            risk_factors=[
+                for metric in value
+            ]
+        if name == "risk_factors":
+            return [
                 pb2.RiskFactor(
                     risk=risk.risk,
                     mitigation=risk.mitigation,
                     risk_level=risk.risk_level,
                 )
-                for risk in care_plan.risk_factors
-            ],
-            support_network=[
+                for risk in value
+            ]
+        if name == "support_network":
+            return [
                 pb2.SupportRole(role=role.role, responsibility=role.responsibility)
-                for role in care_plan.support_network
-            ],
-            review_schedule=pb2.ReviewSchedule(
-                daily=care_plan.review_schedule.daily,
-                weekly=care_plan.review_schedule.weekly,
-                monthly=care_plan.review_schedule.monthly,
-                quarterly=care_plan.review_schedule.quarterly,
-            ),
-            emergency_protocols=care_plan.emergency_protocols,
-            transition_criteria=pb2.TransitionCriteria(
-                next_level=int(care_plan.transition_criteria.next_level),
-                requirements=care_plan.transition_criteria.requirements,
+                for role in value
+            ]
+        if name == "review_schedule":
+            return pb2.ReviewSchedule(
+                daily=value.daily,
+                weekly=value.weekly,
+                monthly=value.monthly,
+                quarterly=value.quarterly,
+            )
+        if name == "transition_criteria":
+            return pb2.TransitionCriteria(
+                next_level=int(value.next_level),
+                requirements=value.requirements,
+            )
+        # assessment_summary, resources_required, emergency_protocols
+        return value
+
+    def _map_goal(self, goal: Goal) -> pb2.Goal:
+        return pb2.Goal(
+            timeframe=goal.timeframe,
+            goal_title=goal.goal_title,
+            description=goal.description,
+            specific_actions=goal.specific_actions,
+        )
+
+    def _map_section_to_message(self, name: str, value: Any) -> pb2.CarePlanSection:
+        """
+        Wrap one streamed section in a CarePlanSection message.
+
+        Args:
+            name: Field name on LLMPersonalizedCarePlanResponse
+            value: Validated section value
+
+        Returns:
+            CarePlanSection with only that field set on care_plan
+        """
+        return pb2.CarePlanSection(
+            section=name,
+            care_plan=pb2.PersonalizedCarePlanResponse(
+                **{name: self._map_section(name, value)}
             ),
         )
+
+
+class AsyncCarePlannerServicer(CarePlannerServicer):
+    """
+    grpc.aio variant of CarePlannerServicer.
+    Awaits the LLM instead of blocking a worker thread while OpenRouter responds.
+    """
+
+    async def GenerateCarePlan(
+        self,
+        request: pb2.PersonalizedCarePlanRequest,
+        context: grpc.aio.ServicerContext,
+    ):
+        """
+        Handle gRPC GenerateCarePlan request on the asyncio server.
+
+        Args:
+            request: PersonalizedCarePlanRequest protobuf message
+            context: gRPC aio context
+
+        Returns:
+            PersonalizedCarePlanResponse protobuf message
+        """
+        self.logger.info("Received GenerateCarePlan request")
+
+        try:
+            input_data = self._map_request_to_domain(request)
+            care_plan = await self.business_service.generate_care_plan_async(input_data)
+            response = self._map_domain_to_response(care_plan)
+
+            self.logger.info("Care plan generated successfully")
+            return response
+
+        except Exception as e:
+            self.logger.error(f"Error in GenerateCarePlan: {e}")
+            await context.abort(
+                grpc.StatusCode.INTERNAL, f"Failed to generate care plan: {str(e)}"
+            )
+
+    async def StreamCarePlan(
+        self,
+        request: pb2.PersonalizedCarePlanRequest,
+        context: grpc.aio.ServicerContext,
+    ):
+        """
+        Handle gRPC StreamCarePlan request on the asyncio server.
+
+        Args:
+            request: PersonalizedCarePlanRequest protobuf message
+            context: gRPC aio context
+
+        Yields:
+            CarePlanSection protobuf messages
+        """
+        self.logger.info("Received StreamCarePlan request")
+
+        try:
+            input_data = self._map_request_to_domain(request)
+
+            async for name, value in self.business_service.stream_care_plan_async(
+                input_data
+            ):
+                yield self._map_section_to_message(name, value)
+
+            self.logger.info("Care plan streamed successfully")
+
+        except Exception as e:
+            self.logger.error(f"Error in StreamCarePlan: {e}")
+            await context.abort(
+                grpc.StatusCode.INTERNAL, f"Failed to stream care plan: {str(e)}"
+            )
@@ -0,0 +1,282 @@
+"""
+PDF gRPC Service
+Thin gRPC layer for rendering documents to PDF and storing them
+"""
+
+import asyncio
+import functools
+from logging import Logger
+from typing import Any, AsyncIterator, Callable, Iterator, Type, TypeVar
+
+import grpc
+from google.protobuf import json_format
+from injector import inject
+from pydantic import BaseModel
+
+import generated.pdf_service_pb2 as pb2
+import generated.pdf_service_pb2_grpc as pb2_grpc
+from src.core.exceptions import (
+    ObjectStorageError,
+    PdfGenerationError,
+    ResourceExhaustedError,
+)
+from src.services.pdf.generator import InvoiceBatchItem, PdfGeneratorService
+from src.services.pdf.schema import (
+    AppointmentCardData,
+    ContractData,
+    IncidentReportData,
+    InvoiceData,
+)
+
+SchemaT = TypeVar("SchemaT", bound=BaseModel)
+
+
+def to_schema(message: Any, schema: Type[SchemaT]) -> SchemaT:
+    """Map a request message onto the pydantic model with the same field names."""
+    return schema.model_validate(
+        json_format.MessageToDict(message, preserving_proto_field_name=True)
+    )
+
+
+def to_batch_response(item: InvoiceBatchItem) -> pb2.GenerateInvoicePdfBatchResponse:
+    """Build the stream message of one finished batch invoice."""
+    return pb2.GenerateInvoicePdfBatchResponse(
+        index=item.index,
+        id=item.invoice_id or 0,
+        pdf_file_key=item.key,
+        size=item.size,
+        error=item.error,
+    )
+
+
+class PdfServicer(pb2_grpc.PdfServiceServicer):
+    """
+    gRPC servicer for PDF generation.
+    Maps requests to document data and delegates to PdfGeneratorService.
+    """
+
+    @inject
+    def __init__(self, pdf_service: PdfGeneratorService, logger: Logger):
+        """Initialize with business service and dependencies"""
+        self.business_service = pdf_service
+        self.logger = logger
+        self.logger.info("PdfServicer initialized")
+
+    def GenerateAppointmentCardPdf(
+        self, request: pb2.GenerateAppointmentCardRequest, context
+    ):
+        key = self._generate(
+            "appointment card",
+            context,
+            self.business_service.upload_pdf,
+            to_schema(request, AppointmentCardData),
+        )
+        return pb2.GenerateAppointmentCardResponse(pdf_file_key=key)
+
+    def GenerateContractPdf(self, request: pb2.GenerateContractRequest, context):
+        key = self._generate(
+            "contract",
+            context,
+            self.business_service.upload_contract,
+            to_schema(request, ContractData),
+        )
+        return pb2.GenerateContractResponse(pdf_file_key=key)
+
+    def GenerateIncidentReportPdf(
+        self, request: pb2.GenerateIncidentReportRequest, context
+    ):
+        key = self._generate(
+            "incident report",
+            context,
+            self.business_service.upload_incident_report,
+            to_schema(request, IncidentReportData),
+        )
+        return pb2.GenerateIncidentReportResponse(pdf_file_key=key)
+
+    def GenerateInvoicePdf(self, request: pb2.GenerateInvoicePdfRequest, context):
+        key, size = self._generate(
+            "invoice",
+            context,
+            self.business_service.upload_invoice,
+            to_schema(request, InvoiceData),
+        )
+        return pb2.GenerateInvoicePdfResponse(pdf_file_key=key, size=size)
+
+    def GenerateInvoicePdfBatch(
+        self, request_iterator: Iterator[pb2.GenerateInvoicePdfRequest], context
+    ):
+        """Stream back each invoice of the request stream as it is stored."""
+        self.logger.info("Received invoice PDF batch")
+        parse = functools.partial(to_schema, schema=InvoiceData)
+        total = failed = 0
+        for item in self.business_service.upload_invoices(request_iterator, parse):
+            total += 1
+            failed += bool(item.error)
+            yield to_batch_response(item)
+        self.logger.info(f"Invoice PDF batch done: {total} invoices, {failed} failed")
+
+    def _generate(
+        self, document: str, context, upload: Callable[[Any], Any], data: BaseModel
+    ) -> Any:
+        """Run one upload, mapping service errors onto gRPC status codes."""
+        self.logger.info(f"Received {document} PDF request")
+        try:
+            return upload(data)
+        except PdfGenerationError as e:
+            self.logger.error(f"Error generating {document} PDF: {e}")
+            context.set_code(grpc.StatusCode.INTERNAL)
+            context.set_details(e.message)
+            raise
+        except ResourceExhaustedError as e:
+            self.logger.warning(f"Rejected {document} PDF request: {e.message}")
+            context.set_code(grpc.StatusCode.RESOURCE_EXHAUSTED)
+            context.set_details(e.message)
+            raise
+        except ObjectStorageError as e:
+            self.logger.error(f"Error storing {document} PDF: {e}")
+            context.set_code(grpc.StatusCode.UNAVAILABLE)
+            context.set_details(e.message)
+            raise
+        except Exception as e:
+            self.logger.error(f"Error in {document} PDF request: {e}")
+            context.set_code(grpc.StatusCode.INTERNAL)
+            context.set_details(f"Failed to generate {document} PDF: {str(e)}")
+            raise
+
+
+class AsyncPdfServicer(PdfServicer):
+    """
+    grpc.aio variant of PdfServicer.
+    Rendering is CPU-bound and uploading blocks, so both run on the loop's
+    default executor instead of the event loop.
+    """
+
+    async def GenerateAppointmentCardPdf(
+        self,
+        request: pb2.GenerateAppointmentCardRequest,
+        context: grpc.aio.ServicerContext,
+    ):
+        key = await self._generate_async(
+            "appointment card",
+            context,
+            self.business_service.upload_pdf,
+            to_schema(request, AppointmentCardData),
+        )
+        return pb2.GenerateAppointmentCardResponse(pdf_file_key=key)
+
+    async def GenerateContractPdf(
+        self, request: pb2.GenerateContractRequest, context: grpc.aio.ServicerContext
+    ):
+        key = await self._generate_async(
+            "contract",
+            context,
+            self.business_service.upload_contract,
+            to_schema(request, ContractData),
+        )
+        return pb2.GenerateContractResponse(pdf_file_key=key)
+
+    async def GenerateIncidentReportPdf(
+        self,
+        request: pb2.GenerateIncidentReportRequest,
+        context: grpc.aio.ServicerContext,
+    ):
+        key = await self._generate_async(
+            "incident report",
+            context,
+            self.business_service.upload_incident_report,
+            to_schema(request, IncidentReportData),
+        )
+        return pb2.GenerateIncidentReportResponse(pdf_file_key=key)
+
+    async def GenerateInvoicePdf(
+        self, request: pb2.GenerateInvoicePdfRequest, context: grpc.aio.ServicerContext
+    ):
+        key, size = await self._generate_async(
+            "invoice",
+            context,
+            self.business_service.upload_invoice,
+            to_schema(request, InvoiceData),
+        )
+        return pb2.GenerateInvoicePdfResponse(pdf_file_key=key, size=size)
+
+    async def GenerateInvoicePdfBatch(
+        self,
+        request_iterator: AsyncIterator[pb2.GenerateInvoicePdfRequest],
+        context: grpc.aio.ServicerContext,
+    ):
+        """Stream back each invoice of the request stream as it is stored."""
+        self.logger.info("Received invoice PDF batch")
+        loop = asyncio.get_running_loop()
+        slots = asyncio.Semaphore(self.business_service.batch_concurrency)
+        results: asyncio.Queue = asyncio.Queue()
+        parse = functools.partial(to_schema, schema=InvoiceData)
+        tasks = []
+
+        async def run(index: int, request: pb2.GenerateInvoicePdfRequest) -> None:
+            try:
+                item = await loop.run_in_executor(
+                    None,
+                    functools.partial(
+                        self.business_service.upload_invoice_item,
+                        index,
+                        request,
+                        parse,
+                    ),
+                )
+            finally:
+                slots.release()
+            await results.put(item)
+
+        async def read() -> None:
+            # Reading runs beside the response loop so a client that waits
+            # for results before sending more requests does not stall
+            try:
+                async for request in request_iterator:
+                    await slots.acquire()
+                    tasks.append(asyncio.ensure_future(run(len(tasks), request)))
+                await asyncio.gather(*tasks)
+            finally:
+                await results.put(None)
+
+        reader = asyncio.ensure_future(read())
+        total = failed = 0
+        try:
+            while (item := await results.get()) is not None:
+                total += 1
+                failed += bool(item.error)
+                yield to_batch_response(item)
+            await reader
+        finally:
+            # Stop reading if the consumer went away; uploads already on the
+            # executor still run to completion
+            reader.cancel()
+            for task in tasks:
+                task.cancel()
+        self.logger.info(f"Invoice PDF batch done: {total} invoices, {failed} failed")
+
+    async def _generate_async(
+        self,
+        document: str,
+        context: grpc.aio.ServicerContext,
+        upload: Callable[[Any], Any],
+        data: BaseModel,
+    ) -> Any:
+        """Run one upload on the executor, aborting with a gRPC status on errors."""
+        self.logger.info(f"Received {document} PDF request")
+        loop = asyncio.get_running_loop()
+        try:
+            return await loop.run_in_executor(None, functools.partial(upload, data))
+        except PdfGenerationError as e:
+            self.logger.error(f"Error generating {document} PDF: {e}")
+            await context.abort(grpc.StatusCode.INTERNAL, e.message)
+        except ResourceExhaustedError as e:
+            self.logger.warning(f"Rejected {document} PDF request: {e.message}")
+            await context.abort(grpc.StatusCode.RESOURCE_EXHAUSTED, e.message)
+        except ObjectStorageError as e:
+            self.logger.error(f"Error storing {document} PDF: {e}")
+            await context.abort(grpc.StatusCode.UNAVAILABLE, e.message)
+        except Exception as e:
+            self.logger.error(f"Error in {document} PDF request: {e}")
+            await context.abort(
+                grpc.StatusCode.INTERNAL, f"Failed to generate {document} PDF: {str(e)}"
+            )
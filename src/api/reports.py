@@ -35,3 +35,24 @@ class AutoReportGeneratorServicer(reports_service_pb2_grpc.ReportGeneratorServic
             context.set_code(grpc.StatusCode.INTERNAL)
             context.set_details(f"Failed to generate report: {str(e)}")
             raise
+
+
+class AsyncAutoReportGeneratorServicer(AutoReportGeneratorServicer):
+    async def GenerateAutoReport(self, request, context: grpc.aio.ServicerContext):
+        self.logger.info("Received GenerateAutoReport request")
+        try:
+            domain_request = GenerateAutoReportRequest(text=request.text)
+
+            response = await self.generator_service.generate_report_async(
+                domain_request
+            )
+            self.logger.info("Report generated successfully")
+
+            from generated import reports_service_pb2
+
+            return reports_service_pb2.GeneratedReports(report=response.report)
+        except Exception as e:
+            self.logger.error(f"Error generating report: {e}")
+            await context.abort(
+                grpc.StatusCode.INTERNAL, f"Failed to generate report: {str(e)}"
+            )
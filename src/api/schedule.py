@@ -3,6 +3,8 @@ Schedule gRPC Service
 Thin gRPC layer for employee shift scheduling
 """
 
+import asyncio
+from concurrent import futures
 from logging import Logger
 from datetime import datetime
 import uuid
@@ -11,11 +13,20 @@ from injector import inject
 import generated.schedule_service_pb2 as pb2
 import generated.schedule_service_pb2_grpc as pb2_grpc
 
+from src.core.exceptions import (
+    InfeasibleScheduleError,
+    ResourceExhaustedError,
+    ValidationError,
+)
 from src.services.schedule.service import ScheduleService
 from src.services.schedule.schema import (
     EmployeeSchema,
+    HorizonScheduleSchema,
+    LocationSchema,
+    PreviousAssignmentSchema,
     ShiftSchema,
     ScheduleResponseSchema,
+    ScheduleUpdateSchema,
 )
 
 
@@ -49,15 +60,18 @@ class ScheduleServicer(pb2_grpc.ScheduleServiceServicer):
 
         try:
             # Map protobuf request to domain models
-            employees = self._map_employees_to_domain(request.employees)
-            shifts = self._map_shifts_to_domain(request.shifts)
+            schedule_input = self._map_request_to_domain(request)
 
-            # Delegate to business service
-            schedule_result = self.business_service.generate_schedule(
-                employees=employees, shifts=shifts, week=request.week, year=request.year
+            # Delegate to business service; the solve runs in the solver pool,
+            # ends before the client deadline and stops if the client leaves
+            job = self.business_service.submit_schedule_proto(
+                **schedule_input, time_remaining=context.time_remaining()
             )
+            if not context.add_callback(job.cancel):
+                job.cancel()
+            response = job.result()
 
-            if schedule_result is None:
+            if response is None:
                 self.logger.warning("No feasible schedule found")
                 context.set_code(grpc.StatusCode.NOT_FOUND)
                 context.set_details(
@@ -65,23 +79,210 @@ class ScheduleServicer(pb2_grpc.ScheduleServiceServicer):
                 )
                 raise grpc.RpcError("No feasible schedule found")
 
-            # Map domain model to protobuf response
-            response = self._map_domain_to_response(schedule_result)
-
             self.logger.info(
-                f"Schedule generated successfully with status: {schedule_result.status}"
+                f"Schedule generated successfully with status: {response.status}"
             )
             return response
 
         except grpc.RpcError:
             # Re-raise gRPC errors as-is
             raise
+        except ValidationError as e:
+            self.logger.warning(f"Invalid GenerateSchedule request: {e}")
+            context.set_code(grpc.StatusCode.INVALID_ARGUMENT)
+            context.set_details(e.message)
+            raise
+        except InfeasibleScheduleError as e:
+            self.logger.warning(f"Infeasible GenerateSchedule request: {e.message}")
+            context.set_code(grpc.StatusCode.FAILED_PRECONDITION)
+            context.set_details(e.message)
+            raise
+        except ResourceExhaustedError as e:
+            self.logger.warning(f"Rejected GenerateSchedule request: {e.message}")
+            context.set_code(grpc.StatusCode.RESOURCE_EXHAUSTED)
+            context.set_details(e.message)
+            raise
+        except futures.CancelledError:
+            self.logger.info("GenerateSchedule cancelled before solving")
+            context.set_code(grpc.StatusCode.CANCELLED)
+            context.set_details("Schedule request was cancelled before solving")
+            raise
         except Exception as e:
             self.logger.error(f"Error in GenerateSchedule: {e}")
             context.set_code(grpc.StatusCode.INTERNAL)
             context.set_details(f"Failed to generate schedule: {str(e)}")
             raise
 
+    def StreamSchedule(self, request: pb2.GenerateScheduleRequest, context):
+        """
+        Handle gRPC StreamSchedule request.
+
+        Sends every improving solution as CP-SAT finds it, followed by the
+        final result. Cancelling the call stops the solver immediately.
+
+        Args:
+            request: GenerateScheduleRequest protobuf message
+            context: gRPC context
+
+        Yields:
+            ScheduleUpdate protobuf messages
+        """
+        self.logger.info(
+            f"Received StreamSchedule request for week {request.week}, year {request.year}"
+        )
+
+        try:
+            schedule_input = self._map_request_to_domain(request)
+            stream = self.business_service.stream_schedule(
+                **schedule_input, time_remaining=context.time_remaining()
+            )
+            context.add_callback(stream.cancel)
+
+            final = None
+            for update in stream:
+                final = update if update.final else None
+                yield self._map_update_to_message(update)
+
+            if final is None:
+                self.logger.warning("No feasible schedule found")
+                context.set_code(grpc.StatusCode.NOT_FOUND)
+                context.set_details(
+                    "No feasible schedule could be generated with the given constraints"
+                )
+                raise grpc.RpcError("No feasible schedule found")
+
+            self.logger.info(
+                f"Schedule streamed successfully with status: {final.schedule.status}"
+            )
+
+        except grpc.RpcError:
+            raise
+        except ValidationError as e:
+            self.logger.warning(f"Invalid StreamSchedule request: {e}")
+            context.set_code(grpc.StatusCode.INVALID_ARGUMENT)
+            context.set_details(e.message)
+            raise
+        except InfeasibleScheduleError as e:
+            self.logger.warning(f"Infeasible StreamSchedule request: {e.message}")
+            context.set_code(grpc.StatusCode.FAILED_PRECONDITION)
+            context.set_details(e.message)
+            raise
+        except ResourceExhaustedError as e:
+            self.logger.warning(f"Rejected StreamSchedule request: {e.message}")
+            context.set_code(grpc.StatusCode.RESOURCE_EXHAUSTED)
+            context.set_details(e.message)
+            raise
+        except Exception as e:
+            self.logger.error(f"Error in StreamSchedule: {e}")
+            context.set_code(grpc.StatusCode.INTERNAL)
+            context.set_details(f"Failed to stream schedule: {str(e)}")
+            raise
+
+    def GenerateHorizonSchedule(
+        self, request: pb2.GenerateHorizonScheduleRequest, context
+    ):
+        """
+        Handle gRPC GenerateHorizonSchedule request.
+
+        Args:
+            request: GenerateHorizonScheduleRequest protobuf message
+            context: gRPC context
+
+        Returns:
+            GenerateHorizonScheduleResponse protobuf message
+        """
+        self.logger.info(
+            f"Received GenerateHorizonSchedule request for {request.num_weeks} weeks "
+            f"from week {request.start_week}, year {request.year}"
+        )
+
+        try:
+            horizon_input = self._map_horizon_request_to_domain(request)
+            # Locations are solved in the solver pool, end before the client
+            # deadline and stop if the client leaves
+            job = self.business_service.submit_horizon_schedule(
+                **horizon_input, time_remaining=context.time_remaining()
+            )
+            if not context.add_callback(job.cancel):
+                job.cancel()
+            horizon_result = job.result()
+            return self._map_horizon_to_response(horizon_result)
+
+        except ValidationError as e:
+            self.logger.warning(f"Invalid GenerateHorizonSchedule request: {e}")
+            context.set_code(grpc.StatusCode.INVALID_ARGUMENT)
+            context.set_details(e.message)
+            raise
+        except ResourceExhaustedError as e:
+            self.logger.warning(
+                f"Rejected GenerateHorizonSchedule request: {e.message}"
+            )
+            context.set_code(grpc.StatusCode.RESOURCE_EXHAUSTED)
+            context.set_details(e.message)
+            raise
+        except futures.CancelledError:
+            self.logger.info("GenerateHorizonSchedule cancelled")
+            context.set_code(grpc.StatusCode.CANCELLED)
+            context.set_details("Horizon schedule request was cancelled")
+            raise
+        except Exception as e:
+            self.logger.error(f"Error in GenerateHorizonSchedule: {e}")
+            context.set_code(grpc.StatusCode.INTERNAL)
+            context.set_details(f"Failed to generate horizon schedule: {str(e)}")
+            raise
+
+    def _map_request_to_domain(self, request: pb2.GenerateScheduleRequest) -> dict:
+        """
+        Map protobuf request to schedule service arguments.
+
+        Args:
+            request: GenerateScheduleRequest protobuf message
+
+        Returns:
+            Keyword arguments for generate_schedule / stream_schedule
+        """
+        return {
+            "employees": self._map_employees_to_domain(request.employees),
+            "shifts": self._map_shifts_to_domain(request.shifts),
+            "week": request.week,
+            "year": request.year,
+            "solver_profile": request.solver_profile,
+            "max_solve_seconds": request.max_solve_seconds,
+            "num_workers": request.num_workers,
+            "previous_schedule": self._map_previous_schedule_to_domain(
+                request.previous_schedule
+            ),
+        }
+
+    def _map_horizon_request_to_domain(
+        self, request: pb2.GenerateHorizonScheduleRequest
+    ) -> dict:
+        """
+        Map protobuf horizon request to schedule service arguments.
+
+        Args:
+            request: GenerateHorizonScheduleRequest protobuf message
+
+        Returns:
+            Keyword arguments for generate_horizon_schedule
+        """
+        return {
+            "locations": [
+                LocationSchema(
+                    id=location.id,
+                    name=location.name,
+                    employees=self._map_employees_to_domain(location.employees),
+                    shifts=self._map_shifts_to_domain(location.shifts),
+                )
+                for location in request.locations
+            ],
+            "start_week": request.start_week,
+            "year": request.year,
+            "num_weeks": request.num_weeks,
+            "solver_profile": request.solver_profile,
+            "max_solve_seconds": request.max_solve_seconds,
+        }
+
     def _map_employees_to_domain(self, pb_employees) -> list[EmployeeSchema]:
         """
         Map protobuf Employee messages to domain EmployeeSchema.
@@ -130,6 +331,28 @@ class ScheduleServicer(pb2_grpc.ScheduleServiceServicer):
             )
         return shifts
 
+    def _map_previous_schedule_to_domain(
+        self, pb_shifts
+    ) -> list[PreviousAssignmentSchema]:
+        """
+        Flatten protobuf ScheduledShift messages into warm-start assignments.
+
+        Args:
+            pb_shifts: List of protobuf ScheduledShift messages
+
+        Returns:
+            List of PreviousAssignmentSchema objects
+        """
+        return [
+            PreviousAssignmentSchema(
+                employee_id=uuid.UUID(emp.id),
+                day_name=shift.day_name,
+                shift_id=shift.shift_id,
+            )
+            for shift in pb_shifts
+            for emp in shift.employees
+        ]
+
     def _map_domain_to_response(
         self, schedule_result: ScheduleResponseSchema
     ) -> pb2.GenerateScheduleResponse:
@@ -201,6 +424,10 @@ class ScheduleServicer(pb2_grpc.ScheduleServiceServicer):
                 )
             )
 
+        pb_solve_stats = None
+        if schedule_result.solve_stats is not None:
+            pb_solve_stats = pb2.SolveStats(**schedule_result.solve_stats.model_dump())
+
         return pb2.GenerateScheduleResponse(
             status=schedule_result.status,
             week=schedule_result.week,
@@ -208,4 +435,239 @@ class ScheduleServicer(pb2_grpc.ScheduleServiceServicer):
             shifts=pb_shifts,
             grid_view=pb_grid_view,
             summary=summary_list,
+            solve_stats=pb_solve_stats,
+        )
+
+    def _map_update_to_message(
+        self, update: ScheduleUpdateSchema
+    ) -> pb2.ScheduleUpdate:
+        """
+        Map a streamed solution to its protobuf message.
+
+        Args:
+            update: Domain model of one improving solution
+
+        Returns:
+            ScheduleUpdate protobuf message
+        """
+        return pb2.ScheduleUpdate(
+            schedule=self._map_domain_to_response(update.schedule),
+            solution_index=update.solution_index,
+            final=update.final,
+        )
+
+    def _map_horizon_to_response(
+        self, horizon: HorizonScheduleSchema
+    ) -> pb2.GenerateHorizonScheduleResponse:
+        """
+        Map domain HorizonScheduleSchema to protobuf response.
+
+        Args:
+            horizon: Domain model with one result per location
+
+        Returns:
+            GenerateHorizonScheduleResponse protobuf message
+        """
+        return pb2.GenerateHorizonScheduleResponse(
+            start_week=horizon.start_week,
+            year=horizon.year,
+            num_weeks=horizon.num_weeks,
+            locations=[
+                pb2.LocationSchedule(
+                    location_id=location.location_id,
+                    status=location.status,
+                    weeks=[
+                        self._map_domain_to_response(week) for week in location.weeks
+                    ],
+                )
+                for location in horizon.locations
+            ],
+            wall_time_seconds=horizon.wall_time_seconds,
         )
+
+
+class AsyncScheduleServicer(ScheduleServicer):
+    """
+    grpc.aio variant of ScheduleServicer.
+    CP-SAT solving is CPU-bound, so it runs on the loop's default executor
+    instead of blocking the event loop.
+    """
+
+    async def GenerateSchedule(
+        self, request: pb2.GenerateScheduleRequest, context: grpc.aio.ServicerContext
+    ):
+        """
+        Handle gRPC GenerateSchedule request on the asyncio server.
+
+        Args:
+            request: GenerateScheduleRequest protobuf message
+            context: gRPC aio context
+
+        Returns:
+            GenerateScheduleResponse protobuf message
+        """
+        self.logger.info(
+            f"Received GenerateSchedule request for week {request.week}, year {request.year}"
+        )
+
+        try:
+            schedule_input = self._map_request_to_domain(request)
+
+            job = self.business_service.submit_schedule_proto(
+                **schedule_input, time_remaining=context.time_remaining()
+            )
+            loop = asyncio.get_running_loop()
+            try:
+                response = await loop.run_in_executor(None, job.result)
+            except asyncio.CancelledError:
+                # The client went away; stop the solve it was waiting for
+                job.cancel()
+                raise
+        except ValidationError as e:
+            self.logger.warning(f"Invalid GenerateSchedule request: {e}")
+            await context.abort(grpc.StatusCode.INVALID_ARGUMENT, e.message)
+        except InfeasibleScheduleError as e:
+            self.logger.warning(f"Infeasible GenerateSchedule request: {e.message}")
+            await context.abort(grpc.StatusCode.FAILED_PRECONDITION, e.message)
+        except ResourceExhaustedError as e:
+            self.logger.warning(f"Rejected GenerateSchedule request: {e.message}")
+            await context.abort(grpc.StatusCode.RESOURCE_EXHAUSTED, e.message)
+        except futures.CancelledError:
+            self.logger.info("GenerateSchedule cancelled before solving")
+            await context.abort(
+                grpc.StatusCode.CANCELLED,
+                "Schedule request was cancelled before solving",
+            )
+        except Exception as e:
+            self.logger.error(f"Error in GenerateSchedule: {e}")
+            await context.abort(
+                grpc.StatusCode.INTERNAL, f"Failed to generate schedule: {str(e)}"
+            )
+
+        if response is None:
+            self.logger.warning("No feasible schedule found")
+            await context.abort(
+                grpc.StatusCode.NOT_FOUND,
+                "No feasible schedule could be generated with the given constraints",
+            )
+
+        self.logger.info(
+            f"Schedule generated successfully with status: {response.status}"
+        )
+        return response
+
+    async def StreamSchedule(
+        self, request: pb2.GenerateScheduleRequest, context: grpc.aio.ServicerContext
+    ):
+        """
+        Handle gRPC StreamSchedule request on the asyncio server.
+
+        The solver runs on its own thread; each update is awaited on the
+        default executor. If the client cancels, the task is cancelled and the
+        solver is stopped on the way out.
+
+        Args:
+            request: GenerateScheduleRequest protobuf message
+            context: gRPC aio context
+
+        Yields:
+            ScheduleUpdate protobuf messages
+        """
+        self.logger.info(
+            f"Received StreamSchedule request for week {request.week}, year {request.year}"
+        )
+
+        final = None
+        try:
+            schedule_input = self._map_request_to_domain(request)
+            stream = self.business_service.stream_schedule(
+                **schedule_input, time_remaining=context.time_remaining()
+            )
+            updates = iter(stream)
+            loop = asyncio.get_running_loop()
+            try:
+                while update := await loop.run_in_executor(None, next, updates, None):
+                    final = update if update.final else None
+                    yield self._map_update_to_message(update)
+            finally:
+                stream.cancel()
+        except ValidationError as e:
+            self.logger.warning(f"Invalid StreamSchedule request: {e}")
+            await context.abort(grpc.StatusCode.INVALID_ARGUMENT, e.message)
+        except InfeasibleScheduleError as e:
+            self.logger.warning(f"Infeasible StreamSchedule request: {e.message}")
+            await context.abort(grpc.StatusCode.FAILED_PRECONDITION, e.message)
+        except ResourceExhaustedError as e:
+            self.logger.warning(f"Rejected StreamSchedule request: {e.message}")
+            await context.abort(grpc.StatusCode.RESOURCE_EXHAUSTED, e.message)
+        except Exception as e:
+            self.logger.error(f"Error in StreamSchedule: {e}")
+            await context.abort(
+                grpc.StatusCode.INTERNAL, f"Failed to stream schedule: {str(e)}"
+            )
+
+        if final is None:
+            self.logger.warning("No feasible schedule found")
+            await context.abort(
+                grpc.StatusCode.NOT_FOUND,
+                "No feasible schedule could be generated with the given constraints",
+            )
+
+        self.logger.info(
+            f"Schedule streamed successfully with status: {final.schedule.status}"
+        )
+
+    async def GenerateHorizonSchedule(
+        self,
+        request: pb2.GenerateHorizonScheduleRequest,
+        context: grpc.aio.ServicerContext,
+    ):
+        """
+        Handle gRPC GenerateHorizonSchedule request on the asyncio server.
+
+        Args:
+            request: GenerateHorizonScheduleRequest protobuf message
+            context: gRPC aio context
+
+        Returns:
+            GenerateHorizonScheduleResponse protobuf message
+        """
+        self.logger.info(
+            f"Received GenerateHorizonSchedule request for {request.num_weeks} weeks "
+            f"from week {request.start_week}, year {request.year}"
+        )
+
+        try:
+            horizon_input = self._map_horizon_request_to_domain(request)
+
+            job = self.business_service.submit_horizon_schedule(
+                **horizon_input, time_remaining=context.time_remaining()
+            )
+            loop = asyncio.get_running_loop()
+            try:
+                horizon_result = await loop.run_in_executor(None, job.result)
+            except asyncio.CancelledError:
+                # The client went away; stop the locations still solving
+                job.cancel()
+                raise
+        except ValidationError as e:
+            self.logger.warning(f"Invalid GenerateHorizonSchedule request: {e}")
+            await context.abort(grpc.StatusCode.INVALID_ARGUMENT, e.message)
+        except ResourceExhaustedError as e:
+            self.logger.warning(
+                f"Rejected GenerateHorizonSchedule request: {e.message}"
+            )
+            await context.abort(grpc.StatusCode.RESOURCE_EXHAUSTED, e.message)
+        except futures.CancelledError:
+            self.logger.info("GenerateHorizonSchedule cancelled")
+            await context.abort(
+                grpc.StatusCode.CANCELLED, "Horizon schedule request was cancelled"
+            )
+        except Exception as e:
+            self.logger.error(f"Error in GenerateHorizonSchedule: {e}")
+            await context.abort(
+                grpc.StatusCode.INTERNAL,
+                f"Failed to generate horizon schedule: {str(e)}",
+            )
+
+        return self._map_horizon_to_response(horizon_result)
@@ -57,3 +57,42 @@ class SpellingCheckServicer(pb2_grpc.SpellingCorrectionServicer):
             context.set_code(grpc.StatusCode.INTERNAL)
             context.set_details(f"Failed to correct spelling: {str(e)}")
             raise
+
+
+class AsyncSpellingCheckServicer(SpellingCheckServicer):
+    """
+    grpc.aio variant of SpellingCheckServicer.
+    Awaits the LLM instead of blocking a worker thread while OpenRouter responds.
+    """
+
+    async def CorrectSpelling(
+        self, request: pb2.CorrectSpellingRequest, context: grpc.aio.ServicerContext
+    ):
+        """
+        Handle gRPC CorrectSpelling request on the asyncio server.
+
+        Args:
+            request: CorrectSpellingRequest protobuf message
+            context: gRPC aio context
+
+        Returns:
+            CorrectSpellingResponse protobuf message
+        """
+        self.logger.info("Received CorrectSpelling request")
+
+        try:
+            corrected = await self.spelling_service.correct_spelling_async(
+                request.initial_text
+            )
+            response = pb2.CorrectSpellingResponse(
+                corrected_text=corrected.corrected_text
+            )
+
+            self.logger.info("Spelling correction completed successfully")
+            return response
+
+        except Exception as e:
+            self.logger.error(f"Error in CorrectSpelling: {e}")
+            await context.abort(
+                grpc.StatusCode.INTERNAL, f"Failed to correct spelling: {str(e)}"
+            )
@@ -42,9 +42,192 @@ class Config(BaseSettings):
         default="", description="Object storage bucket name"
     )
 
+    # LLM HTTP transport (shared by every LLMClient)
+    llm_http2: bool = Field(default=True, description="Use HTTP/2 for LLM requests")
+    llm_max_connections: int = Field(
+        default=100, description="Maximum open connections to the LLM provider"
+    )
+    llm_max_keepalive_connections: int = Field(
+        default=20, description="Maximum idle keep-alive connections"
+    )
+    llm_keepalive_expiry: float = Field(
+        default=60.0, description="Seconds an idle connection is kept open"
+    )
+    llm_timeout_seconds: float = Field(
+        default=600.0, description="Read/write timeout for LLM requests"
+    )
+    llm_connect_timeout_seconds: float = Field(
+        default=5.0, description="Connect timeout for LLM requests"
+    )
+    llm_cache_enabled: bool = Field(
+        default=True, description="Cache LLM responses for identical requests"
+    )
+    llm_cache_max_entries: int = Field(
+        default=1024, description="Maximum entries in the in-memory LLM cache"
+    )
+    llm_cache_ttl_seconds: float = Field(
+        default=3600.0, description="Seconds a cached LLM response stays valid"
+    )
+    llm_cache_path: str = Field(
+        default="", description="SQLite file for the on-disk LLM cache (empty = off)"
+    )
+
+    # Spelling Correction
+    spelling_chunk_max_chars: int = Field(
+        default=2000, description="Target size of text chunks corrected in parallel"
+    )
+    spelling_max_parallel_chunks: int = Field(
+        default=4, description="Maximum chunks of one request corrected concurrently"
+    )
+    spelling_prefilter_enabled: bool = Field(
+        default=False,
+        description="Skip the LLM for sentences without unknown words; "
+        "requires word lists in spelling_dictionary_dir",
+    )
+    spelling_dictionary_dir: str = Field(
+        default="data/dictionaries",
+        description="Directory of <language>.txt word lists and an optional "
+        "names.txt for the pre-filter",
+    )
+    spelling_dictionary_min_frequency: int = Field(
+        default=0, description="Ignore dictionary words below this frequency"
+    )
+
+    # Report Generation
+    report_chunk_max_chars: int = Field(
+        default=24000,
+        description="Reports longer than this are summarized with map-reduce",
+    )
+    report_max_parallel_chunks: int = Field(
+        default=4, description="Maximum report chunks summarized concurrently"
+    )
+    report_memo_path: str = Field(
+        default="",
+        description="SQLite file for memoized report summaries (empty = in-memory)",
+    )
+    report_memo_max_entries: int = Field(
+        default=10000, description="Maximum summaries kept by the in-memory memo"
+    )
+    report_memo_ttl_seconds: float = Field(
+        default=30 * 24 * 3600.0, description="Seconds a memoized summary is kept"
+    )
+
+    # Schedule Generation
+    schedule_solver_profile: str = Field(
+        default="balanced",
+        description="Default CP-SAT profile: fast, balanced or optimal",
+    )
+    schedule_max_solve_seconds: float = Field(
+        default=90.0, description="Wall-clock limit for one schedule solve"
+    )
+    schedule_num_workers: int = Field(
+        default=0,
+        description="CP-SAT search workers (0 = chosen by problem size and cores)",
+    )
+    schedule_pool_processes: int = Field(
+        default=2, description="Processes running GenerateSchedule solves"
+    )
+    schedule_pool_queue_size: int = Field(
+        default=1,
+        description="Solves allowed to wait for a pool process before rejecting",
+    )
+    schedule_deadline_margin_seconds: float = Field(
+        default=1.0,
+        description="Part of the client deadline kept for building the response",
+    )
+    schedule_diagnosis_seconds: float = Field(
+        default=5.0,
+        description="Time limit for explaining why a schedule request is infeasible",
+    )
+    schedule_horizon_max_weeks: int = Field(
+        default=12, description="Longest horizon accepted by GenerateHorizonSchedule"
+    )
+    schedule_horizon_max_seconds: float = Field(
+        default=600.0, description="Wall-clock budget for one horizon request"
+    )
+    schedule_horizon_max_processes: int = Field(
+        default=0,
+        description="Solver pool processes one horizon request may use at once "
+        "(0 = all of SCHEDULE_POOL_PROCESSES)",
+    )
+    schedule_warm_start_enabled: bool = Field(
+        default=True,
+        description="Start the solver from the last roster stored for the same shifts",
+    )
+    schedule_store_path: str = Field(
+        default="",
+        description="SQLite file for stored rosters (empty = in-memory only)",
+    )
+    schedule_store_max_entries: int = Field(
+        default=1000, description="Maximum rosters kept by the in-memory store"
+    )
+    schedule_store_ttl_seconds: float = Field(
+        default=8 * 7 * 24 * 3600.0, description="Seconds a stored roster is kept"
+    )
+    schedule_cache_enabled: bool = Field(
+        default=True,
+        description="Answer repeated GenerateSchedule requests from the cache",
+    )
+    schedule_cache_path: str = Field(
+        default="",
+        description="SQLite file for cached responses (empty = in-memory only)",
+    )
+    schedule_cache_max_entries: int = Field(
+        default=256, description="Maximum responses kept by the in-memory LRU"
+    )
+    schedule_cache_ttl_seconds: float = Field(
+        default=7 * 24 * 3600.0, description="Seconds a cached response is kept"
+    )
+
+    # PDF generation
+    pdf_template_dir: str = Field(
+        default="src/assets/templates", description="Directory of PDF templates"
+    )
+    pdf_template_cache_dir: str = Field(
+        default="",
+        description="Directory for compiled template bytecode (empty = memory only)",
+    )
+    pdf_template_auto_reload: bool = Field(
+        default=True, description="Recompile a PDF template when its file changes"
+    )
+    pdf_pool_processes: int = Field(
+        default=0, description="Processes rendering PDFs (0 = one per core)"
+    )
+    pdf_pool_queue_size: int = Field(
+        default=4,
+        description="Renders allowed to wait for a pool process before rejecting",
+    )
+    pdf_pool_max_documents: int = Field(
+        default=200,
+        description="Documents a render process lays out before it is replaced",
+    )
+    pdf_batch_concurrency: int = Field(
+        default=0,
+        description="Invoices of one batch rendered and uploaded at once "
+        "(0 = one per render process)",
+    )
+    pdf_content_addressed: bool = Field(
+        default=False,
+        description="Key PDFs by a hash of their content and skip rendering "
+        "documents that are already stored",
+    )
+    pdf_index_path: str = Field(
+        default="",
+        description="SQLite file for the index of stored PDFs (empty = in-memory only)",
+    )
+    pdf_index_max_entries: int = Field(
+        default=4096, description="Maximum stored PDFs kept by the in-memory index"
+    )
+    pdf_index_ttl_seconds: float = Field(
+        default=24 * 3600.0,
+        description="Seconds a stored PDF is trusted before it is checked again",
+    )
+
     # Server Configuration
     grpc_port: int = Field(default=50051, description="gRPC server port")
-    grpc_max_workers: int = Field(default=4, description="Maximum worker threads")
+    grpc_max_workers: int = Field(
+        default=10, description="Server threads (executor threads in aio mode)"
+    )
 
     @field_validator("environment")
     def validate_environment(cls, v):
@@ -239,3 +239,94 @@ class ObjectStorageError(ServiceError):
         self.operation = operation
         self.bucket = bucket
         self.key = key
+
+
+class ResourceExhaustedError(ServiceError):
+    """
+    Exception raised when a bounded resource cannot take more work.
+
+    Examples:
+        - Solver process pool queue is full
+        - Too many concurrent jobs of one kind
+    """
+
+    def __init__(
+        self,
+        message: str,
+        resource: Optional[str] = None,
+        details: Optional[dict[str, Any]] = None,
+    ):
+        """
+        Initialize ResourceExhaustedError.
+
+        Args:
+            message: Error message
+            resource: Name of the exhausted resource
+            details: Additional error context
+        """
+        error_details = details or {}
+        if resource:
+            error_details["resource"] = resource
+        super().__init__(message, error_details)
+        self.resource = resource
+
+
+class InfeasibleScheduleError(ServiceError):
+    """
+    Exception raised when a schedule request has no feasible roster.
+
+    Examples:
+        - Fewer employees than shifts per day
+        - Rest rules that the headcount cannot satisfy
+        - Rules carried over from the previous week blocking the first day
+    """
+
+    def __init__(
+        self,
+        reasons: list[str],
+        details: Optional[dict[str, Any]] = None,
+    ):
+        """
+        Initialize InfeasibleScheduleError.
+
+        Args:
+            reasons: Human-readable constraints that cannot hold together
+            details: Additional error context
+        """
+        error_details = details or {}
+        error_details["reasons"] = reasons
+        message = "No feasible schedule"
+        if reasons:
+            message = f"{message}: {'; '.join(reasons)}"
+        super().__init__(message, error_details)
+        self.reasons = reasons
+
+
+class PdfGenerationError(ServiceError):
+    """
+    Exception raised when a PDF document cannot be rendered.
+
+    Examples:
+        - Template missing or failing to render
+        - WeasyPrint layout errors
+    """
+
+    def __init__(
+        self,
+        message: str,
+        document: Optional[str] = None,
+        details: Optional[dict[str, Any]] = None,
+    ):
+        """
+        Initialize PdfGenerationError.
+
+        Args:
+            message: Error message
+            document: Kind of document being generated
+            details: Additional error context
+        """
+        error_details = details or {}
+        if document:
+            error_details["document"] = document
+        super().__init__(message, error_details)
+        self.document = document
@@ -0,0 +1,111 @@
+"""
+HTTP Transport
+Process-wide pooled HTTP client shared by every LLMClient.
+
+httpx connection pools are bound to the event loop they were first used on,
+so the transport owns a dedicated event loop thread and every request made
+through it runs there. Sync callers (thread-pool server) and async callers
+(grpc.aio server) therefore share the same keep-alive connections, TLS
+sessions and DNS results.
+"""
+
+import asyncio
+import threading
+from typing import Any, Coroutine, Optional, TypeVar
+
+import httpx
+
+from src.core.config import Config
+
+T = TypeVar("T")
+
+
+class HttpTransport:
+    """
+    Owner of the shared httpx.AsyncClient and the event loop that drives it.
+
+    Provided as a singleton by the DI container and injected into LLMClient.
+    """
+
+    def __init__(self, config: Config):
+        """
+        Initialize the pooled client and start the transport loop thread.
+
+        Args:
+            config: Application configuration instance
+        """
+        self.http2 = config.llm_http2
+        self.max_connections = config.llm_max_connections
+        self.client = httpx.AsyncClient(
+            http2=config.llm_http2,
+            limits=httpx.Limits(
+                max_connections=config.llm_max_connections,
+                max_keepalive_connections=config.llm_max_keepalive_connections,
+                keepalive_expiry=config.llm_keepalive_expiry,
+            ),
+            timeout=httpx.Timeout(
+                config.llm_timeout_seconds, connect=config.llm_connect_timeout_seconds
+            ),
+        )
+
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(
+            target=self._run_loop, name="llm-http-transport", daemon=True
+        )
+        self._thread.start()
+
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop:
+        """Event loop on which all requests through this transport run."""
+        return self._loop
+
+    def _run_loop(self) -> None:
+        asyncio.set_event_loop(self._loop)
+        self._loop.run_forever()
+
+    def run_sync(
+        self, coro: Coroutine[Any, Any, T], timeout: Optional[float] = None
+    ) -> T:
+        """
+        Run a coroutine on the transport loop and block until it finishes.
+
+        Args:
+            coro: Coroutine that uses the shared client
+            timeout: Optional timeout in seconds
+
+        Returns:
+            The coroutine's result
+        """
+        future = asyncio.run_coroutine_threadsafe(coro, self._loop)
+        return future.result(timeout)
+
+    async def run(self, coro: Coroutine[Any, Any, T]) -> T:
+        """
+        Await a coroutine on the transport loop from any other event loop.
+
+        Args:
+            coro: Coroutine that uses the shared client
+
+        Returns:
+            The coroutine's result
+        """
+        if asyncio.get_running_loop() is self._loop:
+            return await coro
+        future = asyncio.run_coroutine_threadsafe(coro, self._loop)
+        return await asyncio.wrap_future(future)
+
+    def close(self) -> None:
+        """Close pooled connections and stop the transport loop."""
+        if self._loop.is_closed():
+            return
+        if self._loop.is_running():
+            asyncio.run_coroutine_threadsafe(self.client.aclose(), self._loop).result()
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._thread.join()
+        self._loop.close()
+
+    def __repr__(self) -> str:
+        """String representation of HttpTransport."""
+        return (
+            f"HttpTransport(http2={self.http2}, max_connections={self.max_connections})"
+        )
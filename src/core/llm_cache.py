@@ -0,0 +1,66 @@
+"""
+LLM Response Cache
+Content-addressed cache for LLM outputs, used by LLMClient.
+
+Entries are keyed on the model name, the hashes of the system prompt and the
+user prompt, and any extra run arguments, and stored in a TieredCache.
+"""
+
+import hashlib
+import json
+from dataclasses import dataclass
+from typing import Any, Dict, Optional
+
+from src.core.config import Config
+from src.core.tiered_cache import TieredCache
+
+
+def _sha256(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def make_cache_key(
+    model_name: str, system_prompt: str, prompt: str, kwargs: Dict[str, Any]
+) -> Optional[str]:
+    """
+    Build a content-addressed key for an LLM request.
+
+    Args:
+        model_name: LLM model name
+        system_prompt: System prompt of the agent
+        prompt: User prompt
+        kwargs: Extra arguments passed to the agent run
+
+    Returns:
+        Hex digest key, or None if kwargs cannot be serialized deterministically
+    """
+    try:
+        encoded_kwargs = json.dumps(kwargs, sort_keys=True)
+    except (TypeError, ValueError):
+        return None
+    payload = "\x1f".join(
+        [model_name, _sha256(system_prompt), _sha256(prompt), encoded_kwargs]
+    )
+    return _sha256(payload)
+
+
+@dataclass(frozen=True)
+class CachedRunResult:
+    """Stand-in for an agent run result when the output comes from the cache."""
+
+    output: str
+
+
+class LLMResponseCache(TieredCache):
+    """Tiered response cache shared by every LLMClient in the process."""
+
+    @classmethod
+    def from_config(cls, config: Config) -> "LLMResponseCache":
+        """Build the cache from the LLM_CACHE_* settings."""
+        return cls.from_settings(
+            enabled=config.llm_cache_enabled,
+            max_entries=config.llm_cache_max_entries,
+            ttl_seconds=config.llm_cache_ttl_seconds,
+            path=config.llm_cache_path,
+            table="llm_cache",
+        )
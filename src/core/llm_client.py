@@ -6,7 +6,9 @@ This module provides a centralized interface for LLM operations,
 making it easy to switch providers or models in the future.
 """
 
-from typing import Optional, Any, Dict
+import asyncio
+import queue
+from typing import Optional, Any, AsyncIterator, Callable, Dict, Iterator
 from injector import inject
 from pydantic_ai import Agent
 from pydantic_ai.models.openai import OpenAIModel
@@ -14,6 +16,11 @@ from pydantic_ai.providers.openrouter import OpenRouterProvider
 
 from src.core.config import Config
 from src.core.exceptions import LLMError, ConfigurationError
+from src.core.http_transport import HttpTransport
+from src.core.llm_cache import CachedRunResult, LLMResponseCache, make_cache_key
+from src.core.single_flight import SingleFlight
+
+_STREAM_END = object()
 
 
 class LLMClient:
@@ -21,7 +28,8 @@ class LLMClient:
     Wrapper for pydantic-ai Agent with additional functionality.
 
     Provides a clean interface for LLM operations with error handling,
-    retry logic, and consistent configuration management.
+    retry logic, and consistent configuration management. Concurrent
+    identical requests are coalesced into a single upstream call.
     """
 
     @inject
@@ -31,6 +39,8 @@ class LLMClient:
         system_prompt: str,
         config: Config,
         provider_kwargs: Optional[Dict[str, Any]] = None,
+        transport: Optional[HttpTransport] = None,
+        cache: Optional[LLMResponseCache] = None,
     ):
         """
         Initialize LLM client.
@@ -40,6 +50,8 @@ class LLMClient:
             system_prompt: System prompt for the agent
             api_key: OpenRouter API key
             provider_kwargs: Additional provider configuration
+            transport: Shared pooled HTTP transport; requests run on its loop
+            cache: Shared response cache for identical requests
 
         Raises:
             ConfigurationError: If configuration is invalid
@@ -57,10 +69,15 @@ class LLMClient:
         self.model_name = model_name
         self.system_prompt = system_prompt
         self._api_key = config.openrouter_api_key
+        self._transport = transport
+        self._cache = cache
+        self._inflight = SingleFlight()
 
         # Initialize provider
         try:
             provider_params = {"api_key": self._api_key}
+            if transport:
+                provider_params["http_client"] = transport.client
             if provider_kwargs:
                 provider_params.update(provider_kwargs)
 
@@ -82,51 +99,227 @@ class LLMClient:
         """Get the underlying pydantic-ai Agent."""
         return self._agent
 
-    def run_sync(self, prompt: str, **kwargs) -> Any:
+    def _request_key(self, prompt: str, kwargs: Dict[str, Any]) -> Optional[str]:
+        return make_cache_key(self.model_name, self.system_prompt, prompt, kwargs)
+
+    def _lookup(self, key: Optional[str]) -> Optional[CachedRunResult]:
+        if key and self._cache and self._cache.enabled:
+            cached = self._cache.get(key)
+            if cached is not None:
+                return CachedRunResult(output=cached)
+        return None
+
+    def _store(self, key: Optional[str], output: Any) -> None:
+        # Only plain-text outputs are cached; structured outputs are not serialized
+        if key and self._cache and self._cache.enabled:
+            if isinstance(output, str):
+                self._cache.set(key, output)
+
+    def run_sync(self, prompt: str, bypass_cache: bool = False, **kwargs) -> Any:
         """
         Run LLM request synchronously.
 
+        Identical requests already in flight on another thread or event loop
+        are joined instead of sent again.
+
         Args:
             prompt: User prompt/message
+            bypass_cache: Skip the cache lookup; the fresh response is still stored
             **kwargs: Additional arguments passed to agent.run_sync()
 
         Returns:
-            Agent response
+            Agent response, or a CachedRunResult on a cache hit
 
         Raises:
             LLMError: If LLM request fails
         """
+        key = self._request_key(prompt, kwargs)
+        if not bypass_cache:
+            cached = self._lookup(key)
+            if cached is not None:
+                return cached
+
+        if key is None:
+            return self._run_upstream_sync(key, prompt, kwargs)
+        return self._inflight.do(
+            key, lambda: self._run_upstream_sync(key, prompt, kwargs)
+        )
+
+    def _run_upstream_sync(
+        self, key: Optional[str], prompt: str, kwargs: Dict[str, Any]
+    ) -> Any:
         try:
-            return self._agent.run_sync(prompt, **kwargs)
+            if self._transport:
+                result = self._transport.run_sync(self._agent.run(prompt, **kwargs))
+            else:
+                result = self._agent.run_sync(prompt, **kwargs)
         except Exception as e:
             raise LLMError(
                 f"LLM request failed: {str(e)}",
                 model_name=self.model_name,
                 details={"prompt_length": len(prompt)},
             )
+        self._store(key, result.output)
+        return result
 
-    async def run(self, prompt: str, **kwargs) -> Any:
+    async def run(self, prompt: str, bypass_cache: bool = False, **kwargs) -> Any:
         """
         Run LLM request asynchronously.
 
+        Identical requests already in flight on another thread or event loop
+        are joined instead of sent again.
+
         Args:
             prompt: User prompt/message
+            bypass_cache: Skip the cache lookup; the fresh response is still stored
             **kwargs: Additional arguments passed to agent.run()
 
         Returns:
-            Agent response
+            Agent response, or a CachedRunResult on a cache hit
 
         Raises:
             LLMError: If LLM request fails
         """
+        key = self._request_key(prompt, kwargs)
+        if not bypass_cache:
+            cached = self._lookup(key)
+            if cached is not None:
+                return cached
+
+        if key is None:
+            return await self._run_upstream(key, prompt, kwargs)
+        return await self._inflight.do_async(
+            key, lambda: self._run_upstream(key, prompt, kwargs)
+        )
+
+    async def _run_upstream(
+        self, key: Optional[str], prompt: str, kwargs: Dict[str, Any]
+    ) -> Any:
         try:
-            return await self._agent.run(prompt, **kwargs)
+            if self._transport:
+                result = await self._transport.run(self._agent.run(prompt, **kwargs))
+            else:
+                result = await self._agent.run(prompt, **kwargs)
         except Exception as e:
             raise LLMError(
                 f"Async LLM request failed: {str(e)}",
                 model_name=self.model_name,
                 details={"prompt_length": len(prompt)},
             )
+        self._store(key, result.output)
+        return result
+
+    def stream_text_sync(
+        self, prompt: str, bypass_cache: bool = False, **kwargs
+    ) -> Iterator[str]:
+        """
+        Stream the LLM text output, yielding deltas as they arrive.
+
+        The stream runs on the transport loop and chunks are handed to the
+        calling thread through a queue. Without a transport the whole output
+        is returned as a single chunk.
+
+        Args:
+            prompt: User prompt/message
+            bypass_cache: Skip the cache lookup; the full output is still stored
+            **kwargs: Additional arguments passed to agent.run_stream()
+
+        Yields:
+            Text deltas; a cache hit yields the whole output at once
+
+        Raises:
+            LLMError: If LLM request fails
+        """
+        key = self._request_key(prompt, kwargs)
+        if not bypass_cache:
+            cached = self._lookup(key)
+            if cached is not None:
+                yield cached.output
+                return
+
+        if not self._transport:
+            yield self.run_sync(prompt, bypass_cache=True, **kwargs).output
+            return
+
+        chunks: queue.Queue = queue.Queue()
+        future = asyncio.run_coroutine_threadsafe(
+            self._produce_stream(prompt, kwargs, chunks.put), self._transport.loop
+        )
+        future.add_done_callback(lambda _: chunks.put(_STREAM_END))
+
+        parts = []
+        try:
+            while (chunk := chunks.get()) is not _STREAM_END:
+                parts.append(chunk)
+                yield chunk
+            future.result()
+        finally:
+            # Stops the upstream request if the consumer goes away early
+            future.cancel()
+        self._store(key, "".join(parts))
+
+    async def stream_text(
+        self, prompt: str, bypass_cache: bool = False, **kwargs
+    ) -> AsyncIterator[str]:
+        """
+        Async variant of stream_text_sync().
+
+        Args:
+            prompt: User prompt/message
+            bypass_cache: Skip the cache lookup; the full output is still stored
+            **kwargs: Additional arguments passed to agent.run_stream()
+
+        Yields:
+            Text deltas; a cache hit yields the whole output at once
+
+        Raises:
+            LLMError: If LLM request fails
+        """
+        key = self._request_key(prompt, kwargs)
+        if not bypass_cache:
+            cached = self._lookup(key)
+            if cached is not None:
+                yield cached.output
+                return
+
+        loop = asyncio.get_running_loop()
+        chunks: asyncio.Queue = asyncio.Queue()
+
+        def emit(chunk: str) -> None:
+            loop.call_soon_threadsafe(chunks.put_nowait, chunk)
+
+        producer = self._produce_stream(prompt, kwargs, emit)
+        if self._transport:
+            future = asyncio.wrap_future(
+                asyncio.run_coroutine_threadsafe(producer, self._transport.loop)
+            )
+        else:
+            future = asyncio.ensure_future(producer)
+        future.add_done_callback(lambda _: chunks.put_nowait(_STREAM_END))
+
+        parts = []
+        try:
+            while (chunk := await chunks.get()) is not _STREAM_END:
+                parts.append(chunk)
+                yield chunk
+            await future
+        finally:
+            future.cancel()
+        self._store(key, "".join(parts))
+
+    async def _produce_stream(
+        self, prompt: str, kwargs: Dict[str, Any], emit: Callable[[str], None]
+    ) -> None:
+        try:
+            async with self._agent.run_stream(prompt, **kwargs) as result:
+                async for delta in result.stream_text(delta=True):
+                    emit(delta)
+        except Exception as e:
+            raise LLMError(
+                f"LLM stream failed: {str(e)}",
+                model_name=self.model_name,
+                details={"prompt_length": len(prompt)},
+            )
 
     def __repr__(self) -> str:
         """String representation of LLMClient."""
@@ -245,6 +245,44 @@ class ObjectStorageClient:
                 key=object_key,
             )
 
+    def file_size(self, object_key: str) -> Optional[int]:
+        """
+        Get the size of a file in object storage with a single HEAD request.
+
+        Args:
+            object_key: Key (path) of the object
+
+        Returns:
+            Size in bytes, or None if the file does not exist
+
+        Raises:
+            ObjectStorageError: If the check fails due to connection issues
+        """
+        try:
+            response = self._client.head_object(Bucket=self.bucket, Key=object_key)
+            return response.get("ContentLength")
+
+        except ClientError as e:
+            error_code = e.response.get("Error", {}).get("Code")
+
+            if error_code == "404" or error_code == "NoSuchKey":
+                return None
+
+            raise ObjectStorageError(
+                f"Failed to get file size: {str(e)}",
+                operation="size",
+                bucket=self.bucket,
+                key=object_key,
+                details={"error_code": error_code},
+            )
+        except Exception as e:
+            raise ObjectStorageError(
+                f"Unexpected error during size check: {str(e)}",
+                operation="size",
+                bucket=self.bucket,
+                key=object_key,
+            )
+
     def get_file_metadata(self, object_key: str) -> Dict[str, Any]:
         """
         Get metadata for a file in object storage.
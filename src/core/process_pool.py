@@ -0,0 +1,332 @@
+"""
+Bounded Process Pool
+Size-capped pool of worker processes for long CPU-bound jobs.
+
+Unlike concurrent.futures.ProcessPoolExecutor, jobs wait in a bounded queue
+(submitting to a full queue fails immediately, so callers can shed load),
+queued jobs expire at their deadline, and a running job can be asked to
+stop: every worker process owns a stop event that the job function receives
+and is expected to honour, e.g. by calling CpSolver.StopSearch. Workers can
+load expensive state once through an initializer, and can be replaced after
+a number of jobs to return memory that long-running libraries hold on to.
+"""
+
+import multiprocessing
+import multiprocessing.connection
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future
+from logging import Logger
+from typing import Any, Callable, Deque, Dict, Optional, Tuple
+
+from src.core.exceptions import ResourceExhaustedError
+
+
+class PoolJob:
+    """Handle of one submitted job."""
+
+    def __init__(
+        self, fn: Callable[..., Any], args: Tuple[Any, ...], deadline: Optional[float]
+    ):
+        self.fn = fn
+        self.args = args
+        self.deadline = deadline
+        self.future: Future = Future()
+        self._stop_event: Optional[Any] = None
+        self._lock = threading.Lock()
+
+    def cancel(self) -> None:
+        """Drop the job if it is still queued, otherwise ask its worker to stop."""
+        if self.future.cancel():
+            return
+        with self._lock:
+            if self._stop_event is not None and not self.future.done():
+                self._stop_event.set()
+
+    def result(self, timeout: Optional[float] = None) -> Any:
+        """
+        Wait for the job's return value.
+
+        Raises:
+            concurrent.futures.CancelledError: If the job was cancelled or
+                expired before a worker picked it up
+            RuntimeError: If the job raised or its worker process died
+        """
+        return self.future.result(timeout)
+
+    def _attach(self, stop_event: Any) -> None:
+        with self._lock:
+            self._stop_event = stop_event
+
+    def _detach(self) -> None:
+        with self._lock:
+            self._stop_event = None
+
+
+def _worker_main(
+    conn: multiprocessing.connection.Connection,
+    stop_event: Any,
+    initializer: Optional[Callable[[], None]] = None,
+) -> None:
+    """Run jobs received over the pipe until the parent sends None."""
+    if initializer is not None:
+        initializer()
+    while True:
+        try:
+            message = conn.recv()
+        except EOFError:
+            return
+        if message is None:
+            return
+        fn, args = message
+        try:
+            reply = ("ok", fn(*args, stop_event))
+        except Exception as e:
+            # Exceptions with custom constructors do not always unpickle
+            reply = ("error", f"{type(e).__name__}: {e}")
+        try:
+            conn.send(reply)
+        except Exception as e:
+            conn.send(("error", f"unpicklable result: {type(e).__name__}: {e}"))
+
+
+class BoundedProcessPool:
+    """
+    Fixed number of spawn-started worker processes fed from a bounded queue.
+
+    Worker processes start on the first submit and are replaced when one
+    dies or has run max_jobs_per_process jobs. Each worker slot is served by
+    a parent thread that hands it one job at a time.
+    """
+
+    def __init__(
+        self,
+        num_processes: int,
+        max_queue: int,
+        logger: Logger,
+        name: str = "pool",
+        initializer: Optional[Callable[[], None]] = None,
+        max_jobs_per_process: int = 0,
+    ):
+        """
+        Initialize the pool.
+
+        Args:
+            num_processes: Worker processes, i.e. jobs running at once
+            max_queue: Jobs allowed to wait for a free worker
+            logger: Logger instance
+            name: Prefix of worker process and thread names
+            initializer: Picklable function every worker process runs once
+                before its first job
+            max_jobs_per_process: Jobs after which a worker process is
+                replaced (0 = never)
+        """
+        if num_processes < 1:
+            raise ValueError("num_processes must be at least 1")
+        if max_queue < 0:
+            raise ValueError("max_queue must not be negative")
+
+        self.num_processes = num_processes
+        self.max_queue = max_queue
+        self.logger = logger
+        self.name = name
+        self.initializer = initializer
+        self.max_jobs_per_process = max_jobs_per_process
+
+        self._ctx = multiprocessing.get_context("spawn")
+        self._pending: Deque[PoolJob] = deque()
+        self._busy = 0
+        self._cond = threading.Condition()
+        self._threads: list[threading.Thread] = []
+        self._workers: Dict[int, Tuple[Any, Any, Any]] = {}
+        self._jobs_run: Dict[int, int] = {}
+        self._closed = False
+
+    def submit(
+        self,
+        fn: Callable[..., Any],
+        *args: Any,
+        timeout: Optional[float] = None,
+    ) -> PoolJob:
+        """
+        Queue a job.
+
+        ``fn`` must be picklable and is called in a worker as
+        ``fn(*args, stop_event)``.
+
+        Args:
+            fn: Module-level job function
+            *args: Picklable positional arguments
+            timeout: Seconds the caller will wait; the job is dropped if no
+                worker picks it up in time
+
+        Returns:
+            PoolJob handle
+
+        Raises:
+            ResourceExhaustedError: If the queue is full
+        """
+        deadline = time.monotonic() + timeout if timeout is not None else None
+        job = PoolJob(fn, args, deadline)
+        with self._cond:
+            if self._closed:
+                raise RuntimeError(f"{self.name} is closed")
+            if not self._threads:
+                self._start()
+            waiting = len(self._pending) + self._busy - self.num_processes
+            if waiting >= self.max_queue:
+                raise ResourceExhaustedError(
+                    f"{self.name} queue is full "
+                    f"({self.num_processes} running, {len(self._pending)} waiting)",
+                    resource=self.name,
+                )
+            self._pending.append(job)
+            self._cond.notify()
+        return job
+
+    @property
+    def queued(self) -> int:
+        """Jobs waiting for a worker."""
+        with self._cond:
+            return len(self._pending)
+
+    def close(self) -> None:
+        """Cancel queued jobs, stop running ones and shut the workers down."""
+        with self._cond:
+            self._closed = True
+            pending = list(self._pending)
+            self._pending.clear()
+            self._cond.notify_all()
+        for job in pending:
+            job.cancel()
+        for _, _, stop_event in list(self._workers.values()):
+            stop_event.set()
+        for thread in self._threads:
+            thread.join()
+
+    def _start(self) -> None:
+        for slot in range(self.num_processes):
+            thread = threading.Thread(
+                target=self._serve,
+                args=(slot,),
+                name=f"{self.name}-{slot}",
+                daemon=True,
+            )
+            thread.start()
+            self._threads.append(thread)
+        self.logger.info(f"Started {self.name} with {self.num_processes} processes")
+
+    def _next_job(self) -> Optional[PoolJob]:
+        """Block until a live job is queued; None once the pool is closed."""
+        with self._cond:
+            while True:
+                while not self._pending and not self._closed:
+                    self._cond.wait()
+                if self._closed:
+                    return None
+                job = self._pending.popleft()
+                if job.deadline is not None and time.monotonic() >= job.deadline:
+                    job.future.cancel()
+                    self.logger.warning(f"{self.name}: job expired in the queue")
+                    continue
+                self._busy += 1
+                return job
+
+    def _worker(self, slot: int) -> Tuple[Any, Any, Any]:
+        """Return the slot's live worker, starting a new one if needed."""
+        worker = self._workers.get(slot)
+        if worker is not None and worker[0].is_alive():
+            return worker
+        parent_conn, child_conn = self._ctx.Pipe()
+        stop_event = self._ctx.Event()
+        process = self._ctx.Process(
+            target=_worker_main,
+            args=(child_conn, stop_event, self.initializer),
+            name=f"{self.name}-worker-{slot}",
+            daemon=True,
+        )
+        process.start()
+        child_conn.close()
+        self._workers[slot] = (process, parent_conn, stop_event)
+        self._jobs_run[slot] = 0
+        return self._workers[slot]
+
+    def _retire(self, slot: int) -> None:
+        """Ask the slot's worker to exit and wait for it."""
+        worker = self._workers.pop(slot, None)
+        if worker is None:
+            return
+        process, conn, _ = worker
+        try:
+            conn.send(None)
+        except OSError:
+            pass
+        process.join(timeout=5)
+        if process.is_alive():
+            process.terminate()
+
+    def _serve(self, slot: int) -> None:
+        while (job := self._next_job()) is not None:
+            self._run(slot, job)
+        self._retire(slot)
+
+    def _release(self) -> None:
+        """Free the running job's place before its caller sees the result."""
+        with self._cond:
+            self._busy -= 1
+
+    def _run(self, slot: int, job: PoolJob) -> None:
+        """Run one job on the slot's worker and settle its future."""
+        try:
+            process, conn, stop_event = self._worker(slot)
+        except Exception as e:
+            self._release()
+            self.logger.error(f"{self.name} could not start a worker: {e}")
+            if job.future.set_running_or_notify_cancel():
+                job.future.set_exception(e)
+            return
+        stop_event.clear()
+        job._attach(stop_event)
+        if not job.future.set_running_or_notify_cancel():
+            job._detach()
+            self._release()
+            return
+        error: Optional[Exception] = None
+        try:
+            conn.send((job.fn, job.args))
+            ready = multiprocessing.connection.wait([conn, process.sentinel])
+            if conn in ready:
+                status, payload = conn.recv()
+            else:
+                status, payload = "error", "worker process exited"
+        except (EOFError, OSError) as e:
+            status, payload = "error", f"worker process exited: {e}"
+        except Exception as e:
+            # Pickling happens before anything is written, so an argument or
+            # result that cannot be pickled leaves the worker usable
+            status, payload, error = "error", f"{type(e).__name__}: {e}", e
+        finally:
+            job._detach()
+            self._release()
+
+        if status == "ok":
+            job.future.set_result(payload)
+        else:
+            self.logger.error(f"{self.name} job failed: {payload}")
+            job.future.set_exception(error or RuntimeError(payload))
+            if payload.startswith("worker process exited"):
+                # The pipe can report EOF before the process is reaped
+                process.join(timeout=5)
+                if process.is_alive():
+                    process.terminate()
+                self._workers.pop(slot, None)
+                return
+
+        self._jobs_run[slot] += 1
+        if self.max_jobs_per_process and (
+            self._jobs_run[slot] >= self.max_jobs_per_process
+        ):
+            self._retire(slot)
+            # Start the replacement now so its initializer runs while idle
+            self._worker(slot)
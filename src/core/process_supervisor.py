@@ -0,0 +1,175 @@
+"""
+Process Supervisor
+Pre-fork style supervisor that runs the gRPC server in several worker processes.
+
+Every worker binds the same port with SO_REUSEPORT so the kernel spreads
+incoming connections across processes, which lets CPU-bound RPCs (CP-SAT,
+WeasyPrint) use more than one core despite the GIL.
+"""
+
+import multiprocessing
+import multiprocessing.connection
+import signal
+import time
+from logging import Logger
+from typing import Any, Callable, Dict, Optional, Tuple
+
+
+class ProcessSupervisor:
+    """
+    Start, watch and restart a fixed number of worker processes.
+
+    Workers are started with the "spawn" method so that no gRPC or HTTP state
+    from the parent is inherited. SIGTERM/SIGINT received by the supervisor is
+    forwarded to every worker as SIGTERM, and the supervisor waits for them to
+    drain before exiting.
+    """
+
+    def __init__(
+        self,
+        target: Callable[..., Any],
+        num_workers: int,
+        logger: Logger,
+        args: Tuple[Any, ...] = (),
+        shutdown_timeout: float = 35.0,
+        restart_delay: float = 1.0,
+        max_restart_delay: float = 30.0,
+        min_uptime: float = 5.0,
+    ):
+        """
+        Initialize the supervisor.
+
+        Args:
+            target: Picklable callable run in each worker process
+            num_workers: Number of worker processes to keep alive
+            logger: Logger instance
+            args: Positional arguments passed to target
+            shutdown_timeout: Seconds to wait for workers to drain before killing them
+            restart_delay: Initial delay before restarting a crashed worker
+            max_restart_delay: Upper bound for the crash-loop backoff
+            min_uptime: Workers exiting sooner than this count as crash-looping
+        """
+        if num_workers < 1:
+            raise ValueError("num_workers must be at least 1")
+
+        self.target = target
+        self.num_workers = num_workers
+        self.logger = logger
+        self.args = args
+        self.shutdown_timeout = shutdown_timeout
+        self.restart_delay = restart_delay
+        self.max_restart_delay = max_restart_delay
+        self.min_uptime = min_uptime
+
+        self._ctx = multiprocessing.get_context("spawn")
+        self._workers: Dict[int, multiprocessing.process.BaseProcess] = {}
+        self._started_at: Dict[int, float] = {}
+        self._backoff: Dict[int, float] = {}
+        self._restart_at: Dict[int, float] = {}
+        self._stopping = False
+
+    @property
+    def workers(self) -> Dict[int, multiprocessing.process.BaseProcess]:
+        """Currently tracked worker processes, keyed by worker slot."""
+        return dict(self._workers)
+
+    def run(self, install_signal_handlers: bool = True) -> None:
+        """
+        Start all workers and supervise them until stop() is called.
+
+        Args:
+            install_signal_handlers: Forward SIGTERM/SIGINT to the workers.
+                Must only be enabled from the main thread.
+        """
+        if install_signal_handlers:
+            signal.signal(signal.SIGTERM, self._handle_signal)
+            signal.signal(signal.SIGINT, self._handle_signal)
+
+        for slot in range(self.num_workers):
+            self._start_worker(slot)
+
+        self.logger.info(f"Supervisor started {self.num_workers} worker processes")
+
+        while not self._stopping:
+            self._reap_and_restart()
+
+        self._drain()
+
+    def stop(self) -> None:
+        """Begin a coordinated shutdown by sending SIGTERM to every worker."""
+        if self._stopping:
+            return
+        self._stopping = True
+        self.logger.info("Supervisor stopping, forwarding SIGTERM to workers...")
+        for process in self._workers.values():
+            if process.is_alive():
+                process.terminate()
+
+    def _handle_signal(self, signum, frame) -> None:
+        self.logger.info(f"Supervisor received signal {signum}")
+        self.stop()
+
+    def _start_worker(self, slot: int) -> None:
+        process = self._ctx.Process(
+            target=self.target,
+            args=self.args,
+            name=f"grpc-worker-{slot}",
+            daemon=False,
+        )
+        process.start()
+        self._workers[slot] = process
+        self._started_at[slot] = time.monotonic()
+        self._restart_at.pop(slot, None)
+        self.logger.info(f"Started worker {slot} (pid={process.pid})")
+
+    def _reap_and_restart(self) -> None:
+        sentinels = {
+            process.sentinel: slot
+            for slot, process in self._workers.items()
+            if slot not in self._restart_at
+        }
+        timeout = 1.0
+        if self._restart_at:
+            timeout = max(0.0, min(self._restart_at.values()) - time.monotonic())
+            timeout = min(timeout, 1.0)
+
+        for sentinel in multiprocessing.connection.wait(list(sentinels), timeout):
+            slot = sentinels[sentinel]
+            process = self._workers[slot]
+            process.join()
+            if self._stopping:
+                return
+            self._schedule_restart(slot, process.exitcode)
+
+        now = time.monotonic()
+        for slot, restart_at in list(self._restart_at.items()):
+            if not self._stopping and now >= restart_at:
+                self._start_worker(slot)
+
+    def _schedule_restart(self, slot: int, exitcode: Optional[int]) -> None:
+        uptime = time.monotonic() - self._started_at[slot]
+        if uptime < self.min_uptime:
+            delay = min(
+                self._backoff.get(slot, self.restart_delay / 2) * 2,
+                self.max_restart_delay,
+            )
+        else:
+            delay = self.restart_delay
+        self._backoff[slot] = delay
+        self._restart_at[slot] = time.monotonic() + delay
+        self.logger.warning(
+            f"Worker {slot} exited with code {exitcode} after {uptime:.1f}s, "
+            f"restarting in {delay:.1f}s"
+        )
+
+    def _drain(self) -> None:
+        deadline = time.monotonic() + self.shutdown_timeout
+        for slot, process in self._workers.items():
+            process.join(max(0.0, deadline - time.monotonic()))
+            if process.is_alive():
+                self.logger.warning(
+                    f"Worker {slot} (pid={process.pid}) did not stop in time, killing"
+                )
+                process.kill()
+                process.join()
+        self.logger.info("All worker processes stopped")
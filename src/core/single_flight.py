@@ -0,0 +1,102 @@
+"""
+Single Flight
+Coalesces concurrent identical calls into one upstream request.
+
+The first caller for a key (the leader) runs the call; callers arriving while
+it is in flight wait for the leader's result instead of issuing their own.
+Waiters are tracked with concurrent.futures.Future so the same group can be
+shared by thread-pool callers and by coroutines on any event loop.
+"""
+
+import asyncio
+import threading
+from concurrent.futures import Future
+from typing import Any, Awaitable, Callable, Dict, Set, Tuple, TypeVar
+
+T = TypeVar("T")
+
+
+class SingleFlight:
+    """Deduplicate in-flight calls by key."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls: Dict[str, Future] = {}
+        self._tasks: Set[asyncio.Task] = set()
+        self.coalesced = 0
+
+    @property
+    def in_flight(self) -> int:
+        """Number of distinct keys currently being executed."""
+        with self._lock:
+            return len(self._calls)
+
+    def _join(self, key: str) -> Tuple[Future, bool]:
+        with self._lock:
+            future = self._calls.get(key)
+            if future is not None:
+                self.coalesced += 1
+                return future, False
+            future = Future()
+            self._calls[key] = future
+            return future, True
+
+    def _finish(self, key: str, future: Future, result: Any, error: Any) -> None:
+        with self._lock:
+            self._calls.pop(key, None)
+        if error is not None:
+            future.set_exception(error)
+        else:
+            future.set_result(result)
+
+    def do(self, key: str, fn: Callable[[], T]) -> T:
+        """
+        Run fn once for all concurrent callers with the same key.
+
+        Args:
+            key: Request identity
+            fn: Call made by the leader
+
+        Returns:
+            The leader's result; its exception is raised in every caller
+        """
+        future, leader = self._join(key)
+        if not leader:
+            return future.result()
+        try:
+            result = fn()
+        except BaseException as e:
+            self._finish(key, future, None, e)
+            raise
+        self._finish(key, future, result, None)
+        return result
+
+    async def do_async(self, key: str, fn: Callable[[], Awaitable[T]]) -> T:
+        """
+        Async variant of do(); waiters may be on any thread or event loop.
+
+        Args:
+            key: Request identity
+            fn: Coroutine function awaited by the leader
+
+        Returns:
+            The leader's result; its exception is raised in every caller
+        """
+        future, leader = self._join(key)
+        if leader:
+            # Run the call as its own task so cancelling the leader's RPC does
+            # not cancel the request other callers are waiting on
+            task = asyncio.ensure_future(fn())
+            self._tasks.add(task)
+            task.add_done_callback(lambda t: self._finish_task(key, future, t))
+        # Shielded so a cancelled waiter does not cancel the shared future
+        return await asyncio.shield(asyncio.wrap_future(future))
+
+    def _finish_task(self, key: str, future: Future, task: asyncio.Task) -> None:
+        self._tasks.discard(task)
+        if task.cancelled():
+            self._finish(key, future, None, asyncio.CancelledError())
+        elif task.exception() is not None:
+            self._finish(key, future, None, task.exception())
+        else:
+            self._finish(key, future, task.result(), None)
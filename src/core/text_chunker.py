@@ -0,0 +1,109 @@
+"""
+Text Chunker
+Splits long documents into chunks that can be sent to the LLM independently.
+
+Chunks follow paragraph boundaries first and sentence boundaries for
+paragraphs that are too long on their own. Whitespace around each chunk is
+kept aside so the original formatting (blank lines, indentation, trailing
+newlines) is restored exactly when processed chunks are joined. With a
+pre-filter, text is split into sentences and runs of clean sentences become
+chunks that are passed through unchanged.
+"""
+
+import itertools
+import re
+from dataclasses import dataclass
+from typing import Callable, List, Optional
+
+PARAGRAPH_BREAK = re.compile(r"(\n[ \t]*\n\s*)")
+SENTENCE_BREAK = re.compile(r"(?<=[.!?…])(\s+)")
+
+
+@dataclass(frozen=True)
+class TextChunk:
+    """A piece of the input with its surrounding whitespace split off."""
+
+    prefix: str
+    body: str
+    suffix: str
+    skip: bool = False
+
+    def rebuild(self, corrected_body: str) -> str:
+        """Re-attach the original whitespace to a corrected body."""
+        return self.prefix + corrected_body + self.suffix
+
+
+def _split_keep(pattern: re.Pattern, text: str) -> List[str]:
+    """Split text after each separator, keeping separators attached."""
+    parts = pattern.split(text)
+    pieces = []
+    for i in range(0, len(parts), 2):
+        piece = parts[i] + (parts[i + 1] if i + 1 < len(parts) else "")
+        if piece:
+            pieces.append(piece)
+    return pieces
+
+
+def _pack(pieces: List[str], max_chars: int) -> List[str]:
+    """Greedily merge consecutive pieces into groups of at most max_chars."""
+    groups: List[str] = []
+    current = ""
+    for piece in pieces:
+        if current and len(current) + len(piece) > max_chars:
+            groups.append(current)
+            current = ""
+        current += piece
+    if current:
+        groups.append(current)
+    return groups
+
+
+def _make_chunk(group: str, skip: bool) -> TextChunk:
+    body = group.strip()
+    if not body:
+        return TextChunk(prefix=group, body="", suffix="", skip=True)
+    start = group.index(body)
+    return TextChunk(
+        prefix=group[:start],
+        body=body,
+        suffix=group[start + len(body) :],
+        skip=skip,
+    )
+
+
+def split_text(
+    text: str, max_chars: int, is_clean: Optional[Callable[[str], bool]] = None
+) -> List[TextChunk]:
+    """
+    Split text into chunks of roughly max_chars on natural boundaries.
+
+    Joining ``chunk.rebuild(chunk.body)`` for every chunk returns the input
+    unchanged. A single sentence longer than max_chars is kept whole.
+
+    Args:
+        text: Text to split
+        max_chars: Target upper bound for the length of each chunk
+        is_clean: Optional sentence check; consecutive clean sentences are
+            merged into a chunk with skip=True
+
+    Returns:
+        Chunks in document order
+    """
+    pieces: List[str] = []
+    for paragraph in _split_keep(PARAGRAPH_BREAK, text):
+        if is_clean is not None or len(paragraph) > max_chars:
+            pieces.extend(_split_keep(SENTENCE_BREAK, paragraph))
+        else:
+            pieces.append(paragraph)
+
+    if is_clean is None:
+        return [_make_chunk(group, False) for group in _pack(pieces, max_chars)]
+
+    chunks = []
+    runs = itertools.groupby(pieces, key=lambda p: not p.strip() or is_clean(p))
+    for clean, run in runs:
+        if clean:
+            chunks.append(_make_chunk("".join(run), True))
+        else:
+            chunks.extend(_make_chunk(g, False) for g in _pack(list(run), max_chars))
+    return chunks
@@ -0,0 +1,255 @@
+"""
+Tiered Cache
+String key-value cache over an ordered list of backends.
+
+The first tier is an in-memory LRU; an optional SQLite tier keeps entries
+across restarts and is shared by every process on the host. Lookups go tier
+by tier, and a hit in a slower tier is promoted into the faster ones.
+LLMResponseCache and the service caches built on it differ only in their
+keys, values and settings.
+"""
+
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, List, Optional, Tuple, Type, TypeVar
+
+from src.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+CacheT = TypeVar("CacheT", bound="TieredCache")
+
+
+@dataclass
+class CacheStats:
+    """Hit/miss counters for a TieredCache."""
+
+    hits: int = 0
+    misses: int = 0
+
+    @property
+    def hit_ratio(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+class CacheBackend(ABC):
+    """A single cache tier mapping keys to strings."""
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[str]:
+        """Return the cached value, or None on a miss or expired entry."""
+
+    @abstractmethod
+    def set(self, key: str, value: str) -> None:
+        """Store a value under key."""
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Remove every entry."""
+
+
+class MemoryCacheBackend(CacheBackend):
+    """Thread-safe LRU cache with a per-entry time-to-live."""
+
+    def __init__(
+        self,
+        max_entries: int,
+        ttl_seconds: float,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._entries: "OrderedDict[str, Tuple[float, str]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[str]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at <= self._clock():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: str) -> None:
+        with self._lock:
+            self._entries[key] = (self._clock() + self.ttl_seconds, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class SQLiteCacheBackend(CacheBackend):
+    """
+    On-disk cache tier backed by a local SQLite file.
+
+    Survives process restarts and is shared by all workers on the same host.
+    SQLite errors are logged and treated as misses so a broken cache file never
+    fails a request.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        ttl_seconds: float,
+        clock: Callable[[], float] = time.time,
+        table: str = "cache",
+    ):
+        if not table.isidentifier():
+            raise ValueError(f"Invalid cache table name: {table!r}")
+        self.path = path
+        self.ttl_seconds = ttl_seconds
+        self.table = table
+        self._clock = clock
+        self._lock = threading.Lock()
+
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False, timeout=5.0)
+        with self._lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                f"CREATE TABLE IF NOT EXISTS {table} ("
+                "key TEXT PRIMARY KEY, value TEXT NOT NULL, expires_at REAL NOT NULL)"
+            )
+
+    def get(self, key: str) -> Optional[str]:
+        try:
+            with self._lock:
+                row = self._conn.execute(
+                    f"SELECT value, expires_at FROM {self.table} WHERE key = ?", (key,)
+                ).fetchone()
+        except sqlite3.Error as e:
+            logger.warning(f"Cache read from {self.table} failed: {e}")
+            return None
+        if row is None or row[1] <= self._clock():
+            return None
+        return row[0]
+
+    def set(self, key: str, value: str) -> None:
+        try:
+            with self._lock, self._conn:
+                self._conn.execute(
+                    f"INSERT OR REPLACE INTO {self.table} (key, value, expires_at) "
+                    "VALUES (?, ?, ?)",
+                    (key, value, self._clock() + self.ttl_seconds),
+                )
+        except sqlite3.Error as e:
+            logger.warning(f"Cache write to {self.table} failed: {e}")
+
+    def clear(self) -> None:
+        with self._lock, self._conn:
+            self._conn.execute(f"DELETE FROM {self.table}")
+
+    def purge_expired(self) -> int:
+        """Delete expired rows and return how many were removed."""
+        with self._lock, self._conn:
+            cursor = self._conn.execute(
+                f"DELETE FROM {self.table} WHERE expires_at <= ?", (self._clock(),)
+            )
+            return cursor.rowcount
+
+
+class TieredCache:
+    """
+    Cache that reads through its tiers in order and writes to all of them.
+
+    With no backends the cache is disabled and every lookup is a miss.
+    """
+
+    def __init__(self, backends: Optional[List[CacheBackend]] = None):
+        self.backends = backends or []
+        self.stats = CacheStats()
+        self._stats_lock = threading.Lock()
+
+    @classmethod
+    def from_settings(
+        cls: Type[CacheT],
+        enabled: bool,
+        max_entries: int,
+        ttl_seconds: float,
+        path: Optional[str],
+        table: str,
+    ) -> CacheT:
+        """
+        Build the memory tier and, if a path is given, the SQLite tier.
+
+        Args:
+            enabled: False returns a disabled cache
+            max_entries: Size of the in-memory LRU
+            ttl_seconds: Lifetime of an entry in either tier
+            path: SQLite file that keeps entries across restarts, if any
+            table: SQLite table of this cache; caches may share one file
+
+        Returns:
+            Instance of the calling class
+        """
+        if not enabled:
+            return cls()
+        backends: List[CacheBackend] = [
+            MemoryCacheBackend(max_entries=max_entries, ttl_seconds=ttl_seconds)
+        ]
+        if path:
+            backends.append(
+                SQLiteCacheBackend(path=path, ttl_seconds=ttl_seconds, table=table)
+            )
+        return cls(backends)
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.backends)
+
+    def get(self, key: str) -> Optional[str]:
+        """Look the key up tier by tier, promoting hits into faster tiers."""
+        for index, backend in enumerate(self.backends):
+            value = backend.get(key)
+            if value is not None:
+                for faster in self.backends[:index]:
+                    faster.set(key, value)
+                self._record(hit=True)
+                return value
+        self._record(hit=False)
+        return None
+
+    def set(self, key: str, value: str) -> None:
+        """Write the value to every tier."""
+        for backend in self.backends:
+            backend.set(key, value)
+
+    def clear(self) -> None:
+        """Empty every tier and reset the counters."""
+        for backend in self.backends:
+            backend.clear()
+        with self._stats_lock:
+            self.stats = CacheStats()
+
+    def _record(self, hit: bool) -> None:
+        with self._stats_lock:
+            if hit:
+                self.stats.hits += 1
+            else:
+                self.stats.misses += 1
+
+    def __repr__(self) -> str:
+        """String representation of the cache."""
+        tiers = ", ".join(type(b).__name__ for b in self.backends)
+        return (
+            f"{type(self).__name__}(tiers=[{tiers}], hits={self.stats.hits}, "
+            f"misses={self.stats.misses})"
+        )
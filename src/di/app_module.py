@@ -2,11 +2,23 @@ from logging import Logger
 from injector import Module, singleton, provider
 
 from src.core.config import Config
+from src.core.http_transport import HttpTransport
+from src.core.llm_cache import LLMResponseCache
 from src.core.logging import get_logger, setup_logging
+from src.core.object_storage_client import ObjectStorageClient
 from src.services.care_planner.generator import CarePlanGenerator
 from src.services.care_planner.planner import CarePlannerService
+from src.services.pdf.generator import PdfGeneratorService
+from src.services.pdf.index import PdfIndex
+from src.services.pdf.pool import PdfRenderPool
+from src.services.pdf.templates import TemplateRegistry
+from src.services.reports.memo import ReportSummaryMemo
 from src.services.spelling.corrector import SpellingCorrectorService
+from src.services.spelling.prefilter import SpellingPrefilter
+from src.services.schedule.pool import SolverPool
 from src.services.schedule.service import ScheduleService
+from src.services.schedule.solution_cache import ScheduleSolutionCache
+from src.services.schedule.store import ScheduleStore
 
 
 class AppModule(Module):
@@ -21,14 +33,36 @@ class AppModule(Module):
         setup_logging(env=config.environment, log_level=config.log_level)
         return get_logger(self.__class__.__name__)  # inject class-specific loggers
 
+    @singleton
+    @provider
+    def provide_http_transport(self, config: Config) -> HttpTransport:
+        # One pooled client per process, shared by every LLMClient
+        return HttpTransport(config)
+
+    @singleton
+    @provider
+    def provide_llm_response_cache(self, config: Config) -> LLMResponseCache:
+        # Shared across services so identical prompts hit the same entries
+        return LLMResponseCache.from_config(config)
+
+    @singleton
+    @provider
+    def provide_object_storage_client(self, config: Config) -> ObjectStorageClient:
+        # One boto3 client per process; it is thread-safe
+        return ObjectStorageClient(config)
+
 
 class ServiceModule(Module):
     @singleton
     @provider
     def provide_care_plan_generator(
-        self, config: Config, logger: Logger
+        self,
+        config: Config,
+        logger: Logger,
+        transport: HttpTransport,
+        response_cache: LLMResponseCache,
     ) -> CarePlanGenerator:
-        return CarePlanGenerator(logger, config)
+        return CarePlanGenerator(logger, config, transport, response_cache)
 
     @singleton
     @provider
@@ -40,11 +74,97 @@ class ServiceModule(Module):
     @singleton
     @provider
     def provide_spelling_corrector_service(
-        self, config: Config, logger: Logger
+        self,
+        config: Config,
+        logger: Logger,
+        transport: HttpTransport,
+        response_cache: LLMResponseCache,
+        prefilter: SpellingPrefilter,
     ) -> SpellingCorrectorService:
-        return SpellingCorrectorService(logger, config)
+        return SpellingCorrectorService(
+            logger, config, transport, response_cache, prefilter
+        )
+
+    @singleton
+    @provider
+    def provide_spelling_prefilter(
+        self, config: Config, logger: Logger
+    ) -> SpellingPrefilter:
+        # Word lists are compiled once per process
+        return SpellingPrefilter.from_config(config, logger)
+
+    @singleton
+    @provider
+    def provide_schedule_service(
+        self,
+        logger: Logger,
+        config: Config,
+        schedule_store: ScheduleStore,
+        solver_pool: SolverPool,
+        solution_cache: ScheduleSolutionCache,
+    ) -> ScheduleService:
+        return ScheduleService(
+            logger, config, schedule_store, solver_pool, solution_cache
+        )
+
+    @singleton
+    @provider
+    def provide_solver_pool(self, config: Config, logger: Logger) -> SolverPool:
+        # Processes start on the first solve and are shared by every request
+        return SolverPool.from_config(config, logger)
+
+    @singleton
+    @provider
+    def provide_schedule_store(self, config: Config) -> ScheduleStore:
+        # Rosters are shared by every request in the process
+        return ScheduleStore.from_config(config)
+
+    @singleton
+    @provider
+    def provide_schedule_solution_cache(self, config: Config) -> ScheduleSolutionCache:
+        return ScheduleSolutionCache.from_config(config)
+
+    @singleton
+    @provider
+    def provide_report_summary_memo(self, config: Config) -> ReportSummaryMemo:
+        return ReportSummaryMemo.from_config(config)
+
+    @singleton
+    @provider
+    def provide_template_registry(
+        self, config: Config, logger: Logger
+    ) -> TemplateRegistry:
+        # Templates are compiled once, when the PDF servicer is created
+        return TemplateRegistry.from_config(config, logger)
+
+    @singleton
+    @provider
+    def provide_pdf_generator_service(
+        self,
+        object_storage_client: ObjectStorageClient,
+        templates: TemplateRegistry,
+        logger: Logger,
+        render_pool: PdfRenderPool,
+        pdf_index: PdfIndex,
+        config: Config,
+    ) -> PdfGeneratorService:
+        return PdfGeneratorService(
+            object_storage_client,
+            templates,
+            logger,
+            render_pool,
+            batch_concurrency=config.pdf_batch_concurrency,
+            content_addressed=config.pdf_content_addressed,
+            pdf_index=pdf_index,
+        )
+
+    @singleton
+    @provider
+    def provide_pdf_index(self, config: Config) -> PdfIndex:
+        return PdfIndex.from_config(config)
 
     @singleton
     @provider
-    def provide_schedule_service(self, logger: Logger) -> ScheduleService:
-        return ScheduleService(logger)
+    def provide_pdf_render_pool(self, config: Config, logger: Logger) -> PdfRenderPool:
+        # Processes start on the first render and are shared by every request
+        return PdfRenderPool.from_config(config, logger)
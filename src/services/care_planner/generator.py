@@ -7,12 +7,17 @@ Migrated from: care_planner/generator.py
 import json
 from logging import Logger
 import re
+from typing import Any, AsyncIterator, Iterator, List, Set, Tuple
 from injector import inject
 from json_repair import repair_json
+from pydantic import TypeAdapter, ValidationError
 
 from src.core.config import Config
+from src.core.http_transport import HttpTransport
+from src.core.llm_cache import LLMResponseCache
 from src.core.llm_client import LLMClient
 from src.services.care_planner.schemas import LLMPersonalizedCarePlanResponse
+from src.services.care_planner.stream_parser import IncrementalSectionParser
 
 
 SYSTEM_PROMPT = """
@@ -120,6 +125,12 @@ Here are the inputs:
 {inputs}
 """
 
+# Validators for each top-level care plan section, used while streaming
+SECTION_ADAPTERS = {
+    name: TypeAdapter(field.annotation)
+    for name, field in LLMPersonalizedCarePlanResponse.model_fields.items()
+}
+
 
 class CarePlanGenerator:
     """
@@ -128,17 +139,27 @@ class CarePlanGenerator:
     """
 
     @inject
-    def __init__(self, logger: Logger, config: Config):
+    def __init__(
+        self,
+        logger: Logger,
+        config: Config,
+        transport: HttpTransport,
+        response_cache: LLMResponseCache,
+    ):
         """
         Initialize generator with LLM client.
 
         Args:
             llm_client: LLM client for care plan generation
+            transport: Shared HTTP transport for the LLM client
+            response_cache: Shared LLM response cache
         """
         self.llm_client = LLMClient(
             model_name="x-ai/grok-4-fast",  # or read from Config if configurable
             config=config,
             system_prompt=SYSTEM_PROMPT,
+            transport=transport,
+            cache=response_cache,
         )
         self.logger = logger
         self.logger.info("CarePlanGenerator initialized")
@@ -160,25 +181,145 @@ class CarePlanGenerator:
             llm_output: str = self.llm_client.run_sync(
                 PROMPT.format(inputs=inputs)
             ).output
+            return self._parse_care_plan(llm_output)
 
-            # Extract JSON from markdown if present
-            match = re.search(r"```(?:json)?\s*([\s\S]*?)\s*```", llm_output)
-            json_str = match.group(1) if match else llm_output.strip()
+        except Exception as e:
+            self.logger.error(f"Error generating care plan: {e}")
+            raise
 
-            # Try to repair malformed JSON
-            try:
-                json_response = json.loads(json_str)
-            except json.JSONDecodeError:
-                self.logger.warning("Initial JSON parse failed, attempting repair...")
-                repaired = repair_json(json_str)
-                json_response = json.loads(repaired)
+    async def generate_care_plan_async(
+        self, inputs: dict
+    ) -> LLMPersonalizedCarePlanResponse:
+        """
+        Generate a personalized care plan using the async LLM path.
 
-            # Validate against schema
-            validated = LLMPersonalizedCarePlanResponse.model_validate(json_response)
-            self.logger.info("Care plan generated and validated successfully")
+        Args:
+            inputs: Dictionary containing client data and domain definitions
 
-            return validated
+        Returns:
+            LLMPersonalizedCarePlanResponse: Validated care plan response
+
+        Raises:
+            Exception: If LLM generation or validation fails
+        """
+        try:
+            result = await self.llm_client.run(PROMPT.format(inputs=inputs))
+            return self._parse_care_plan(result.output)
 
         except Exception as e:
             self.logger.error(f"Error generating care plan: {e}")
             raise
+
+    def stream_care_plan(self, inputs: dict) -> Iterator[Tuple[str, Any]]:
+        """
+        Generate a care plan, yielding each top-level section once it is complete.
+
+        Sections are validated individually as they arrive. Once the stream
+        ends the whole document is validated, and any section that could not
+        be parsed incrementally is yielded from the repaired output.
+
+        Args:
+            inputs: Dictionary containing client data and domain definitions
+
+        Yields:
+            (section name, validated section value) in generation order
+
+        Raises:
+            Exception: If LLM generation or validation fails
+        """
+        try:
+            parser = IncrementalSectionParser()
+            emitted: Set[str] = set()
+            parts: List[str] = []
+            for chunk in self.llm_client.stream_text_sync(PROMPT.format(inputs=inputs)):
+                parts.append(chunk)
+                yield from self._validate_sections(parser.feed(chunk), emitted)
+            yield from self._remaining_sections("".join(parts), emitted)
+
+        except Exception as e:
+            self.logger.error(f"Error streaming care plan: {e}")
+            raise
+
+    async def stream_care_plan_async(
+        self, inputs: dict
+    ) -> AsyncIterator[Tuple[str, Any]]:
+        """
+        Async variant of stream_care_plan().
+
+        Args:
+            inputs: Dictionary containing client data and domain definitions
+
+        Yields:
+            (section name, validated section value) in generation order
+
+        Raises:
+            Exception: If LLM generation or validation fails
+        """
+        try:
+            parser = IncrementalSectionParser()
+            emitted: Set[str] = set()
+            parts: List[str] = []
+            async for chunk in self.llm_client.stream_text(
+                PROMPT.format(inputs=inputs)
+            ):
+                parts.append(chunk)
+                for section in self._validate_sections(parser.feed(chunk), emitted):
+                    yield section
+            for section in self._remaining_sections("".join(parts), emitted):
+                yield section
+
+        except Exception as e:
+            self.logger.error(f"Error streaming care plan: {e}")
+            raise
+
+    def _validate_sections(
+        self, members: List[Tuple[str, Any]], emitted: Set[str]
+    ) -> Iterator[Tuple[str, Any]]:
+        for name, value in members:
+            adapter = SECTION_ADAPTERS.get(name)
+            if adapter is None or name in emitted:
+                continue
+            try:
+                validated = adapter.validate_python(value)
+            except ValidationError as e:
+                # Left for the full-document parse at the end of the stream
+                self.logger.warning(f"Streamed section {name} failed validation: {e}")
+                continue
+            emitted.add(name)
+            yield name, validated
+
+    def _remaining_sections(
+        self, llm_output: str, emitted: Set[str]
+    ) -> Iterator[Tuple[str, Any]]:
+        care_plan = self._parse_care_plan(llm_output)
+        for name in LLMPersonalizedCarePlanResponse.model_fields:
+            if name not in emitted:
+                yield name, getattr(care_plan, name)
+
+    def _parse_care_plan(self, llm_output: str) -> LLMPersonalizedCarePlanResponse:
+        """
+        Extract, repair and validate the care plan JSON from raw LLM output.
+
+        Args:
+            llm_output: Raw text returned by the LLM
+
+        Returns:
+            LLMPersonalizedCarePlanResponse: Validated care plan response
+        """
+        # Extract JSON from markdown if present
+        match = re.search(r"```(?:json)?\s*([\s\S]*?)\s*```", llm_output)
+        json_str = match.group(1) if match else llm_output.strip()
+
+        # Try to repair malformed JSON
+        try:
+            json_response = json.loads(json_str)
+        except json.JSONDecodeError:
+            self.logger.warning("Initial JSON parse failed, attempting repair...")
+            repaired = repair_json(json_str)
+            json_response = json.loads(repaired)
+
+        # Validate against schema
+        validated = LLMPersonalizedCarePlanResponse.model_validate(json_response)
+        self.logger.info("Care plan generated and validated successfully")
+
+        return validated
@@ -4,7 +4,7 @@ Core business logic for care plan generation (framework-agnostic)
 """
 
 from logging import Logger
-from typing import Dict, Any
+from typing import Any, AsyncIterator, Dict, Iterator, Tuple
 
 from injector import inject
 
@@ -65,3 +65,96 @@ class CarePlannerService:
         except Exception as e:
             self.logger.error(f"Failed to generate care plan: {e}")
             raise
+
+    async def generate_care_plan_async(
+        self, input_data: Dict[str, Any]
+    ) -> LLMPersonalizedCarePlanResponse:
+        """
+        Generate a personalized care plan without blocking the event loop.
+
+        Args:
+            input_data: Same shape as for generate_care_plan
+
+        Returns:
+            LLMPersonalizedCarePlanResponse: Generated care plan
+
+        Raises:
+            Exception: If care plan generation fails
+        """
+        self.logger.info(
+            f"Generating care plan for domain: {input_data.get('client_data', {}).get('assessment_domain', 'unknown')}"
+        )
+
+        try:
+            if "client_data" not in input_data:
+                raise ValueError("Missing required field: client_data")
+
+            care_plan = await self.generator.generate_care_plan_async(input_data)
+
+            self.logger.info("Care plan generated successfully")
+            return care_plan
+
+        except Exception as e:
+            self.logger.error(f"Failed to generate care plan: {e}")
+            raise
+
+    def stream_care_plan(self, input_data: Dict[str, Any]) -> Iterator[Tuple[str, Any]]:
+        """
+        Generate a care plan section by section.
+
+        Args:
+            input_data: Same shape as for generate_care_plan
+
+        Yields:
+            (section name, validated section value) as each section completes
+
+        Raises:
+            Exception: If care plan generation fails
+        """
+        self.logger.info(
+            f"Streaming care plan for domain: {input_data.get('client_data', {}).get('assessment_domain', 'unknown')}"
+        )
+
+        try:
+            if "client_data" not in input_data:
+                raise ValueError("Missing required field: client_data")
+
+            yield from self.generator.stream_care_plan(input_data)
+
+            self.logger.info("Care plan streamed successfully")
+
+        except Exception as e:
+            self.logger.error(f"Failed to stream care plan: {e}")
+            raise
+
+    async def stream_care_plan_async(
+        self, input_data: Dict[str, Any]
+    ) -> AsyncIterator[Tuple[str, Any]]:
+        """
+        Async variant of stream_care_plan().
+
+        Args:
+            input_data: Same shape as for generate_care_plan
+
+        Yields:
+            (section name, validated section value) as each section completes
+
+        Raises:
+            Exception: If care plan generation fails
+        """
+        self.logger.info(
+            f"Streaming care plan for domain: {input_data.get('client_data', {}).get('assessment_domain', 'unknown')}"
+        )
+
+        try:
+            if "client_data" not in input_data:
+                raise ValueError("Missing required field: client_data")
+
+            async for section in self.generator.stream_care_plan_async(input_data):
+                yield section
+
+            self.logger.info("Care plan streamed successfully")
+
+        except Exception as e:
+            self.logger.error(f"Failed to stream care plan: {e}")
+            raise
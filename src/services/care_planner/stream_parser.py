@@ -0,0 +1,98 @@
+"""
+Incremental JSON Section Parser
+Emits top-level members of a streamed JSON object as soon as they are complete.
+
+The LLM writes the care plan as one JSON object, possibly wrapped in a
+markdown fence. Instead of waiting for the closing brace, the parser tracks
+nesting depth and string state across chunks and hands back every
+``"key": value`` pair the moment the comma or brace that ends it arrives.
+"""
+
+import json
+from typing import Any, List, Tuple
+
+
+class IncrementalSectionParser:
+    """
+    Streaming scanner for the top-level members of a JSON object.
+
+    Text before the first ``{`` (such as a ```json fence) is ignored, as is
+    everything after the object closes.
+    """
+
+    def __init__(self):
+        self._text = ""
+        self._pos = 0
+        self._depth = 0
+        self._in_string = False
+        self._escape = False
+        self._member_start = -1
+        self.done = False
+
+    def feed(self, chunk: str) -> List[Tuple[str, Any]]:
+        """
+        Consume a chunk of LLM output.
+
+        Args:
+            chunk: Next piece of streamed text
+
+        Returns:
+            (key, value) pairs completed by this chunk, in document order.
+            Members that are not valid JSON are skipped and left for the
+            caller's final full-document parse.
+        """
+        if self.done:
+            return []
+
+        self._text += chunk
+        completed: List[Tuple[str, Any]] = []
+        text = self._text
+
+        for i in range(self._pos, len(text)):
+            ch = text[i]
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif ch == "\\":
+                    self._escape = True
+                elif ch == '"':
+                    self._in_string = False
+                continue
+
+            if ch == '"':
+                if self._depth > 0:
+                    self._in_string = True
+            elif ch in "{[":
+                self._depth += 1
+                if self._depth == 1:
+                    if ch != "{":
+                        self._depth = 0
+                        continue
+                    self._member_start = i + 1
+            elif ch in "}]":
+                # Stray closing brackets before the document starts
+                if self._depth == 0:
+                    continue
+                if self._depth == 1:
+                    self._emit(text[self._member_start : i], completed)
+                    self._depth = 0
+                    self.done = True
+                    self._pos = i + 1
+                    return completed
+                self._depth -= 1
+            elif ch == "," and self._depth == 1:
+                self._emit(text[self._member_start : i], completed)
+                self._member_start = i + 1
+
+        self._pos = len(text)
+        return completed
+
+    @staticmethod
+    def _emit(member: str, completed: List[Tuple[str, Any]]) -> None:
+        if not member.strip():
+            return
+        try:
+            parsed = json.loads("{" + member + "}")
+        except json.JSONDecodeError:
+            return
+        completed.extend(parsed.items())
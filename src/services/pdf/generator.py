@@ -1,80 +1,365 @@
+import queue
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime
-from weasyprint import HTML
 from io import BytesIO
-from jinja2 import Environment, FileSystemLoader, select_autoescape
-from griffe import Logger
+from logging import Logger
+from typing import Any, Callable, Iterable, Iterator, Optional, Tuple
+
 from injector import inject
+from pydantic import BaseModel
+
+from src.core.exceptions import PdfGenerationError, ResourceExhaustedError
 from src.core.object_storage_client import ObjectStorageClient
-from src.services.pdf.schema import AppointmentCardData
+from src.services.pdf.index import PdfIndex, document_fingerprint
+from src.services.pdf.pool import PdfRenderPool
+from src.services.pdf.renderer import render_in_worker, render_pdf
+from src.services.pdf.schema import (
+    AppointmentCardData,
+    ContractData,
+    IncidentReportData,
+    InvoiceData,
+)
+from src.services.pdf.templates import TemplateRegistry
+
+
+@dataclass(frozen=True)
+class PdfDocument:
+    """A kind of PDF document: its template, stylesheets and where uploads go."""
+
+    name: str
+    template: str
+    folder: str
+    # Relative to the template directory, applied in order
+    stylesheets: Tuple[str, ...] = ("styles/document.css",)
+
+
+APPOINTMENT_CARD = PdfDocument(
+    "appointment_card", "appointment_card.html", "appointment_cards"
+)
+CONTRACT = PdfDocument(
+    "contract",
+    "contract.html",
+    "contracts",
+    ("styles/document.css", "styles/contract.css"),
+)
+INCIDENT_REPORT = PdfDocument(
+    "incident_report", "incident_report.html", "incident_reports"
+)
+INVOICE = PdfDocument(
+    "invoice",
+    "invoice.html",
+    "invoices",
+    ("styles/document.css", "styles/invoice.css"),
+)
+
+# A batch invoice that finds the render queue full waits for room instead of
+# failing; single requests keep priority on the queue
+BATCH_RETRY_SECONDS = 0.25
+BATCH_MAX_WAIT_SECONDS = 120.0
+
+
+@dataclass
+class InvoiceBatchItem:
+    """Outcome of one invoice of a batch."""
+
+    index: int
+    invoice_id: Optional[int]
+    key: str = ""
+    size: int = 0
+    error: str = ""
 
 
 class PdfGeneratorService:
     @inject
-    def __init__(self, object_storage_client: ObjectStorageClient, logger: Logger):
+    def __init__(
+        self,
+        object_storage_client: ObjectStorageClient,
+        templates: TemplateRegistry,
+        logger: Logger,
+        render_pool: Optional[PdfRenderPool] = None,
+        batch_concurrency: int = 0,
+        content_addressed: bool = False,
+        pdf_index: Optional[PdfIndex] = None,
+    ):
         self.object_storage_client = object_storage_client
+        self.templates = templates
         self.logger = logger
+        # Without a pool, documents are laid out on the calling thread
+        self.render_pool = render_pool
+        self.batch_concurrency = batch_concurrency or (
+            render_pool.num_processes if render_pool is not None else 1
+        )
+        # Key documents by content and reuse stored ones; see index.py
+        self.content_addressed = content_addressed
+        self.pdf_index = pdf_index or PdfIndex()
 
-    def generate_appointment_card(
-        self, appointment_card_data: AppointmentCardData
-    ) -> BytesIO:
+    def render_html(self, document: PdfDocument, data: BaseModel) -> str:
         """
-        Generate a PDF appointment card and store it in object storage.
+        Fill the document's compiled template with the request data.
 
         Args:
-            appointment_data: Data for the appointment card.
+            document: Kind of document
+            data: Request data; every field is passed to the template
 
         Returns:
-            URL to the stored PDF in object storage.
+            Rendered HTML
+
+        Raises:
+            PdfGenerationError: If the template fails to render
+        """
+        try:
+            return self.templates.render(document.template, **dict(data))
+        except Exception as e:
+            raise PdfGenerationError(
+                f"Failed to render {document.template}: {e}", document=document.name
+            )
+
+    def generate_document(self, document: PdfDocument, data: BaseModel) -> BytesIO:
         """
+        Generate a PDF document.
+
+        Args:
+            document: Kind of document
+            data: Request data for the document's template
+
+        Returns:
+            In-memory PDF file
 
+        Raises:
+            PdfGenerationError: If rendering fails
+            ResourceExhaustedError: If the render pool queue is full
+        """
+        html_content = self.render_html(document, data)
+        stylesheets = tuple(self.templates.path(name) for name in document.stylesheets)
+        base_url = self.templates.path()
         try:
-            env = Environment(
-                loader=FileSystemLoader("src/assets/templates"),
-                autoescape=select_autoescape(["html", "xml"]),
+            if self.render_pool is None:
+                return render_pdf(html_content, stylesheets, base_url)
+            job = self.render_pool.submit(
+                render_in_worker, html_content, stylesheets, base_url
+            )
+            return BytesIO(job.result())
+        except ResourceExhaustedError:
+            raise
+        except Exception as e:
+            raise PdfGenerationError(
+                f"PDF generation error: {e}", document=document.name
             )
 
-            template = env.get_template("appointment_card.html")
-            html_content = template.render(
-                client_name=appointment_card_data.client_name,
-                date=appointment_card_data.date,
-                mentor=appointment_card_data.mentor,
-                general_information=appointment_card_data.general_information,
-                important_contacts=appointment_card_data.important_contacts,
-                household_info=appointment_card_data.household_info,
-                organization_agreements=appointment_card_data.organization_agreements,
-                youth_officer_agreements=appointment_card_data.youth_officer_agreements,
-                treatment_agreements=appointment_card_data.treatment_agreements,
-                smoking_rules=appointment_card_data.smoking_rules,
-                work=appointment_card_data.work,
-                school_internship=appointment_card_data.school_internship,
-                travel=appointment_card_data.travel,
-                leave=appointment_card_data.leave,
+    def upload_document(
+        self,
+        document: PdfDocument,
+        data: BaseModel,
+        document_id: Optional[int],
+    ) -> Tuple[str, int]:
+        """
+        Generate a PDF document and store it in object storage.
+
+        In content-addressed mode a document that is already stored is
+        neither rendered nor uploaded again.
+
+        Args:
+            document: Kind of document
+            data: Request data for the document's template
+            document_id: Id used in the object key
+
+        Returns:
+            Object key and size in bytes of the stored PDF
+
+        Raises:
+            PdfGenerationError: If rendering fails
+            ResourceExhaustedError: If the render pool queue is full
+            ObjectStorageError: If the upload or the existence check fails
+        """
+        if self.content_addressed:
+            filename = self.content_key(document, data, document_id)
+            size = self.pdf_index.load(filename)
+            if size is None:
+                size = self.object_storage_client.file_size(filename)
+                if size is not None:
+                    self.pdf_index.save(filename, size)
+            if size is not None:
+                self.logger.info(f"{document.name} PDF unchanged, reusing {filename}")
+                return filename, size
+        else:
+            filename = (
+                f"{document.folder}/{datetime.now().strftime('%Y-%m-%d')}/"
+                f"{document.name}_{document_id}.pdf"
             )
 
-            pdf_file = BytesIO()
-            HTML(string=html_content).write_pdf(pdf_file)
-            pdf_file.seek(0)
-            return pdf_file
-        except Exception as e:
-            raise Exception(f"PDF generation error: {str(e)}")
+        pdf_file = self.generate_document(document, data)
+        size = pdf_file.getbuffer().nbytes
+        key = self.object_storage_client.upload_file(
+            file_obj=pdf_file, key=filename, content_type="application/pdf"
+        )
+        if self.content_addressed:
+            self.pdf_index.save(key, size)
+        self.logger.info(f"Uploaded {document.name} PDF ({size} bytes) to {key}")
+        return key, size
+
+    def content_key(
+        self, document: PdfDocument, data: BaseModel, document_id: Optional[int]
+    ) -> str:
+        """
+        Object key derived from the request data and the template version.
+
+        Args:
+            document: Kind of document
+            data: Request data for the document's template
+            document_id: Id used in the object key
+
+        Returns:
+            Key that is the same for every request with the same content
+        """
+        version = self.templates.version(document.template, *document.stylesheets)
+        digest = document_fingerprint(document.name, version, data)
+        return f"{document.folder}/{document.name}_{document_id}_{digest[:32]}.pdf"
+
+    def generate_appointment_card(
+        self, appointment_card_data: AppointmentCardData
+    ) -> BytesIO:
+        """
+        Generate a PDF appointment card.
+
+        Args:
+            appointment_card_data: Data for the appointment card.
+
+        Returns:
+            In-memory PDF file.
+        """
+        return self.generate_document(APPOINTMENT_CARD, appointment_card_data)
 
     def upload_pdf(self, appointment_card_data: AppointmentCardData) -> str:
         """
-        Upload the generated PDF to object storage.
+        Generate an appointment card and upload it to object storage.
+
+        Args:
+            appointment_card_data: Data for the appointment card.
+
+        Returns:
+            Object key of the stored PDF.
+        """
+        key, _ = self.upload_document(
+            APPOINTMENT_CARD, appointment_card_data, appointment_card_data.id
+        )
+        return key
+
+    def upload_contract(self, contract_data: ContractData) -> str:
+        """Generate a care contract and return its object key."""
+        key, _ = self.upload_document(
+            CONTRACT, contract_data, contract_data.contract_id
+        )
+        return key
+
+    def upload_incident_report(self, incident_report_data: IncidentReportData) -> str:
+        """Generate an incident report and return its object key."""
+        key, _ = self.upload_document(
+            INCIDENT_REPORT, incident_report_data, incident_report_data.id
+        )
+        return key
+
+    def upload_invoice(self, invoice_data: InvoiceData) -> Tuple[str, int]:
+        """Generate an invoice and return its object key and size in bytes."""
+        return self.upload_document(INVOICE, invoice_data, invoice_data.id)
+
+    def upload_invoice_item(
+        self,
+        index: int,
+        invoice: Any,
+        parse: Optional[Callable[[Any], InvoiceData]] = None,
+    ) -> InvoiceBatchItem:
+        """
+        Generate and store one invoice of a batch.
+
+        Never raises: a failure, including invalid invoice data, is reported
+        in the returned item so the rest of the batch carries on.
 
         Args:
-            pdf_file: In-memory PDF file.
-            filename: Desired filename in object storage.
+            index: Position of the invoice in the batch
+            invoice: Data for the invoice, or the input parse maps onto it
+            parse: Optional mapping of invoice onto InvoiceData
 
         Returns:
-            URL to the stored PDF.
+            Object key and size, or the error
         """
+        item = InvoiceBatchItem(index=index, invoice_id=getattr(invoice, "id", None))
         try:
-            pdf_file = self.generate_appointment_card(appointment_card_data)
-            filename = f"appointment_cards/{datetime.now().strftime('%Y-%m-%d')}/appointment_card_{str(appointment_card_data.id)}.pdf"
-            key = self.object_storage_client.upload_file(
-                file_obj=pdf_file, key=filename, content_type="application/pdf"
-            )
-            return key
+            invoice_data = parse(invoice) if parse else invoice
         except Exception as e:
-            raise Exception(f"PDF upload error: {str(e)}")
+            self.logger.error(f"Invoice {index} of a batch is invalid: {e}")
+            item.error = str(e)
+            return item
+        item.invoice_id = invoice_data.id
+        give_up = time.monotonic() + BATCH_MAX_WAIT_SECONDS
+        while True:
+            try:
+                item.key, item.size = self.upload_invoice(invoice_data)
+                return item
+            except ResourceExhaustedError as e:
+                if time.monotonic() >= give_up:
+                    item.error = e.message
+                    return item
+                time.sleep(BATCH_RETRY_SECONDS)
+            except Exception as e:
+                self.logger.error(f"Invoice {invoice_data.id} of a batch failed: {e}")
+                item.error = str(e)
+                return item
+
+    def upload_invoices(
+        self,
+        invoices: Iterable[Any],
+        parse: Optional[Callable[[Any], InvoiceData]] = None,
+    ) -> Iterator[InvoiceBatchItem]:
+        """
+        Generate and store a stream of invoices, batch_concurrency at a time.
+
+        Invoices are read from the iterable while earlier ones are rendered
+        and uploaded, so results can be consumed before the input ends.
+
+        Args:
+            invoices: Invoice data, or e.g. the messages of a request stream
+            parse: Optional mapping of each invoice onto InvoiceData, run per
+                invoice so invalid data fails only its own item
+
+        Yields:
+            One item per invoice, in completion order
+
+        Raises:
+            Exception: Whatever reading the iterable raised, after the
+                invoices read so far have been yielded
+        """
+        results: queue.Queue = queue.Queue()
+        slots = threading.Semaphore(self.batch_concurrency)
+        done = object()
+
+        def run(index: int, invoice: Any) -> None:
+            try:
+                results.put(self.upload_invoice_item(index, invoice, parse))
+            finally:
+                slots.release()
+
+        def read() -> None:
+            try:
+                with ThreadPoolExecutor(
+                    self.batch_concurrency, thread_name_prefix="pdf-batch"
+                ) as executor:
+                    for index, invoice in enumerate(invoices):
+                        slots.acquire()
+                        executor.submit(run, index, invoice)
+            except Exception as e:
+                results.put(e)
+            finally:
+                results.put(done)
+
+        threading.Thread(target=read, name="pdf-batch-reader", daemon=True).start()
+        failure: Optional[Exception] = None
+        while (item := results.get()) is not done:
+            if isinstance(item, Exception):
+                failure = item
+                continue
+            yield item
+        if failure is not None:
+            raise failure
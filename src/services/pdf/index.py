@@ -0,0 +1,77 @@
+"""
+PDF Content Index
+Content-addressed object keys for generated PDFs, and a local index of the
+ones already stored.
+
+With PDF_CONTENT_ADDRESSED on, a document's object key is derived from the
+request data and the version of its template and stylesheets instead of
+the current date. The data is written out as JSON with sorted keys, so the
+order of map entries in the request does not matter; list order does, as it
+is printed. Rendering the same data with the same template again produces
+the same key, so the service can check whether that key is stored before
+rendering anything. The index remembers keys this process has stored or seen
+in object storage, which saves the HEAD request as well.
+"""
+
+import hashlib
+import json
+from typing import Optional
+
+from pydantic import BaseModel
+
+from src.core.config import Config
+from src.core.tiered_cache import TieredCache
+
+
+def document_fingerprint(
+    document_name: str, template_version: str, data: BaseModel
+) -> str:
+    """
+    Build the content hash of one document.
+
+    Args:
+        document_name: Kind of document, e.g. "invoice"
+        template_version: TemplateRegistry.version of its template and styles
+        data: Request data for the template
+
+    Returns:
+        Hex digest
+    """
+    canonical = json.dumps(
+        data.model_dump(mode="json"), sort_keys=True, separators=(",", ":")
+    )
+    return hashlib.sha256(
+        f"{document_name}\n{template_version}\n{canonical}".encode("utf-8")
+    ).hexdigest()
+
+
+class PdfIndex(TieredCache):
+    """
+    Sizes of content-addressed PDFs known to be in object storage, by key.
+
+    Entries expire after PDF_INDEX_TTL_SECONDS, after which the object is
+    checked with a HEAD request again.
+    """
+
+    @classmethod
+    def from_config(cls, config: Config) -> "PdfIndex":
+        """Build the index from the PDF_INDEX_* settings."""
+        return cls.from_settings(
+            enabled=config.pdf_content_addressed,
+            max_entries=config.pdf_index_max_entries,
+            ttl_seconds=config.pdf_index_ttl_seconds,
+            path=config.pdf_index_path,
+            table="pdf_objects",
+        )
+
+    def load(self, key: str) -> Optional[int]:
+        """Return the size of the PDF stored under key, if it is indexed."""
+        if not self.backends:
+            return None
+        value = self.get(key)
+        return int(value) if value is not None else None
+
+    def save(self, key: str, size: int) -> None:
+        """Record that a PDF of size bytes is stored under key."""
+        if self.backends:
+            self.set(key, str(size))
@@ -0,0 +1,56 @@
+"""
+PDF Render Pool
+Dedicated process pool for WeasyPrint renders.
+
+A render holds the GIL for hundreds of milliseconds, so rendering on gRPC
+threads stalled every other RPC in the process. Renders now run in worker
+processes that load WeasyPrint and the fonts once. Requests beyond the
+queue are rejected right away so callers can back off, and a worker is
+replaced after PDF_POOL_MAX_DOCUMENTS documents because WeasyPrint's caches
+only grow.
+
+A running or waiting render still holds its server thread. By default the
+pool and its queue together take at most half of the GRPC_MAX_WORKERS
+server threads, so other RPCs are still answered while it is full.
+"""
+
+import os
+from logging import Logger
+
+from src.core.config import Config
+from src.core.process_pool import BoundedProcessPool
+from src.services.pdf.renderer import init_render_worker
+
+
+class PdfRenderPool(BoundedProcessPool):
+    """Process pool that lays out PDF documents."""
+
+    @classmethod
+    def from_config(cls, config: Config, logger: Logger) -> "PdfRenderPool":
+        """
+        Build the pool sized by configuration.
+
+        With PDF_POOL_PROCESSES at 0, the pool gets one process per core,
+        and processes plus queue are capped at half the server threads.
+        Explicit sizes are used as given.
+        """
+        budget = max(1, config.grpc_max_workers // 2)
+        processes = config.pdf_pool_processes
+        max_queue = config.pdf_pool_queue_size
+        if not processes:
+            processes = min(os.cpu_count() or 1, budget)
+            max_queue = min(max_queue, budget - processes)
+        elif processes + max_queue > budget:
+            logger.warning(
+                f"PDF pool holds up to {processes + max_queue} of "
+                f"{config.grpc_max_workers} server threads; other RPCs may "
+                "wait while it is full"
+            )
+        return cls(
+            num_processes=processes,
+            max_queue=max_queue,
+            logger=logger,
+            name="pdf-pool",
+            initializer=init_render_worker,
+            max_jobs_per_process=config.pdf_pool_max_documents,
+        )
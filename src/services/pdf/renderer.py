@@ -0,0 +1,144 @@
+"""
+PDF Renderer
+WeasyPrint layout, run in the server process or in a PdfRenderPool worker.
+
+WeasyPrint is pure Python and holds the GIL for the whole layout of a
+document, so the server hands rendering to worker processes. Importing
+WeasyPrint and loading the system fonts takes longer than rendering a small
+document; init_render_worker does both once when a worker starts.
+
+Everything a document shares with the previous one is kept for the life of
+the process: the parsed stylesheets (reparsed only when the file changes),
+one FontConfiguration, the images WeasyPrint has decoded, and every file a
+document referenced through fetch_url.
+"""
+
+import os
+from io import BytesIO
+from typing import Any, Dict, Optional, Sequence, Tuple
+
+# Render workers yield the CPU to gRPC threads and solver processes
+RENDER_NICENESS = 5
+
+# Fetched logos and images kept in memory; further URLs are fetched each time
+MAX_FETCHED_RESOURCES = 64
+
+_font_config: Optional[Any] = None
+_stylesheets: Dict[str, Tuple[int, Any]] = {}
+_fetched: Dict[str, Dict[str, Any]] = {}
+_image_cache: Dict[Any, Any] = {}
+
+
+def init_render_worker() -> None:
+    """Prepare a fresh render worker process before its first document."""
+    os.nice(RENDER_NICENESS)
+    # Lay out a tiny page so WeasyPrint, Pango and fontconfig are loaded
+    render_pdf("<p>.</p>")
+
+
+def font_config() -> Any:
+    """Return the process's FontConfiguration, creating it on first use."""
+    global _font_config
+    if _font_config is None:
+        from weasyprint.text.fonts import FontConfiguration
+
+        _font_config = FontConfiguration()
+    return _font_config
+
+
+def fetch_url(url: str, **kwargs: Any) -> Dict[str, Any]:
+    """
+    WeasyPrint url_fetcher that keeps what it fetched in memory.
+
+    Args:
+        url: Absolute URL of an image, stylesheet or font
+        **kwargs: Passed on to weasyprint.default_url_fetcher
+
+    Returns:
+        Fetched resource in the url_fetcher result format
+    """
+    cached = _fetched.get(url)
+    if cached is None:
+        from weasyprint import default_url_fetcher
+
+        cached = default_url_fetcher(url, **kwargs)
+        file_obj = cached.pop("file_obj", None)
+        if file_obj is not None:
+            with file_obj:
+                cached["string"] = file_obj.read()
+        if len(_fetched) < MAX_FETCHED_RESOURCES:
+            _fetched[url] = cached
+    # WeasyPrint may modify the result it is given
+    return dict(cached)
+
+
+def stylesheet(path: str) -> Any:
+    """
+    Return the parsed stylesheet at path.
+
+    Args:
+        path: CSS file
+
+    Returns:
+        weasyprint.CSS, parsed again only when the file has changed
+    """
+    from weasyprint import CSS
+
+    mtime = os.stat(path).st_mtime_ns
+    cached = _stylesheets.get(path)
+    if cached is None or cached[0] != mtime:
+        css = CSS(filename=path, font_config=font_config(), url_fetcher=fetch_url)
+        cached = _stylesheets[path] = (mtime, css)
+    return cached[1]
+
+
+def render_pdf(
+    html_content: str,
+    stylesheets: Sequence[str] = (),
+    base_url: Optional[str] = None,
+) -> BytesIO:
+    """
+    Lay out HTML as a PDF.
+
+    Args:
+        html_content: Rendered template
+        stylesheets: CSS files applied to the document
+        base_url: Base for relative URLs in the document
+
+    Returns:
+        In-memory PDF file, positioned at the start
+    """
+    # WeasyPrint loads Pango when imported; keep that out of module import so
+    # processes that never render a PDF do not need it
+    from weasyprint import HTML
+
+    pdf_file = BytesIO()
+    HTML(string=html_content, base_url=base_url, url_fetcher=fetch_url).write_pdf(
+        pdf_file,
+        stylesheets=[stylesheet(path) for path in stylesheets],
+        font_config=font_config(),
+        cache=_image_cache,
+    )
+    pdf_file.seek(0)
+    return pdf_file
+
+
+def render_in_worker(
+    html_content: str,
+    stylesheets: Sequence[str],
+    base_url: Optional[str],
+    stop_event: Any,
+) -> bytes:
+    """
+    Render one document in a PdfRenderPool worker.
+
+    Args:
+        html_content: Rendered template
+        stylesheets: CSS files applied to the document
+        base_url: Base for relative URLs in the document
+        stop_event: Pool stop event; a WeasyPrint layout cannot be interrupted
+
+    Returns:
+        PDF bytes
+    """
+    return render_pdf(html_content, stylesheets, base_url).getvalue()
@@ -1,4 +1,4 @@
-from typing import List, Optional
+from typing import Dict, List, Optional
 from pydantic import BaseModel, Field
 
 
@@ -18,3 +18,109 @@ class AppointmentCardData(BaseModel):
     school_internship: List[str] = Field(default_factory=list)
     travel: List[str] = Field(default_factory=list)
     leave: List[str] = Field(default_factory=list)
+
+
+class ContractData(BaseModel):
+    contract_id: Optional[int] = None
+    status: str = ""
+    start_date: str = ""
+    end_date: str = ""
+    reminder_period: int = 0
+    sender_name: str = ""
+    sender_address: str = ""
+    sender_contact_info: str = ""
+    client_first_name: str = ""
+    client_last_name: str = ""
+    client_address: str = ""
+    client_contact_info: str = ""
+    care_type: str = ""
+    care_name: str = ""
+    financing_act: str = ""
+    financing_option: str = ""
+    hours: float = 0.0
+    hours_type: str = ""
+    ambulante_display: str = ""
+    price: float = 0.0
+    price_time_unit: str = ""
+    vat: float = 0.0
+    type_name: str = ""
+    generation_date: str = ""
+
+
+class IncidentReportData(BaseModel):
+    id: Optional[int] = None
+    employee_id: Optional[int] = None
+    employee_first_name: str = ""
+    employee_last_name: str = ""
+    location_id: Optional[int] = None
+    reporter_involvement: str = ""
+    inform_who: List[str] = Field(default_factory=list)
+    incident_date: str = ""
+    runtime_incident: str = ""
+    incident_type: str = ""
+    passing_away: bool = False
+    self_harm: bool = False
+    violence: bool = False
+    fire_water_damage: bool = False
+    accident: bool = False
+    client_absence: bool = False
+    medicines: bool = False
+    organization: bool = False
+    use_prohibited_substances: bool = False
+    other_notifications: bool = False
+    severity_of_incident: str = ""
+    incident_explanation: str = ""
+    recurrence_risk: str = ""
+    incident_prevent_steps: str = ""
+    incident_taken_measures: str = ""
+    technical: List[str] = Field(default_factory=list)
+    organizational: List[str] = Field(default_factory=list)
+    mese_worker: List[str] = Field(default_factory=list)
+    client_options: List[str] = Field(default_factory=list)
+    other_cause: str = ""
+    cause_explanation: str = ""
+    physical_injury: str = ""
+    physical_injury_desc: str = ""
+    psychological_damage: str = ""
+    psychological_damage_desc: str = ""
+    needed_consultation: str = ""
+    succession: List[str] = Field(default_factory=list)
+    succession_desc: str = ""
+    other: bool = False
+    other_desc: str = ""
+    additional_appointments: str = ""
+    employee_absenteeism: str = ""
+    client_id: Optional[int] = None
+    client_firstname: str = ""
+    client_lastname: str = ""
+    location_name: str = ""
+
+
+class InvoicePeriod(BaseModel):
+    start_date: str = ""
+    end_date: str = ""
+    accommodation_time_frame: str = ""
+    ambulante_total_minutes: float = 0.0
+
+
+class InvoiceDetail(BaseModel):
+    care_type: str = ""
+    periods: List[InvoicePeriod] = Field(default_factory=list)
+    price: float = 0.0
+    price_time_unit: str = ""
+    pre_vat_total: float = 0.0
+    total: float = 0.0
+
+
+class InvoiceData(BaseModel):
+    id: Optional[int] = None
+    sender_name: str = ""
+    sender_contact_person: str = ""
+    sender_address_line1: str = ""
+    sender_postal_code_city: str = ""
+    invoice_number: str = ""
+    invoice_date: str = ""
+    due_date: str = ""
+    invoice_details: List[InvoiceDetail] = Field(default_factory=list)
+    total_amount: float = 0.0
+    extra_items: Dict[str, str] = Field(default_factory=dict)
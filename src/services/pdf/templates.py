@@ -0,0 +1,126 @@
+"""
+PDF Template Registry
+Jinja templates of the PDF documents, compiled once per process.
+
+Building a Jinja Environment and parsing the template on every request put
+template setup in the cost of each PDF. The registry owns one Environment
+for the template directory and compiles every template when the service
+starts. Compiled templates stay in memory; with auto-reload on, Jinja only
+recompiles a template whose file mtime has changed. A FileSystemBytecodeCache
+(PDF_TEMPLATE_CACHE_DIR) lets new processes load compiled code instead of
+parsing the sources again.
+"""
+
+import hashlib
+import os
+from logging import Logger
+from typing import Any, Dict, List, Tuple
+
+from jinja2 import (
+    Environment,
+    FileSystemBytecodeCache,
+    FileSystemLoader,
+    Template,
+    select_autoescape,
+)
+
+from src.core.config import Config
+
+
+class TemplateRegistry:
+    """Compiled Jinja templates shared by every PDF request in the process."""
+
+    def __init__(
+        self,
+        directory: str,
+        logger: Logger,
+        bytecode_cache_dir: str = "",
+        auto_reload: bool = True,
+    ):
+        """
+        Initialize the registry.
+
+        Args:
+            directory: Directory holding the HTML templates
+            logger: Logger instance
+            bytecode_cache_dir: Directory for compiled template bytecode
+                (empty = keep compiled templates in memory only)
+            auto_reload: Recompile a template when its file changes
+        """
+        self.directory = directory
+        self.logger = logger
+        bytecode_cache = None
+        if bytecode_cache_dir:
+            os.makedirs(bytecode_cache_dir, exist_ok=True)
+            bytecode_cache = FileSystemBytecodeCache(bytecode_cache_dir)
+        self.environment = Environment(
+            loader=FileSystemLoader(directory),
+            autoescape=select_autoescape(["html", "xml"]),
+            auto_reload=auto_reload,
+            bytecode_cache=bytecode_cache,
+            # Keep every template; the set is small and fixed
+            cache_size=-1,
+        )
+        # path -> (mtime_ns, sha256 of the file)
+        self._digests: Dict[str, Tuple[int, str]] = {}
+
+    @classmethod
+    def from_config(cls, config: Config, logger: Logger) -> "TemplateRegistry":
+        """Build the registry and compile its templates."""
+        registry = cls(
+            directory=config.pdf_template_dir,
+            logger=logger,
+            bytecode_cache_dir=config.pdf_template_cache_dir,
+            auto_reload=config.pdf_template_auto_reload,
+        )
+        registry.warm()
+        return registry
+
+    def warm(self) -> List[str]:
+        """
+        Compile every HTML template in the directory.
+
+        Returns:
+            Names of the compiled templates
+        """
+        names = self.environment.list_templates(extensions=["html"])
+        for name in names:
+            self.environment.get_template(name)
+        self.logger.info(f"Compiled {len(names)} PDF templates from {self.directory}")
+        return names
+
+    def get(self, name: str) -> Template:
+        """Return the compiled template, recompiling it if its file changed."""
+        return self.environment.get_template(name)
+
+    def render(self, name: str, **context: Any) -> str:
+        """Render a template to HTML."""
+        return self.get(name).render(**context)
+
+    def version(self, *names: str) -> str:
+        """
+        Digest of the contents of files in the template directory.
+
+        Files are hashed again only when their mtime changes.
+
+        Args:
+            *names: Template and stylesheet names, e.g. "invoice.html"
+
+        Returns:
+            Hex digest that changes whenever one of the files is edited
+        """
+        version = hashlib.sha256()
+        for name in names:
+            path = self.path(name)
+            mtime = os.stat(path).st_mtime_ns
+            cached = self._digests.get(path)
+            if cached is None or cached[0] != mtime:
+                with open(path, "rb") as f:
+                    cached = (mtime, hashlib.sha256(f.read()).hexdigest())
+                self._digests[path] = cached
+            version.update(f"{name}:{cached[1]}\n".encode("utf-8"))
+        return version.hexdigest()
+
+    def path(self, name: str = "") -> str:
+        """Absolute path of a file in the template directory, e.g. a stylesheet."""
+        return os.path.abspath(os.path.join(self.directory, name))
@@ -0,0 +1,27 @@
+"""
+Report Summary Memo
+Long-lived, content-addressed store of intermediate report summaries.
+
+Weekly auto-reports for a client repeat last week's input plus a few new
+reports. Chunk and merge summaries are stored under the hash of the prompt
+that produced them, so a new request only pays for chunks it has not seen
+before and for the final report step.
+"""
+
+from src.core.config import Config
+from src.core.tiered_cache import TieredCache
+
+
+class ReportSummaryMemo(TieredCache):
+    """Memo of map/reduce summaries used by AutomatiqueReportService."""
+
+    @classmethod
+    def from_config(cls, config: Config) -> "ReportSummaryMemo":
+        """Build the memo from the REPORT_MEMO_* settings."""
+        return cls.from_settings(
+            enabled=True,
+            max_entries=config.report_memo_max_entries,
+            ttl_seconds=config.report_memo_ttl_seconds,
+            path=config.report_memo_path,
+            table="report_summaries",
+        )
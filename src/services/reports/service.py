@@ -1,10 +1,16 @@
+import asyncio
 import json
 from logging import Logger
 import re
+from typing import List
 from injector import inject
 from json_repair import repair_json
 from src.core.config import Config
+from src.core.http_transport import HttpTransport
+from src.core.llm_cache import LLMResponseCache, make_cache_key
 from src.core.llm_client import LLMClient
+from src.core.text_chunker import split_text
+from src.services.reports.memo import ReportSummaryMemo
 from src.services.reports.schemas import (
     GenerateAutoReportRequest,
     GenerateAutoReportResponse,
@@ -29,32 +35,177 @@ here are the reports to analyze:
 """
 
 
+CHUNK_SUMMARY_PROMPT = """
+The following reports are one part of a longer, chronologically ordered history.
+Summarize them in plain text. Keep dates, key findings, incidents, trends and
+recommendations; drop repetition. Do not add information that is not in the
+reports and do not return JSON.
+
+here are the reports to summarize:
+{reports}
+"""
+
+
+MERGE_SUMMARIES_PROMPT = """
+The following texts are summaries of consecutive parts of a longer,
+chronologically ordered history of reports. Merge them into one plain-text
+summary that keeps dates, key findings, incidents, trends and recommendations.
+Do not add information that is not in the summaries and do not return JSON.
+
+here are the summaries to merge:
+{summaries}
+"""
+
+SUMMARY_SEPARATOR = "\n\n---\n\n"
+
+
 class AutomatiqueReportService:
     @inject
-    def __init__(self, logger: Logger, config: Config):
+    def __init__(
+        self,
+        logger: Logger,
+        config: Config,
+        transport: HttpTransport,
+        response_cache: LLMResponseCache,
+        summary_memo: ReportSummaryMemo,
+    ):
         self.llm_client = LLMClient(
-            model_name="x-ai/grok-4-fast", config=config, system_prompt=SYSTEM_PROMPT
+            model_name="x-ai/grok-4-fast",
+            config=config,
+            system_prompt=SYSTEM_PROMPT,
+            transport=transport,
+            cache=response_cache,
         )
+        self.summary_memo = summary_memo
+        self.chunk_max_chars = config.report_chunk_max_chars
+        self.max_parallel_chunks = config.report_max_parallel_chunks
         self.logger = logger
 
     def generate_report(
         self, req: GenerateAutoReportRequest
     ) -> GenerateAutoReportResponse:
         try:
+            if len(req.text) > self.chunk_max_chars:
+                # Only the LLM calls go to the transport loop; the memo I/O
+                # and parsing stay off it
+                return asyncio.run(self._map_reduce(req.text))
+
             llm_output: str = self.llm_client.run_sync(
                 REPORT_GENERATION_PROMPT.format(reports=req.text)
             ).output
+            return self._parse_report(llm_output)
+        except Exception as e:
+            self.logger.error(f"Error generating report: {e}")
+            raise e
 
-            match = re.search(r"```json\s*([\s\S]*?)\s*```", llm_output)
-            json_str = match.group(1) if match else llm_output.strip()
+    async def generate_report_async(
+        self, req: GenerateAutoReportRequest
+    ) -> GenerateAutoReportResponse:
+        try:
+            if len(req.text) > self.chunk_max_chars:
+                return await self._map_reduce(req.text)
 
-            try:
-                json_response = json.loads(json_str)
-            except json.JSONDecodeError:
-                repaired = repair_json(json_str)
-                json_response = json.loads(repaired)
-            validated = GenerateAutoReportResponse.model_validate(json_response)
-            return validated
+            result = await self.llm_client.run(
+                REPORT_GENERATION_PROMPT.format(reports=req.text)
+            )
+            return self._parse_report(result.output)
         except Exception as e:
             self.logger.error(f"Error generating report: {e}")
             raise e
+
+    async def _map_reduce(self, text: str) -> GenerateAutoReportResponse:
+        """
+        Summarize oversized input hierarchically.
+
+        The reports are split into chunks of at most chunk_max_chars that are
+        summarized in parallel (map). Partial summaries are then merged in
+        batches that fit the same budget until they fit into one final
+        report prompt (reduce). Order is preserved at every level.
+
+        Chunk and merge summaries are memoized under the hash of their
+        prompt. Chunks are packed from the start of the text, so a request
+        that appends new reports to last week's input reuses every earlier
+        chunk summary and only summarizes the new tail. Memo lookups run on
+        worker threads so a SQLite memo never blocks the event loop.
+
+        Args:
+            text: All reports of the request
+
+        Returns:
+            GenerateAutoReportResponse: Final report
+        """
+        semaphore = asyncio.Semaphore(self.max_parallel_chunks)
+
+        reused = 0
+
+        async def complete(prompt: str) -> str:
+            nonlocal reused
+            key = make_cache_key(self.llm_client.model_name, SYSTEM_PROMPT, prompt, {})
+            summary = await asyncio.to_thread(self.summary_memo.get, key)
+            if summary is not None:
+                reused += 1
+                return summary
+            async with semaphore:
+                result = await self.llm_client.run(prompt)
+            summary = result.output.strip()
+            await asyncio.to_thread(self.summary_memo.set, key, summary)
+            return summary
+
+        chunks = [c.body for c in split_text(text, self.chunk_max_chars) if c.body]
+        self.logger.info(f"Summarizing {len(chunks)} report chunks")
+        summaries = await asyncio.gather(
+            *(complete(CHUNK_SUMMARY_PROMPT.format(reports=c)) for c in chunks)
+        )
+
+        level = 1
+        while len(SUMMARY_SEPARATOR.join(summaries)) > self.chunk_max_chars:
+            batches = self._batch(summaries)
+            if len(batches) == len(summaries):
+                # Every summary is already over budget on its own
+                break
+            level += 1
+            self.logger.info(
+                f"Merging {len(summaries)} summaries into {len(batches)} "
+                f"(level {level})"
+            )
+            summaries = await asyncio.gather(
+                *(
+                    complete(
+                        MERGE_SUMMARIES_PROMPT.format(
+                            summaries=SUMMARY_SEPARATOR.join(batch)
+                        )
+                    )
+                    for batch in batches
+                )
+            )
+
+        self.logger.info(f"Reused {reused} memoized summaries")
+        result = await self.llm_client.run(
+            REPORT_GENERATION_PROMPT.format(reports=SUMMARY_SEPARATOR.join(summaries))
+        )
+        return self._parse_report(result.output)
+
+    def _batch(self, summaries: List[str]) -> List[List[str]]:
+        """Group consecutive summaries so each group fits chunk_max_chars."""
+        batches: List[List[str]] = []
+        size = 0
+        for summary in summaries:
+            added = len(SUMMARY_SEPARATOR) + len(summary)
+            if batches and size + added <= self.chunk_max_chars:
+                batches[-1].append(summary)
+                size += added
+            else:
+                batches.append([summary])
+                size = len(summary)
+        return batches
+
+    def _parse_report(self, llm_output: str) -> GenerateAutoReportResponse:
+        match = re.search(r"```json\s*([\s\S]*?)\s*```", llm_output)
+        json_str = match.group(1) if match else llm_output.strip()
+
+        try:
+            json_response = json.loads(json_str)
+        except json.JSONDecodeError:
+            repaired = repair_json(json_str)
+            json_response = json.loads(repaired)
+        return GenerateAutoReportResponse.model_validate(json_response)
@@ -0,0 +1,100 @@
+"""
+Schedule Horizon
+Helpers for planning several weeks and several locations in one request.
+
+A horizon is decomposed in two directions. Locations have disjoint staff, so
+each location is an independent sub-problem and locations are solved in
+parallel in the solver pool. Within a location the weeks are solved as a rolling
+horizon: one CP-SAT model per week, with the last days of the previous week
+fixed so rest rules that span the week boundary still hold, and the previous
+week's roster used as the solver hint.
+"""
+
+import datetime
+import os
+from typing import Iterator, List, Tuple
+
+from src.core.exceptions import ValidationError
+from src.services.schedule.schema import LocationSchema
+
+# Days of the previous week carried into the next window; the night-shift
+# rule looks back two days, the rest rule one.
+BOUNDARY_DAYS = 2
+
+
+def iso_weeks(start_week: int, year: int, num_weeks: int) -> Iterator[Tuple[int, int]]:
+    """
+    Yield (week, year) for consecutive ISO weeks, crossing year ends.
+
+    Args:
+        start_week: ISO week number of the first week
+        year: ISO year of the first week
+        num_weeks: Number of weeks
+
+    Yields:
+        (ISO week, ISO year) tuples
+    """
+    monday = datetime.date.fromisocalendar(year, start_week, 1)
+    for offset in range(num_weeks):
+        iso_year, iso_week, _ = (
+            monday + datetime.timedelta(weeks=offset)
+        ).isocalendar()
+        yield iso_week, iso_year
+
+
+def validate_horizon(
+    locations: List[LocationSchema],
+    start_week: int,
+    year: int,
+    num_weeks: int,
+    max_weeks: int,
+) -> None:
+    """
+    Check a horizon request before any solving starts.
+
+    Raises:
+        ValidationError: If the horizon is empty, too long, starts on an
+            invalid week, or an employee belongs to more than one location
+    """
+    if not locations:
+        raise ValidationError("At least one location is required", field="locations")
+    if not 1 <= num_weeks <= max_weeks:
+        raise ValidationError(
+            f"num_weeks must be between 1 and {max_weeks}",
+            field="num_weeks",
+            invalid_value=num_weeks,
+        )
+    try:
+        datetime.date.fromisocalendar(year, start_week, 1)
+    except ValueError as e:
+        raise ValidationError(
+            f"Invalid start week: {e}", field="start_week", invalid_value=start_week
+        )
+
+    seen = {}
+    for location in locations:
+        for emp in location.employees:
+            if emp.id in seen and seen[emp.id] != location.id:
+                raise ValidationError(
+                    f"Employee {emp.id} is assigned to locations "
+                    f"{seen[emp.id]} and {location.id}",
+                    field="locations",
+                    invalid_value=emp.id,
+                )
+            seen[emp.id] = location.id
+
+
+def plan_processes(num_locations: int, max_processes: int) -> Tuple[int, int]:
+    """
+    Split the machine between location processes and CP-SAT workers.
+
+    Args:
+        num_locations: Independent sub-problems
+        max_processes: Configured process limit (0 = one per core)
+
+    Returns:
+        (processes, CPU cores available to each process)
+    """
+    cores = os.cpu_count() or 1
+    processes = min(num_locations, max_processes or cores, cores)
+    return max(1, processes), max(1, cores // max(1, processes))
@@ -0,0 +1,93 @@
+"""
+Schedule Model Strengthening
+Redundant structure that shrinks the CP-SAT search for ShiftScheduler.
+
+The deviation variables get the tightest domain the week allows, and the
+per-shift coverage limits are summed into per-day cuts so the LP relaxation
+sees how many hours every day has to be staffed. On rosters where the target
+hours do not add up to the coverage demand this is what lets the search
+prove its lower bound.
+
+Employees with the same target hours and the same recent history are
+interchangeable: swapping their rows turns one roster into another with the
+same cost. Ordering the rows of each class lexicographically keeps one
+representative of every permutation. CP-SAT's presolve detects the same row
+symmetry by itself and the explicit ordering hides it, which measured slower
+in tests/benchmarks, so ShiftScheduler only adds it on request.
+
+None of the helpers here change the optimal cost.
+"""
+
+from collections import defaultdict
+from typing import Hashable, List, Sequence
+
+from ortools.sat.python import cp_model
+
+
+def interchangeable_groups(keys: Sequence[Hashable]) -> List[List[int]]:
+    """
+    Group row indices that share a key.
+
+    Args:
+        keys: One key per employee row; rows with equal keys are
+            interchangeable in the model
+
+    Returns:
+        Groups of two or more indices, each in ascending order
+    """
+    groups = defaultdict(list)
+    for index, key in enumerate(keys):
+        groups[key].append(index)
+    return [group for group in groups.values() if len(group) > 1]
+
+
+def add_lex_ordering(
+    model: cp_model.CpModel, rows: Sequence[Sequence[cp_model.IntVar]]
+) -> None:
+    """
+    Constrain boolean rows to be lexicographically non-increasing.
+
+    Each consecutive pair (a, b) gets a chain of "prefix equal" literals:
+    while the prefixes agree, a[k] >= b[k]; the chain stays true exactly as
+    long as a[k] == b[k], so the first differing position has a[k] = 1 and
+    b[k] = 0.
+
+    Args:
+        model: Model to add the constraints to
+        rows: Boolean variable rows of equal length, in the required order
+    """
+    for a, b in zip(rows, rows[1:]):
+        # Literal "a[:k] == b[:k]"; None while the prefix is empty
+        equal = None
+        for k, (x, y) in enumerate(zip(a, b)):
+            if equal is None:
+                model.AddImplication(y, x)
+            else:
+                model.AddImplication(y, x).OnlyEnforceIf(equal)
+            if k == len(a) - 1:
+                break
+            # With x >= y, the positions agree unless x = 1 and y = 0
+            next_equal = model.NewBoolVar(f"lex_{k}")
+            model.AddBoolOr([y, x.Not()]).OnlyEnforceIf(next_equal)
+            if equal is None:
+                model.AddBoolOr([x, next_equal])
+                model.AddBoolOr([y.Not(), next_equal])
+            else:
+                model.AddImplication(next_equal, equal)
+                model.AddBoolOr([equal.Not(), x, next_equal])
+                model.AddBoolOr([equal.Not(), y.Not(), next_equal])
+            equal = next_equal
+
+
+def deviation_bound(target: int, max_hours: int) -> int:
+    """
+    Largest possible |hours - target| for hours in [0, max_hours].
+
+    Args:
+        target: Scaled target hours
+        max_hours: Scaled hours of the longest possible week
+
+    Returns:
+        Upper bound of the deviation variable
+    """
+    return max(abs(target), abs(max_hours - target))
@@ -0,0 +1,30 @@
+"""
+Schedule Solver Pool
+Dedicated process pool for the CP-SAT solves behind GenerateSchedule.
+
+Solving on gRPC worker threads let a few long solves take every thread and
+starve cheap RPCs. Solves now run in a fixed number of processes; requests
+beyond that wait in a short queue, and requests beyond the queue are
+rejected right away so the caller can back off. Schedule RPCs therefore
+hold at most SCHEDULE_POOL_PROCESSES + SCHEDULE_POOL_QUEUE_SIZE of the
+GRPC_MAX_WORKERS server threads; keep that sum well below the thread count.
+"""
+
+from logging import Logger
+
+from src.core.config import Config
+from src.core.process_pool import BoundedProcessPool
+
+
+class SolverPool(BoundedProcessPool):
+    """Process pool that runs ShiftScheduler solves."""
+
+    @classmethod
+    def from_config(cls, config: Config, logger: Logger) -> "SolverPool":
+        """Build the pool sized by configuration."""
+        return cls(
+            num_processes=config.schedule_pool_processes,
+            max_queue=config.schedule_pool_queue_size,
+            logger=logger,
+            name="solver-pool",
+        )
@@ -18,6 +18,21 @@ class ShiftSchema(BaseModel):
     end_time: datetime.time  # Changed to time only
 
 
+class PreviousAssignmentSchema(BaseModel):
+    """One employee on one shift in a previous roster (warm-start hint)"""
+
+    employee_id: uuid.UUID
+    day_name: str  # "Monday", "Tuesday", etc.
+    shift_id: int
+
+
+class ConflictSchema(BaseModel):
+    """A group of hard constraints that takes part in an infeasibility"""
+
+    group: str  # "coverage:Monday", "one_shift_per_day", "rest", ...
+    reason: str  # Human-readable, actionable explanation
+
+
 class AssignedEmployeeSchema(BaseModel):
     id: uuid.UUID
     name: str
@@ -73,6 +88,21 @@ class EmployeeSummarySchema(BaseModel):
     shifts: Dict[str, int]
 
 
+class SolveStatsSchema(BaseModel):
+    """How the solver got to the returned schedule"""
+
+    profile: str  # "fast", "balanced" or "optimal"
+    size_class: str  # "small", "medium" or "large"
+    num_workers: int
+    wall_time_seconds: float
+    objective_value: float  # Total deviation from target hours (x10)
+    best_bound: float
+    first_solution_seconds: float = 0.0
+    hint_used: bool = False  # Solver started from a previous roster
+    hint_feasible: bool = False  # Previous roster satisfied every constraint
+    time_saved_seconds: float = 0.0  # vs. last solve of these shifts without hint
+
+
 class ScheduleResponseSchema(BaseModel):
     """Hybrid response structure with both flat and grid views"""
 
@@ -82,3 +112,41 @@ class ScheduleResponseSchema(BaseModel):
     shifts: List[ScheduledShiftSchema]  # Flat list for database
     grid_view: GridViewSchema  # Grid for frontend visualization
     summary: List[EmployeeSummarySchema]
+    solve_stats: Optional[SolveStatsSchema] = None
+
+
+class ScheduleUpdateSchema(BaseModel):
+    """One improving solution of a streamed schedule solve"""
+
+    schedule: ScheduleResponseSchema
+    solution_index: int  # 1-based count of solutions found so far
+    final: bool  # True once the solver has stopped
+
+
+class LocationSchema(BaseModel):
+    """Staff and shift types of one location in a horizon request"""
+
+    id: str
+    name: str = ""
+    employees: List[EmployeeSchema]
+    shifts: List[ShiftSchema]
+
+
+class LocationScheduleSchema(BaseModel):
+    """Rolling-horizon result for one location"""
+
+    location_id: str
+    # "optimal" or "feasible"; when a week has no roster, weeks stop there
+    # and status is "infeasible", "timeout", "cancelled" or "unknown"
+    status: str
+    weeks: List[ScheduleResponseSchema]
+
+
+class HorizonScheduleSchema(BaseModel):
+    """Multi-week, multi-location schedule"""
+
+    start_week: int
+    year: int
+    num_weeks: int
+    locations: List[LocationScheduleSchema]
+    wall_time_seconds: float
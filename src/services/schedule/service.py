@@ -1,9 +1,40 @@
+import dataclasses
+import math
+import queue
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, CancelledError, Future, wait
 from logging import Logger
-from typing import Optional
+from typing import Any, Callable, Iterator, Optional, Union
+import numpy as np
 from injector import inject
 from ortools.sat.python import cp_model
 
+import generated.schedule_service_pb2 as pb2
+
+from src.core.config import Config
+from src.core.exceptions import InfeasibleScheduleError, ResourceExhaustedError
+from src.core.process_pool import PoolJob
+from src.services.schedule.horizon import (
+    BOUNDARY_DAYS,
+    iso_weeks,
+    plan_processes,
+    validate_horizon,
+)
+from src.services.schedule.model_strengthening import (
+    add_lex_ordering,
+    deviation_bound,
+    interchangeable_groups,
+)
+from src.services.schedule.pool import SolverPool
+from src.services.schedule.solution_cache import (
+    ScheduleSolutionCache,
+    schedule_fingerprint,
+)
+from src.services.schedule.solver_profiles import SolverProfile, resolve_profile
+from src.services.schedule.store import ScheduleStore, StoredSchedule
 from src.services.schedule.schema import (
+    ConflictSchema,
     EmployeeSchema,
     ShiftSchema,
     ScheduleResponseSchema,
@@ -13,8 +44,22 @@ from src.services.schedule.schema import (
     GridShiftSchema,
     EmployeeSummarySchema,
     AssignedEmployeeSchema,
+    HorizonScheduleSchema,
+    LocationScheduleSchema,
+    LocationSchema,
+    PreviousAssignmentSchema,
+    ScheduleUpdateSchema,
+    SolveStatsSchema,
 )
 
+# Upper bound for checking a warm-start hint; a complete hint is checked by
+# presolve alone, so this only matters for pathological inputs.
+HINT_CHECK_SECONDS = 2.0
+# Shortest solve allowed when the client deadline is closer than that
+MIN_SOLVE_SECONDS = 0.1
+
+_STREAM_END = object()
+
 
 class ScheduleService:
     DAYS = [
@@ -28,8 +73,23 @@ class ScheduleService:
     ]
 
     @inject
-    def __init__(self, logger: Logger):
+    def __init__(
+        self,
+        logger: Logger,
+        config: Config,
+        schedule_store: ScheduleStore,
+        solver_pool: Optional[SolverPool] = None,
+        solution_cache: Optional[ScheduleSolutionCache] = None,
+    ):
         self.logger = logger
+        self.config = config
+        self.schedule_store = schedule_store
+        # Without a pool, solves run on the calling thread
+        self.solver_pool = solver_pool
+        self.solution_cache = solution_cache or ScheduleSolutionCache()
+        # Stream solves run in this process; cap them like the pool's processes
+        self.stream_slots = config.schedule_pool_processes
+        self._stream_semaphore = threading.BoundedSemaphore(self.stream_slots)
         self.model = cp_model.CpModel()
         self.assignments = {}
 
@@ -39,21 +99,945 @@ class ScheduleService:
         shifts: list[ShiftSchema],
         week: int,
         year: int,
+        solver_profile: str = "",
+        max_solve_seconds: float = 0,
+        num_workers: int = 0,
+        previous_schedule: Optional[list[PreviousAssignmentSchema]] = None,
     ):
+        """
+        Generate a weekly schedule.
+
+        The solver starts from ``previous_schedule`` when given, otherwise from
+        the last roster stored for the same shifts.
+
+        Args:
+            employees: Employees to schedule
+            shifts: Shift types to fill every day
+            week: ISO week number
+            year: ISO year
+            solver_profile: "fast", "balanced" or "optimal" (empty = configured)
+            max_solve_seconds: Wall-clock limit (0 = configured limit)
+            num_workers: CP-SAT search workers (0 = chosen by problem size)
+            previous_schedule: Assignments of an earlier roster to start from
+
+        Returns:
+            ScheduleResponseSchema, or None if no schedule was found in time
+
+        Raises:
+            ValidationError: If the solver options are invalid
+            InfeasibleScheduleError: If no feasible schedule exists
+        """
+        return self._submit(
+            ShiftScheduler.solve,
+            employees,
+            shifts,
+            week,
+            year,
+            solver_profile,
+            max_solve_seconds,
+            num_workers,
+            previous_schedule,
+        ).result()
+
+    def generate_schedule_proto(
+        self,
+        employees: list[EmployeeSchema],
+        shifts: list[ShiftSchema],
+        week: int,
+        year: int,
+        solver_profile: str = "",
+        max_solve_seconds: float = 0,
+        num_workers: int = 0,
+        previous_schedule: Optional[list[PreviousAssignmentSchema]] = None,
+    ) -> Optional[pb2.GenerateScheduleResponse]:
+        """
+        Generate a weekly schedule as a ready-to-send gRPC response.
+
+        Takes the same arguments as generate_schedule, but fills the protobuf
+        message straight from the solved assignment matrix instead of going
+        through the pydantic response models.
+
+        Returns:
+            GenerateScheduleResponse, or None if no schedule was found in time
+
+        Raises:
+            ValidationError: If the solver options are invalid
+            InfeasibleScheduleError: If no feasible schedule exists
+        """
+        return self.submit_schedule_proto(
+            employees,
+            shifts,
+            week,
+            year,
+            solver_profile,
+            max_solve_seconds,
+            num_workers,
+            previous_schedule,
+        ).result()
+
+    def submit_schedule_proto(
+        self,
+        employees: list[EmployeeSchema],
+        shifts: list[ShiftSchema],
+        week: int,
+        year: int,
+        solver_profile: str = "",
+        max_solve_seconds: float = 0,
+        num_workers: int = 0,
+        previous_schedule: Optional[list[PreviousAssignmentSchema]] = None,
+        time_remaining: Optional[float] = None,
+    ) -> "ScheduleJob":
+        """
+        Queue a generate_schedule_proto solve on the solver pool.
+
+        Takes the same arguments as generate_schedule_proto, plus the time
+        left until the client's deadline. The solve ends before that deadline,
+        and is dropped if no pool process picks it up in time. A request seen
+        before is answered from the solution cache without solving.
+
+        Args:
+            time_remaining: Seconds until the client deadline (None = no deadline)
+
+        Returns:
+            ScheduleJob or CachedScheduleJob; result() returns the
+            GenerateScheduleResponse
+
+        Raises:
+            ValidationError: If the solver options are invalid
+            InfeasibleScheduleError: If the request fails the pre-check
+            ResourceExhaustedError: If the solver pool queue is full
+        """
+        key = None
+        if self.solution_cache.enabled:
+            key = schedule_fingerprint(
+                employees,
+                shifts,
+                week,
+                year,
+                solver_profile or self.config.schedule_solver_profile,
+                max_solve_seconds or self.config.schedule_max_solve_seconds,
+                previous_schedule,
+            )
+            cached = self.solution_cache.load(key)
+            if cached is not None:
+                self.logger.info(
+                    f"Schedule for week {week}, {year} served from cache "
+                    f"(proven optimal: {cached.proven_optimal})"
+                )
+                return CachedScheduleJob(cached.response)
+
+        return self._submit(
+            ShiftScheduler.solve_proto,
+            employees,
+            shifts,
+            week,
+            year,
+            solver_profile,
+            max_solve_seconds,
+            num_workers,
+            previous_schedule,
+            time_remaining,
+            cache_key=key,
+        )
+
+    def _submit(
+        self,
+        solve: Callable[["ShiftScheduler"], Any],
+        employees: list[EmployeeSchema],
+        shifts: list[ShiftSchema],
+        week: int,
+        year: int,
+        solver_profile: str,
+        max_solve_seconds: float,
+        num_workers: int,
+        previous_schedule: Optional[list[PreviousAssignmentSchema]],
+        time_remaining: Optional[float] = None,
+        cache_key: Optional[str] = None,
+    ) -> "ScheduleJob":
+        """Start one solve with the given result builder, recording it when done."""
         self.logger.info(f"Generating schedule for week {week}, {year}")
 
-        scheduler = ShiftScheduler(
-            employees, shifts, self.DAYS, week, year, max_solve_time=90
+        scheduler, stored = self._create_scheduler(
+            employees,
+            shifts,
+            week,
+            year,
+            solver_profile,
+            max_solve_seconds,
+            num_workers,
+            previous_schedule,
+            time_remaining,
+        )
+        if cache_key is not None and time_remaining is not None:
+            # A solve cut short by the client deadline is kept only if it
+            # still proves optimality, so a retry with more time can improve
+            cut_short = (
+                scheduler.max_solve_time
+                >= time_remaining - self.config.schedule_deadline_margin_seconds
+            )
+        else:
+            cut_short = False
+        pool_job = None
+        if self.solver_pool is not None:
+            pool_job = self.solver_pool.submit(
+                solve_in_worker,
+                solve,
+                scheduler.init_args(),
+                self.config.schedule_diagnosis_seconds,
+                timeout=time_remaining,
+            )
+        return ScheduleJob(
+            scheduler,
+            solve,
+            finish=lambda outcome: self._finish(
+                scheduler, stored, outcome, cache_key, cut_short
+            ),
+            pool_job=pool_job,
         )
-        result = scheduler.solve()
 
+    def _finish(
+        self,
+        scheduler: "ShiftScheduler",
+        stored: Optional[StoredSchedule],
+        outcome: "SolveOutcome",
+        cache_key: Optional[str] = None,
+        cut_short: bool = False,
+    ) -> Any:
+        """Record a successful solve, or explain why there is no schedule."""
+        result = outcome.result
         if result:
+            self._record_solve(scheduler, result.solve_stats, stored)
+            proven_optimal = scheduler.status == cp_model.OPTIMAL
+            if cache_key is not None and (proven_optimal or not cut_short):
+                self.solution_cache.save(cache_key, result, proven_optimal)
             self.logger.info("Schedule generated successfully.")
         else:
+            self._explain_no_solution(scheduler, outcome)
             self.logger.warning("No feasible schedule found.")
 
         return result
 
+    def stream_schedule(
+        self,
+        employees: list[EmployeeSchema],
+        shifts: list[ShiftSchema],
+        week: int,
+        year: int,
+        solver_profile: str = "",
+        max_solve_seconds: float = 0,
+        num_workers: int = 0,
+        previous_schedule: Optional[list[PreviousAssignmentSchema]] = None,
+        time_remaining: Optional[float] = None,
+    ) -> "ScheduleStream":
+        """
+        Generate a weekly schedule, yielding every improving solution.
+
+        Takes the same arguments as generate_schedule, plus the time left until
+        the client's deadline. The solve starts when the returned stream is
+        iterated, on a thread of this process rather than the solver pool, so
+        solutions can be handed over as they are found; cancelling the stream
+        stops CP-SAT. At most stream_slots streams solve at once.
+
+        Returns:
+            ScheduleStream of ScheduleUpdateSchema, ending with a final update
+
+        Raises:
+            ValidationError: If the solver options are invalid
+            InfeasibleScheduleError: If no feasible schedule exists; raised
+                by the stream when the solver proves it
+            ResourceExhaustedError: If every stream slot is taken
+        """
+        self.logger.info(f"Streaming schedule for week {week}, {year}")
+
+        if not self._stream_semaphore.acquire(blocking=False):
+            raise ResourceExhaustedError(
+                f"All {self.stream_slots} streaming schedule solves are running",
+                resource="schedule-stream",
+            )
+        try:
+            scheduler, stored = self._create_scheduler(
+                employees,
+                shifts,
+                week,
+                year,
+                solver_profile,
+                max_solve_seconds,
+                num_workers,
+                previous_schedule,
+                time_remaining,
+            )
+        except BaseException:
+            self._stream_semaphore.release()
+            raise
+        return ScheduleStream(
+            scheduler,
+            on_final=lambda result: self._record_solve(
+                scheduler, result.solve_stats, stored
+            ),
+            on_empty=lambda: self._explain_no_solution(scheduler),
+            on_close=self._stream_semaphore.release,
+        )
+
+    def generate_horizon_schedule(
+        self,
+        locations: list[LocationSchema],
+        start_week: int,
+        year: int,
+        num_weeks: int,
+        solver_profile: str = "",
+        max_solve_seconds: float = 0,
+    ) -> HorizonScheduleSchema:
+        """
+        Generate schedules for several weeks and locations.
+
+        Locations are solved in parallel solver pool processes; the weeks of
+        a location are solved one after another with the previous week's
+        last days fixed.
+
+        Args:
+            locations: Locations with their own staff and shift types
+            start_week: ISO week number of the first week
+            year: ISO year of the first week
+            num_weeks: Number of consecutive weeks
+            solver_profile: "fast", "balanced" or "optimal" (empty = configured)
+            max_solve_seconds: Wall-clock budget for the whole horizon
+                (0 = configured budget)
+
+        Returns:
+            HorizonScheduleSchema with one rolling-horizon result per location
+
+        Raises:
+            ValidationError: If the horizon or the solver options are invalid
+            ResourceExhaustedError: If the solver pool has no room at all
+        """
+        return self.submit_horizon_schedule(
+            locations, start_week, year, num_weeks, solver_profile, max_solve_seconds
+        ).result()
+
+    def submit_horizon_schedule(
+        self,
+        locations: list[LocationSchema],
+        start_week: int,
+        year: int,
+        num_weeks: int,
+        solver_profile: str = "",
+        max_solve_seconds: float = 0,
+        time_remaining: Optional[float] = None,
+    ) -> "HorizonJob":
+        """
+        Prepare the solves of a multi-week, multi-location schedule.
+
+        Takes the same arguments as generate_horizon_schedule, plus the time
+        left until the client's deadline. Each location is one job on the
+        solver pool, and at most SCHEDULE_HORIZON_MAX_PROCESSES locations of
+        a request are in the pool at once. The weekly time limits are cut so
+        every location ends before the deadline.
+
+        Args:
+            time_remaining: Seconds until the client deadline (None = no deadline)
+
+        Returns:
+            HorizonJob; result() returns the HorizonScheduleSchema
+
+        Raises:
+            ValidationError: If the horizon or the solver options are invalid
+        """
+        validate_horizon(
+            locations,
+            start_week,
+            year,
+            num_weeks,
+            self.config.schedule_horizon_max_weeks,
+        )
+        self.logger.info(
+            f"Generating {num_weeks}-week schedule from week {start_week}, {year} "
+            f"for {len(locations)} location(s)"
+        )
+
+        weeks = list(iso_weeks(start_week, year, num_weeks))
+        parallel = 1
+        if self.solver_pool is not None:
+            parallel = self.solver_pool.num_processes
+            if self.config.schedule_horizon_max_processes:
+                parallel = min(parallel, self.config.schedule_horizon_max_processes)
+        processes, cores = plan_processes(len(locations), parallel)
+        if self.solver_pool is not None:
+            # Other requests' solves share the pool's processes and cores
+            _, pool_cores = plan_processes(
+                self.solver_pool.num_processes, self.solver_pool.num_processes
+            )
+            cores = min(cores, pool_cores)
+        budget = max_solve_seconds or self.config.schedule_horizon_max_seconds
+        if time_remaining is not None:
+            budget = min(
+                budget, time_remaining - self.config.schedule_deadline_margin_seconds
+            )
+        # Locations run in rounds of `processes` and the weeks of a location
+        # back to back, so each week gets a share of the budget
+        rounds = math.ceil(len(locations) / processes)
+        week_seconds = max(
+            MIN_SOLVE_SECONDS,
+            min(self.config.schedule_max_solve_seconds, budget / (rounds * num_weeks)),
+        )
+        profiles = [
+            resolve_profile(
+                solver_profile or self.config.schedule_solver_profile,
+                num_employees=len(location.employees),
+                num_shifts=len(location.shifts),
+                num_days=len(self.DAYS),
+                max_solve_seconds=week_seconds,
+                num_workers=self.config.schedule_num_workers,
+                cpu_count=cores,
+            )
+            for location in locations
+        ]
+
+        return HorizonJob(
+            [
+                (location, weeks, profile)
+                for location, profile in zip(locations, profiles)
+            ],
+            finish=lambda results, wall_time: self._finish_horizon(
+                start_week, year, num_weeks, results, wall_time, processes
+            ),
+            pool=self.solver_pool,
+            parallel=processes,
+            time_remaining=time_remaining,
+        )
+
+    def _finish_horizon(
+        self,
+        start_week: int,
+        year: int,
+        num_weeks: int,
+        results: list[LocationScheduleSchema],
+        wall_time: float,
+        processes: int,
+    ) -> HorizonScheduleSchema:
+        """Log locations that stopped early and build the horizon result."""
+        for result in results:
+            week = f"week {len(result.weeks) + 1} of {num_weeks}"
+            if result.status == "infeasible":
+                self.logger.warning(
+                    f"Location {result.location_id}: no feasible schedule for {week}"
+                )
+            elif result.status in ("timeout", "unknown"):
+                self.logger.warning(
+                    f"Location {result.location_id}: no schedule found in time "
+                    f"for {week}"
+                )
+            elif result.status == "cancelled":
+                self.logger.info(f"Location {result.location_id}: stopped at {week}")
+        self.logger.info(
+            f"Horizon schedule generated in {wall_time}s using {processes} process(es)"
+        )
+
+        return HorizonScheduleSchema(
+            start_week=start_week,
+            year=year,
+            num_weeks=num_weeks,
+            locations=results,
+            wall_time_seconds=wall_time,
+        )
+
+    def _create_scheduler(
+        self,
+        employees: list[EmployeeSchema],
+        shifts: list[ShiftSchema],
+        week: int,
+        year: int,
+        solver_profile: str,
+        max_solve_seconds: float,
+        num_workers: int,
+        previous_schedule: Optional[list[PreviousAssignmentSchema]],
+        time_remaining: Optional[float] = None,
+    ) -> tuple["ShiftScheduler", Optional[StoredSchedule]]:
+        """Resolve the solver profile and warm-start hint for one request."""
+        profile = resolve_profile(
+            solver_profile or self.config.schedule_solver_profile,
+            num_employees=len(employees),
+            num_shifts=len(shifts),
+            num_days=len(self.DAYS),
+            max_solve_seconds=max_solve_seconds
+            or self.config.schedule_max_solve_seconds,
+            num_workers=num_workers or self.config.schedule_num_workers,
+        )
+        if time_remaining is not None:
+            # Leave time to build and send the response before the deadline
+            budget = time_remaining - self.config.schedule_deadline_margin_seconds
+            profile = dataclasses.replace(
+                profile,
+                max_time_in_seconds=max(
+                    MIN_SOLVE_SECONDS, min(profile.max_time_in_seconds, budget)
+                ),
+            )
+        self.logger.info(
+            f"Solving with profile '{profile.name}' ({profile.size_class} model, "
+            f"{profile.num_workers} workers)"
+        )
+
+        stored = self.schedule_store.load(shifts, employees)
+        if not previous_schedule and stored is not None:
+            previous_schedule = stored.assignments
+
+        scheduler = ShiftScheduler(
+            employees,
+            shifts,
+            self.DAYS,
+            week,
+            year,
+            max_solve_time=profile.max_time_in_seconds,
+            profile=profile,
+            previous_assignments=previous_schedule,
+        )
+        conflicts = scheduler.precheck()
+        if conflicts:
+            self.logger.warning(
+                f"Schedule request is infeasible: {[c.group for c in conflicts]}"
+            )
+            raise InfeasibleScheduleError([c.reason for c in conflicts])
+        return scheduler, stored
+
+    def _explain_no_solution(
+        self,
+        scheduler: "ShiftScheduler",
+        outcome: Optional["SolveOutcome"] = None,
+    ) -> None:
+        """
+        Raise with the conflicting constraint groups if the request is infeasible.
+
+        Runs the assumption-literal diagnosis when the solver proved
+        infeasibility or ran out of time without any solution. Returns quietly
+        when the search was stopped or infeasibility cannot be shown.
+
+        Args:
+            scheduler: Scheduler of the unsolved request
+            outcome: Outcome of a pooled solve, which was already diagnosed
+                in the pool process
+
+        Raises:
+            InfeasibleScheduleError: If conflicting constraint groups were found
+        """
+        if outcome is not None and outcome.pooled:
+            conflicts = outcome.conflicts
+        else:
+            started = time.monotonic()
+            conflicts = diagnose_unsolved(
+                scheduler, self.config.schedule_diagnosis_seconds
+            )
+            if conflicts is not None:
+                self.logger.info(
+                    f"Infeasibility diagnosis took {time.monotonic() - started:.3f}s"
+                )
+        if conflicts is None:
+            return
+        self.logger.info(
+            f"Conflicting constraint groups: {[c.group for c in conflicts]}"
+        )
+        if conflicts or scheduler.status == cp_model.INFEASIBLE:
+            raise InfeasibleScheduleError([c.reason for c in conflicts])
+
+    def _record_solve(
+        self,
+        scheduler: "ShiftScheduler",
+        stats: Union[SolveStatsSchema, pb2.SolveStats],
+        stored: Optional[StoredSchedule],
+    ) -> None:
+        """Fill in the time saved by the hint and store the new roster."""
+        baseline = stored.cold_wall_time if stored is not None else None
+        if stats.hint_used:
+            if baseline is not None:
+                stats.time_saved_seconds = round(
+                    max(0.0, baseline - stats.wall_time_seconds), 3
+                )
+            self.logger.info(
+                f"Warm start: hint feasible={stats.hint_feasible}, "
+                f"first solution after {stats.first_solution_seconds}s, "
+                f"saved {stats.time_saved_seconds}s"
+            )
+        else:
+            baseline = stats.wall_time_seconds
+
+        self.schedule_store.save(
+            scheduler.shifts,
+            scheduler.employees,
+            scheduler.solution_assignments(),
+            cold_wall_time=baseline,
+        )
+
+
+class _FirstSolutionTimer(cp_model.CpSolverSolutionCallback):
+    """Records when the solver found its first solution"""
+
+    def __init__(self):
+        super().__init__()
+        self.first_solution_seconds = 0.0
+        self.solutions = 0
+
+    def on_solution_callback(self) -> None:
+        if self.solutions == 0:
+            self.first_solution_seconds = self.WallTime()
+        self.solutions += 1
+
+
+class _SolutionStreamer(_FirstSolutionTimer):
+    """Builds and emits a response for every improving solution"""
+
+    def __init__(
+        self,
+        scheduler: "ShiftScheduler",
+        emit: Callable[[ScheduleUpdateSchema], None],
+    ):
+        super().__init__()
+        self.scheduler = scheduler
+        self.emit = emit
+
+    def on_solution_callback(self) -> None:
+        super().on_solution_callback()
+        if self.scheduler.stopped:
+            self.StopSearch()
+            return
+        self.scheduler.first_solution_seconds = round(self.first_solution_seconds, 3)
+        # The search is paused while the callback runs, so Value() is consistent
+        schedule = self.scheduler._build_response(self, cp_model.FEASIBLE)
+        self.emit(
+            ScheduleUpdateSchema(
+                schedule=schedule, solution_index=self.solutions, final=False
+            )
+        )
+
+
+@dataclasses.dataclass
+class SolveOutcome:
+    """What one solve hands back, possibly across a process boundary"""
+
+    result: Any
+    status: Optional[int]
+    solution: Optional[np.ndarray]
+    # Set when the solve ran in a pool process, which diagnoses it as well
+    pooled: bool = False
+    conflicts: Optional[list[ConflictSchema]] = None
+
+
+def diagnose_unsolved(
+    scheduler: "ShiftScheduler", time_limit: float
+) -> Optional[list[ConflictSchema]]:
+    """
+    Find the conflicting constraint groups of a request without a solution.
+
+    Args:
+        scheduler: Scheduler whose solve ended without a solution
+        time_limit: Seconds the diagnosis may take
+
+    Returns:
+        Conflicting groups, or None when the search was stopped or the
+        status does not call for a diagnosis
+    """
+    if scheduler.stopped or scheduler.status not in (
+        cp_model.INFEASIBLE,
+        cp_model.UNKNOWN,
+    ):
+        return None
+    return scheduler.diagnose(time_limit)
+
+
+def _run_solve(
+    solve: Callable[["ShiftScheduler"], Any], scheduler: "ShiftScheduler"
+) -> SolveOutcome:
+    result = solve(scheduler)
+    return SolveOutcome(result, scheduler.status, scheduler.solution)
+
+
+def _from_wire(result: Any) -> Any:
+    if isinstance(result, bytes):
+        return pb2.GenerateScheduleResponse.FromString(result)
+    return result
+
+
+def _stop_when_set(
+    stop_event: Any, finished: threading.Event, scheduler: "ShiftScheduler"
+) -> None:
+    """Forward a pool stop request to the running solver"""
+    while not finished.is_set():
+        if stop_event.wait(0.1):
+            scheduler.stop()
+            return
+
+
+def solve_in_worker(
+    solve: Callable[["ShiftScheduler"], Any],
+    scheduler_args: dict[str, Any],
+    diagnosis_seconds: float,
+    stop_event: Any,
+) -> SolveOutcome:
+    """
+    Rebuild a ShiftScheduler in a solver pool process and solve it.
+
+    Args:
+        solve: ShiftScheduler.solve or ShiftScheduler.solve_proto
+        scheduler_args: ShiftScheduler.init_args() of the request's scheduler
+        diagnosis_seconds: Time limit of the infeasibility diagnosis run
+            when no solution is found
+        stop_event: Set by the pool when the request is cancelled
+
+    Returns:
+        SolveOutcome with the built result, solver status, assignments and
+        the diagnosis of an unsolved request
+    """
+    scheduler = ShiftScheduler(**scheduler_args)
+    finished = threading.Event()
+    threading.Thread(
+        target=_stop_when_set, args=(stop_event, finished, scheduler), daemon=True
+    ).start()
+    try:
+        outcome = _run_solve(solve, scheduler)
+        outcome.pooled = True
+        if outcome.result is None:
+            outcome.conflicts = diagnose_unsolved(scheduler, diagnosis_seconds)
+    finally:
+        finished.set()
+    # Generated message classes are registered under their bare module name
+    # and do not unpickle in the parent, so responses travel serialized
+    if isinstance(outcome.result, pb2.GenerateScheduleResponse):
+        outcome.result = outcome.result.SerializeToString()
+    return outcome
+
+
+class ScheduleJob:
+    """
+    One schedule solve, running in the solver pool or, without a pool, on
+    the thread that calls result().
+
+    cancel() may be called from any thread, e.g. a gRPC termination callback;
+    a queued solve is dropped and a running one stops at the next check.
+    """
+
+    def __init__(
+        self,
+        scheduler: "ShiftScheduler",
+        solve: Callable[["ShiftScheduler"], Any],
+        finish: Callable[[SolveOutcome], Any],
+        pool_job: Optional[PoolJob] = None,
+    ):
+        self.scheduler = scheduler
+        self.solve = solve
+        self.finish = finish
+        self.pool_job = pool_job
+
+    def result(self) -> Any:
+        """
+        Wait for the solve and return the built result.
+
+        Returns:
+            The solve's result, or None if no schedule was found in time
+
+        Raises:
+            InfeasibleScheduleError: If no feasible schedule exists
+            concurrent.futures.CancelledError: If the job was cancelled or
+                expired while queued
+        """
+        if self.pool_job is None:
+            outcome = _run_solve(self.solve, self.scheduler)
+        else:
+            outcome = self.pool_job.result()
+            outcome.result = _from_wire(outcome.result)
+            self.scheduler.status = outcome.status
+            self.scheduler.solution = outcome.solution
+        return self.finish(outcome)
+
+    def cancel(self) -> None:
+        """Stop the solve; safe to call more than once."""
+        self.scheduler.stop()
+        if self.pool_job is not None:
+            self.pool_job.cancel()
+
+
+class CachedScheduleJob:
+    """A schedule request answered from the solution cache."""
+
+    def __init__(self, response: pb2.GenerateScheduleResponse):
+        self.response = response
+
+    def result(self) -> pb2.GenerateScheduleResponse:
+        """Return the cached response."""
+        return self.response
+
+    def cancel(self) -> None:
+        """Nothing to stop."""
+
+
+class HorizonJob:
+    """
+    The location solves of one horizon request.
+
+    With a pool, locations are submitted as solver pool jobs, at most
+    ``parallel`` at a time; when the pool is full the next location waits
+    for one of the request's own locations to finish. Without a pool the
+    locations are solved one after another on the thread that calls
+    result(). cancel() may be called from any thread.
+    """
+
+    def __init__(
+        self,
+        solves: list[tuple[LocationSchema, list[tuple[int, int]], SolverProfile]],
+        finish: Callable[[list[LocationScheduleSchema], float], Any],
+        pool: Optional[SolverPool] = None,
+        parallel: int = 1,
+        time_remaining: Optional[float] = None,
+    ):
+        self.solves = solves
+        self.finish = finish
+        self.pool = pool
+        self.parallel = parallel
+        self.deadline = (
+            time.monotonic() + time_remaining if time_remaining is not None else None
+        )
+        self._stop = threading.Event()
+        self._jobs: list[PoolJob] = []
+        self._lock = threading.Lock()
+
+    def result(self) -> Any:
+        """
+        Solve every location and return the built result.
+
+        Raises:
+            ResourceExhaustedError: If the pool has no room for the first location
+            concurrent.futures.CancelledError: If the request was cancelled, or
+                a location expired in the pool queue
+        """
+        started = time.monotonic()
+        if self.pool is None:
+            results = [
+                solve_location_horizon(*solve, self._stop) for solve in self.solves
+            ]
+        else:
+            results = self._run_in_pool()
+        if self._stop.is_set():
+            raise CancelledError()
+        return self.finish(results, round(time.monotonic() - started, 3))
+
+    def cancel(self) -> None:
+        """Stop every location; safe to call more than once."""
+        self._stop.set()
+        with self._lock:
+            jobs = list(self._jobs)
+        for job in jobs:
+            job.cancel()
+
+    def _run_in_pool(self) -> list[LocationScheduleSchema]:
+        results: list[Optional[LocationScheduleSchema]] = [None] * len(self.solves)
+        waiting = list(enumerate(self.solves))
+        running: dict[Future, int] = {}
+        try:
+            while waiting or running:
+                while waiting and len(running) < self.parallel:
+                    if self._stop.is_set():
+                        raise CancelledError()
+                    index, solve = waiting[0]
+                    try:
+                        job = self.pool.submit(
+                            solve_location_horizon, *solve, timeout=self._time_left()
+                        )
+                    except ResourceExhaustedError:
+                        # Other requests hold the pool; wait for a location
+                        # of this one to finish, unless none is running
+                        if not running:
+                            raise
+                        break
+                    with self._lock:
+                        self._jobs.append(job)
+                    if self._stop.is_set():
+                        job.cancel()
+                    running[job.future] = index
+                    waiting.pop(0)
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    results[running.pop(future)] = future.result()
+        finally:
+            # Stop the locations still running when one failed or was cancelled
+            if running:
+                self.cancel()
+        return results  # type: ignore[return-value]
+
+    def _time_left(self) -> Optional[float]:
+        if self.deadline is None:
+            return None
+        return self.deadline - time.monotonic()
+
+
+class ScheduleStream:
+    """
+    Improving solutions of one schedule solve, produced on a worker thread.
+
+    Iterating starts the solve and yields a ScheduleUpdateSchema for every
+    solution CP-SAT finds, then a final update with the end status. cancel()
+    (or abandoning the iteration) stops the search through StopSearch.
+    on_close runs once, when the solve thread ends or when a stream that was
+    never started is cancelled.
+    """
+
+    def __init__(
+        self,
+        scheduler: "ShiftScheduler",
+        on_final: Optional[Callable[[ScheduleResponseSchema], None]] = None,
+        on_empty: Optional[Callable[[], None]] = None,
+        on_close: Optional[Callable[[], None]] = None,
+    ):
+        self.scheduler = scheduler
+        self.on_final = on_final
+        self.on_empty = on_empty
+        self.on_close = on_close
+        self._updates: queue.Queue = queue.Queue()
+        self._error: Optional[BaseException] = None
+        self._thread = threading.Thread(
+            target=self._run, name="schedule-stream", daemon=True
+        )
+        self._start_lock = threading.Lock()
+        self._closed = False
+
+    def _run(self) -> None:
+        try:
+            result = self.scheduler.solve_streaming(self._updates.put)
+            if result is not None and self.on_final is not None:
+                self.on_final(result)
+            elif result is None and self.on_empty is not None:
+                self.on_empty()
+        except Exception as e:
+            self._error = e
+        finally:
+            self._close()
+            self._updates.put(_STREAM_END)
+
+    def _close(self) -> None:
+        with self._start_lock:
+            if self._closed:
+                return
+            self._closed = True
+        if self.on_close is not None:
+            self.on_close()
+
+    def __iter__(self) -> Iterator[ScheduleUpdateSchema]:
+        with self._start_lock:
+            if self._thread.ident is not None:
+                raise RuntimeError("ScheduleStream can only be iterated once")
+            self._thread.start()
+        try:
+            while (update := self._updates.get()) is not _STREAM_END:
+                yield update
+            if self._error is not None:
+                raise self._error
+        finally:
+            self.cancel()
+            self._thread.join()
+
+    def cancel(self) -> None:
+        """Stop the search; safe to call from any thread and more than once."""
+        self.scheduler.stop()
+        with self._start_lock:
+            started = self._thread.ident is not None
+        if not started:
+            self._close()
+
 
 class ShiftScheduler:
     def __init__(
@@ -63,7 +1047,12 @@ class ShiftScheduler:
         days: list[str],
         week: int,
         year: int,
-        max_solve_time: int = 30,
+        max_solve_time: float = 30,
+        profile: Optional[SolverProfile] = None,
+        previous_assignments: Optional[list[PreviousAssignmentSchema]] = None,
+        previous_days: Optional[np.ndarray] = None,
+        strengthen: bool = True,
+        break_symmetry: bool = False,
     ):
         self.employees = employees
         self.shifts = shifts
@@ -73,9 +1062,51 @@ class ShiftScheduler:
         self.model = cp_model.CpModel()
         self.assignments = {}
         self.max_solve_time = max_solve_time
+        self.previous_assignments = previous_assignments or []
+        # (employees, days, shifts) assignments of the days just before this
+        # schedule, in the same employee and shift order
+        self.previous_days = previous_days
+        # Tight deviation domains and redundant coverage cuts
+        self.strengthen = strengthen
+        # Explicit lexicographic ordering of interchangeable employees; off
+        # by default because CP-SAT presolve already exploits that symmetry
+        self.break_symmetry = break_symmetry
+        # Assumption literal per constraint group; only set while diagnosing
+        self._group_literals: Optional[dict[str, cp_model.IntVar]] = None
+        self.status: Optional[int] = None
+        self.hint_used = False
+        self.hint_feasible = False
+        self.first_solution_seconds = 0.0
+        self.solution: Optional[np.ndarray] = None
+        self.stopped = False
+        self._solver: Optional[cp_model.CpSolver] = None
+        self._solver_lock = threading.Lock()
+        self.profile = profile or resolve_profile(
+            "",
+            num_employees=len(employees),
+            num_shifts=len(shifts),
+            num_days=len(days),
+            max_solve_seconds=max_solve_time,
+        )
 
         self.shift_hours = [self._calculate_shift_hours(s) for s in shifts]
 
+    def init_args(self) -> dict[str, Any]:
+        """Constructor arguments, to rebuild this scheduler in another process"""
+        return {
+            "employees": self.employees,
+            "shifts": self.shifts,
+            "days": self.days,
+            "week": self.week,
+            "year": self.year,
+            "max_solve_time": self.max_solve_time,
+            "profile": self.profile,
+            "previous_assignments": self.previous_assignments,
+            "previous_days": self.previous_days,
+            "strengthen": self.strengthen,
+            "break_symmetry": self.break_symmetry,
+        }
+
     def _calculate_shift_hours(self, shift: ShiftSchema) -> float:
         """Calculate shift duration in hours using time objects"""
         start = shift.start_time
@@ -135,6 +1166,14 @@ class ShiftScheduler:
                         self.model.NewBoolVar(var_name)
                     )
 
+        # Model indices in (employee, day, shift) order, so one gather on the
+        # solution vector yields the dense assignment array
+        self._assignment_index = np.fromiter(
+            (var.Index() for var in self.assignments.values()),
+            dtype=np.int64,
+            count=len(self.assignments),
+        )
+
     def add_constraints(self) -> None:
         """Add all scheduling constraints"""
 
@@ -145,7 +1184,10 @@ class ShiftScheduler:
                     self.assignments[(emp.id, day_idx, shift_idx)]
                     for emp in self.employees
                 ]
-                self.model.Add(sum(shift_assignments) >= 1)  # At least 1
+                self._enforce(
+                    self.model.Add(sum(shift_assignments) >= 1),  # At least 1
+                    f"coverage:{self.days[day_idx]}",
+                )
                 self.model.Add(sum(shift_assignments) <= 2)  # At most 2
 
         # CONSTRAINT 2: Maximum one shift per day per employee
@@ -155,7 +1197,7 @@ class ShiftScheduler:
                     self.assignments[(emp.id, day_idx, shift_idx)]
                     for shift_idx in range(len(self.shifts))
                 ]
-                self.model.Add(sum(day_shifts) <= 1)
+                self._enforce(self.model.Add(sum(day_shifts) <= 1), "one_shift_per_day")
 
         # CONSTRAINT 3: No consecutive shifts (check for overlapping times)
         for emp in self.employees:
@@ -168,7 +1210,9 @@ class ShiftScheduler:
                             next_shift = self.assignments[
                                 (emp.id, day_idx + 1, next_shift_idx)
                             ]
-                            self.model.Add(curr_shift + next_shift <= 1)
+                            self._enforce(
+                                self.model.Add(curr_shift + next_shift <= 1), "rest"
+                            )
 
         # CONSTRAINT 4: No 3 consecutive shifts of the same type (if there's a "Night" shift)
         night_shifts = [i for i, s in enumerate(self.shifts) if s.start_time.hour >= 21]
@@ -180,7 +1224,9 @@ class ShiftScheduler:
                         self.assignments[(emp.id, day_idx + i, night_idx)]
                         for i in range(3)
                     ]
-                    self.model.Add(sum(night_shift_vars) <= 2)
+                    self._enforce(
+                        self.model.Add(sum(night_shift_vars) <= 2), "night_limit"
+                    )
 
     def _shifts_overlap(self, shift1_idx: int, shift2_idx: int) -> bool:
         """Check if shift1 ending late and shift2 starting early would be too close"""
@@ -196,9 +1242,174 @@ class ShiftScheduler:
 
         return False
 
+    def _enforce(self, constraint: cp_model.Constraint, group: str) -> None:
+        """Tie a hard constraint to its group's assumption literal when diagnosing"""
+        if self._group_literals is None:
+            return
+        literal = self._group_literals.get(group)
+        if literal is None:
+            literal = self._group_literals[group] = self.model.NewBoolVar(group)
+        constraint.OnlyEnforceIf(literal)
+
+    def _group_reason(self, group: str) -> str:
+        """Actionable description of a constraint group"""
+        if group.startswith("coverage:"):
+            day = group.split(":", 1)[1]
+            return f"every shift on {day} needs at least one employee"
+        if group == "one_shift_per_day":
+            return "an employee works at most one shift per day"
+        if group == "rest":
+            return (
+                "nobody starts at 10:00 or earlier the day after a shift "
+                "ending at 20:00 or later"
+            )
+        if group == "night_limit":
+            night = self._night_shift()
+            return f"nobody works {night.shift_name} three days in a row"
+        if group == "boundary":
+            return "rest rules carried over from the previous week"
+        return group
+
+    def _night_shift(self) -> Optional[ShiftSchema]:
+        """The shift CONSTRAINT 4 applies to, if any"""
+        return next((s for s in self.shifts if s.start_time.hour >= 21), None)
+
+    def precheck(self) -> list[ConflictSchema]:
+        """
+        Find infeasibility that counting alone reveals, without building a model.
+
+        Every shift needs someone every day and nobody works twice a day, so a
+        day needs as many employees as it has shifts. The late shifts of one
+        day and the early shifts of the next need distinct people, and with a
+        night shift three nights in a row need at least two.
+
+        Returns:
+            Conflicts found; empty if the request may be feasible
+        """
+        num_employees = len(self.employees)
+        num_shifts = len(self.shifts)
+        conflicts = []
+        if num_employees < num_shifts:
+            conflicts.append(
+                ConflictSchema(
+                    group="one_shift_per_day",
+                    reason=(
+                        f"{num_shifts} shifts a day need at least {num_shifts} "
+                        f"employees because an employee works at most one shift "
+                        f"per day, but only {num_employees} are available"
+                    ),
+                )
+            )
+
+        late = sum(1 for s in self.shifts if s.end_time.hour >= 20)
+        early = sum(1 for s in self.shifts if s.start_time.hour <= 10)
+        if (
+            len(self.days) > 1
+            and late
+            and early
+            and num_employees >= num_shifts
+            and num_employees < late + early
+        ):
+            conflicts.append(
+                ConflictSchema(
+                    group="rest",
+                    reason=(
+                        f"{late} shift(s) ending at 20:00 or later and {early} "
+                        f"starting at 10:00 or earlier the next day need "
+                        f"{late + early} different employees, but only "
+                        f"{num_employees} are available"
+                    ),
+                )
+            )
+
+        night = self._night_shift()
+        if night is not None and len(self.days) > 2 and num_employees == 1:
+            conflicts.append(
+                ConflictSchema(
+                    group="night_limit",
+                    reason=(
+                        f"{night.shift_name} needs at least two employees because "
+                        f"nobody works it three days in a row"
+                    ),
+                )
+            )
+        return conflicts
+
+    def diagnose(self, time_limit: float) -> list[ConflictSchema]:
+        """
+        Explain an infeasible request by its conflicting constraint groups.
+
+        Builds the hard constraints without an objective, each group behind an
+        assumption literal, and shrinks the core CP-SAT reports through
+        SufficientAssumptionsForInfeasibility until no group can be dropped.
+
+        Args:
+            time_limit: Wall-clock budget for all diagnostic solves
+
+        Returns:
+            A minimal set of conflicting groups; empty if the constraints are
+            feasible or infeasibility was not proven within the budget
+        """
+        probe = ShiftScheduler(
+            self.employees,
+            self.shifts,
+            self.days,
+            self.week,
+            self.year,
+            profile=self.profile,
+            previous_days=self.previous_days,
+            strengthen=False,
+        )
+        probe._group_literals = {}
+        probe.create_variables()
+        probe.add_constraints()
+        probe.add_boundary_constraints()
+        deadline = time.monotonic() + time_limit
+
+        core = probe._infeasible_core(list(probe._group_literals), deadline)
+        if core is None:
+            return []
+        # The reported core is sufficient, not minimal; drop what is not needed
+        for group in list(core):
+            if group not in core or len(core) == 1:
+                continue
+            smaller = probe._infeasible_core([g for g in core if g != group], deadline)
+            if smaller is not None:
+                core = smaller
+        return [
+            ConflictSchema(group=group, reason=self._group_reason(group))
+            for group in core
+        ]
+
+    def _infeasible_core(
+        self, groups: list[str], deadline: float
+    ) -> Optional[list[str]]:
+        """Groups of an infeasible core under these assumptions, or None"""
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return None
+        literals = [self._group_literals[group] for group in groups]
+        self.model.ClearAssumptions()
+        self.model.AddAssumptions(literals)
+
+        solver = cp_model.CpSolver()
+        solver.parameters.num_workers = 1
+        solver.parameters.max_time_in_seconds = remaining
+        if solver.Solve(self.model) != cp_model.INFEASIBLE:
+            return None
+        by_index = {literal.Index(): group for literal, group in zip(literals, groups)}
+        return [
+            by_index[index]
+            for index in solver.SufficientAssumptionsForInfeasibility()
+            if index in by_index
+        ]
+
     def add_objectives(self) -> None:
         """Add soft constraints as objectives to minimize"""
         deviation_vars = []
+        max_hours = len(self.days) * max(
+            (int(hours * 10) for hours in self.shift_hours), default=0
+        )
 
         for emp in self.employees:
             # Calculate total hours worked (each shift has different hours)
@@ -210,8 +1421,12 @@ class ShiftScheduler:
             )
             target = emp.target_hours
 
-            # Create variable for deviation from target
-            deviation = self.model.NewIntVar(0, 1000, f"deviation_{emp.id}")
+            # Create variable for deviation from target; at most one shift a
+            # day bounds the hours a week can hold
+            bound = deviation_bound(int(target * 10), max_hours)
+            if not self.strengthen:
+                bound = max(bound, 1000)
+            deviation = self.model.NewIntVar(0, bound, f"deviation_{emp.id}")
 
             # deviation = |total_hours - target| (scaled by 10 for integer precision)
             scaled_hours = sum(
@@ -226,66 +1441,336 @@ class ShiftScheduler:
         # Minimize total deviation
         self.model.Minimize(sum(deviation_vars))
 
-    def solve(self) -> Optional[ScheduleResponseSchema]:
-        """Solve the constraint programming model"""
+    def add_boundary_constraints(self) -> None:
+        """Carry the rest rules over from the days just before this schedule"""
+        if self.previous_days is None or not self.previous_days.shape[1]:
+            return
+
+        # CONSTRAINT 3 across the boundary: late shift yesterday, early today
+        last_day = self.previous_days[:, -1, :]
+        for emp_idx, shift_idx in zip(*np.nonzero(last_day)):
+            emp = self.employees[emp_idx]
+            for next_shift_idx in range(len(self.shifts)):
+                if self._shifts_overlap(int(shift_idx), next_shift_idx):
+                    self._enforce(
+                        self.model.Add(
+                            self.assignments[(emp.id, 0, next_shift_idx)] == 0
+                        ),
+                        "boundary",
+                    )
+
+        # CONSTRAINT 4 across the boundary: no 3 consecutive nights
+        night_shifts = [i for i, s in enumerate(self.shifts) if s.start_time.hour >= 21]
+        if not night_shifts:
+            return
+        night_idx = night_shifts[0]
+        nights = self.previous_days[:, -2:, night_idx].astype(int)
+        for emp_idx, emp in enumerate(self.employees):
+            recent = nights[emp_idx].tolist()
+            first = self.assignments[(emp.id, 0, night_idx)]
+            if len(recent) == 2 and recent[0] + recent[1] == 2:
+                self._enforce(self.model.Add(first == 0), "boundary")
+            if recent[-1] and len(self.days) > 1:
+                second = self.assignments[(emp.id, 1, night_idx)]
+                self._enforce(self.model.Add(first + second <= 1), "boundary")
+
+    def add_symmetry_breaking(self) -> None:
+        """
+        Order interchangeable employees lexicographically.
+
+        Employees are interchangeable when they share target hours and, if
+        the schedule continues an earlier one, the days carried over from
+        it. When a previous roster is hinted, each class is ordered the way
+        the hint already is so the hint stays a feasible solution.
+        """
+        history = self.previous_days
+        keys = [
+            (
+                int(emp.target_hours * 10),
+                history[emp_idx].tobytes() if history is not None else b"",
+            )
+            for emp_idx, emp in enumerate(self.employees)
+        ]
+        previous = self._previous_keys()
+        for group in interchangeable_groups(keys):
+            rows = [
+                [
+                    self.assignments[(self.employees[emp_idx].id, day_idx, shift_idx)]
+                    for day_idx in range(len(self.days))
+                    for shift_idx in range(len(self.shifts))
+                ]
+                for emp_idx in group
+            ]
+            if previous:
+                hinted = [
+                    tuple(
+                        (self.employees[emp_idx].id, day_idx, shift_idx) in previous
+                        for day_idx in range(len(self.days))
+                        for shift_idx in range(len(self.shifts))
+                    )
+                    for emp_idx in group
+                ]
+                # Stable sort keeps the given order for equal hints
+                order = sorted(range(len(group)), key=lambda i: hinted[i], reverse=True)
+                rows = [rows[i] for i in order]
+            add_lex_ordering(self.model, rows)
+
+    def add_redundant_constraints(self) -> None:
+        """Add per-day coverage cuts implied by the shift and day limits"""
+        num_shifts = len(self.shifts)
+        max_staff = min(2 * num_shifts, len(self.employees))
+        for day_idx in range(len(self.days)):
+            day_assignments = [
+                self.assignments[(emp.id, day_idx, shift_idx)]
+                for emp in self.employees
+                for shift_idx in range(num_shifts)
+            ]
+            self.model.Add(sum(day_assignments) >= num_shifts)
+            self.model.Add(sum(day_assignments) <= max_staff)
+
+    def _previous_keys(self) -> set[tuple[str, int, int]]:
+        """(employee id, day index, shift index) of the previous roster"""
+        day_index = {day: i for i, day in enumerate(self.days)}
+        shift_index = {shift.id: i for i, shift in enumerate(self.shifts)}
+        previous = {
+            (a.employee_id, day_index[a.day_name], shift_index[a.shift_id])
+            for a in self.previous_assignments
+            if a.day_name in day_index and a.shift_id in shift_index
+        }
+        return previous if previous.intersection(self.assignments) else set()
+
+    def add_hints(self) -> bool:
+        """
+        Hint every assignment with its value in the previous roster.
+
+        Previous assignments are matched by employee, weekday and shift id;
+        employees or shifts that did not exist last time are hinted as free.
+
+        Returns:
+            True if any previous assignment matched the current model
+        """
+        previous = self._previous_keys()
+        if not previous:
+            return False
+
+        for key, var in self.assignments.items():
+            self.model.AddHint(var, key in previous)
+        return True
+
+    def _hint_is_feasible(self) -> bool:
+        """Check whether the hinted roster satisfies every hard constraint"""
+        solver = cp_model.CpSolver()
+        solver.parameters.fix_variables_to_their_hinted_value = True
+        solver.parameters.num_workers = 1
+        solver.parameters.max_time_in_seconds = HINT_CHECK_SECONDS
+        status = solver.Solve(self.model)
+        return status == cp_model.OPTIMAL or status == cp_model.FEASIBLE
+
+    def _prepare(self) -> cp_model.CpSolver:
+        """Build the model and a solver configured by the profile"""
         self.create_variables()
         self.add_constraints()
+        self.add_boundary_constraints()
         self.add_objectives()
+        if self.strengthen:
+            self.add_redundant_constraints()
+        if self.break_symmetry:
+            self.add_symmetry_breaking()
+        self.hint_used = self.add_hints()
+        self.hint_feasible = self.hint_used and self._hint_is_feasible()
 
         solver = cp_model.CpSolver()
-        solver.parameters.max_time_in_seconds = self.max_solve_time
+        self.profile.apply(solver.parameters)
+        return solver
 
-        status = solver.Solve(self.model)
+    def _solve(self) -> tuple[cp_model.CpSolver, int]:
+        """Build and solve the model, timing the first solution"""
+        solver = self._prepare()
+        with self._solver_lock:
+            if self.stopped:
+                self.status = cp_model.UNKNOWN
+                return solver, cp_model.UNKNOWN
+            self._solver = solver
+
+        timer = _FirstSolutionTimer()
+        self.status = status = solver.Solve(self.model, timer)
+        self.first_solution_seconds = round(timer.first_solution_seconds, 3)
+        return solver, status
+
+    def solve(self) -> Optional[ScheduleResponseSchema]:
+        """Solve the constraint programming model"""
+        solver, status = self._solve()
 
         if status == cp_model.OPTIMAL or status == cp_model.FEASIBLE:
             return self._build_response(solver, status)  # type: ignore
         else:
             return None
 
+    def solve_proto(self) -> Optional[pb2.GenerateScheduleResponse]:
+        """Solve the model and build the gRPC response directly"""
+        solver, status = self._solve()
+
+        if status == cp_model.OPTIMAL or status == cp_model.FEASIBLE:
+            return self._build_proto(solver, status)  # type: ignore
+        else:
+            return None
+
+    def solve_streaming(
+        self, emit: Callable[[ScheduleUpdateSchema], None]
+    ) -> Optional[ScheduleResponseSchema]:
+        """
+        Solve the model, emitting every improving solution as it is found.
+
+        Args:
+            emit: Called with a ScheduleUpdateSchema per solution and once
+                more with the final result
+
+        Returns:
+            Final ScheduleResponseSchema, or None if no solution was found
+        """
+        solver = self._prepare()
+        with self._solver_lock:
+            if self.stopped:
+                return None
+            self._solver = solver
+
+        streamer = _SolutionStreamer(self, emit)
+        self.status = status = solver.Solve(self.model, streamer)
+        self.first_solution_seconds = round(streamer.first_solution_seconds, 3)
+
+        if status != cp_model.OPTIMAL and status != cp_model.FEASIBLE:
+            return None
+        result = self._build_response(solver, status)  # type: ignore
+        emit(
+            ScheduleUpdateSchema(
+                schedule=result, solution_index=streamer.solutions, final=True
+            )
+        )
+        return result
+
+    def stop(self) -> None:
+        """Stop a running solve as soon as possible"""
+        with self._solver_lock:
+            self.stopped = True
+            if self._solver is not None:
+                self._solver.StopSearch()
+
+    def _extract_assignments(
+        self, solver: Union[cp_model.CpSolver, cp_model.CpSolverSolutionCallback]
+    ) -> np.ndarray:
+        """
+        Read the solved assignments in one pass.
+
+        Args:
+            solver: Solver after Solve(), or a solution callback during search
+
+        Returns:
+            Boolean array of shape (employees, days, shifts)
+        """
+        solution = solver.response_proto.solution
+        values = np.fromiter(solution, dtype=np.int64, count=len(solution))
+        self.solution = (
+            values[self._assignment_index]
+            .reshape(len(self.employees), len(self.days), len(self.shifts))
+            .astype(bool)
+        )
+        return self.solution
+
+    def solution_assignments(self) -> list[PreviousAssignmentSchema]:
+        """Assignments of the last extracted solution, for the schedule store"""
+        if self.solution is None:
+            return []
+        emp_idx, day_idx, shift_idx = np.nonzero(self.solution)
+        return [
+            PreviousAssignmentSchema(
+                employee_id=self.employees[e].id,
+                day_name=self.days[d],
+                shift_id=self.shifts[s].id,
+            )
+            for e, d, s in zip(emp_idx.tolist(), day_idx.tolist(), shift_idx.tolist())
+        ]
+
+    def _slot_employees(self, x: np.ndarray) -> list[np.ndarray]:
+        """Employee indices on each (day, shift) slot, in day-major slot order"""
+        slot_sizes = x.sum(axis=0).ravel()
+        return np.split(np.nonzero(x.transpose(1, 2, 0))[2], np.cumsum(slot_sizes)[:-1])
+
+    def _slot_times(self, date, shift: ShiftSchema):
+        """Start and end datetimes of a shift on a date"""
+        import datetime
+
+        start_datetime = self._combine_date_time(date, shift.start_time)
+        end_datetime = self._combine_date_time(date, shift.end_time)
+
+        # If end time is before start time, shift crosses midnight
+        if shift.end_time < shift.start_time:
+            end_datetime += datetime.timedelta(days=1)
+        return start_datetime, end_datetime
+
+    def _solve_stats(
+        self, solver: Union[cp_model.CpSolver, cp_model.CpSolverSolutionCallback]
+    ) -> dict:
+        """Solve statistics shared by the domain and protobuf responses"""
+        return {
+            "profile": self.profile.name,
+            "size_class": self.profile.size_class,
+            "num_workers": self.profile.num_workers,
+            "wall_time_seconds": round(solver.WallTime(), 3),
+            "objective_value": solver.ObjectiveValue(),
+            "best_bound": solver.BestObjectiveBound(),
+            "first_solution_seconds": self.first_solution_seconds,
+            "hint_used": self.hint_used,
+            "hint_feasible": self.hint_feasible,
+        }
+
+    @staticmethod
+    def _summary_status(deviation: float) -> str:
+        if abs(deviation) < 0.01:
+            return "perfect"
+        return "overtime" if deviation > 0 else "undertime"
+
     def _build_response(
-        self, solver: cp_model.CpSolver, status: int
+        self,
+        solver: Union[cp_model.CpSolver, cp_model.CpSolverSolutionCallback],
+        status: int,
     ) -> ScheduleResponseSchema:
         """Build hybrid response with flat shifts list and grid view"""
+        x = self._extract_assignments(solver)
+        hours = np.asarray(self.shift_hours, dtype=np.float64)
+
+        # Per-employee and per-slot aggregates, all from the same array
+        actual_hours = (x * hours).sum(axis=(1, 2))
+        shift_counts = x.sum(axis=1).tolist()  # (employees, shifts)
+        slot_employees = self._slot_employees(x)
+
+        assigned_by_emp = [
+            AssignedEmployeeSchema(id=emp.id, name=f"{emp.first_name} {emp.last_name}")
+            for emp in self.employees
+        ]
+        shift_hours = hours.tolist()
+        shift_start = [shift.start_time.strftime("%H:%M") for shift in self.shifts]
+        shift_end = [shift.end_time.strftime("%H:%M") for shift in self.shifts]
 
         # Build flat shifts list for database
         shifts_list = []
 
         # Build grid view for frontend
-        grid_days = []
         grid_dates = []
         grid_shifts_by_day = {}
 
+        slot = 0
         for day_idx, day in enumerate(self.days):
             # Calculate the actual date for this day using ISO week
             date_for_day = self._get_date_from_iso_week(self.year, self.week, day_idx)
             date_str = date_for_day.isoformat()  # "2025-02-03"
-
-            grid_days.append(day)
             grid_dates.append(date_str)
 
-            # Initialize grid day
             grid_day_shifts = {}
-
             for shift_idx, shift in enumerate(self.shifts):
-                assigned = []
-                for emp in self.employees:
-                    if (
-                        solver.Value(self.assignments[(emp.id, day_idx, shift_idx)])
-                        == 1
-                    ):
-                        assigned.append(
-                            AssignedEmployeeSchema(
-                                id=emp.id, name=f"{emp.first_name} {emp.last_name}"
-                            )
-                        )
-
-                # Combine date with time to create datetime objects
-                start_datetime = self._combine_date_time(date_for_day, shift.start_time)
-                end_datetime = self._combine_date_time(date_for_day, shift.end_time)
+                assigned = [assigned_by_emp[e] for e in slot_employees[slot].tolist()]
+                slot += 1
 
-                # If end time is before start time, shift crosses midnight
-                if shift.end_time < shift.start_time:
-                    end_datetime = end_datetime.replace(day=end_datetime.day + 1)
+                start_datetime, end_datetime = self._slot_times(date_for_day, shift)
 
                 # Add to flat shifts list
                 shifts_list.append(
@@ -296,18 +1781,17 @@ class ShiftScheduler:
                         shift_name=shift.shift_name,
                         start_time=start_datetime,
                         end_time=end_datetime,
-                        hours=self.shift_hours[shift_idx],
+                        hours=shift_hours[shift_idx],
                         employees=assigned,
                     )
                 )
 
                 # Add to grid view (compact format)
-                employee_names = [emp.name for emp in assigned]
                 grid_day_shifts[shift.shift_name] = GridShiftSchema(
-                    employees=employee_names,
-                    hours=self.shift_hours[shift_idx],
-                    start=shift.start_time.strftime("%H:%M"),
-                    end=shift.end_time.strftime("%H:%M"),
+                    employees=[emp.name for emp in assigned],
+                    hours=shift_hours[shift_idx],
+                    start=shift_start[shift_idx],
+                    end=shift_end[shift_idx],
                 )
 
             # Add day to grid
@@ -318,39 +1802,17 @@ class ShiftScheduler:
 
         # Build grid view
         grid_view = GridViewSchema(
-            days=grid_days,
+            days=list(self.days),
             dates=grid_dates,
             shifts_by_day=grid_shifts_by_day,
         )
 
         # Build summary
         summary = []
-        for emp in self.employees:
-            actual_hours = sum(
-                solver.Value(self.assignments[(emp.id, day_idx, shift_idx)])
-                * self.shift_hours[shift_idx]
-                for day_idx in range(len(self.days))
-                for shift_idx in range(len(self.shifts))
-            )
+        for emp_idx, emp in enumerate(self.employees):
+            actual = float(actual_hours[emp_idx])
             target = emp.target_hours
-            deviation = actual_hours - target
-
-            # Count shift types
-            shift_counts = {}
-            for shift_idx, shift in enumerate(self.shifts):
-                count = sum(
-                    solver.Value(self.assignments[(emp.id, day_idx, shift_idx)])
-                    for day_idx in range(len(self.days))
-                )
-                shift_counts[shift.shift_name] = count
-
-            status_str = (
-                "perfect"
-                if abs(deviation) < 0.01
-                else "overtime"
-                if deviation > 0
-                else "undertime"
-            )
+            deviation = actual - target
 
             summary.append(
                 EmployeeSummarySchema(
@@ -358,10 +1820,13 @@ class ShiftScheduler:
                     first_name=emp.first_name,
                     last_name=emp.last_name,
                     target=target,
-                    actual=round(actual_hours, 2),
+                    actual=round(actual, 2),
                     deviation=round(deviation, 2),
-                    status=status_str,
-                    shifts=shift_counts,
+                    status=self._summary_status(deviation),
+                    shifts={
+                        shift.shift_name: shift_counts[emp_idx][shift_idx]
+                        for shift_idx, shift in enumerate(self.shifts)
+                    },
                 )
             )
 
@@ -372,4 +1837,164 @@ class ShiftScheduler:
             shifts=shifts_list,
             grid_view=grid_view,
             summary=summary,
+            solve_stats=SolveStatsSchema(**self._solve_stats(solver)),
+        )
+
+    def _build_proto(
+        self,
+        solver: Union[cp_model.CpSolver, cp_model.CpSolverSolutionCallback],
+        status: int,
+    ) -> pb2.GenerateScheduleResponse:
+        """Build the gRPC response straight from the assignment matrix"""
+        x = self._extract_assignments(solver)
+        hours = np.asarray(self.shift_hours, dtype=np.float64)
+        actual_hours = (x * hours).sum(axis=(1, 2)).tolist()
+        shift_counts = x.sum(axis=1).tolist()
+        slot_employees = self._slot_employees(x)
+
+        emp_ids = [str(emp.id) for emp in self.employees]
+        emp_names = [f"{emp.first_name} {emp.last_name}" for emp in self.employees]
+        shift_hours = hours.tolist()
+        shift_start = [shift.start_time.strftime("%H:%M") for shift in self.shifts]
+        shift_end = [shift.end_time.strftime("%H:%M") for shift in self.shifts]
+
+        response = pb2.GenerateScheduleResponse(
+            status="optimal" if status == cp_model.OPTIMAL else "feasible",
+            week=self.week,
+            year=self.year,
+            solve_stats=pb2.SolveStats(**self._solve_stats(solver)),
+        )
+        grid_view = response.grid_view
+        grid_view.days.extend(self.days)
+
+        slot = 0
+        for day_idx, day in enumerate(self.days):
+            date_for_day = self._get_date_from_iso_week(self.year, self.week, day_idx)
+            date_str = date_for_day.isoformat()
+            grid_view.dates.append(date_str)
+            grid_day = grid_view.shifts_by_day[day]
+            grid_day.date = date_str
+
+            for shift_idx, shift in enumerate(self.shifts):
+                assigned = slot_employees[slot].tolist()
+                slot += 1
+                start_datetime, end_datetime = self._slot_times(date_for_day, shift)
+
+                pb_shift = response.shifts.add(
+                    date=date_str,
+                    day_name=day,
+                    shift_id=shift.id,
+                    shift_name=shift.shift_name,
+                    start_time=start_datetime.isoformat(),
+                    end_time=end_datetime.isoformat(),
+                    hours=shift_hours[shift_idx],
+                )
+                for e in assigned:
+                    pb_shift.employees.add(id=emp_ids[e], name=emp_names[e])
+
+                grid_shift = grid_day.shifts[shift.shift_name]
+                grid_shift.employees.extend([emp_names[e] for e in assigned])
+                grid_shift.hours = shift_hours[shift_idx]
+                grid_shift.start = shift_start[shift_idx]
+                grid_shift.end = shift_end[shift_idx]
+
+        for emp_idx, emp in enumerate(self.employees):
+            deviation = actual_hours[emp_idx] - emp.target_hours
+            response.summary.add(
+                id=emp_ids[emp_idx],
+                first_name=emp.first_name,
+                last_name=emp.last_name,
+                target=emp.target_hours,
+                actual=round(actual_hours[emp_idx], 2),
+                deviation=round(deviation, 2),
+                status=self._summary_status(deviation),
+                shifts={
+                    shift.shift_name: shift_counts[emp_idx][shift_idx]
+                    for shift_idx, shift in enumerate(self.shifts)
+                },
+            )
+
+        return response
+
+
+def unsolved_status(scheduler: "ShiftScheduler") -> str:
+    """
+    Name why a solve ended without a roster.
+
+    Returns:
+        "cancelled" if it was stopped, "infeasible" if CP-SAT proved that no
+        roster exists, "timeout" if the time limit hit first, else "unknown"
+    """
+    if scheduler.stopped:
+        return "cancelled"
+    if scheduler.status == cp_model.INFEASIBLE:
+        return "infeasible"
+    if scheduler.status == cp_model.UNKNOWN:
+        return "timeout"
+    return "unknown"
+
+
+def solve_location_horizon(
+    location: LocationSchema,
+    weeks: list[tuple[int, int]],
+    profile: SolverProfile,
+    stop_event: Any = None,
+) -> LocationScheduleSchema:
+    """
+    Solve consecutive weeks of one location as a rolling horizon.
+
+    Runs in a solver pool process, so it only takes and returns picklable
+    data. Each week starts from the previous week's roster as a hint, with
+    the previous week's last days fixed so cross-week rest rules hold.
+    Solving stops at the first week without a roster.
+
+    Args:
+        location: Staff and shift types of the location
+        weeks: (ISO week, ISO year) of every week, in order
+        profile: Solver profile for each weekly solve
+        stop_event: Set by the pool (or HorizonJob) when the request is
+            cancelled
+
+    Returns:
+        LocationScheduleSchema with the weeks solved so far
+    """
+    results = []
+    status = "optimal"
+    previous_days = None
+    previous_assignments = None
+    for week, year in weeks:
+        if stop_event is not None and stop_event.is_set():
+            status = "cancelled"
+            break
+        scheduler = ShiftScheduler(
+            location.employees,
+            location.shifts,
+            ScheduleService.DAYS,
+            week,
+            year,
+            max_solve_time=profile.max_time_in_seconds,
+            profile=profile,
+            previous_assignments=previous_assignments,
+            previous_days=previous_days,
         )
+        finished = threading.Event()
+        if stop_event is not None:
+            threading.Thread(
+                target=_stop_when_set,
+                args=(stop_event, finished, scheduler),
+                daemon=True,
+            ).start()
+        try:
+            result = scheduler.solve()
+        finally:
+            finished.set()
+        if result is None:
+            status = unsolved_status(scheduler)
+            break
+        if result.status != "optimal":
+            status = "feasible"
+        results.append(result)
+        previous_days = scheduler.solution[:, -BOUNDARY_DAYS:, :]
+        previous_assignments = scheduler.solution_assignments()
+
+    return LocationScheduleSchema(location_id=location.id, status=status, weeks=results)
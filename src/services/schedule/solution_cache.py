@@ -0,0 +1,130 @@
+"""
+Schedule Solution Cache
+Finished GenerateSchedule responses, keyed on the canonical problem instance.
+
+Planners regenerate the same week with the same staff and shifts after a
+page reload or a client retry. The fingerprint covers everything that
+decides the roster, written out in a fixed order (employees by id, shifts by
+id, times as HH:MM), so list order and time formatting in the request do not
+matter. A hit skips the solver entirely and returns the stored response.
+
+Values are the base64 of the serialized response behind a one-character
+flag ("1" when the solver proved the roster optimal), which decodes a good
+deal faster than a JSON envelope.
+"""
+
+import base64
+import hashlib
+from dataclasses import dataclass
+from typing import Iterable, Optional
+
+import generated.schedule_service_pb2 as pb2
+from src.core.config import Config
+from src.core.tiered_cache import TieredCache
+from src.services.schedule.schema import (
+    EmployeeSchema,
+    PreviousAssignmentSchema,
+    ShiftSchema,
+)
+
+
+def schedule_fingerprint(
+    employees: Iterable[EmployeeSchema],
+    shifts: Iterable[ShiftSchema],
+    week: int,
+    year: int,
+    solver_profile: str,
+    max_solve_seconds: float,
+    previous_schedule: Optional[Iterable[PreviousAssignmentSchema]] = None,
+) -> str:
+    """
+    Build the cache key of one schedule request.
+
+    Args:
+        employees: Employees to schedule
+        shifts: Shift types to fill every day
+        week: ISO week number
+        year: ISO year
+        solver_profile: Resolved profile name
+        max_solve_seconds: Resolved wall-clock limit
+        previous_schedule: Assignments the request asked to start from
+
+    Returns:
+        Hex digest key
+    """
+    lines = [f"{year}-W{week}|{solver_profile}|{max_solve_seconds:g}"]
+    lines.extend(
+        sorted(
+            f"e|{e.id.hex}|{e.first_name}|{e.last_name}|{e.target_hours:g}"
+            for e in employees
+        )
+    )
+    lines.extend(
+        sorted(
+            f"s|{s.id}|{s.shift_name}|{s.start_time:%H:%M}|{s.end_time:%H:%M}"
+            for s in shifts
+        )
+    )
+    lines.extend(
+        sorted(
+            f"p|{a.employee_id.hex}|{a.day_name}|{a.shift_id}"
+            for a in previous_schedule or []
+        )
+    )
+    return hashlib.sha256("\n".join(lines).encode("utf-8")).hexdigest()
+
+
+@dataclass
+class CachedSolution:
+    """A stored response and whether the solver proved it optimal."""
+
+    response: pb2.GenerateScheduleResponse
+    proven_optimal: bool
+
+
+class ScheduleSolutionCache(TieredCache):
+    """Cache of GenerateSchedule responses, keyed on schedule_fingerprint."""
+
+    @classmethod
+    def from_config(cls, config: Config) -> "ScheduleSolutionCache":
+        """Build the cache from the SCHEDULE_CACHE_* settings."""
+        return cls.from_settings(
+            enabled=config.schedule_cache_enabled,
+            max_entries=config.schedule_cache_max_entries,
+            ttl_seconds=config.schedule_cache_ttl_seconds,
+            path=config.schedule_cache_path,
+            table="schedule_solutions",
+        )
+
+    def load(self, key: str) -> Optional[CachedSolution]:
+        """Return the response stored under key, if any."""
+        if not self.backends:
+            return None
+        value = self.get(key)
+        if value is None:
+            return None
+        return CachedSolution(
+            response=pb2.GenerateScheduleResponse.FromString(
+                base64.b64decode(value[1:])
+            ),
+            proven_optimal=value[0] == "1",
+        )
+
+    def save(
+        self,
+        key: str,
+        response: pb2.GenerateScheduleResponse,
+        proven_optimal: bool,
+    ) -> None:
+        """
+        Store a finished response.
+
+        Args:
+            key: schedule_fingerprint of the request
+            response: Response sent for the request
+            proven_optimal: Whether the solver proved the roster optimal
+        """
+        if not self.backends:
+            return
+        flag = "1" if proven_optimal else "0"
+        self.set(key, flag + base64.b64encode(response.SerializeToString()).decode())
@@ -0,0 +1,177 @@
+"""
+CP-SAT Solver Profiles
+Named search configurations for ShiftScheduler, tuned to the problem size.
+
+A profile states what the caller wants (a quick usable roster, a near-optimal
+one, or a proven optimum); the size class of the model decides how the
+parallel portfolio is split between full-problem workers and LNS workers,
+how strong the LP relaxation is, and how much deterministic time the search
+may use. Deterministic time keeps the amount of search about the same on a
+busy node and on an idle one. The parallel workers still race each other, so
+two runs of the same request can return different rosters of similar cost.
+"""
+
+import math
+import os
+from dataclasses import dataclass
+from typing import Dict, Optional, Tuple
+
+from ortools.sat import sat_parameters_pb2
+
+from src.core.exceptions import ValidationError
+
+
+@dataclass(frozen=True)
+class SizeClass:
+    """Search settings for models up to a given number of assignment variables."""
+
+    name: str
+    max_variables: float
+    max_workers: int
+    lns_share: float
+    linearization_level: int
+    deterministic_time: float
+
+
+# Ordered by max_variables; employees x shifts x days picks the first match.
+SIZE_CLASSES: Tuple[SizeClass, ...] = (
+    SizeClass("small", 1_000, 8, 0.0, 1, 10.0),
+    SizeClass("medium", 5_000, 16, 0.5, 2, 60.0),
+    SizeClass("large", math.inf, 32, 0.75, 2, 240.0),
+)
+
+
+@dataclass(frozen=True)
+class ProfileGoal:
+    """Quality target of a named profile."""
+
+    relative_gap_limit: float
+    max_time_cap: Optional[float]
+    deterministic_time_factor: Optional[float]
+
+
+PROFILE_GOALS: Dict[str, ProfileGoal] = {
+    # Stop at 5% of the bound, within ten seconds
+    "fast": ProfileGoal(0.05, 10.0, 0.25),
+    # Stop at 1% of the bound or when the deterministic budget is spent
+    "balanced": ProfileGoal(0.01, None, 1.0),
+    # Search until optimality is proven or the wall-clock limit hits
+    "optimal": ProfileGoal(0.0, None, None),
+}
+
+DEFAULT_PROFILE = "balanced"
+
+
+@dataclass(frozen=True)
+class SolverProfile:
+    """Resolved CP-SAT parameters for one solve."""
+
+    name: str
+    size_class: str
+    max_time_in_seconds: float
+    num_workers: int
+    relative_gap_limit: float
+    max_deterministic_time: Optional[float]
+    num_full_subsolvers: int
+    linearization_level: int
+
+    def apply(self, parameters: sat_parameters_pb2.SatParameters) -> None:
+        """
+        Write this profile into a solver's parameters.
+
+        Args:
+            parameters: ``CpSolver.parameters`` of the solver about to run
+        """
+        parameters.max_time_in_seconds = self.max_time_in_seconds
+        parameters.num_workers = self.num_workers
+        parameters.relative_gap_limit = self.relative_gap_limit
+        if self.max_deterministic_time is not None:
+            parameters.max_deterministic_time = self.max_deterministic_time
+        parameters.linearization_level = self.linearization_level
+        # With a single worker there is no portfolio to split
+        if self.num_workers > 1:
+            parameters.num_full_subsolvers = self.num_full_subsolvers
+            parameters.use_lns = self.num_full_subsolvers < self.num_workers
+
+
+def classify(num_variables: int) -> SizeClass:
+    """Return the size class for a model with this many assignment variables."""
+    for size_class in SIZE_CLASSES:
+        if num_variables <= size_class.max_variables:
+            return size_class
+    return SIZE_CLASSES[-1]
+
+
+def resolve_profile(
+    name: str,
+    num_employees: int,
+    num_shifts: int,
+    num_days: int,
+    max_solve_seconds: float,
+    num_workers: int = 0,
+    cpu_count: Optional[int] = None,
+) -> SolverProfile:
+    """
+    Build the solver profile for a scheduling problem.
+
+    Args:
+        name: Profile name ("fast", "balanced" or "optimal"); empty for default
+        num_employees: Employees in the roster
+        num_shifts: Shift types per day
+        num_days: Days in the horizon
+        max_solve_seconds: Wall-clock ceiling for the solve
+        num_workers: Explicit search worker count (0 = size-based default)
+        cpu_count: Available cores (defaults to ``os.cpu_count()``)
+
+    Returns:
+        Resolved SolverProfile
+
+    Raises:
+        ValidationError: If the profile name is unknown or a limit is negative
+    """
+    name = name or DEFAULT_PROFILE
+    goal = PROFILE_GOALS.get(name)
+    if goal is None:
+        raise ValidationError(
+            f"Unknown solver profile '{name}', expected one of "
+            f"{', '.join(PROFILE_GOALS)}",
+            field="solver_profile",
+            invalid_value=name,
+        )
+    if max_solve_seconds <= 0:
+        raise ValidationError(
+            "max_solve_seconds must be positive",
+            field="max_solve_seconds",
+            invalid_value=max_solve_seconds,
+        )
+    if num_workers < 0:
+        raise ValidationError(
+            "num_workers must not be negative",
+            field="num_workers",
+            invalid_value=num_workers,
+        )
+
+    size_class = classify(num_employees * num_shifts * num_days)
+    if not num_workers:
+        num_workers = min(size_class.max_workers, cpu_count or os.cpu_count() or 1)
+    full_subsolvers = max(1, round(num_workers * (1 - size_class.lns_share)))
+
+    max_time = max_solve_seconds
+    if goal.max_time_cap is not None:
+        max_time = min(max_time, goal.max_time_cap)
+    deterministic_time = None
+    if goal.deterministic_time_factor is not None:
+        deterministic_time = (
+            size_class.deterministic_time * goal.deterministic_time_factor
+        )
+
+    return SolverProfile(
+        name=name,
+        size_class=size_class.name,
+        max_time_in_seconds=max_time,
+        num_workers=num_workers,
+        relative_gap_limit=goal.relative_gap_limit,
+        max_deterministic_time=deterministic_time,
+        num_full_subsolvers=min(full_subsolvers, num_workers),
+        linearization_level=size_class.linearization_level,
+    )
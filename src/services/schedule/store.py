@@ -0,0 +1,109 @@
+"""
+Schedule Store
+Remembers the last roster generated for each team.
+
+Most weeks look like the previous one, so the last assignment for the same
+shifts and staff is a good starting point for CP-SAT. Entries are keyed on
+the shift definitions (a location's shift types) and the set of employee
+ids, so two locations that share shift times never hint each other. They
+hold the (employee, weekday, shift) triples of the last solution plus the
+wall time of the last solve that ran without a hint, which serves as the
+baseline for "time saved".
+"""
+
+import hashlib
+import json
+from dataclasses import dataclass
+from typing import Iterable, List, Optional
+
+from src.core.config import Config
+from src.core.tiered_cache import TieredCache
+from src.services.schedule.schema import (
+    EmployeeSchema,
+    PreviousAssignmentSchema,
+    ShiftSchema,
+)
+
+
+@dataclass
+class StoredSchedule:
+    """Last solution for a set of shifts and employees."""
+
+    assignments: List[PreviousAssignmentSchema]
+    cold_wall_time: Optional[float] = None
+
+
+class ScheduleStore(TieredCache):
+    """
+    Local store of previous rosters, used to warm-start ShiftScheduler.
+
+    Keeps rosters in memory, backed by a local SQLite file when
+    SCHEDULE_STORE_PATH is set so they survive restarts. With no backends
+    the store is disabled.
+    """
+
+    @classmethod
+    def from_config(cls, config: Config) -> "ScheduleStore":
+        """Build the store from the SCHEDULE_STORE_* settings."""
+        return cls.from_settings(
+            enabled=config.schedule_warm_start_enabled,
+            max_entries=config.schedule_store_max_entries,
+            ttl_seconds=config.schedule_store_ttl_seconds,
+            path=config.schedule_store_path,
+            table="schedules",
+        )
+
+    @staticmethod
+    def roster_key(
+        shifts: Iterable[ShiftSchema], employees: Iterable[EmployeeSchema]
+    ) -> str:
+        """Key a roster on its shifts and employee ids, independent of order."""
+        parts = sorted(
+            f"{s.id}|{s.shift_name}|{s.start_time:%H:%M}|{s.end_time:%H:%M}"
+            for s in shifts
+        )
+        parts.extend(sorted(e.id.hex for e in employees))
+        return hashlib.sha256("\n".join(parts).encode("utf-8")).hexdigest()
+
+    def load(
+        self, shifts: Iterable[ShiftSchema], employees: Iterable[EmployeeSchema]
+    ) -> Optional[StoredSchedule]:
+        """Return the last roster stored for these shifts and employees, if any."""
+        if not self.backends:
+            return None
+        value = self.get(self.roster_key(shifts, employees))
+        if value is None:
+            return None
+        data = json.loads(value)
+        return StoredSchedule(
+            assignments=[
+                PreviousAssignmentSchema.model_validate(a) for a in data["assignments"]
+            ],
+            cold_wall_time=data.get("cold_wall_time"),
+        )
+
+    def save(
+        self,
+        shifts: Iterable[ShiftSchema],
+        employees: Iterable[EmployeeSchema],
+        assignments: List[PreviousAssignmentSchema],
+        cold_wall_time: Optional[float] = None,
+    ) -> None:
+        """
+        Store the roster just generated for these shifts and employees.
+
+        Args:
+            shifts: Shift definitions the roster was solved for
+            employees: Employees the roster was solved for
+            assignments: Assignments of the solution
+            cold_wall_time: Wall time of the last solve without a hint
+        """
+        if not self.backends:
+            return
+        value = json.dumps(
+            {
+                "assignments": [a.model_dump(mode="json") for a in assignments],
+                "cold_wall_time": cold_wall_time,
+            }
+        )
+        self.set(self.roster_key(shifts, employees), value)
@@ -4,15 +4,21 @@ LLM-powered multilingual spelling correction
 Migrated from: spelling_check/corrector.py
 """
 
+import asyncio
 import json
 from logging import Logger
 import re
+from typing import List
 
 from injector import inject
 
 
 from src.core.config import Config
+from src.core.http_transport import HttpTransport
+from src.core.llm_cache import LLMResponseCache
 from src.core.llm_client import LLMClient
+from src.core.text_chunker import TextChunk, split_text
+from src.services.spelling.prefilter import SpellingPrefilter
 from src.services.spelling.schemas import LLMCorrectorResponse
 
 
@@ -81,16 +87,34 @@ class SpellingCorrectorService:
     """
 
     @inject
-    def __init__(self, logger: Logger, config: Config):
+    def __init__(
+        self,
+        logger: Logger,
+        config: Config,
+        transport: HttpTransport,
+        response_cache: LLMResponseCache,
+        prefilter: SpellingPrefilter,
+    ):
         """
         Initialize spelling corrector with LLM client.
 
         Args:
             llm_client: LLM client for spell checking
+            transport: Shared HTTP transport for the LLM client
+            response_cache: Shared LLM response cache
+            prefilter: Local dictionary check for sentences without errors
         """
         self.llm_client = LLMClient(
-            model_name="x-ai/grok-4-fast", config=config, system_prompt=SYSTEM_PROMPT
+            model_name="x-ai/grok-4-fast",
+            config=config,
+            system_prompt=SYSTEM_PROMPT,
+            transport=transport,
+            cache=response_cache,
         )
+        self.transport = transport
+        self.prefilter = prefilter
+        self.chunk_max_chars = config.spelling_chunk_max_chars
+        self.max_parallel_chunks = config.spelling_max_parallel_chunks
         self.logger = logger
         self.logger.info("SpellingCorrectorService initialized")
 
@@ -98,6 +122,11 @@ class SpellingCorrectorService:
         """
         Correct spelling errors in text using LLM.
 
+        Long texts are split into paragraph/sentence chunks that are
+        corrected concurrently on the transport loop and joined in order.
+        Sentences the local pre-filter finds no suspect words in are
+        returned as-is without an LLM call.
+
         Args:
             input_text: Text to correct (any language)
 
@@ -109,20 +138,120 @@ class SpellingCorrectorService:
             Exception: If LLM call or validation fails
         """
         try:
+            chunks = self._split(input_text)
+            if all(chunk.skip for chunk in chunks):
+                self.logger.info("No suspect words found, skipping LLM")
+                return LLMCorrectorResponse(corrected_text=input_text)
+            if len(chunks) > 1:
+                return self.transport.run_sync(self._correct_chunks(chunks))
+
             llm_output = self.llm_client.run_sync(input_text).output
-            self.logger.debug(f"Raw LLM output: {llm_output}")
-
-            # Extract JSON from markdown code block if present
-            match = re.search(r"```json\s*([\s\S]*?)\s*```", llm_output)
-            if match:
-                json_response = json.loads(match.group(1))
-                validated = LLMCorrectorResponse.model_validate(json_response)
-                self.logger.info("Spelling correction completed successfully")
-                return validated
-            else:
-                self.logger.error(f"No valid JSON found in the response: {llm_output}")
-                raise ValueError("No valid JSON found in the response.")
+            return self._parse_response(llm_output)
+
+        except Exception as e:
+            self.logger.error(f"Error during LLM spelling correction: {e}")
+            raise
+
+    async def correct_spelling_async(self, input_text: str) -> LLMCorrectorResponse:
+        """
+        Correct spelling errors in text using the async LLM path.
+
+        Args:
+            input_text: Text to correct (any language)
+
+        Returns:
+            LLMCorrectorResponse: Response with corrected text
+
+        Raises:
+            ValueError: If no valid JSON found in LLM response
+            Exception: If LLM call or validation fails
+        """
+        try:
+            chunks = self._split(input_text)
+            if all(chunk.skip for chunk in chunks):
+                self.logger.info("No suspect words found, skipping LLM")
+                return LLMCorrectorResponse(corrected_text=input_text)
+            if len(chunks) > 1:
+                return await self._correct_chunks(chunks)
+
+            result = await self.llm_client.run(input_text)
+            return self._parse_response(result.output)
 
         except Exception as e:
             self.logger.error(f"Error during LLM spelling correction: {e}")
             raise
+
+    def _split(self, input_text: str) -> List[TextChunk]:
+        """
+        Split the input into chunks, marking clean sentences as skipped.
+
+        Args:
+            input_text: Text of one request
+
+        Returns:
+            Chunks in document order
+        """
+        if not self.prefilter.enabled:
+            return split_text(input_text, self.chunk_max_chars)
+
+        checked: List[bool] = []
+
+        def is_clean(sentence: str) -> bool:
+            clean = self.prefilter.is_clean(sentence)
+            checked.append(clean)
+            return clean
+
+        chunks = split_text(input_text, self.chunk_max_chars, is_clean)
+        skipped_chars = sum(len(c.rebuild(c.body)) for c in chunks if c.skip)
+        self.prefilter.record(
+            total_chars=len(input_text),
+            skipped_chars=skipped_chars,
+            sentences=len(checked),
+            skipped_sentences=sum(checked),
+        )
+        self.logger.info(
+            f"Pre-filter skipped {sum(checked)}/{len(checked)} sentences "
+            f"({skipped_chars}/{len(input_text)} chars), "
+            f"{self.prefilter.stats.skipped_char_ratio:.0%} of all chars so far"
+        )
+        return chunks
+
+    async def _correct_chunks(self, chunks: List[TextChunk]) -> LLMCorrectorResponse:
+        """
+        Correct chunks with bounded concurrency and stitch them back together.
+
+        Args:
+            chunks: Output of split_text for one request
+
+        Returns:
+            LLMCorrectorResponse: Corrected text with original formatting
+        """
+        semaphore = asyncio.Semaphore(self.max_parallel_chunks)
+
+        async def correct(chunk: TextChunk) -> str:
+            if chunk.skip:
+                return chunk.rebuild(chunk.body)
+            async with semaphore:
+                result = await self.llm_client.run(chunk.body)
+            corrected = self._parse_response(result.output).corrected_text
+            return chunk.rebuild(corrected.strip())
+
+        pending = sum(not chunk.skip for chunk in chunks)
+        self.logger.info(f"Correcting {pending} of {len(chunks)} chunks in parallel")
+        parts = await asyncio.gather(*(correct(chunk) for chunk in chunks))
+        return LLMCorrectorResponse(corrected_text="".join(parts))
+
+    def _parse_response(self, llm_output: str) -> LLMCorrectorResponse:
+        """Extract and validate the JSON payload from raw LLM output."""
+        self.logger.debug(f"Raw LLM output: {llm_output}")
+
+        # Extract JSON from markdown code block if present
+        match = re.search(r"```json\s*([\s\S]*?)\s*```", llm_output)
+        if match:
+            json_response = json.loads(match.group(1))
+            validated = LLMCorrectorResponse.model_validate(json_response)
+            self.logger.info("Spelling correction completed successfully")
+            return validated
+        else:
+            self.logger.error(f"No valid JSON found in the response: {llm_output}")
+            raise ValueError("No valid JSON found in the response.")
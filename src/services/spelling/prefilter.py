@@ -0,0 +1,210 @@
+"""
+Spelling Pre-filter
+Local dictionary check that lets already-correct text skip the LLM.
+
+Word lists are plain-text files named after their language (``nl.txt``,
+``en.txt``, optionally gzip-compressed), one word per line with an optional
+frequency column. They are compiled once at startup into one frozenset per
+language. A sentence is "clean" when one language knows every word in it,
+apart from things a dictionary cannot judge (numbers, dates, URLs, acronyms).
+Checking one language at a time keeps a misspelling from passing because it
+happens to be a word in another language; sentences that mix languages go to
+the LLM.
+
+Capitalization alone does not make a word a proper noun: a capitalized word
+passes only if its lowercase form is known or it appears in the optional
+``names.txt`` list (client and staff names, places) in the same directory.
+
+No word lists ship with the service. With the pre-filter enabled, startup
+fails unless SPELLING_DICTIONARY_DIR holds at least one list.
+"""
+
+import gzip
+import re
+import threading
+from dataclasses import dataclass
+from logging import Logger
+from pathlib import Path
+from typing import Dict, FrozenSet, Iterator
+
+from src.core.config import Config
+from src.core.exceptions import ConfigurationError
+
+WORD = re.compile(r"[^\W\d_]+(?:['’-][^\W\d_]+)*|\S*\d\S*")
+NON_WORDS = re.compile(r"https?://\S+|www\.\S+|\S+@\S+\.\S+")
+# Word list of proper nouns; not a language
+NAMES_LIST = "names"
+
+
+@dataclass
+class PrefilterStats:
+    """Counters for how much text the pre-filter kept away from the LLM."""
+
+    requests: int = 0
+    requests_skipped: int = 0
+    sentences_checked: int = 0
+    sentences_skipped: int = 0
+    chars_checked: int = 0
+    chars_skipped: int = 0
+
+    @property
+    def skipped_char_ratio(self) -> float:
+        """Share of input characters that did not need an LLM call."""
+        return self.chars_skipped / self.chars_checked if self.chars_checked else 0.0
+
+
+def load_word_list(path: Path, min_frequency: int = 0) -> FrozenSet[str]:
+    """
+    Read a word list file into a frozenset of lowercase words.
+
+    Args:
+        path: ``.txt`` or ``.txt.gz`` file, one ``word [frequency]`` per line
+        min_frequency: Drop words whose frequency column is below this value
+
+    Returns:
+        Set of known words
+    """
+    opener = gzip.open if path.suffix == ".gz" else open
+    words = set()
+    with opener(path, "rt", encoding="utf-8") as f:
+        for line in f:
+            parts = line.split()
+            if not parts:
+                continue
+            if min_frequency and len(parts) > 1 and parts[1].isdigit():
+                if int(parts[1]) < min_frequency:
+                    continue
+            words.add(parts[0].lower())
+    return frozenset(words)
+
+
+class SpellingPrefilter:
+    """
+    Decides which sentences can be returned without an LLM round trip.
+
+    Provided as a singleton by the DI container; with no dictionaries loaded
+    the pre-filter is disabled and every sentence is treated as suspect.
+    """
+
+    def __init__(
+        self,
+        dictionaries: Dict[str, FrozenSet[str]],
+        names: FrozenSet[str] = frozenset(),
+    ):
+        """
+        Initialize the pre-filter.
+
+        Args:
+            dictionaries: Known words per language code
+            names: Lowercase proper nouns accepted when capitalized
+        """
+        self.languages = sorted(dictionaries)
+        self._words = dict(dictionaries)
+        self._names = names
+        self.stats = PrefilterStats()
+        self._stats_lock = threading.Lock()
+
+    @classmethod
+    def from_config(cls, config: Config, logger: Logger) -> "SpellingPrefilter":
+        """
+        Load every word list found in the configured dictionary directory.
+
+        Raises:
+            ConfigurationError: If the pre-filter is enabled and the directory
+                is missing or holds no word lists
+        """
+        if not config.spelling_prefilter_enabled:
+            logger.info("Spelling pre-filter disabled")
+            return cls({})
+        directory = Path(config.spelling_dictionary_dir)
+        paths = sorted(directory.glob("*.txt*")) if directory.is_dir() else []
+        name_paths = [p for p in paths if p.name.split(".")[0] == NAMES_LIST]
+        paths = [p for p in paths if p not in name_paths]
+        if not paths:
+            raise ConfigurationError(
+                f"No word lists in spelling dictionary directory '{directory}'; "
+                "add <language>.txt files or disable the spelling pre-filter",
+                config_key="spelling_dictionary_dir",
+            )
+        dictionaries: Dict[str, FrozenSet[str]] = {}
+        for path in paths:
+            language = path.name.split(".")[0]
+            dictionaries[language] = load_word_list(
+                path, config.spelling_dictionary_min_frequency
+            )
+        names = frozenset().union(*(load_word_list(p) for p in name_paths))
+        logger.info(
+            "Spelling pre-filter loaded "
+            + ", ".join(
+                f"{len(words)} {lang} words" for lang, words in dictionaries.items()
+            )
+            + f", {len(names)} names"
+        )
+        return cls(dictionaries, names)
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self._words)
+
+    def _candidates(self, sentence: str) -> Iterator[str]:
+        """Yield the words in a sentence that a dictionary can judge."""
+        text = NON_WORDS.sub(" ", sentence)
+        for match in WORD.finditer(text):
+            token = match.group(0)
+            if any(ch.isdigit() for ch in token) or len(token) == 1:
+                continue
+            if token.isupper() and len(token) <= 5:
+                continue  # acronyms
+            if token[0].isupper() and token.lower() in self._names:
+                continue  # known proper nouns
+            yield token
+
+    @staticmethod
+    def _is_known(token: str, words: FrozenSet[str]) -> bool:
+        word = token.lower()
+        if word in words:
+            return True
+        parts = re.split(r"['’-]", word)
+        return len(parts) > 1 and all(p in words for p in parts if p)
+
+    def is_clean(self, sentence: str) -> bool:
+        """True if one language knows every word of the sentence."""
+        if not self.enabled:
+            return False
+        candidates = list(self._candidates(sentence))
+        return any(
+            all(self._is_known(token, words) for token in candidates)
+            for words in self._words.values()
+        )
+
+    def record(
+        self,
+        total_chars: int,
+        skipped_chars: int,
+        sentences: int,
+        skipped_sentences: int,
+    ) -> None:
+        """
+        Update the counters after a request has been split and filtered.
+
+        Args:
+            total_chars: Characters in the request
+            skipped_chars: Characters returned without an LLM call
+            sentences: Sentences checked
+            skipped_sentences: Sentences found clean
+        """
+        with self._stats_lock:
+            self.stats.requests += 1
+            if skipped_chars == total_chars:
+                self.stats.requests_skipped += 1
+            self.stats.sentences_checked += sentences
+            self.stats.sentences_skipped += skipped_sentences
+            self.stats.chars_checked += total_chars
+            self.stats.chars_skipped += skipped_chars
+
+    def __repr__(self) -> str:
+        """String representation of SpellingPrefilter."""
+        return (
+            f"SpellingPrefilter(languages={self.languages}, "
+            f"skipped_char_ratio={self.stats.skipped_char_ratio:.2f})"
+        )
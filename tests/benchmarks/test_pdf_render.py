@@ -0,0 +1,75 @@
+"""Benchmarks for laying out each PDF document with shared styles and fonts."""
+
+import time as clock
+from logging import Logger
+from unittest.mock import Mock
+
+import pytest
+
+try:
+    from weasyprint import HTML
+except OSError as e:
+    # WeasyPrint raises OSError, not ImportError, when Pango is missing
+    pytest.skip(f"WeasyPrint cannot load: {e}", allow_module_level=True)
+
+from src.api.pdf import to_schema
+from src.services.pdf.generator import (
+    APPOINTMENT_CARD,
+    CONTRACT,
+    INCIDENT_REPORT,
+    INVOICE,
+    PdfGeneratorService,
+)
+from src.services.pdf.renderer import render_pdf
+from src.services.pdf.schema import (
+    AppointmentCardData,
+    ContractData,
+    IncidentReportData,
+    InvoiceData,
+)
+from src.services.pdf.templates import TemplateRegistry
+from tests.fixtures.factories import PdfRequestBuilder
+
+pytestmark = pytest.mark.benchmark
+
+ROUNDS = 10
+
+
+def _best_of(fn) -> float:
+    timings = []
+    for _ in range(ROUNDS):
+        started = clock.perf_counter()
+        fn()
+        timings.append(clock.perf_counter() - started)
+    return min(timings)
+
+
+@pytest.mark.parametrize(
+    "document, request_message, schema",
+    [
+        (APPOINTMENT_CARD, PdfRequestBuilder.appointment_card(), AppointmentCardData),
+        (CONTRACT, PdfRequestBuilder.contract(), ContractData),
+        (INCIDENT_REPORT, PdfRequestBuilder.incident_report(), IncidentReportData),
+        (INVOICE, PdfRequestBuilder.invoice(details=6), InvoiceData),
+    ],
+)
+def test_render_time(document, request_message, schema):
+    """Shared parsed CSS and FontConfiguration vs styles parsed per document."""
+    templates = TemplateRegistry("src/assets/templates", Mock(spec=Logger))
+    service = PdfGeneratorService(Mock(), templates, Mock(spec=Logger))
+    html_content = service.render_html(document, to_schema(request_message, schema))
+    stylesheets = [templates.path(name) for name in document.stylesheets]
+
+    # How documents were rendered before: inline <style>, nothing kept
+    css = "".join(open(path).read() for path in stylesheets)
+    inline = html_content.replace("</head>", f"<style>{css}</style></head>", 1)
+    per_document = _best_of(lambda: HTML(string=inline).write_pdf())
+
+    render_pdf(html_content, stylesheets, templates.path())
+    shared = _best_of(lambda: render_pdf(html_content, stylesheets, templates.path()))
+
+    print(
+        f"\n{document.name}: per document {per_document * 1e3:.1f} ms, "
+        f"shared {shared * 1e3:.1f} ms ({per_document / shared:.2f}x)"
+    )
+    assert shared < 2.0
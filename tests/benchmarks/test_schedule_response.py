@@ -0,0 +1,85 @@
+"""Benchmarks for turning a solved schedule model into a response."""
+
+import time as clock
+import uuid
+from datetime import time
+from logging import Logger
+from unittest.mock import Mock
+
+import pytest
+from ortools.sat.python import cp_model
+
+from src.api.schedule import ScheduleServicer
+from src.services.schedule.schema import EmployeeSchema, ShiftSchema
+from src.services.schedule.service import ScheduleService, ShiftScheduler
+
+pytestmark = pytest.mark.benchmark
+
+ROUNDS = 20
+
+
+@pytest.fixture(scope="module")
+def solved_scheduler():
+    """100 employees x 7 days x 6 shifts, stopped at the first solution."""
+    employees = [
+        EmployeeSchema(
+            id=uuid.uuid4(), first_name=f"Emp{i}", last_name="Bench", target_hours=24
+        )
+        for i in range(100)
+    ]
+    shifts = [
+        ShiftSchema(
+            id=i,
+            shift_name=f"Shift{i}",
+            start_time=time(4 * i),
+            end_time=time((4 * i + 4) % 24),
+        )
+        for i in range(6)
+    ]
+    scheduler = ShiftScheduler(employees, shifts, ScheduleService.DAYS, 10, 2025)
+    scheduler.create_variables()
+    scheduler.add_constraints()
+    scheduler.add_objectives()
+    solver = cp_model.CpSolver()
+    solver.parameters.stop_after_first_solution = True
+    status = solver.Solve(scheduler.model)
+    assert status in (cp_model.OPTIMAL, cp_model.FEASIBLE)
+    return scheduler, solver, status
+
+
+def _best_of(fn) -> float:
+    timings = []
+    for _ in range(ROUNDS):
+        started = clock.perf_counter()
+        fn()
+        timings.append(clock.perf_counter() - started)
+    return min(timings)
+
+
+def test_build_response_time(solved_scheduler):
+    """Response construction for a 4200-variable roster."""
+    scheduler, solver, status = solved_scheduler
+
+    seconds = _best_of(lambda: scheduler._build_response(solver, status))
+
+    print(f"\n_build_response (100x7x6): {seconds * 1000:.2f} ms")
+    assert seconds < 0.05
+
+
+def test_build_proto_time(solved_scheduler):
+    """gRPC response construction with and without pydantic intermediates."""
+    scheduler, solver, status = solved_scheduler
+    servicer = ScheduleServicer(Mock(spec=ScheduleService), Mock(spec=Logger))
+
+    via_domain = _best_of(
+        lambda: servicer._map_domain_to_response(
+            scheduler._build_response(solver, status)
+        )
+    )
+    direct = _best_of(lambda: scheduler._build_proto(solver, status))
+
+    print(
+        f"\nGenerateScheduleResponse (100x7x6): {via_domain * 1000:.2f} ms via "
+        f"pydantic, {direct * 1000:.2f} ms direct"
+    )
+    assert direct < 0.05
@@ -0,0 +1,69 @@
+"""Benchmark for answering a repeated GenerateSchedule request from the cache."""
+
+import time as clock
+import uuid
+from datetime import time
+from logging import Logger
+from unittest.mock import Mock
+
+import pytest
+
+from src.core.config import Config
+from src.core.tiered_cache import MemoryCacheBackend
+from src.services.schedule.schema import EmployeeSchema, ShiftSchema
+from src.services.schedule.service import CachedScheduleJob, ScheduleService
+from src.services.schedule.solution_cache import ScheduleSolutionCache
+from src.services.schedule.store import ScheduleStore
+
+pytestmark = pytest.mark.benchmark
+
+ROUNDS = 1000
+
+
+def test_cache_hit_latency():
+    """Fingerprint, lookup and decode for 60 employees and 4 shifts."""
+    employees = [
+        EmployeeSchema(
+            id=uuid.UUID(int=i + 1),
+            first_name=f"Emp{i}",
+            last_name="Bench",
+            target_hours=32,
+        )
+        for i in range(60)
+    ]
+    shifts = [
+        ShiftSchema(
+            id=i,
+            shift_name=f"Shift{i}",
+            start_time=time(6 * i),
+            end_time=time((6 * i + 6) % 24),
+        )
+        for i in range(4)
+    ]
+    config = Mock(spec=Config)
+    config.schedule_pool_processes = 2
+    config.schedule_solver_profile = "fast"
+    config.schedule_max_solve_seconds = 10.0
+    config.schedule_num_workers = 0
+    config.schedule_diagnosis_seconds = 5.0
+    cache = ScheduleSolutionCache([MemoryCacheBackend(max_entries=10, ttl_seconds=60)])
+    service = ScheduleService(
+        Mock(spec=Logger), config, ScheduleStore(), solution_cache=cache
+    )
+
+    started = clock.perf_counter()
+    response = service.generate_schedule_proto(employees, shifts, week=10, year=2025)
+    solve_seconds = clock.perf_counter() - started
+
+    started = clock.perf_counter()
+    for _ in range(ROUNDS):
+        job = service.submit_schedule_proto(employees, shifts, week=10, year=2025)
+        job.result()
+    hit_seconds = (clock.perf_counter() - started) / ROUNDS
+
+    print(
+        f"\nsolve: {solve_seconds:.2f} s, cache hit: {hit_seconds * 1e6:.0f} us "
+        f"({len(response.shifts)} shifts in the response)"
+    )
+    assert isinstance(job, CachedScheduleJob)
+    assert hit_seconds < 1e-3
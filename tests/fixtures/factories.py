@@ -1,6 +1,8 @@
 """Test data factories and builders for creating test objects."""
 
 from typing import Dict, Any
+
+import generated.pdf_service_pb2 as pdf_pb2
 from src.services.care_planner.schemas import (
     ClientProfile,
     Goal,
@@ -103,3 +105,103 @@ def create_sample_care_plan_response() -> Dict[str, Any]:
             "monitoring_plan": "Weekly check-ins",
         },
     }
+
+
+class PdfRequestBuilder:
+    """Builder for filled-in PdfService requests, one per document kind."""
+
+    @staticmethod
+    def appointment_card(**kwargs) -> pdf_pb2.GenerateAppointmentCardRequest:
+        defaults = {
+            "id": 7,
+            "client_name": "Sanne de Vries",
+            "date": "2025-03-10",
+            "mentor": "Pieter Jansen",
+            "general_information": ["Woont op de groep sinds januari"],
+            "important_contacts": ["Moeder: 06-12345678"],
+            "smoking_rules": ["Alleen buiten, na 16:00"],
+            "leave": ["Weekendverlof in overleg"],
+        }
+        defaults.update(kwargs)
+        return pdf_pb2.GenerateAppointmentCardRequest(**defaults)
+
+    @staticmethod
+    def contract(**kwargs) -> pdf_pb2.GenerateContractRequest:
+        defaults = {
+            "contract_id": 12,
+            "status": "approved",
+            "start_date": "2025-01-01",
+            "end_date": "2025-12-31",
+            "reminder_period": 30,
+            "sender_name": "Maicare Zorg",
+            "client_first_name": "Sanne",
+            "client_last_name": "de Vries",
+            "care_type": "ambulante",
+            "care_name": "Ambulante begeleiding",
+            "financing_act": "WMO",
+            "hours": 6,
+            "hours_type": "per week",
+            "price": 68.5,
+            "price_time_unit": "uur",
+            "vat": 21,
+            "type_name": "Begeleiding",
+            "generation_date": "2025-01-02",
+        }
+        defaults.update(kwargs)
+        return pdf_pb2.GenerateContractRequest(**defaults)
+
+    @staticmethod
+    def incident_report(**kwargs) -> pdf_pb2.GenerateIncidentReportRequest:
+        defaults = {
+            "id": 3,
+            "employee_id": 21,
+            "employee_first_name": "Pieter",
+            "employee_last_name": "Jansen",
+            "incident_date": "2025-03-08",
+            "incident_type": "Agressie",
+            "violence": True,
+            "severity_of_incident": "Gemiddeld",
+            "incident_explanation": "Conflict tijdens het avondeten.",
+            "technical": ["Geen"],
+            "inform_who": ["Teamleider", "Ouders"],
+            "client_firstname": "Sanne",
+            "client_lastname": "de Vries",
+            "location_name": "Groep Noord",
+        }
+        defaults.update(kwargs)
+        return pdf_pb2.GenerateIncidentReportRequest(**defaults)
+
+    @staticmethod
+    def invoice(details: int = 2, **kwargs) -> pdf_pb2.GenerateInvoicePdfRequest:
+        defaults = {
+            "id": 101,
+            "sender_name": "Gemeente Utrecht",
+            "sender_contact_person": "Afdeling Zorg",
+            "sender_address_line1": "Stadsplateau 1",
+            "sender_postal_code_city": "3521 AZ Utrecht",
+            "invoice_number": "2025-0101",
+            "invoice_date": "2025-03-31",
+            "due_date": "2025-04-30",
+            "invoice_details": [
+                pdf_pb2.InvoiceDetail(
+                    care_type=f"Zorgproduct {i}",
+                    periods=[
+                        pdf_pb2.InvoicePeriod(
+                            start_date="2025-03-01",
+                            end_date="2025-03-31",
+                            accommodation_time_frame="31 dagen",
+                            ambulante_total_minutes=240,
+                        )
+                    ],
+                    price=95.0,
+                    price_time_unit="dag",
+                    pre_vat_total=2945.0,
+                    total=2945.0,
+                )
+                for i in range(details)
+            ],
+            "total_amount": 2945.0 * details,
+            "extra_items": {"Reiskosten": "45.00"},
+        }
+        defaults.update(kwargs)
+        return pdf_pb2.GenerateInvoicePdfRequest(**defaults)
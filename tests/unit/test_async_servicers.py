@@ -0,0 +1,139 @@
+"""Unit tests for the grpc.aio servicer variants."""
+
+import grpc
+import pytest
+from unittest.mock import AsyncMock, MagicMock, Mock
+from logging import Logger
+
+import generated.schedule_service_pb2 as schedule_pb2
+import generated.spelling_service_pb2 as spelling_pb2
+from src.api.schedule import AsyncScheduleServicer
+from src.api.spelling_check import AsyncSpellingCheckServicer
+from src.core.exceptions import InfeasibleScheduleError, ResourceExhaustedError
+from src.services.schedule.service import ScheduleService
+from src.services.spelling.corrector import SpellingCorrectorService
+from src.services.spelling.schemas import LLMCorrectorResponse
+
+
+class _AbortError(Exception):
+    """Stand-in for grpc.aio.AbortError raised by context.abort()."""
+
+
+def _make_context():
+    context = Mock()
+    context.abort = AsyncMock(side_effect=_AbortError)
+    return context
+
+
+@pytest.mark.asyncio
+async def test_async_correct_spelling_awaits_service():
+    """The aio servicer awaits the async service path."""
+    service = Mock(spec=SpellingCorrectorService)
+    service.correct_spelling_async = AsyncMock(
+        return_value=LLMCorrectorResponse(corrected_text="Hello world")
+    )
+    servicer = AsyncSpellingCheckServicer(service, Mock(spec=Logger))
+
+    response = await servicer.CorrectSpelling(
+        spelling_pb2.CorrectSpellingRequest(initial_text="hellow wrold"),
+        _make_context(),
+    )
+
+    assert response.corrected_text == "Hello world"
+    service.correct_spelling_async.assert_awaited_once_with("hellow wrold")
+    service.correct_spelling.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_async_correct_spelling_aborts_with_internal():
+    """Service failures are reported through context.abort."""
+    service = Mock(spec=SpellingCorrectorService)
+    service.correct_spelling_async = AsyncMock(side_effect=ValueError("boom"))
+    servicer = AsyncSpellingCheckServicer(service, Mock(spec=Logger))
+    context = _make_context()
+
+    with pytest.raises(_AbortError):
+        await servicer.CorrectSpelling(
+            spelling_pb2.CorrectSpellingRequest(initial_text="foo"), context
+        )
+
+    code, details = context.abort.await_args.args
+    assert code == grpc.StatusCode.INTERNAL
+    assert "boom" in details
+
+
+@pytest.mark.asyncio
+async def test_async_generate_schedule_not_found():
+    """A solve without a schedule maps to NOT_FOUND without blocking the loop."""
+    service = Mock(spec=ScheduleService)
+    service.submit_schedule_proto.return_value.result.return_value = None
+    servicer = AsyncScheduleServicer(service, Mock(spec=Logger))
+    context = _make_context()
+    context.time_remaining.return_value = 30.0
+
+    with pytest.raises(_AbortError):
+        await servicer.GenerateSchedule(
+            schedule_pb2.GenerateScheduleRequest(week=1, year=2024), context
+        )
+
+    service.submit_schedule_proto.assert_called_once()
+    assert service.submit_schedule_proto.call_args.kwargs["time_remaining"] == 30.0
+    assert context.abort.await_args.args[0] == grpc.StatusCode.NOT_FOUND
+
+
+@pytest.mark.asyncio
+async def test_async_generate_schedule_infeasible_is_failed_precondition():
+    """Proven infeasibility is reported with its reasons."""
+    service = Mock(spec=ScheduleService)
+    service.submit_schedule_proto.side_effect = InfeasibleScheduleError(
+        ["every shift on Monday needs at least one employee"]
+    )
+    servicer = AsyncScheduleServicer(service, Mock(spec=Logger))
+    context = _make_context()
+
+    with pytest.raises(_AbortError):
+        await servicer.GenerateSchedule(
+            schedule_pb2.GenerateScheduleRequest(week=1, year=2024), context
+        )
+
+    code, details = context.abort.await_args.args
+    assert code == grpc.StatusCode.FAILED_PRECONDITION
+    assert "Monday" in details
+
+
+@pytest.mark.asyncio
+async def test_async_generate_schedule_sheds_load_when_pool_is_full():
+    """A full solver pool queue maps to RESOURCE_EXHAUSTED."""
+    service = Mock(spec=ScheduleService)
+    service.submit_schedule_proto.side_effect = ResourceExhaustedError(
+        "solver-pool queue is full", resource="solver-pool"
+    )
+    servicer = AsyncScheduleServicer(service, Mock(spec=Logger))
+    context = _make_context()
+
+    with pytest.raises(_AbortError):
+        await servicer.GenerateSchedule(
+            schedule_pb2.GenerateScheduleRequest(week=1, year=2024), context
+        )
+
+    assert context.abort.await_args.args[0] == grpc.StatusCode.RESOURCE_EXHAUSTED
+
+
+@pytest.mark.asyncio
+async def test_async_stream_schedule_not_found_cancels_stream():
+    """A stream without a final solution maps to NOT_FOUND and is cancelled."""
+    stream = MagicMock()
+    stream.__iter__.return_value = iter([])
+    service = Mock(spec=ScheduleService)
+    service.stream_schedule.return_value = stream
+    servicer = AsyncScheduleServicer(service, Mock(spec=Logger))
+    context = _make_context()
+
+    with pytest.raises(_AbortError):
+        async for _ in servicer.StreamSchedule(
+            schedule_pb2.GenerateScheduleRequest(week=1, year=2024), context
+        ):
+            pass
+
+    stream.cancel.assert_called_once()
+    assert context.abort.await_args.args[0] == grpc.StatusCode.NOT_FOUND
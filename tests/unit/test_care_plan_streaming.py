@@ -0,0 +1,146 @@
+"""Unit tests for streamed care plan generation."""
+
+import json
+from logging import Logger
+from unittest.mock import Mock, patch
+
+import pytest
+
+import generated.service_pb2 as pb2
+from src.api.care_planner import CarePlannerServicer
+from src.services.care_planner.generator import CarePlanGenerator
+from src.services.care_planner.planner import CarePlannerService
+from src.services.care_planner.stream_parser import IncrementalSectionParser
+
+CARE_PLAN = {
+    "client_profile": {
+        "age": 16,
+        "living_situation": "Foster home",
+        "education_level": "High school",
+        "assessment_domain": "Independence",
+        "current_level": 2,
+        "level_description": 'Developing skills, {with "braces"}',
+    },
+    "assessment_summary": "Client shows progress, slowly",
+    "care_plan_objectives": {
+        "short_term_goals": [
+            {
+                "timeframe": "1-3 months",
+                "goal_title": "Routines",
+                "description": "Build consistency",
+                "specific_actions": ["Wake up", "Make bed"],
+            }
+        ],
+        "medium_term_goals": [],
+        "long_term_goals": [],
+    },
+    "interventions": {
+        "daily_activities": ["Morning routine"],
+        "weekly_activities": ["Counseling"],
+        "monthly_activities": ["Goal review"],
+    },
+    "resources_required": ["Budget worksheets"],
+    "success_metrics": [
+        {"metric": "Routine", "target": "90%", "measurement_method": "Checklist"}
+    ],
+    "risk_factors": [{"risk": "Relapse", "risk_level": "low", "mitigation": "Calls"}],
+    "support_network": [{"role": "Mentor", "responsibility": "Weekly check-in"}],
+    "review_schedule": {
+        "daily": "Check-in",
+        "weekly": "Review",
+        "monthly": "Assessment",
+        "quarterly": "Evaluation",
+    },
+    "emergency_protocols": ["Call case manager"],
+    "transition_criteria": {"next_level": 3, "requirements": ["Budgeting"]},
+}
+
+
+def _chunks(text, size=7):
+    return [text[i : i + size] for i in range(0, len(text), size)]
+
+
+def test_parser_emits_members_as_they_complete():
+    """Each top-level member is returned once its terminator arrives."""
+    parser = IncrementalSectionParser()
+    assert parser.feed('```json\n{"a": {"x": "}, ["') == []
+    assert parser.feed('}, "b": [1, 2') == [("a", {"x": "}, ["})]
+    assert parser.feed("]}\n```") == [("b", [1, 2])]
+    assert parser.done
+
+
+def test_parser_ignores_closing_brackets_before_the_document():
+    """Stray brackets in a preamble do not throw off the nesting depth."""
+    parser = IncrementalSectionParser()
+    assert parser.feed('Note: ] } ]\n{"a": 1, ') == [("a", 1)]
+    assert parser.feed('"b": {"c": [2]}}') == [("b", {"c": [2]})]
+    assert parser.done
+
+
+@pytest.fixture
+def generator():
+    with patch("src.services.care_planner.generator.LLMClient") as client_class:
+        generator = CarePlanGenerator(Mock(spec=Logger), Mock(), Mock(), Mock())
+    return generator, client_class.return_value
+
+
+def test_stream_care_plan_yields_sections_in_order(generator):
+    """Sections stream out before the document is complete, in LLM order."""
+    generator, llm_client = generator
+    text = "```json\n" + json.dumps(CARE_PLAN, indent=2) + "\n```"
+    seen_before_end = []
+
+    def stream(prompt):
+        for chunk in _chunks(text):
+            yield chunk
+        seen_before_end.extend(name for name, _ in emitted)
+
+    llm_client.stream_text_sync.side_effect = stream
+    emitted = []
+    for section in generator.stream_care_plan({"client_data": {}}):
+        emitted.append(section)
+
+    assert [name for name, _ in emitted] == list(CARE_PLAN)
+    assert len(seen_before_end) == len(CARE_PLAN)
+    assert emitted[0][1].age == 16
+
+
+def test_stream_care_plan_recovers_sections_from_final_parse(generator):
+    """A member that is not valid JSON on its own is sent after repair."""
+    generator, llm_client = generator
+    plan = dict(CARE_PLAN, client_profile=dict(CARE_PLAN["client_profile"]))
+    plan["client_profile"]["level_description"] = "Developing skills"
+    text = json.dumps(plan).replace('["Budget worksheets"]', '["Budget worksheets",]')
+    llm_client.stream_text_sync.return_value = iter(_chunks(text))
+
+    names = [name for name, _ in generator.stream_care_plan({"client_data": {}})]
+
+    assert names[-1] == "resources_required"
+    assert sorted(names) == sorted(CARE_PLAN)
+
+
+def test_stream_care_plan_fails_on_invalid_document(generator):
+    """Validation errors that repair cannot fix end the stream with an error."""
+    generator, llm_client = generator
+    broken = dict(CARE_PLAN, interventions={"daily_activities": "not a list"})
+    llm_client.stream_text_sync.return_value = iter(_chunks(json.dumps(broken)))
+
+    with pytest.raises(Exception):
+        list(generator.stream_care_plan({"client_data": {}}))
+
+
+def test_merged_sections_equal_full_response(generator):
+    """Merging every streamed CarePlanSection reproduces GenerateCarePlan."""
+    generator, llm_client = generator
+    llm_client.stream_text_sync.return_value = iter(_chunks(json.dumps(CARE_PLAN)))
+    service = CarePlannerService(generator, Mock(spec=Logger))
+    servicer = CarePlannerServicer(service, Mock(spec=Logger))
+
+    merged = pb2.PersonalizedCarePlanResponse()
+    for message in servicer.StreamCarePlan(pb2.PersonalizedCarePlanRequest(), Mock()):
+        merged.MergeFrom(message.care_plan)
+
+    expected = servicer._map_domain_to_response(
+        generator._parse_care_plan(json.dumps(CARE_PLAN))
+    )
+    assert merged == expected
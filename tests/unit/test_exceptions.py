@@ -6,6 +6,7 @@ from src.core.exceptions import (
     ValidationError,
     ConfigurationError,
     GRPCServiceError,
+    InfeasibleScheduleError,
     JSONParsingError,
 )
 
@@ -105,3 +106,17 @@ class TestJSONParsingError:
         # Content should be truncated to 200 chars + "..."
         assert len(error.details["raw_content"]) == 203
         assert error.details["raw_content"].endswith("...")
+
+
+class TestInfeasibleScheduleError:
+    """Tests for InfeasibleScheduleError."""
+
+    def test_reasons_are_joined_into_the_message(self):
+        """Test that every reason appears in the message and details."""
+        error = InfeasibleScheduleError(["first reason", "second reason"])
+        assert error.message == "No feasible schedule: first reason; second reason"
+        assert error.details["reasons"] == ["first reason", "second reason"]
+
+    def test_error_without_reasons(self):
+        """Test the message when infeasibility could not be explained."""
+        assert InfeasibleScheduleError([]).message == "No feasible schedule"
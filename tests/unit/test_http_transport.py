@@ -0,0 +1,106 @@
+"""Unit tests for the shared LLM HTTP transport."""
+
+import asyncio
+import threading
+from unittest import mock
+
+import httpx
+import pytest
+
+from src.core.config import Config
+from src.core.http_transport import HttpTransport
+from src.core.llm_client import LLMClient
+
+
+@pytest.fixture
+def config():
+    """Configuration with transport settings and a dummy API key."""
+    cfg = mock.Mock(spec=Config)
+    cfg.openrouter_api_key = "test-key-123456"
+    cfg.llm_http2 = True
+    cfg.llm_max_connections = 10
+    cfg.llm_max_keepalive_connections = 5
+    cfg.llm_keepalive_expiry = 30.0
+    cfg.llm_timeout_seconds = 60.0
+    cfg.llm_connect_timeout_seconds = 5.0
+    return cfg
+
+
+@pytest.fixture
+def transport(config):
+    transport = HttpTransport(config)
+    yield transport
+    transport.close()
+
+
+def test_transport_builds_pooled_client(transport):
+    """The shared client is an httpx.AsyncClient with the configured timeouts."""
+    assert isinstance(transport.client, httpx.AsyncClient)
+    assert transport.client.timeout.connect == 5.0
+    assert transport.client.timeout.read == 60.0
+
+
+def test_run_sync_executes_on_transport_loop(transport):
+    """Coroutines from worker threads all run on the single transport loop."""
+    loops = []
+
+    async def record_loop():
+        loops.append(asyncio.get_running_loop())
+        return "ok"
+
+    threads = [
+        threading.Thread(target=lambda: transport.run_sync(record_loop()))
+        for _ in range(3)
+    ]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert len(loops) == 3
+    assert all(loop is transport.loop for loop in loops)
+
+
+@pytest.mark.asyncio
+async def test_run_from_other_loop(transport):
+    """Awaiting from a foreign event loop hops to the transport loop."""
+
+    async def current_loop():
+        return asyncio.get_running_loop()
+
+    assert await transport.run(current_loop()) is transport.loop
+
+
+def test_close_is_idempotent(config):
+    """Closing twice does not raise and closes the pooled client."""
+    transport = HttpTransport(config)
+    transport.close()
+    transport.close()
+
+    assert transport.client.is_closed
+
+
+def test_llm_client_uses_shared_http_client(config, transport):
+    """LLMClient hands the pooled client to the provider and routes calls through it."""
+    with (
+        mock.patch("src.core.llm_client.OpenAIModel"),
+        mock.patch("src.core.llm_client.OpenRouterProvider") as mock_provider,
+        mock.patch("src.core.llm_client.Agent") as mock_agent_class,
+    ):
+        mock_result = mock.MagicMock(output="done")
+
+        async def mock_run(*args, **kwargs):
+            assert asyncio.get_running_loop() is transport.loop
+            return mock_result
+
+        mock_agent_class.return_value.run = mock_run
+
+        client = LLMClient(
+            model_name="test-model",
+            system_prompt="Test prompt",
+            config=config,
+            transport=transport,
+        )
+
+        assert mock_provider.call_args.kwargs["http_client"] is transport.client
+        assert client.run_sync("hi").output == "done"
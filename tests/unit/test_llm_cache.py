@@ -0,0 +1,144 @@
+"""Unit tests for the LLM response cache."""
+
+from unittest import mock
+
+import pytest
+
+from src.core.config import Config
+from src.core.llm_cache import CachedRunResult, LLMResponseCache, make_cache_key
+from src.core.llm_client import LLMClient
+from src.core.tiered_cache import (
+    MemoryCacheBackend,
+    SQLiteCacheBackend,
+    TieredCache,
+)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_cache_key_depends_on_every_component():
+    """Model, system prompt, prompt and kwargs all change the key."""
+    base = make_cache_key("m", "sys", "hello", {})
+    assert base == make_cache_key("m", "sys", "hello", {})
+    assert base != make_cache_key("other", "sys", "hello", {})
+    assert base != make_cache_key("m", "sys2", "hello", {})
+    assert base != make_cache_key("m", "sys", "hello!", {})
+    assert base != make_cache_key("m", "sys", "hello", {"temperature": 0})
+
+
+def test_cache_key_none_for_unserializable_kwargs():
+    """Requests with non-JSON kwargs are not cacheable."""
+    assert make_cache_key("m", "sys", "hello", {"deps": object()}) is None
+
+
+def test_memory_backend_evicts_lru_and_expires():
+    """The least recently used entry is evicted and expired entries miss."""
+    clock = FakeClock()
+    backend = MemoryCacheBackend(max_entries=2, ttl_seconds=10, clock=clock)
+    backend.set("a", "1")
+    backend.set("b", "2")
+    assert backend.get("a") == "1"
+    backend.set("c", "3")
+
+    assert backend.get("b") is None
+    assert backend.get("a") == "1"
+
+    clock.now += 11
+    assert backend.get("a") is None
+    assert len(backend) == 1
+
+
+def test_sqlite_tier_survives_restart_and_promotes(tmp_path):
+    """Entries on disk are visible to a new cache and promoted into memory."""
+    path = str(tmp_path / "cache" / "llm.sqlite")
+    first = LLMResponseCache([SQLiteCacheBackend(path, ttl_seconds=60)])
+    first.set("key", "value")
+
+    memory = MemoryCacheBackend(max_entries=10, ttl_seconds=60)
+    second = LLMResponseCache([memory, SQLiteCacheBackend(path, ttl_seconds=60)])
+
+    assert second.get("key") == "value"
+    assert memory.get("key") == "value"
+    assert second.get("missing") is None
+    assert (second.stats.hits, second.stats.misses) == (1, 1)
+
+
+def test_from_settings_builds_the_configured_tiers(tmp_path):
+    """The SQLite tier is added only when a path is given."""
+    path = str(tmp_path / "cache.sqlite")
+
+    tiered = TieredCache.from_settings(
+        enabled=True, max_entries=10, ttl_seconds=60, path=path, table="things"
+    )
+    memory_only = TieredCache.from_settings(
+        enabled=True, max_entries=10, ttl_seconds=60, path=None, table="things"
+    )
+    disabled = LLMResponseCache.from_settings(
+        enabled=False, max_entries=10, ttl_seconds=60, path=path, table="things"
+    )
+
+    assert [type(b) for b in tiered.backends] == [
+        MemoryCacheBackend,
+        SQLiteCacheBackend,
+    ]
+    assert tiered.backends[1].table == "things"
+    assert [type(b) for b in memory_only.backends] == [MemoryCacheBackend]
+    assert isinstance(disabled, LLMResponseCache)
+    assert not disabled.enabled
+
+
+@pytest.fixture
+def client_factory():
+    config = mock.Mock(spec=Config)
+    config.openrouter_api_key = "test-key-123456"
+
+    with (
+        mock.patch("src.core.llm_client.OpenAIModel"),
+        mock.patch("src.core.llm_client.OpenRouterProvider"),
+        mock.patch("src.core.llm_client.Agent") as mock_agent_class,
+    ):
+        agent = mock_agent_class.return_value
+        agent.run_sync.return_value = mock.MagicMock(output="corrected")
+
+        def factory(cache):
+            return LLMClient(
+                model_name="test-model",
+                system_prompt="Test prompt",
+                config=config,
+                cache=cache,
+            )
+
+        yield factory, agent
+
+
+def test_llm_client_serves_repeated_prompt_from_cache(client_factory):
+    """A repeated prompt skips the upstream call unless bypass_cache is set."""
+    factory, agent = client_factory
+    cache = LLMResponseCache([MemoryCacheBackend(max_entries=10, ttl_seconds=60)])
+    client = factory(cache)
+
+    assert client.run_sync("note").output == "corrected"
+    second = client.run_sync("note")
+    assert isinstance(second, CachedRunResult)
+    assert second.output == "corrected"
+    assert agent.run_sync.call_count == 1
+
+    client.run_sync("note", bypass_cache=True)
+    assert agent.run_sync.call_count == 2
+    assert cache.stats.hits == 1
+
+
+def test_llm_client_without_backends_always_calls_upstream(client_factory):
+    """A disabled cache never short-circuits the request."""
+    factory, agent = client_factory
+    client = factory(LLMResponseCache())
+
+    client.run_sync("note")
+    client.run_sync("note")
+    assert agent.run_sync.call_count == 2
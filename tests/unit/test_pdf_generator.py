@@ -0,0 +1,145 @@
+"""Unit tests for PdfGeneratorService rendering through the process pool."""
+
+from logging import Logger
+from unittest.mock import Mock
+
+import pytest
+
+from src.core.exceptions import PdfGenerationError, ResourceExhaustedError
+from src.core.object_storage_client import ObjectStorageClient
+from src.core.tiered_cache import MemoryCacheBackend
+from src.services.pdf.generator import CONTRACT, PdfGeneratorService
+from src.services.pdf.index import PdfIndex
+from src.services.pdf.pool import PdfRenderPool
+from src.services.pdf.renderer import render_in_worker
+from src.services.pdf.schema import ContractData, InvoiceData
+from src.services.pdf.templates import TemplateRegistry
+
+
+@pytest.fixture
+def templates():
+    templates = Mock(spec=TemplateRegistry)
+    templates.render.return_value = "<p>contract</p>"
+    templates.path.side_effect = lambda name="": f"/templates/{name}"
+    templates.version.return_value = "v1"
+    return templates
+
+
+@pytest.fixture
+def pool():
+    pool = Mock(spec=PdfRenderPool)
+    pool.num_processes = 2
+    return pool
+
+
+def test_document_is_rendered_in_the_pool(templates, pool):
+    pool.submit.return_value.result.return_value = b"%PDF-1.7"
+    service = PdfGeneratorService(Mock(), templates, Mock(spec=Logger), pool)
+
+    pdf = service.generate_document(CONTRACT, ContractData(contract_id=7))
+
+    pool.submit.assert_called_once_with(
+        render_in_worker,
+        "<p>contract</p>",
+        ("/templates/styles/document.css", "/templates/styles/contract.css"),
+        "/templates/",
+    )
+    assert pdf.getvalue() == b"%PDF-1.7"
+
+
+def test_full_pool_is_not_reported_as_a_render_failure(templates, pool):
+    pool.submit.side_effect = ResourceExhaustedError(
+        "pdf-pool queue is full", resource="pdf-pool"
+    )
+    service = PdfGeneratorService(Mock(), templates, Mock(spec=Logger), pool)
+
+    with pytest.raises(ResourceExhaustedError):
+        service.generate_document(CONTRACT, ContractData(contract_id=7))
+
+
+def test_worker_failure_is_a_render_failure(templates, pool):
+    pool.submit.return_value.result.side_effect = RuntimeError("worker process exited")
+    service = PdfGeneratorService(Mock(), templates, Mock(spec=Logger), pool)
+
+    with pytest.raises(PdfGenerationError):
+        service.generate_document(CONTRACT, ContractData(contract_id=7))
+
+
+def test_batch_reports_failed_invoices_and_keeps_going():
+    service = PdfGeneratorService(Mock(), Mock(), Mock(spec=Logger), None, 3)
+
+    def upload_invoice(invoice_data):
+        if invoice_data.id == 2:
+            raise PdfGenerationError("bad layout", document="invoice")
+        return f"invoices/invoice_{invoice_data.id}.pdf", 100 + invoice_data.id
+
+    service.upload_invoice = upload_invoice
+
+    items = list(service.upload_invoices(InvoiceData(id=i) for i in range(5)))
+
+    assert sorted(item.index for item in items) == [0, 1, 2, 3, 4]
+    failed = [item for item in items if item.error]
+    assert [(item.invoice_id, item.key) for item in failed] == [(2, "")]
+    stored = sorted(item.key for item in items if not item.error)
+    assert stored[0] == "invoices/invoice_0.pdf" and len(stored) == 4
+
+
+def test_batch_invoice_waits_for_a_full_render_queue(monkeypatch):
+    monkeypatch.setattr("src.services.pdf.generator.BATCH_RETRY_SECONDS", 0)
+    service = PdfGeneratorService(Mock(), Mock(), Mock(spec=Logger))
+    service.upload_invoice = Mock(
+        side_effect=[
+            ResourceExhaustedError("pdf-pool queue is full", resource="pdf-pool"),
+            ("invoices/invoice_7.pdf", 2048),
+        ]
+    )
+
+    item = service.upload_invoice_item(0, InvoiceData(id=7))
+
+    assert (item.key, item.size, item.error) == ("invoices/invoice_7.pdf", 2048, "")
+
+
+def _content_addressed_service(templates, pool, storage):
+    index = PdfIndex([MemoryCacheBackend(max_entries=10, ttl_seconds=60)])
+    pool.submit.return_value.result.return_value = b"%PDF-1.7"
+    storage.upload_file.side_effect = lambda file_obj, key, content_type: key
+    return PdfGeneratorService(
+        storage,
+        templates,
+        Mock(spec=Logger),
+        pool,
+        content_addressed=True,
+        pdf_index=index,
+    )
+
+
+def test_unchanged_document_is_not_rendered_again(templates, pool):
+    storage = Mock(spec=ObjectStorageClient)
+    storage.file_size.return_value = None
+    service = _content_addressed_service(templates, pool, storage)
+
+    first = service.upload_document(CONTRACT, ContractData(contract_id=7), 7)
+    again = service.upload_document(CONTRACT, ContractData(contract_id=7), 7)
+    changed = service.upload_document(
+        CONTRACT, ContractData(contract_id=7, status="ended"), 7
+    )
+
+    assert first == again == (first[0], 8)
+    assert first[0].startswith("contracts/contract_7_")
+    assert changed[0] != first[0]
+    # The second call was answered by the index: no HEAD, render or upload
+    assert storage.file_size.call_count == 2
+    assert pool.submit.call_count == storage.upload_file.call_count == 2
+
+
+def test_document_found_in_storage_is_indexed(templates, pool):
+    storage = Mock(spec=ObjectStorageClient)
+    storage.file_size.return_value = 4096
+    service = _content_addressed_service(templates, pool, storage)
+
+    key, size = service.upload_document(CONTRACT, ContractData(contract_id=7), 7)
+
+    assert size == 4096
+    assert service.pdf_index.load(key) == 4096
+    pool.submit.assert_not_called()
+    storage.upload_file.assert_not_called()
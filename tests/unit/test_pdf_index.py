@@ -0,0 +1,47 @@
+"""Unit tests for content-addressed PDF keys and the stored PDF index."""
+
+import os
+from logging import Logger
+from unittest.mock import Mock
+
+from src.core.tiered_cache import MemoryCacheBackend
+from src.services.pdf.index import PdfIndex, document_fingerprint
+from src.services.pdf.schema import InvoiceData
+from src.services.pdf.templates import TemplateRegistry
+
+
+def test_fingerprint_ignores_map_order_but_not_content():
+    first = InvoiceData(id=1, extra_items={"Reiskosten": "45.00", "Huur": "10.00"})
+    same = InvoiceData(id=1, extra_items={"Huur": "10.00", "Reiskosten": "45.00"})
+    changed = InvoiceData(id=1, extra_items={"Reiskosten": "46.00", "Huur": "10.00"})
+
+    key = document_fingerprint("invoice", "v1", first)
+
+    assert document_fingerprint("invoice", "v1", same) == key
+    assert document_fingerprint("invoice", "v1", changed) != key
+    assert document_fingerprint("invoice", "v2", first) != key
+
+
+def test_template_version_follows_file_contents(tmp_path):
+    template = tmp_path / "card.html"
+    template.write_text("<p>{{ name }}</p>")
+    registry = TemplateRegistry(str(tmp_path), Mock(spec=Logger))
+
+    version = registry.version("card.html")
+    assert registry.version("card.html") == version
+
+    template.write_text("<p><b>{{ name }}</b></p>")
+    os.utime(template, ns=(0, template.stat().st_mtime_ns + 1_000_000_000))
+    assert registry.version("card.html") != version
+
+
+def test_index_stores_sizes_and_is_a_noop_when_disabled():
+    index = PdfIndex([MemoryCacheBackend(max_entries=10, ttl_seconds=60)])
+    index.save("invoices/invoice_1_ab.pdf", 2048)
+
+    assert index.load("invoices/invoice_1_ab.pdf") == 2048
+    assert index.load("invoices/invoice_2_cd.pdf") is None
+
+    disabled = PdfIndex()
+    disabled.save("invoices/invoice_1_ab.pdf", 2048)
+    assert disabled.load("invoices/invoice_1_ab.pdf") is None
@@ -0,0 +1,268 @@
+"""Unit tests for the PdfService servicers."""
+
+import asyncio
+import time
+from concurrent import futures
+from logging import Logger
+from unittest.mock import AsyncMock, Mock
+
+import grpc
+import pytest
+
+import generated.pdf_service_pb2_grpc as pdf_pb2_grpc
+import generated.spelling_service_pb2 as spelling_pb2
+import generated.spelling_service_pb2_grpc as spelling_pb2_grpc
+from src.api.pdf import AsyncPdfServicer, PdfServicer, to_schema
+from src.api.spelling_check import SpellingCheckServicer
+from src.core.config import Config
+from src.core.exceptions import (
+    ObjectStorageError,
+    PdfGenerationError,
+    ResourceExhaustedError,
+)
+from src.services.pdf.generator import InvoiceBatchItem, PdfGeneratorService
+from src.services.pdf.pool import PdfRenderPool
+from src.services.pdf.templates import TemplateRegistry
+from src.services.spelling.corrector import SpellingCorrectorService
+from tests.fixtures.factories import PdfRequestBuilder
+
+
+class _AbortError(Exception):
+    """Stand-in for grpc.aio.AbortError raised by context.abort()."""
+
+
+def _render_until_stopped(html_content, stylesheets, base_url, stop_event):
+    """Render stand-in that holds its worker until the pool closes."""
+    stop_event.wait(60)
+    return b"%PDF-1.7"
+
+
+def test_invoice_request_is_mapped_to_invoice_data():
+    service = Mock(spec=PdfGeneratorService)
+    service.upload_invoice.return_value = ("invoices/2025-03-31/invoice_101.pdf", 2048)
+    servicer = PdfServicer(service, Mock(spec=Logger))
+
+    response = servicer.GenerateInvoicePdf(PdfRequestBuilder.invoice(), Mock())
+
+    assert response.pdf_file_key == "invoices/2025-03-31/invoice_101.pdf"
+    assert response.size == 2048
+    data = service.upload_invoice.call_args.args[0]
+    assert data.id == 101
+    assert data.invoice_details[1].periods[0].ambulante_total_minutes == 240
+    assert data.extra_items == {"Reiskosten": "45.00"}
+
+
+def test_storage_failure_maps_to_unavailable():
+    service = Mock(spec=PdfGeneratorService)
+    service.upload_contract.side_effect = ObjectStorageError("bucket unreachable")
+    servicer = PdfServicer(service, Mock(spec=Logger))
+    context = Mock()
+
+    with pytest.raises(ObjectStorageError):
+        servicer.GenerateContractPdf(PdfRequestBuilder.contract(), context)
+
+    context.set_code.assert_called_once_with(grpc.StatusCode.UNAVAILABLE)
+
+
+def test_full_render_pool_maps_to_resource_exhausted():
+    service = Mock(spec=PdfGeneratorService)
+    service.upload_incident_report.side_effect = ResourceExhaustedError(
+        "pdf-pool queue is full", resource="pdf-pool"
+    )
+    servicer = PdfServicer(service, Mock(spec=Logger))
+    context = Mock()
+
+    with pytest.raises(ResourceExhaustedError):
+        servicer.GenerateIncidentReportPdf(PdfRequestBuilder.incident_report(), context)
+
+    context.set_code.assert_called_once_with(grpc.StatusCode.RESOURCE_EXHAUSTED)
+
+
+@pytest.mark.asyncio
+async def test_async_render_failure_aborts_with_internal():
+    service = Mock(spec=PdfGeneratorService)
+    service.upload_pdf.side_effect = PdfGenerationError(
+        "PDF generation error: bad layout", document="appointment_card"
+    )
+    servicer = AsyncPdfServicer(service, Mock(spec=Logger))
+    context = Mock()
+    context.abort = AsyncMock(side_effect=_AbortError)
+
+    with pytest.raises(_AbortError):
+        await servicer.GenerateAppointmentCardPdf(
+            PdfRequestBuilder.appointment_card(), context
+        )
+
+    code, details = context.abort.await_args.args
+    assert code == grpc.StatusCode.INTERNAL
+    assert "bad layout" in details
+
+
+def _batch_item(index, invoice_data, parse=None):
+    if parse:
+        invoice_data = parse(invoice_data)
+    if invoice_data.id == 102:
+        return InvoiceBatchItem(index, invoice_data.id, error="bad layout")
+    return InvoiceBatchItem(index, invoice_data.id, f"invoices/{index}.pdf", 2048)
+
+
+def test_batch_streams_a_response_per_invoice():
+    service = Mock(spec=PdfGeneratorService)
+    service.upload_invoices.side_effect = lambda invoices, parse: (
+        _batch_item(index, data, parse) for index, data in enumerate(invoices)
+    )
+    servicer = PdfServicer(service, Mock(spec=Logger))
+    requests = [PdfRequestBuilder.invoice(id=101 + i) for i in range(3)]
+
+    responses = list(servicer.GenerateInvoicePdfBatch(iter(requests), Mock()))
+
+    assert [r.id for r in responses] == [101, 102, 103]
+    assert responses[0].pdf_file_key == "invoices/0.pdf"
+    assert (responses[1].pdf_file_key, responses[1].error) == ("", "bad layout")
+
+
+@pytest.mark.asyncio
+async def test_async_batch_streams_a_response_per_invoice():
+    service = Mock(spec=PdfGeneratorService)
+    service.batch_concurrency = 2
+    service.upload_invoice_item.side_effect = _batch_item
+    servicer = AsyncPdfServicer(service, Mock(spec=Logger))
+
+    async def requests():
+        for i in range(5):
+            yield PdfRequestBuilder.invoice(id=101 + i)
+
+    responses = [r async for r in servicer.GenerateInvoicePdfBatch(requests(), Mock())]
+
+    assert sorted(r.index for r in responses) == [0, 1, 2, 3, 4]
+    assert [r.id for r in responses if r.error] == [102]
+
+
+def _invalid_invoice_102(message, schema):
+    if message.id == 102:
+        return schema.model_validate({"id": "not a number"})
+    return to_schema(message, schema)
+
+
+def _batch_service():
+    service = PdfGeneratorService(
+        Mock(), Mock(), Mock(spec=Logger), batch_concurrency=2
+    )
+    service.upload_invoice = lambda data: (f"invoices/{data.id}.pdf", 2048)
+    return service
+
+
+def test_batch_reports_invalid_invoice_data_per_item(monkeypatch):
+    monkeypatch.setattr("src.api.pdf.to_schema", _invalid_invoice_102)
+    servicer = PdfServicer(_batch_service(), Mock(spec=Logger))
+    requests = [PdfRequestBuilder.invoice(id=101 + i) for i in range(3)]
+
+    responses = list(servicer.GenerateInvoicePdfBatch(iter(requests), Mock()))
+
+    assert sorted(r.index for r in responses) == [0, 1, 2]
+    failed = [r for r in responses if r.error]
+    assert [(r.id, r.pdf_file_key) for r in failed] == [(102, "")]
+    assert "id" in failed[0].error
+
+
+@pytest.mark.asyncio
+async def test_async_batch_reports_invalid_invoice_data_per_item(monkeypatch):
+    monkeypatch.setattr("src.api.pdf.to_schema", _invalid_invoice_102)
+    servicer = AsyncPdfServicer(_batch_service(), Mock(spec=Logger))
+
+    async def requests():
+        for i in range(3):
+            yield PdfRequestBuilder.invoice(id=101 + i)
+
+    responses = [r async for r in servicer.GenerateInvoicePdfBatch(requests(), Mock())]
+
+    assert sorted(r.index for r in responses) == [0, 1, 2]
+    assert [r.id for r in responses if r.error] == [102]
+
+
+@pytest.mark.asyncio
+async def test_async_batch_stops_reading_when_the_consumer_goes_away():
+    service = Mock(spec=PdfGeneratorService)
+    service.batch_concurrency = 1
+    service.upload_invoice_item.side_effect = _batch_item
+    servicer = AsyncPdfServicer(service, Mock(spec=Logger))
+    sent = []
+
+    async def requests():
+        for i in range(100):
+            sent.append(i)
+            yield PdfRequestBuilder.invoice(id=1000 + i)
+
+    stream = servicer.GenerateInvoicePdfBatch(requests(), Mock())
+    await stream.__anext__()
+    await stream.aclose()
+    read = len(sent)
+    await asyncio.sleep(0.05)
+
+    assert len(sent) == read < 100
+
+
+def test_full_render_pool_leaves_threads_for_other_services(monkeypatch):
+    """With every render slot taken, PDFs are refused and spelling still answers."""
+    config = Mock(spec=Config)
+    config.grpc_max_workers = 6
+    config.pdf_pool_processes = 0
+    config.pdf_pool_queue_size = 4
+    config.pdf_pool_max_documents = 200
+    monkeypatch.setattr("os.cpu_count", lambda: 1)
+    monkeypatch.setattr(
+        "src.services.pdf.generator.render_in_worker", _render_until_stopped
+    )
+    pool = PdfRenderPool.from_config(config, Mock(spec=Logger))
+    pool.initializer = None
+    assert pool.num_processes + pool.max_queue <= config.grpc_max_workers // 2
+
+    storage = Mock()
+    storage.upload_file.side_effect = lambda file_obj, key, content_type: key
+    pdf_service = PdfGeneratorService(
+        storage,
+        TemplateRegistry("src/assets/templates", Mock(spec=Logger)),
+        Mock(spec=Logger),
+        render_pool=pool,
+    )
+    spelling_service = Mock(spec=SpellingCorrectorService)
+    spelling_service.correct_spelling.return_value = Mock(corrected_text="Hello")
+
+    server = grpc.server(
+        futures.ThreadPoolExecutor(max_workers=config.grpc_max_workers)
+    )
+    pdf_pb2_grpc.add_PdfServiceServicer_to_server(
+        PdfServicer(pdf_service, Mock(spec=Logger)), server
+    )
+    spelling_pb2_grpc.add_SpellingCorrectionServicer_to_server(
+        SpellingCheckServicer(spelling_service, Mock(spec=Logger)), server
+    )
+    port = server.add_insecure_port("127.0.0.1:0")
+    server.start()
+    channel = grpc.insecure_channel(f"127.0.0.1:{port}")
+    pdf_stub = pdf_pb2_grpc.PdfServiceStub(channel)
+    spelling_stub = spelling_pb2_grpc.SpellingCorrectionStub(channel)
+    held = [
+        pdf_stub.GenerateContractPdf.future(PdfRequestBuilder.contract())
+        for _ in range(pool.num_processes + pool.max_queue)
+    ]
+    try:
+        deadline = time.monotonic() + 30
+        while pool._busy + pool.queued < len(held):
+            assert time.monotonic() < deadline, "renders never reached the pool"
+            time.sleep(0.01)
+
+        with pytest.raises(grpc.RpcError) as exc:
+            pdf_stub.GenerateContractPdf(PdfRequestBuilder.contract(), timeout=10)
+        assert exc.value.code() == grpc.StatusCode.RESOURCE_EXHAUSTED
+
+        response = spelling_stub.CorrectSpelling(
+            spelling_pb2.CorrectSpellingRequest(initial_text="helo"), timeout=10
+        )
+        assert response.corrected_text == "Hello"
+    finally:
+        pool.close()
+        for call in held:
+            call.exception(timeout=30)
+        channel.close()
+        server.stop(None)
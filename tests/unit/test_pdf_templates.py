@@ -0,0 +1,103 @@
+"""Unit tests for the PDF template registry and document templates."""
+
+import os
+from logging import Logger
+from unittest.mock import Mock
+
+import pytest
+
+from src.api.pdf import to_schema
+from src.services.pdf.generator import (
+    APPOINTMENT_CARD,
+    CONTRACT,
+    INCIDENT_REPORT,
+    INVOICE,
+    PdfGeneratorService,
+)
+from src.services.pdf.schema import (
+    AppointmentCardData,
+    ContractData,
+    IncidentReportData,
+    InvoiceData,
+)
+from src.services.pdf.templates import TemplateRegistry
+from tests.fixtures.factories import PdfRequestBuilder
+
+TEMPLATE_DIR = "src/assets/templates"
+
+
+@pytest.fixture
+def registry():
+    return TemplateRegistry(TEMPLATE_DIR, Mock(spec=Logger))
+
+
+def test_warm_compiles_every_template(registry):
+    assert registry.warm() == [
+        "appointment_card.html",
+        "contract.html",
+        "incident_report.html",
+        "invoice.html",
+    ]
+
+
+def test_templates_are_compiled_once(registry):
+    assert registry.get("contract.html") is registry.get("contract.html")
+
+
+def test_changed_template_is_recompiled(tmp_path):
+    path = tmp_path / "note.html"
+    path.write_text("<p>{{ text }}</p>")
+    registry = TemplateRegistry(str(tmp_path), Mock(spec=Logger))
+    first = registry.get("note.html")
+
+    path.write_text("<h1>{{ text }}</h1>")
+    mtime = os.path.getmtime(path) + 10
+    os.utime(path, (mtime, mtime))
+
+    assert registry.get("note.html") is not first
+    assert registry.render("note.html", text="hi") == "<h1>hi</h1>"
+
+
+def test_bytecode_cache_is_written(tmp_path):
+    cache_dir = tmp_path / "bytecode"
+    TemplateRegistry(TEMPLATE_DIR, Mock(spec=Logger), str(cache_dir)).warm()
+
+    assert len(os.listdir(cache_dir)) == 4
+
+
+@pytest.mark.parametrize(
+    "document, request_message, schema, expected",
+    [
+        (
+            APPOINTMENT_CARD,
+            PdfRequestBuilder.appointment_card(),
+            AppointmentCardData,
+            "Alleen buiten, na 16:00",
+        ),
+        (CONTRACT, PdfRequestBuilder.contract(), ContractData, "&euro; 68.50"),
+        (
+            INCIDENT_REPORT,
+            PdfRequestBuilder.incident_report(),
+            IncidentReportData,
+            "Teamleider, Ouders",
+        ),
+        (INVOICE, PdfRequestBuilder.invoice(), InvoiceData, "&euro; 5890.00"),
+    ],
+)
+def test_documents_render_request_data(
+    registry, document, request_message, schema, expected
+):
+    service = PdfGeneratorService(Mock(), registry, Mock(spec=Logger))
+
+    html = service.render_html(document, to_schema(request_message, schema))
+
+    assert expected in html
+
+
+@pytest.mark.parametrize(
+    "document", [APPOINTMENT_CARD, CONTRACT, INCIDENT_REPORT, INVOICE]
+)
+def test_document_stylesheets_exist(registry, document):
+    assert document.stylesheets[0] == "styles/document.css"
+    for name in document.stylesheets:
+        assert os.path.isfile(registry.path(name))
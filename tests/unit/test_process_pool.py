@@ -0,0 +1,151 @@
+"""Unit tests for the bounded process pool."""
+
+import os
+import threading
+import time
+from concurrent.futures import CancelledError
+from logging import Logger
+from unittest.mock import Mock
+
+import pytest
+
+from src.core.exceptions import ResourceExhaustedError
+from src.core.process_pool import BoundedProcessPool
+
+
+def _square(value, stop_event):
+    return value * value
+
+
+def _wait_for_stop(seconds, stop_event):
+    """Return True if the pool asked the job to stop within ``seconds``."""
+    return stop_event.wait(seconds)
+
+
+def _fail(stop_event):
+    raise ValueError("bad input")
+
+
+def _crash(stop_event):
+    os._exit(1)
+
+
+_loaded = None
+
+
+def _load():
+    global _loaded
+    _loaded = os.getpid()
+
+
+def _worker_state(stop_event):
+    """Return the worker's pid and what its initializer loaded."""
+    return os.getpid(), _loaded
+
+
+@pytest.fixture
+def pool():
+    pool = BoundedProcessPool(1, 1, Mock(spec=Logger), name="test-pool")
+    yield pool
+    pool.close()
+
+
+def _wait_until_running(job, timeout=30.0):
+    deadline = time.monotonic() + timeout
+    while not job.future.running():
+        assert time.monotonic() < deadline, "job never started"
+        time.sleep(0.01)
+
+
+def test_runs_jobs_in_worker_processes(pool):
+    assert pool.submit(_square, 7).result(timeout=30) == 49
+
+
+def test_job_errors_are_reported(pool):
+    with pytest.raises(RuntimeError, match="ValueError: bad input"):
+        pool.submit(_fail).result(timeout=30)
+
+
+def test_unpicklable_argument_fails_the_job_only():
+    pool = BoundedProcessPool(1, 0, Mock(spec=Logger), name="test-pool")
+    try:
+        with pytest.raises(TypeError, match="pickle"):
+            pool.submit(_square, threading.Lock()).result(timeout=30)
+        # The slot was released and its thread still serves jobs
+        assert pool.submit(_square, 3).result(timeout=30) == 9
+    finally:
+        pool.close()
+
+
+def test_dead_worker_is_replaced(pool):
+    with pytest.raises(RuntimeError, match="worker process exited"):
+        pool.submit(_crash).result(timeout=30)
+
+    assert pool.submit(_square, 2).result(timeout=30) == 4
+
+
+def test_full_queue_sheds_load(pool):
+    """One job running and one waiting fill a 1 process, 1 slot pool."""
+    running = pool.submit(_wait_for_stop, 30)
+    _wait_until_running(running)
+    queued = pool.submit(_square, 3)
+
+    with pytest.raises(ResourceExhaustedError):
+        pool.submit(_square, 4)
+
+    queued.cancel()
+    running.cancel()
+    assert running.result(timeout=30) is True
+    with pytest.raises(CancelledError):
+        queued.result()
+
+
+def test_cancel_stops_a_running_job(pool):
+    job = pool.submit(_wait_for_stop, 30)
+    _wait_until_running(job)
+    started = time.monotonic()
+
+    job.cancel()
+
+    assert job.result(timeout=30) is True
+    assert time.monotonic() - started < 5
+
+
+def test_queued_job_expires_at_its_deadline(pool):
+    running = pool.submit(_wait_for_stop, 1)
+    _wait_until_running(running)
+    expired = pool.submit(_square, 5, timeout=0.1)
+
+    assert running.result(timeout=30) is False
+    with pytest.raises(CancelledError):
+        expired.result(timeout=30)
+    # The worker is free again once the expired job is skipped
+    assert pool.submit(_square, 6).result(timeout=30) == 36
+
+
+def test_closed_pool_rejects_jobs():
+    pool = BoundedProcessPool(1, 0, Mock(spec=Logger))
+    pool.close()
+
+    with pytest.raises(RuntimeError):
+        pool.submit(_square, 2)
+
+
+def test_initializer_runs_in_every_worker():
+    pool = BoundedProcessPool(1, 0, Mock(spec=Logger), initializer=_load)
+    try:
+        pid, loaded = pool.submit(_worker_state).result(timeout=30)
+    finally:
+        pool.close()
+
+    assert loaded == pid
+
+
+def test_worker_is_replaced_after_max_jobs():
+    pool = BoundedProcessPool(1, 0, Mock(spec=Logger), max_jobs_per_process=2)
+    try:
+        pids = [pool.submit(_worker_state).result(timeout=30)[0] for _ in range(5)]
+    finally:
+        pool.close()
+
+    assert pids[0] == pids[1] != pids[2] == pids[3] != pids[4]
@@ -0,0 +1,65 @@
+"""Unit tests for the pre-fork process supervisor."""
+
+import threading
+import time
+from logging import Logger
+from unittest.mock import Mock
+
+import pytest
+
+from src.core.process_supervisor import ProcessSupervisor
+
+
+def _sleep_forever():
+    """Worker target that runs until it is terminated."""
+    while True:
+        time.sleep(0.1)
+
+
+def _wait_for(predicate, timeout=15.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.05)
+    return False
+
+
+def test_supervisor_rejects_zero_workers():
+    """At least one worker is required."""
+    with pytest.raises(ValueError):
+        ProcessSupervisor(_sleep_forever, num_workers=0, logger=Mock(spec=Logger))
+
+
+def test_supervisor_restarts_crashed_worker_and_drains_on_stop():
+    """A killed worker is replaced, and stop() terminates every worker."""
+    supervisor = ProcessSupervisor(
+        _sleep_forever,
+        num_workers=2,
+        logger=Mock(spec=Logger),
+        shutdown_timeout=5.0,
+        restart_delay=0.1,
+    )
+    thread = threading.Thread(
+        target=supervisor.run, kwargs={"install_signal_handlers": False}
+    )
+    thread.start()
+
+    try:
+        assert _wait_for(
+            lambda: len(supervisor.workers) == 2
+            and all(p.is_alive() for p in supervisor.workers.values())
+        )
+        crashed = supervisor.workers[0]
+        crashed.kill()
+
+        assert _wait_for(
+            lambda: supervisor.workers[0].pid != crashed.pid
+            and supervisor.workers[0].is_alive()
+        )
+    finally:
+        supervisor.stop()
+        thread.join(timeout=10)
+
+    assert not thread.is_alive()
+    assert all(not p.is_alive() for p in supervisor.workers.values())
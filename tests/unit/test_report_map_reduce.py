@@ -0,0 +1,141 @@
+"""Unit tests for map-reduce report summarization."""
+
+import asyncio
+import json
+from logging import Logger
+from unittest.mock import Mock, patch
+
+import pytest
+
+from src.core.config import Config
+from src.core.http_transport import HttpTransport
+from src.core.tiered_cache import MemoryCacheBackend, SQLiteCacheBackend
+from src.services.reports.memo import ReportSummaryMemo
+from src.services.reports.schemas import GenerateAutoReportRequest
+from src.services.reports.service import (
+    CHUNK_SUMMARY_PROMPT,
+    MERGE_SUMMARIES_PROMPT,
+    AutomatiqueReportService,
+)
+
+REPORTS = "\n\n".join(f"Report {i}: client was calm, ate well." for i in range(40))
+
+
+@pytest.fixture
+def memo():
+    return ReportSummaryMemo([MemoryCacheBackend(max_entries=100, ttl_seconds=60)])
+
+
+@pytest.fixture
+def service(memo):
+    config = Mock(spec=Config)
+    config.report_chunk_max_chars = 200
+    config.report_max_parallel_chunks = 3
+    transport = Mock(spec=HttpTransport)
+    transport.run_sync.side_effect = AssertionError("ran on the transport loop")
+
+    with patch("src.services.reports.service.LLMClient") as client_class:
+        service = AutomatiqueReportService(
+            Mock(spec=Logger), config, transport, Mock(), memo
+        )
+    llm_client = client_class.return_value
+    llm_client.model_name = "test-model"
+    prompts = []
+    state = {"active": 0, "peak": 0}
+
+    async def fake_run(prompt):
+        prompts.append(prompt)
+        state["active"] += 1
+        state["peak"] = max(state["peak"], state["active"])
+        await asyncio.sleep(0.005)
+        state["active"] -= 1
+        if prompt.startswith(CHUNK_SUMMARY_PROMPT[:40]):
+            return Mock(output=f"summary {len(prompts)}, all calm")
+        if prompt.startswith(MERGE_SUMMARIES_PROMPT[:40]):
+            return Mock(output="merged summary, calm")
+        return Mock(output="```json\n" + json.dumps({"report": "final"}) + "\n```")
+
+    llm_client.run.side_effect = fake_run
+    return service, llm_client, prompts, state
+
+
+def test_oversized_input_is_mapped_and_reduced(service):
+    """Large inputs never reach the final prompt unsummarized."""
+    service, llm_client, prompts, state = service
+
+    response = service.generate_report(GenerateAutoReportRequest(text=REPORTS))
+
+    assert response.report == "final"
+    map_calls = [p for p in prompts if p.startswith(CHUNK_SUMMARY_PROMPT[:40])]
+    merge_calls = [p for p in prompts if p.startswith(MERGE_SUMMARIES_PROMPT[:40])]
+    assert len(map_calls) > 1
+    assert merge_calls
+    assert "Report 0:" not in prompts[-1]
+    assert state["peak"] <= 3
+    llm_client.run_sync.assert_not_called()
+
+
+def test_short_input_uses_single_prompt(service):
+    """Inputs under the chunk budget keep the single-call path."""
+    service, llm_client, prompts, _ = service
+    llm_client.run_sync.return_value = Mock(output='{"report": "short"}')
+
+    response = service.generate_report(GenerateAutoReportRequest(text="Report 1."))
+
+    assert response.report == "short"
+    assert prompts == []
+
+
+def test_regeneration_only_summarizes_new_chunks(service):
+    """Appending reports reuses memoized summaries of the unchanged chunks."""
+    service, _, prompts, _ = service
+    service.generate_report(GenerateAutoReportRequest(text=REPORTS))
+    first_map_calls = sum(p.startswith(CHUNK_SUMMARY_PROMPT[:40]) for p in prompts)
+    prompts.clear()
+
+    extended = REPORTS + "\n\nReport 40: client was restless."
+    service.generate_report(GenerateAutoReportRequest(text=extended))
+
+    map_calls = [p for p in prompts if p.startswith(CHUNK_SUMMARY_PROMPT[:40])]
+    assert first_map_calls > 1
+    assert len(map_calls) == 1
+    assert "Report 40" in map_calls[0]
+
+
+def _on_event_loop():
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return False
+    return True
+
+
+@pytest.mark.asyncio
+async def test_memo_io_stays_off_the_event_loop(service, memo):
+    """SQLite memo reads and writes never block the event loop."""
+    service, _, _, _ = service
+    calls = []
+    get, set_ = memo.get, memo.set
+    memo.get = lambda key: calls.append(_on_event_loop()) or get(key)
+    memo.set = lambda key, value: calls.append(_on_event_loop()) or set_(key, value)
+
+    response = await service.generate_report_async(
+        GenerateAutoReportRequest(text=REPORTS)
+    )
+
+    assert response.report == "final"
+    assert calls and not any(calls)
+
+
+def test_memo_uses_sqlite_when_path_configured(tmp_path):
+    """A configured path selects the persistent backend."""
+    config = Mock(spec=Config)
+    config.report_memo_path = str(tmp_path / "memo.sqlite")
+    config.report_memo_ttl_seconds = 60.0
+    config.report_memo_max_entries = 10
+
+    memo = ReportSummaryMemo.from_config(config)
+    memo.set("k", "summary")
+
+    assert isinstance(memo.backends[-1], SQLiteCacheBackend)
+    assert ReportSummaryMemo.from_config(config).get("k") == "summary"
@@ -0,0 +1,128 @@
+"""Unit tests for infeasibility pre-checks and diagnosis."""
+
+import threading
+import time as clock
+import uuid
+from datetime import time
+from logging import Logger
+from unittest.mock import Mock
+
+import numpy as np
+import pytest
+from ortools.sat.python import cp_model
+
+from src.core.config import Config
+from src.core.exceptions import InfeasibleScheduleError
+from src.services.schedule.schema import EmployeeSchema, ShiftSchema
+from src.services.schedule.service import (
+    ScheduleService,
+    ShiftScheduler,
+    solve_in_worker,
+)
+from src.services.schedule.store import ScheduleStore
+
+
+def _employees(count):
+    return [
+        EmployeeSchema(
+            id=uuid.uuid4(), first_name=f"E{i}", last_name="Test", target_hours=16
+        )
+        for i in range(count)
+    ]
+
+
+@pytest.fixture
+def shifts():
+    return [
+        ShiftSchema(id=1, shift_name="Day", start_time=time(8), end_time=time(14)),
+        ShiftSchema(id=2, shift_name="Evening", start_time=time(14), end_time=time(22)),
+    ]
+
+
+@pytest.fixture
+def service():
+    config = Mock(spec=Config)
+    config.schedule_pool_processes = 2
+    config.schedule_solver_profile = "balanced"
+    config.schedule_max_solve_seconds = 90.0
+    config.schedule_num_workers = 0
+    config.schedule_diagnosis_seconds = 5.0
+    return ScheduleService(Mock(spec=Logger), config, ScheduleStore())
+
+
+def test_headcount_below_shifts_fails_before_solving(service, shifts):
+    """Fewer employees than daily shifts is rejected without a solve."""
+    started = clock.monotonic()
+
+    with pytest.raises(InfeasibleScheduleError) as excinfo:
+        service.generate_schedule(_employees(1), shifts, week=1, year=2024)
+
+    assert clock.monotonic() - started < 0.5
+    assert "2 shifts a day need at least 2 employees" in excinfo.value.message
+
+
+def test_rest_rule_headcount_is_prechecked():
+    """Shifts that are both late and early need two people per day pair."""
+    shifts = [
+        ShiftSchema(id=1, shift_name="Long", start_time=time(6), end_time=time(21)),
+        ShiftSchema(id=2, shift_name="Split", start_time=time(9), end_time=time(20)),
+    ]
+    scheduler = ShiftScheduler(
+        _employees(3), shifts, ScheduleService.DAYS, week=1, year=2024
+    )
+
+    assert [c.group for c in scheduler.precheck()] == ["rest"]
+
+
+def test_diagnosis_names_the_minimal_conflict(shifts):
+    """Both employees closed last week late, so nobody can open Monday."""
+    employees = _employees(2)
+    previous_days = np.zeros((2, 2, 2), dtype=bool)
+    previous_days[:, -1, 1] = True
+    scheduler = ShiftScheduler(
+        employees,
+        shifts,
+        ScheduleService.DAYS,
+        week=1,
+        year=2024,
+        previous_days=previous_days,
+    )
+    assert scheduler.precheck() == []
+
+    assert scheduler.solve() is None
+    assert scheduler.status == cp_model.INFEASIBLE
+    conflicts = scheduler.diagnose(time_limit=5.0)
+
+    assert {c.group for c in conflicts} == {"coverage:Monday", "boundary"}
+    assert all(c.reason for c in conflicts)
+
+
+def test_pool_worker_diagnoses_an_unsolved_request(shifts):
+    """The worker that failed to solve returns the conflicts with its outcome."""
+    previous_days = np.zeros((2, 2, 2), dtype=bool)
+    previous_days[:, -1, 1] = True
+    scheduler = ShiftScheduler(
+        _employees(2),
+        shifts,
+        ScheduleService.DAYS,
+        week=1,
+        year=2024,
+        previous_days=previous_days,
+    )
+
+    outcome = solve_in_worker(
+        ShiftScheduler.solve, scheduler.init_args(), 5.0, threading.Event()
+    )
+
+    assert outcome.result is None
+    assert outcome.pooled
+    assert {c.group for c in outcome.conflicts} == {"coverage:Monday", "boundary"}
+
+
+def test_feasible_request_has_no_conflicts(shifts):
+    scheduler = ShiftScheduler(
+        _employees(3), shifts, ScheduleService.DAYS, week=1, year=2024
+    )
+
+    assert scheduler.precheck() == []
+    assert scheduler.diagnose(time_limit=5.0) == []
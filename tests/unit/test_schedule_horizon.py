@@ -0,0 +1,199 @@
+"""Unit tests for multi-week, multi-location schedule horizons."""
+
+import uuid
+from concurrent.futures import CancelledError
+from datetime import time
+from logging import Logger
+from unittest.mock import Mock, patch
+
+import numpy as np
+import pytest
+from ortools.sat.python import cp_model
+
+from src.core.config import Config
+from src.core.exceptions import ResourceExhaustedError, ValidationError
+from src.services.schedule.horizon import iso_weeks, plan_processes, validate_horizon
+from src.services.schedule.pool import SolverPool
+from src.services.schedule.schema import EmployeeSchema, LocationSchema, ShiftSchema
+from src.services.schedule.service import (
+    ScheduleService,
+    ShiftScheduler,
+    unsolved_status,
+)
+from src.services.schedule.store import ScheduleStore
+
+SHIFTS = [
+    ShiftSchema(id=1, shift_name="Morning", start_time=time(7), end_time=time(15)),
+    ShiftSchema(id=2, shift_name="Evening", start_time=time(15), end_time=time(23)),
+]
+
+
+def _employees(count, hours=28.0):
+    return [
+        EmployeeSchema(
+            id=uuid.uuid4(), first_name=f"E{i}", last_name="Test", target_hours=hours
+        )
+        for i in range(count)
+    ]
+
+
+def _location(location_id, count):
+    return LocationSchema(id=location_id, employees=_employees(count), shifts=SHIFTS)
+
+
+def _wait_for_stop(seconds, stop_event):
+    """Pool job of another request that holds its process until stopped."""
+    return stop_event.wait(seconds)
+
+
+@pytest.fixture
+def config():
+    config = Mock(spec=Config)
+    config.schedule_pool_processes = 2
+    config.schedule_pool_queue_size = 0
+    config.schedule_solver_profile = "fast"
+    config.schedule_max_solve_seconds = 10.0
+    config.schedule_num_workers = 0
+    config.schedule_deadline_margin_seconds = 1.0
+    config.schedule_horizon_max_weeks = 12
+    config.schedule_horizon_max_seconds = 60.0
+    config.schedule_horizon_max_processes = 0
+    return config
+
+
+@pytest.fixture
+def service(config):
+    return ScheduleService(Mock(spec=Logger), config, ScheduleStore())
+
+
+@pytest.fixture
+def pooled_service(config):
+    pool = SolverPool.from_config(config, Mock(spec=Logger))
+    yield ScheduleService(Mock(spec=Logger), config, ScheduleStore(), solver_pool=pool)
+    pool.close()
+
+
+def test_iso_weeks_cross_the_year_end():
+    assert list(iso_weeks(52, 2024, 3)) == [(52, 2024), (1, 2025), (2, 2025)]
+
+
+def test_validate_horizon_rejects_bad_requests():
+    shared = _location("a", 2)
+    other = LocationSchema(id="b", employees=shared.employees[:1], shifts=SHIFTS)
+
+    with pytest.raises(ValidationError, match="assigned to locations"):
+        validate_horizon([shared, other], 1, 2025, 4, max_weeks=12)
+    with pytest.raises(ValidationError):
+        validate_horizon([shared], 1, 2025, 13, max_weeks=12)
+    with pytest.raises(ValidationError):
+        validate_horizon([shared], 54, 2025, 1, max_weeks=12)
+
+
+def test_plan_processes_splits_cores():
+    with patch("src.services.schedule.horizon.os.cpu_count", return_value=16):
+        assert plan_processes(3, 0) == (3, 5)
+        assert plan_processes(40, 8) == (8, 2)
+
+
+def test_boundary_days_enforce_rest_rule():
+    """A late shift on the previous Sunday rules out Monday's early shift."""
+    employees = _employees(2)
+    previous_days = np.zeros((2, 2, 2), dtype=bool)
+    previous_days[0, -1, 1] = True  # employee 0 worked Sunday evening
+    scheduler = ShiftScheduler(
+        employees,
+        SHIFTS,
+        ScheduleService.DAYS,
+        2,
+        2025,
+        max_solve_time=10,
+        previous_days=previous_days,
+    )
+
+    result = scheduler.solve()
+
+    monday_morning = result.shifts[0]
+    assert [e.id for e in monday_morning.employees] == [employees[1].id]
+
+
+def test_horizon_rolls_weeks_per_location(service):
+    """Each location gets consecutive weeks with rest rules across boundaries."""
+    locations = [_location("north", 3), _location("south", 2)]
+
+    horizon = service.generate_horizon_schedule(
+        locations, start_week=52, year=2024, num_weeks=2
+    )
+
+    assert [loc.location_id for loc in horizon.locations] == ["north", "south"]
+    for location in horizon.locations:
+        assert location.status in ["optimal", "feasible"]
+        assert [(w.week, w.year) for w in location.weeks] == [(52, 2024), (1, 2025)]
+        sunday_evening = location.weeks[0].shifts[-1].employees
+        monday_morning = location.weeks[1].shifts[0].employees
+        assert not {e.id for e in sunday_evening} & {e.id for e in monday_morning}
+
+
+def test_horizon_solves_locations_in_the_solver_pool(pooled_service):
+    """Locations beyond the pool's processes wait for the request's own ones."""
+    locations = [_location(name, 3) for name in ["north", "south", "east"]]
+
+    horizon = pooled_service.generate_horizon_schedule(
+        locations, start_week=10, year=2025, num_weeks=1
+    )
+
+    assert [loc.location_id for loc in horizon.locations] == ["north", "south", "east"]
+    assert [len(loc.weeks) for loc in horizon.locations] == [1, 1, 1]
+
+
+def test_horizon_is_rejected_when_the_pool_is_full(pooled_service):
+    """Another request holding every process fails the horizon fast."""
+    pool = pooled_service.solver_pool
+    held = [pool.submit(_wait_for_stop, 60) for _ in range(pool.num_processes)]
+
+    with pytest.raises(ResourceExhaustedError):
+        pooled_service.generate_horizon_schedule(
+            [_location("north", 3)], start_week=10, year=2025, num_weeks=1
+        )
+    for job in held:
+        job.cancel()
+
+
+def test_horizon_deadline_caps_the_weekly_limit(service):
+    """Two weeks in one round share the time left before the deadline."""
+    job = service.submit_horizon_schedule(
+        [_location("north", 3)],
+        start_week=10,
+        year=2025,
+        num_weeks=2,
+        time_remaining=5.0,
+    )
+
+    assert job.solves[0][2].max_time_in_seconds == pytest.approx(2.0)
+
+
+def test_cancelled_horizon_raises_cancelled(service):
+    job = service.submit_horizon_schedule(
+        [_location("north", 3)], start_week=10, year=2025, num_weeks=2
+    )
+    job.cancel()
+
+    with pytest.raises(CancelledError):
+        job.result()
+
+
+def test_unsolved_weeks_name_the_reason(service):
+    """A proven conflict is "infeasible"; running out of time is not."""
+    understaffed = LocationSchema(id="tiny", employees=_employees(1), shifts=SHIFTS)
+
+    horizon = service.generate_horizon_schedule(
+        [understaffed], start_week=10, year=2025, num_weeks=2
+    )
+
+    assert horizon.locations[0].status == "infeasible"
+    assert horizon.locations[0].weeks == []
+
+    scheduler = ShiftScheduler(_employees(2), SHIFTS, ScheduleService.DAYS, 10, 2025)
+    scheduler.status = cp_model.UNKNOWN
+    assert unsolved_status(scheduler) == "timeout"
+    scheduler.stop()
+    assert unsolved_status(scheduler) == "cancelled"
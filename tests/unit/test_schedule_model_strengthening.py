@@ -0,0 +1,116 @@
+"""Unit tests for the redundant structure added to the schedule model."""
+
+import itertools
+import uuid
+from datetime import time
+
+import pytest
+from ortools.sat.python import cp_model
+
+from src.services.schedule.model_strengthening import (
+    add_lex_ordering,
+    deviation_bound,
+    interchangeable_groups,
+)
+from src.services.schedule.schema import EmployeeSchema, ShiftSchema
+from src.services.schedule.service import ScheduleService, ShiftScheduler
+from src.services.schedule.solver_profiles import resolve_profile
+
+
+class _Collector(cp_model.CpSolverSolutionCallback):
+    def __init__(self, rows):
+        super().__init__()
+        self.rows = rows
+        self.solutions = []
+
+    def on_solution_callback(self):
+        self.solutions.append(
+            tuple(tuple(self.Value(x) for x in row) for row in self.rows)
+        )
+
+
+def test_interchangeable_groups_skips_singletons():
+    assert interchangeable_groups(["a", "b", "a", "c", "a", "b"]) == [
+        [0, 2, 4],
+        [1, 5],
+    ]
+
+
+def test_deviation_bound_covers_both_directions():
+    assert deviation_bound(target=320, max_hours=560) == 320
+    assert deviation_bound(target=100, max_hours=560) == 460
+
+
+def test_lex_ordering_keeps_exactly_the_ordered_rows():
+    """Every lexicographically non-increasing pair survives, nothing else."""
+    model = cp_model.CpModel()
+    rows = [[model.NewBoolVar(f"r{i}_{k}") for k in range(3)] for i in range(2)]
+    add_lex_ordering(model, rows)
+    solver = cp_model.CpSolver()
+    solver.parameters.enumerate_all_solutions = True
+    collector = _Collector(rows)
+
+    solver.Solve(model, collector)
+
+    vectors = list(itertools.product((0, 1), repeat=3))
+    expected = {(a, b) for a in vectors for b in vectors if a >= b}
+    assert set(collector.solutions) == expected
+    assert len(collector.solutions) == len(expected)
+
+
+@pytest.fixture
+def employees():
+    return [
+        EmployeeSchema(
+            id=uuid.uuid4(), first_name=f"E{i}", last_name="Test", target_hours=hours
+        )
+        for i, hours in enumerate([32, 32, 32, 40, 40])
+    ]
+
+
+@pytest.fixture
+def shifts():
+    return [
+        ShiftSchema(id=1, shift_name="Morning", start_time=time(7), end_time=time(15)),
+        ShiftSchema(id=2, shift_name="Evening", start_time=time(15), end_time=time(23)),
+        ShiftSchema(id=3, shift_name="Night", start_time=time(23), end_time=time(7)),
+    ]
+
+
+def _solve(employees, shifts, **options):
+    profile = resolve_profile("optimal", len(employees), len(shifts), 7, 30, 1)
+    scheduler = ShiftScheduler(
+        employees, shifts, ScheduleService.DAYS, 10, 2025, profile=profile, **options
+    )
+    solver, status = scheduler._solve()
+    assert status == cp_model.OPTIMAL
+    scheduler._extract_assignments(solver)
+    return scheduler, solver
+
+
+def test_strengthening_keeps_the_optimum(employees, shifts):
+    """Cuts and symmetry breaking do not change the optimal cost."""
+    _, plain = _solve(employees, shifts, strengthen=False)
+    _, strong = _solve(employees, shifts, break_symmetry=True)
+
+    assert strong.ObjectiveValue() == plain.ObjectiveValue()
+
+
+def test_symmetry_breaking_keeps_the_hint_feasible(employees, shifts):
+    """Classes are ordered like the previous roster, whatever its order."""
+    scheduler, _ = _solve(employees, shifts)
+    previous = scheduler.solution_assignments()
+    # Swap two rows of the first class so the hint need not follow the
+    # employee order
+    swap = {employees[0].id: employees[2].id, employees[2].id: employees[0].id}
+    previous = [
+        a.model_copy(update={"employee_id": swap.get(a.employee_id, a.employee_id)})
+        for a in previous
+    ]
+
+    hinted, _ = _solve(
+        employees, shifts, break_symmetry=True, previous_assignments=previous
+    )
+
+    assert hinted.hint_used
+    assert hinted.hint_feasible
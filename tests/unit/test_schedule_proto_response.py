@@ -0,0 +1,69 @@
+"""Unit tests for building the schedule gRPC response without pydantic models."""
+
+import uuid
+from datetime import time
+from logging import Logger
+from unittest.mock import Mock
+
+from ortools.sat.python import cp_model
+
+from src.api.schedule import ScheduleServicer
+from src.services.schedule.schema import EmployeeSchema, ShiftSchema
+from src.services.schedule.service import ScheduleService, ShiftScheduler
+
+
+def _solved_scheduler(week: int) -> tuple[ShiftScheduler, cp_model.CpSolver, int]:
+    employees = [
+        EmployeeSchema(
+            id=uuid.uuid4(),
+            first_name=f"E{i}",
+            last_name="Test",
+            target_hours=[16, 24, 32.5][i % 3],
+        )
+        for i in range(6)
+    ]
+    shifts = [
+        ShiftSchema(id=1, shift_name="Day", start_time=time(8), end_time=time(16)),
+        ShiftSchema(id=2, shift_name="Night", start_time=time(22), end_time=time(6)),
+    ]
+    scheduler = ShiftScheduler(
+        employees, shifts, ScheduleService.DAYS, week, 2025, max_solve_time=5
+    )
+    scheduler.create_variables()
+    scheduler.add_constraints()
+    scheduler.add_objectives()
+    solver = cp_model.CpSolver()
+    status = solver.Solve(scheduler.model)
+    return scheduler, solver, status
+
+
+def test_proto_path_matches_domain_path():
+    """The direct protobuf response equals the mapped domain response."""
+    # Week 5 of 2025 ends on 2 February, so night shifts cross a month end
+    scheduler, solver, status = _solved_scheduler(week=5)
+    servicer = ScheduleServicer(Mock(spec=ScheduleService), Mock(spec=Logger))
+
+    expected = servicer._map_domain_to_response(
+        scheduler._build_response(solver, status)
+    )
+    actual = scheduler._build_proto(solver, status)
+
+    assert actual == expected
+    assert actual.shifts[-1].end_time == "2025-02-03T06:00:00"
+
+
+def test_solution_assignments_follow_the_extracted_matrix():
+    """Stored assignments are read from the same matrix as the response."""
+    scheduler, solver, status = _solved_scheduler(week=10)
+    response = scheduler._build_proto(solver, status)
+
+    stored = {
+        (str(a.employee_id), a.day_name, a.shift_id)
+        for a in scheduler.solution_assignments()
+    }
+
+    assert stored == {
+        (emp.id, shift.day_name, shift.shift_id)
+        for shift in response.shifts
+        for emp in shift.employees
+    }
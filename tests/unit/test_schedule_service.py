@@ -6,7 +6,10 @@ from datetime import datetime, time
 from unittest.mock import Mock
 from logging import Logger
 
+from src.core.config import Config
+from src.core.exceptions import InfeasibleScheduleError
 from src.services.schedule.service import ScheduleService, ShiftScheduler
+from src.services.schedule.store import ScheduleStore
 from src.services.schedule.schema import (
     EmployeeSchema,
     ShiftSchema,
@@ -61,17 +64,33 @@ def sample_shifts():
 
 
 @pytest.fixture
-def schedule_service(mock_logger):
+def mock_config():
+    """Create a mock config with the schedule solver defaults."""
+    config = Mock(spec=Config)
+    config.schedule_pool_processes = 2
+    config.schedule_solver_profile = "balanced"
+    config.schedule_max_solve_seconds = 90.0
+    config.schedule_num_workers = 0
+    config.schedule_diagnosis_seconds = 5.0
+    return config
+
+
+@pytest.fixture
+def schedule_service(mock_logger, mock_config):
     """Create a ScheduleService instance for testing."""
-    return ScheduleService(logger=mock_logger)
+    return ScheduleService(
+        logger=mock_logger, config=mock_config, schedule_store=ScheduleStore()
+    )
 
 
 # ==================== ScheduleService Tests ====================
 
 
-def test_schedule_service_initialization(mock_logger):
+def test_schedule_service_initialization(mock_logger, mock_config):
     """Test that ScheduleService initializes correctly."""
-    service = ScheduleService(logger=mock_logger)
+    service = ScheduleService(
+        logger=mock_logger, config=mock_config, schedule_store=ScheduleStore()
+    )
 
     assert service.logger == mock_logger
     assert service.model is not None
@@ -114,8 +133,8 @@ def test_generate_schedule_success(
 def test_generate_schedule_with_minimal_employees(
     schedule_service, sample_shifts, mock_logger
 ):
-    """Test schedule generation with minimal number of employees."""
-    # Create only 2 employees (minimum viable)
+    """Test that fewer employees than daily shifts is reported as infeasible."""
+    # Only 2 employees for 3 shifts a day
     minimal_employees = [
         EmployeeSchema(
             id=uuid.uuid4(), first_name="John", last_name="Doe", target_hours=40.0
@@ -125,15 +144,12 @@ def test_generate_schedule_with_minimal_employees(
         ),
     ]
 
-    # Act
-    result = schedule_service.generate_schedule(
-        employees=minimal_employees, shifts=sample_shifts, week=1, year=2024
-    )
-
-    # Assert - might be feasible or None depending on constraints
-    if result:
-        assert isinstance(result, ScheduleResponseSchema)
-        assert len(result.summary) == 2
+    # Act / Assert
+    with pytest.raises(InfeasibleScheduleError) as excinfo:
+        schedule_service.generate_schedule(
+            employees=minimal_employees, shifts=sample_shifts, week=1, year=2024
+        )
+    assert "only 2 are available" in excinfo.value.message
 
 
 def test_generate_schedule_with_single_shift(
@@ -393,7 +409,7 @@ def test_build_response_structure(sample_employees, sample_shifts):
         # Check top-level structure
         assert result.week == 1
         assert result.year == 2024
-        
+
         # Check shifts (flat list) structure
         assert isinstance(result.shifts, list)
         assert len(result.shifts) > 0
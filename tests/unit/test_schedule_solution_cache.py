@@ -0,0 +1,135 @@
+"""Unit tests for the schedule solution cache."""
+
+import uuid
+from datetime import time
+from logging import Logger
+from unittest.mock import Mock
+
+import pytest
+
+from src.core.config import Config
+from src.core.tiered_cache import MemoryCacheBackend, SQLiteCacheBackend
+from src.services.schedule.schema import EmployeeSchema, ShiftSchema
+from src.services.schedule.service import CachedScheduleJob, ScheduleService
+from src.services.schedule.solution_cache import (
+    ScheduleSolutionCache,
+    schedule_fingerprint,
+)
+from src.services.schedule.store import ScheduleStore
+
+
+def _employees(targets):
+    return [
+        EmployeeSchema(
+            id=uuid.UUID(int=i + 1),
+            first_name=f"E{i}",
+            last_name="Test",
+            target_hours=t,
+        )
+        for i, t in enumerate(targets)
+    ]
+
+
+@pytest.fixture
+def shifts():
+    return [
+        ShiftSchema(id=1, shift_name="Morning", start_time=time(7), end_time=time(15)),
+        ShiftSchema(id=2, shift_name="Evening", start_time=time(15), end_time=time(22)),
+        ShiftSchema(id=3, shift_name="Night", start_time=time(22), end_time=time(7)),
+    ]
+
+
+def _key(employees, shifts, week=1, profile="balanced", seconds=90.0):
+    return schedule_fingerprint(employees, shifts, week, 2024, profile, seconds)
+
+
+def test_fingerprint_ignores_order_and_time_format(shifts):
+    employees = _employees([40, 32, 24])
+    reordered = [
+        s.model_copy(update={"start_time": time(s.start_time.hour, 0, 0)})
+        for s in reversed(shifts)
+    ]
+
+    assert _key(employees, shifts) == _key(employees[::-1], reordered)
+
+
+def test_fingerprint_changes_with_the_instance(shifts):
+    employees = _employees([40, 32, 24])
+    key = _key(employees, shifts)
+    later_morning = [shifts[0].model_copy(update={"start_time": time(8)})] + shifts[1:]
+
+    assert key != _key(employees, shifts, week=2)
+    assert key != _key(employees, shifts, profile="fast")
+    assert key != _key(employees, shifts, seconds=30.0)
+    assert key != _key(_employees([40, 32, 28]), shifts)
+    assert key != _key(employees, later_morning)
+
+
+def test_sqlite_tier_survives_restart(tmp_path, service, shifts):
+    """A response saved by one process is found by the next one."""
+    response = service.generate_schedule_proto(
+        _employees([40] * 5), shifts, week=1, year=2024, solver_profile="fast"
+    )
+    path = str(tmp_path / "solutions.db")
+    ScheduleSolutionCache([SQLiteCacheBackend(path, ttl_seconds=60)]).save(
+        "key", response, proven_optimal=True
+    )
+
+    cached = ScheduleSolutionCache(
+        [
+            MemoryCacheBackend(max_entries=10, ttl_seconds=60),
+            SQLiteCacheBackend(path, ttl_seconds=60),
+        ]
+    ).load("key")
+
+    assert cached.proven_optimal
+    assert cached.response == response
+
+
+@pytest.fixture
+def service():
+    config = Mock(spec=Config)
+    config.schedule_pool_processes = 2
+    config.schedule_solver_profile = "optimal"
+    config.schedule_max_solve_seconds = 60.0
+    config.schedule_num_workers = 0
+    config.schedule_deadline_margin_seconds = 1.0
+    config.schedule_diagnosis_seconds = 5.0
+    cache = ScheduleSolutionCache([MemoryCacheBackend(max_entries=10, ttl_seconds=60)])
+    return ScheduleService(
+        Mock(spec=Logger), config, ScheduleStore(), solution_cache=cache
+    )
+
+
+def test_repeated_request_is_served_from_cache(service, shifts):
+    employees = _employees([40, 40, 32, 32, 24])
+
+    first = service.submit_schedule_proto(employees, shifts, week=1, year=2024)
+    response = first.result()
+    second = service.submit_schedule_proto(employees[::-1], shifts, week=1, year=2024)
+
+    assert not isinstance(first, CachedScheduleJob)
+    assert isinstance(second, CachedScheduleJob)
+    assert second.result() == response
+    key = _key(employees, shifts, profile="optimal", seconds=60.0)
+    assert service.solution_cache.load(key).proven_optimal
+
+
+def test_deadline_cut_solve_is_not_cached(service, shifts):
+    """A feasible roster found under a short deadline may improve on retry."""
+    # Six mixed contracts cannot cover 21 shifts evenly; proving the optimum
+    # takes far longer than the deadline
+    employees = _employees([20, 24.5, 33, 36, 16.5, 20.5])
+
+    response = service.submit_schedule_proto(
+        employees, shifts, week=1, year=2024, time_remaining=2.0
+    ).result()
+
+    assert response.status == "feasible"
+    assert service.solution_cache.stats.hits == 0
+    assert (
+        service.solution_cache.load(
+            _key(employees, shifts, profile="optimal", seconds=60.0)
+        )
+        is None
+    )
@@ -0,0 +1,92 @@
+"""Unit tests for schedule solves in the solver process pool."""
+
+import time as clock
+import uuid
+from datetime import time
+from logging import Logger
+from unittest.mock import Mock
+
+import pytest
+
+from src.core.config import Config
+from src.core.tiered_cache import MemoryCacheBackend
+from src.services.schedule.pool import SolverPool
+from src.services.schedule.schema import EmployeeSchema, ShiftSchema
+from src.services.schedule.service import ScheduleService
+from src.services.schedule.store import ScheduleStore
+
+
+@pytest.fixture
+def shifts():
+    return [
+        ShiftSchema(id=1, shift_name="Morning", start_time=time(7), end_time=time(15)),
+        ShiftSchema(id=2, shift_name="Evening", start_time=time(15), end_time=time(22)),
+        ShiftSchema(id=3, shift_name="Night", start_time=time(22), end_time=time(7)),
+    ]
+
+
+def _employees(targets):
+    return [
+        EmployeeSchema(
+            id=uuid.uuid4(), first_name=f"E{i}", last_name="Test", target_hours=hours
+        )
+        for i, hours in enumerate(targets)
+    ]
+
+
+@pytest.fixture
+def service():
+    config = Mock(spec=Config)
+    config.schedule_solver_profile = "optimal"
+    config.schedule_max_solve_seconds = 60.0
+    config.schedule_num_workers = 0
+    config.schedule_pool_processes = 1
+    config.schedule_pool_queue_size = 1
+    config.schedule_deadline_margin_seconds = 1.0
+    config.schedule_diagnosis_seconds = 5.0
+    pool = SolverPool.from_config(config, Mock(spec=Logger))
+    store = ScheduleStore([MemoryCacheBackend(max_entries=10, ttl_seconds=60)])
+    yield ScheduleService(Mock(spec=Logger), config, store, solver_pool=pool)
+    pool.close()
+
+
+def test_pool_solve_matches_in_process_solve(service, shifts):
+    """The response built in the worker is recorded in the parent's store."""
+    employees = _employees([40, 40, 40, 40, 40])
+
+    response = service.generate_schedule_proto(
+        employees, shifts, week=1, year=2024, solver_profile="fast"
+    )
+
+    assert response is not None
+    assert len(response.shifts) == 21
+    assert service.schedule_store.load(shifts, employees) is not None
+
+
+def test_deadline_caps_the_solve(service, shifts):
+    """A request with 3 s left stops solving about a margin before that."""
+    # Six mixed contracts cannot cover 21 shifts evenly; proving the optimum
+    # takes far longer than the deadline
+    employees = _employees([20, 24.5, 33, 36, 16.5, 20.5])
+    started = clock.monotonic()
+
+    job = service.submit_schedule_proto(
+        employees, shifts, week=1, year=2024, time_remaining=3.0
+    )
+    response = job.result()
+
+    assert response is not None
+    assert response.status == "feasible"
+    assert clock.monotonic() - started < 3.0 + 5
+
+
+def test_cancel_stops_a_pooled_solve(service, shifts):
+    employees = _employees([20, 24.5, 33, 36, 16.5, 20.5])
+    job = service.submit_schedule_proto(employees, shifts, week=1, year=2024)
+    clock.sleep(3)
+    started = clock.monotonic()
+
+    job.cancel()
+    job.result()
+
+    assert clock.monotonic() - started < 5
@@ -0,0 +1,135 @@
+"""Unit tests for streamed schedule generation."""
+
+import time as clock
+import uuid
+from datetime import time
+from logging import Logger
+from unittest.mock import Mock
+
+import pytest
+
+import generated.schedule_service_pb2 as pb2
+from src.api.schedule import ScheduleServicer
+from src.core.config import Config
+from src.core.exceptions import ResourceExhaustedError
+from src.core.tiered_cache import MemoryCacheBackend
+from src.services.schedule.schema import EmployeeSchema, ShiftSchema
+from src.services.schedule.service import ScheduleService
+from src.services.schedule.store import ScheduleStore
+
+
+@pytest.fixture
+def employees():
+    return [
+        EmployeeSchema(
+            id=uuid.uuid4(), first_name=f"E{i}", last_name="Test", target_hours=27.5
+        )
+        for i in range(7)
+    ]
+
+
+@pytest.fixture
+def shifts():
+    return [
+        ShiftSchema(id=1, shift_name="Morning", start_time=time(7), end_time=time(15)),
+        ShiftSchema(id=2, shift_name="Evening", start_time=time(15), end_time=time(23)),
+        ShiftSchema(id=3, shift_name="Night", start_time=time(23), end_time=time(7)),
+    ]
+
+
+@pytest.fixture
+def service():
+    config = Mock(spec=Config)
+    config.schedule_pool_processes = 2
+    config.schedule_solver_profile = "optimal"
+    config.schedule_max_solve_seconds = 60.0
+    config.schedule_num_workers = 0
+    store = ScheduleStore([MemoryCacheBackend(max_entries=10, ttl_seconds=60)])
+    return ScheduleService(Mock(spec=Logger), config, store)
+
+
+def test_stream_yields_improving_solutions_then_final(service, employees, shifts):
+    """Solutions arrive in order with a non-increasing objective."""
+    stream = service.stream_schedule(
+        employees, shifts, week=1, year=2024, solver_profile="fast"
+    )
+
+    updates = list(stream)
+
+    assert [u.solution_index for u in updates[:-1]] == list(range(1, len(updates)))
+    assert [u.final for u in updates] == [False] * (len(updates) - 1) + [True]
+    objectives = [u.schedule.solve_stats.objective_value for u in updates]
+    assert objectives == sorted(objectives, reverse=True)
+    assert service.schedule_store.load(shifts, employees) is not None
+
+
+def test_cancel_stops_the_solver_immediately(service, shifts):
+    """Cancelling after the first solution ends the stream well before the limit."""
+    # Six mixed contracts cannot cover 21 shifts evenly; proving the optimum
+    # takes far longer than the 60 s limit
+    employees = [
+        EmployeeSchema(
+            id=uuid.uuid4(), first_name=f"E{i}", last_name="Test", target_hours=hours
+        )
+        for i, hours in enumerate([20, 24.5, 33, 36, 16.5, 20.5])
+    ]
+    shifts[1] = shifts[1].model_copy(update={"end_time": time(22)})
+    shifts[2] = shifts[2].model_copy(update={"start_time": time(22)})
+    stream = service.stream_schedule(employees, shifts, week=1, year=2024)
+    started = clock.monotonic()
+
+    updates = []
+    for update in stream:
+        updates.append(update)
+        stream.cancel()
+
+    assert clock.monotonic() - started < 10
+    assert stream.scheduler.stopped
+    assert not updates[0].final
+
+
+def test_streams_beyond_the_pool_size_are_rejected(service, employees, shifts):
+    """Each open stream holds a slot until it finishes or is cancelled."""
+    args = dict(week=1, year=2024, solver_profile="fast")
+    first = service.stream_schedule(employees, shifts, **args)
+    second = service.stream_schedule(employees, shifts, **args)
+
+    with pytest.raises(ResourceExhaustedError):
+        service.stream_schedule(employees, shifts, **args)
+
+    list(first)
+    second.cancel()
+    for _ in range(service.stream_slots):
+        service.stream_schedule(employees, shifts, **args).cancel()
+
+
+def test_servicer_streams_updates_and_registers_cancel(service, employees, shifts):
+    """StreamSchedule maps every update and hooks cancellation to the call."""
+    servicer = ScheduleServicer(service, Mock(spec=Logger))
+    request = pb2.GenerateScheduleRequest(
+        week=1,
+        year=2024,
+        solver_profile="fast",
+        employees=[
+            pb2.Employee(id=str(e.id), first_name=e.first_name, target_hours=27.5)
+            for e in employees
+        ],
+        shifts=[
+            pb2.Shift(
+                id=s.id,
+                shift_name=s.shift_name,
+                start_time=f"{s.start_time:%H:%M}",
+                end_time=f"{s.end_time:%H:%M}",
+            )
+            for s in shifts
+        ],
+    )
+    context = Mock()
+    context.time_remaining.return_value = None
+
+    messages = list(servicer.StreamSchedule(request, context))
+
+    context.add_callback.assert_called_once()
+    assert messages[-1].final
+    assert messages[-1].schedule.status in ["optimal", "feasible"]
+    assert len(messages[-1].schedule.shifts) == 21
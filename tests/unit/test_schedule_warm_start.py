@@ -0,0 +1,161 @@
+"""Unit tests for warm-starting schedule generation from a previous roster."""
+
+import uuid
+from datetime import time
+from logging import Logger
+from unittest.mock import Mock
+
+import pytest
+
+from src.core.config import Config
+from src.core.tiered_cache import MemoryCacheBackend, SQLiteCacheBackend
+from src.services.schedule.schema import (
+    EmployeeSchema,
+    PreviousAssignmentSchema,
+    ShiftSchema,
+)
+from src.services.schedule.service import ScheduleService, ShiftScheduler
+from src.services.schedule.store import ScheduleStore
+
+DAYS = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"]
+
+
+@pytest.fixture
+def employees():
+    return [
+        EmployeeSchema(
+            id=uuid.uuid4(), first_name=f"E{i}", last_name="Test", target_hours=32.0
+        )
+        for i in range(4)
+    ]
+
+
+@pytest.fixture
+def shifts():
+    return [
+        ShiftSchema(id=1, shift_name="Day", start_time=time(8), end_time=time(16)),
+        ShiftSchema(id=2, shift_name="Evening", start_time=time(16), end_time=time(0)),
+    ]
+
+
+@pytest.fixture
+def store():
+    return ScheduleStore([MemoryCacheBackend(max_entries=10, ttl_seconds=60)])
+
+
+def test_store_round_trip_is_keyed_on_shifts_and_staff(store, employees, shifts):
+    """Rosters are found again for the same shifts and staff in any order."""
+    assignment = PreviousAssignmentSchema(
+        employee_id=employees[0].id, day_name="Monday", shift_id=1
+    )
+    store.save(shifts, employees, [assignment], cold_wall_time=1.5)
+
+    stored = store.load(list(reversed(shifts)), list(reversed(employees)))
+
+    assert stored.assignments == [assignment]
+    assert stored.cold_wall_time == 1.5
+    assert store.load(shifts[:1], employees) is None
+    assert ScheduleStore().load(shifts, employees) is None
+
+
+def test_store_keeps_a_memory_tier_in_front_of_sqlite(tmp_path, employees, shifts):
+    """A configured path adds the persistent tier behind the in-memory one."""
+    config = Mock(spec=Config)
+    config.schedule_warm_start_enabled = True
+    config.schedule_store_path = str(tmp_path / "schedules.sqlite")
+    config.schedule_store_max_entries = 10
+    config.schedule_store_ttl_seconds = 60.0
+    assignment = PreviousAssignmentSchema(
+        employee_id=employees[0].id, day_name="Monday", shift_id=1
+    )
+
+    store = ScheduleStore.from_config(config)
+    store.save(shifts, employees, [assignment])
+
+    tiers = [type(backend) for backend in store.backends]
+    assert tiers == [MemoryCacheBackend, SQLiteCacheBackend]
+    reloaded = ScheduleStore.from_config(config).load(shifts, employees)
+    assert reloaded.assignments == [assignment]
+    config.schedule_warm_start_enabled = False
+    assert not ScheduleStore.from_config(config).enabled
+
+
+def test_store_does_not_share_rosters_between_teams(store, employees, shifts):
+    """Another location with the same shift times gets no hint."""
+    assignment = PreviousAssignmentSchema(
+        employee_id=employees[0].id, day_name="Monday", shift_id=1
+    )
+    store.save(shifts, employees, [assignment])
+    other_team = [
+        employee.model_copy(update={"id": uuid.uuid4()}) for employee in employees
+    ]
+
+    assert store.load(shifts, other_team) is None
+    assert store.load(shifts, employees[1:]) is None
+
+
+def test_scheduler_reports_hint_feasibility(employees, shifts):
+    """A previous solution is a feasible hint; a conflicting one is not."""
+    first = ShiftScheduler(employees, shifts, DAYS, 1, 2024, max_solve_time=10)
+    result = first.solve()
+    previous = [
+        PreviousAssignmentSchema(
+            employee_id=emp.id, day_name=s.day_name, shift_id=s.shift_id
+        )
+        for s in result.shifts
+        for emp in s.employees
+    ]
+    conflicting = [
+        PreviousAssignmentSchema(
+            employee_id=employees[0].id, day_name="Monday", shift_id=shift.id
+        )
+        for shift in shifts
+    ]
+
+    warm = ShiftScheduler(
+        employees,
+        shifts,
+        DAYS,
+        2,
+        2024,
+        max_solve_time=10,
+        previous_assignments=previous,
+    ).solve()
+    bad = ShiftScheduler(
+        employees,
+        shifts,
+        DAYS,
+        2,
+        2024,
+        max_solve_time=10,
+        previous_assignments=conflicting,
+    ).solve()
+
+    assert not result.solve_stats.hint_used
+    assert warm.solve_stats.hint_used and warm.solve_stats.hint_feasible
+    assert bad.solve_stats.hint_used and not bad.solve_stats.hint_feasible
+    assert bad.status in ["optimal", "feasible"]
+
+
+def test_service_warm_starts_from_stored_roster(employees, shifts, store):
+    """The second week starts from the first and reports the time saved."""
+    config = Mock(spec=Config)
+    config.schedule_pool_processes = 2
+    config.schedule_solver_profile = "balanced"
+    config.schedule_max_solve_seconds = 10.0
+    config.schedule_num_workers = 0
+    service = ScheduleService(Mock(spec=Logger), config, store)
+
+    week1 = service.generate_schedule(employees, shifts, week=1, year=2024)
+    store.save(
+        shifts,
+        employees,
+        store.load(shifts, employees).assignments,
+        cold_wall_time=1000.0,
+    )
+    week2 = service.generate_schedule(employees, shifts, week=2, year=2024)
+
+    assert not week1.solve_stats.hint_used
+    assert week2.solve_stats.hint_used and week2.solve_stats.hint_feasible
+    assert week2.solve_stats.time_saved_seconds > 0
+    assert store.load(shifts, employees).cold_wall_time == 1000.0
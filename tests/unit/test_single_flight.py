@@ -0,0 +1,125 @@
+"""Unit tests for single-flight request coalescing."""
+
+import asyncio
+import threading
+import time
+from unittest import mock
+
+import pytest
+
+from src.core.config import Config
+from src.core.exceptions import LLMError
+from src.core.llm_client import LLMClient
+from src.core.single_flight import SingleFlight
+
+
+def test_do_coalesces_concurrent_threads():
+    """Threads asking for the same key share one call and one result."""
+    flight = SingleFlight()
+    calls = []
+    release = threading.Event()
+
+    def slow_call():
+        calls.append(1)
+        release.wait(5)
+        return object()
+
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(flight.do("k", slow_call)))
+        for _ in range(5)
+    ]
+    for t in threads:
+        t.start()
+    deadline = time.monotonic() + 5
+    while flight.coalesced < 4 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    release.set()
+    for t in threads:
+        t.join()
+
+    assert len(calls) == 1
+    assert len(results) == 5
+    assert all(r is results[0] for r in results)
+    assert flight.in_flight == 0
+
+
+def test_do_propagates_leader_error_and_forgets_key():
+    """A failed call is raised in the caller and the next call runs again."""
+    flight = SingleFlight()
+
+    def failing():
+        raise ValueError("boom")
+
+    with pytest.raises(ValueError):
+        flight.do("k", failing)
+    assert flight.do("k", lambda: "ok") == "ok"
+
+
+@pytest.mark.asyncio
+async def test_llm_client_coalesces_identical_async_requests():
+    """Concurrent identical prompts produce one upstream call."""
+    config = mock.Mock(spec=Config)
+    config.openrouter_api_key = "test-key-123456"
+
+    with (
+        mock.patch("src.core.llm_client.OpenAIModel"),
+        mock.patch("src.core.llm_client.OpenRouterProvider"),
+        mock.patch("src.core.llm_client.Agent") as mock_agent_class,
+    ):
+        calls = []
+
+        async def mock_run(prompt, **kwargs):
+            calls.append(prompt)
+            await asyncio.sleep(0.05)
+            return mock.MagicMock(output=f"report for {prompt}")
+
+        mock_agent_class.return_value.run = mock_run
+        client = LLMClient(
+            model_name="test-model", system_prompt="Test prompt", config=config
+        )
+
+        results = await asyncio.gather(
+            *(client.run("same text") for _ in range(4)), client.run("other text")
+        )
+
+    assert sorted(calls) == ["other text", "same text"]
+    assert len({id(r) for r in results[:4]}) == 1
+    assert results[4].output == "report for other text"
+
+
+@pytest.mark.asyncio
+async def test_cancelled_leader_does_not_cancel_waiters():
+    """Cancelling the first caller leaves the shared call running for the rest."""
+    flight = SingleFlight()
+
+    async def slow_call():
+        await asyncio.sleep(0.05)
+        return "done"
+
+    leader = asyncio.ensure_future(flight.do_async("k", slow_call))
+    await asyncio.sleep(0)
+    follower = asyncio.ensure_future(flight.do_async("k", slow_call))
+    await asyncio.sleep(0)
+    leader.cancel()
+
+    assert await follower == "done"
+
+
+def test_llm_error_reaches_every_waiter():
+    """Upstream failures surface as LLMError for sync callers."""
+    config = mock.Mock(spec=Config)
+    config.openrouter_api_key = "test-key-123456"
+
+    with (
+        mock.patch("src.core.llm_client.OpenAIModel"),
+        mock.patch("src.core.llm_client.OpenRouterProvider"),
+        mock.patch("src.core.llm_client.Agent") as mock_agent_class,
+    ):
+        mock_agent_class.return_value.run_sync.side_effect = RuntimeError("down")
+        client = LLMClient(
+            model_name="test-model", system_prompt="Test prompt", config=config
+        )
+
+        with pytest.raises(LLMError):
+            client.run_sync("text")
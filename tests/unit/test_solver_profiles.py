@@ -0,0 +1,62 @@
+"""Unit tests for CP-SAT solver profiles."""
+
+import pytest
+from ortools.sat.python import cp_model
+
+from src.core.exceptions import ValidationError
+from src.services.schedule.solver_profiles import resolve_profile
+
+
+def test_profile_tuned_by_problem_size():
+    """Larger rosters get more workers, an LNS share and a bigger budget."""
+    small = resolve_profile("balanced", 10, 3, 7, 90, cpu_count=16)
+    large = resolve_profile("balanced", 300, 3, 7, 90, cpu_count=16)
+
+    assert (small.size_class, small.num_workers) == ("small", 8)
+    assert small.num_full_subsolvers == 8
+    assert (large.size_class, large.num_workers) == ("large", 16)
+    assert large.num_full_subsolvers == 4
+    assert large.max_deterministic_time > small.max_deterministic_time
+
+
+def test_profile_goals_and_overrides():
+    """Profiles set the gap; request overrides take precedence."""
+    fast = resolve_profile("fast", 60, 3, 7, 90, num_workers=4, cpu_count=16)
+    optimal = resolve_profile("optimal", 60, 3, 7, 45, cpu_count=2)
+
+    assert fast.relative_gap_limit == 0.05
+    assert fast.max_time_in_seconds == 10.0
+    assert fast.num_workers == 4
+    assert optimal.relative_gap_limit == 0.0
+    assert optimal.max_deterministic_time is None
+    assert optimal.max_time_in_seconds == 45
+    assert optimal.num_workers == 2
+    assert resolve_profile("", 60, 3, 7, 90).name == "balanced"
+
+
+def test_apply_sets_solver_parameters():
+    """apply() writes the profile into CpSolver parameters."""
+    profile = resolve_profile("balanced", 60, 3, 7, 30, cpu_count=16)
+    solver = cp_model.CpSolver()
+
+    profile.apply(solver.parameters)
+
+    assert solver.parameters.num_workers == 16
+    assert solver.parameters.max_time_in_seconds == 30
+    assert solver.parameters.relative_gap_limit == 0.01
+    assert solver.parameters.max_deterministic_time == 60.0
+    assert solver.parameters.num_full_subsolvers == 8
+    assert solver.parameters.linearization_level == 2
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [{"name": "best"}, {"max_solve_seconds": -1}, {"num_workers": -2}],
+)
+def test_invalid_options_raise_validation_error(kwargs):
+    """Unknown profiles and negative limits are rejected."""
+    options = dict(name="balanced", max_solve_seconds=90)
+    options.update(kwargs)
+
+    with pytest.raises(ValidationError):
+        resolve_profile(num_employees=10, num_shifts=3, num_days=7, **options)
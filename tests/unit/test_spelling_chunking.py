@@ -0,0 +1,81 @@
+"""Unit tests for chunked parallel spelling correction."""
+
+import asyncio
+import json
+from logging import Logger
+from unittest.mock import Mock, patch
+
+import pytest
+
+from src.core.config import Config
+from src.core.http_transport import HttpTransport
+from src.core.text_chunker import split_text
+from src.services.spelling.corrector import SpellingCorrectorService
+from src.services.spelling.prefilter import SpellingPrefilter
+
+DOCUMENT = (
+    "  Intro paragraf with an eror.\n\n"
+    "Second paragraf. It has two sentenses! Does it?\n"
+    "\n\n\tIndented third paragraf.\n"
+)
+
+
+def test_split_text_round_trips_and_respects_boundaries():
+    """Joining the chunks restores the input; chunks end on boundaries."""
+    chunks = split_text(DOCUMENT, max_chars=30)
+
+    assert "".join(c.rebuild(c.body) for c in chunks) == DOCUMENT
+    assert [c.body for c in chunks] == [
+        "Intro paragraf with an eror.",
+        "Second paragraf.",
+        "It has two sentenses!",
+        "Does it?",
+        "Indented third paragraf.",
+    ]
+
+
+def test_split_text_keeps_short_text_in_one_chunk():
+    """Texts under the limit are not split."""
+    assert len(split_text(DOCUMENT, max_chars=1000)) == 1
+
+
+@pytest.fixture
+def service():
+    config = Mock(spec=Config)
+    config.spelling_chunk_max_chars = 30
+    config.spelling_max_parallel_chunks = 2
+    transport = Mock(spec=HttpTransport)
+    transport.run_sync.side_effect = asyncio.run
+
+    with patch("src.services.spelling.corrector.LLMClient") as client_class:
+        service = SpellingCorrectorService(
+            Mock(spec=Logger), config, transport, Mock(), SpellingPrefilter({})
+        )
+    llm_client = client_class.return_value
+    state = {"active": 0, "peak": 0}
+
+    async def fake_run(text):
+        state["active"] += 1
+        state["peak"] = max(state["peak"], state["active"])
+        await asyncio.sleep(0.01)
+        state["active"] -= 1
+        corrected = text.replace("paragraf", "paragraph").replace("eror", "error")
+        payload = json.dumps({"corrected_text": corrected})
+        return Mock(output=f"```json\n{payload}\n```")
+
+    llm_client.run.side_effect = fake_run
+    return service, llm_client, state
+
+
+def test_correct_spelling_stitches_chunks_in_order(service):
+    """Chunks are corrected concurrently, bounded, and re-joined in order."""
+    service, llm_client, state = service
+
+    result = service.correct_spelling(DOCUMENT)
+
+    assert result.corrected_text == (
+        DOCUMENT.replace("paragraf", "paragraph").replace("eror", "error")
+    )
+    assert llm_client.run.call_count == 5
+    assert state["peak"] == 2
+    llm_client.run_sync.assert_not_called()
@@ -0,0 +1,123 @@
+"""Unit tests for the local spelling pre-filter."""
+
+import gzip
+from logging import Logger
+from unittest.mock import Mock, patch
+
+import pytest
+
+from src.core.config import Config
+from src.core.exceptions import ConfigurationError
+from src.core.http_transport import HttpTransport
+from src.services.spelling.corrector import SpellingCorrectorService
+from src.services.spelling.prefilter import SpellingPrefilter, load_word_list
+
+WORDS = frozenset("the client had a good day and slept well it was is at on".split())
+
+
+def test_load_word_list_reads_gzip_and_frequency(tmp_path):
+    """Frequency columns are honoured and words are lowercased."""
+    path = tmp_path / "en.txt.gz"
+    with gzip.open(path, "wt", encoding="utf-8") as f:
+        f.write("The 900\nrare 2\n\nwell\n")
+
+    assert load_word_list(path, min_frequency=10) == {"the", "well"}
+
+
+def test_names_numbers_and_urls_are_ignored():
+    """Only unknown ordinary words make a sentence suspect."""
+    prefilter = SpellingPrefilter({"en": WORDS}, names=frozenset({"jan"}))
+
+    assert prefilter.is_clean("The client Jan had a good day on 12-03-2024.")
+    assert prefilter.is_clean("It was NIPT at https://example.org/x well.")
+    assert not prefilter.is_clean("The cleint slept well.")
+
+
+def test_capitalized_words_are_checked_unless_listed_as_names():
+    """A misspelled capitalized word mid-sentence still reaches the LLM."""
+    prefilter = SpellingPrefilter({"en": WORDS}, names=frozenset({"jan"}))
+
+    assert prefilter.is_clean("The Client had a good day.")
+    assert prefilter.is_clean("Jan slept well.")
+    assert not prefilter.is_clean("The client had a good Dya.")
+    assert not prefilter.is_clean("The client Piet slept well.")
+
+
+def test_languages_are_checked_separately():
+    """A sentence is clean only if one language knows all of its words."""
+    prefilter = SpellingPrefilter(
+        {"en": WORDS, "nl": frozenset("de client sliep".split())}
+    )
+
+    assert prefilter.is_clean("The client slept well.")
+    assert prefilter.is_clean("De client sliep.")
+    assert not prefilter.is_clean("The client sliep well.")
+    assert not prefilter.is_clean("De client slept.")
+
+
+def test_from_config_loads_word_lists_per_language(tmp_path):
+    """Each file in the dictionary directory becomes one language."""
+    (tmp_path / "en.txt").write_text("the\nclient\n", encoding="utf-8")
+    (tmp_path / "nl.txt").write_text("de\nclient\n", encoding="utf-8")
+    (tmp_path / "names.txt").write_text("Jan\n", encoding="utf-8")
+    config = Mock(spec=Config)
+    config.spelling_prefilter_enabled = True
+    config.spelling_dictionary_dir = str(tmp_path)
+    config.spelling_dictionary_min_frequency = 0
+
+    prefilter = SpellingPrefilter.from_config(config, Mock(spec=Logger))
+
+    assert prefilter.languages == ["en", "nl"]
+    assert prefilter.is_clean("The client Jan")
+    assert not prefilter.is_clean("De client the")
+
+
+def test_from_config_fails_without_word_lists(tmp_path):
+    """An enabled pre-filter with nothing to load stops startup."""
+    config = Mock(spec=Config)
+    config.spelling_prefilter_enabled = True
+    config.spelling_dictionary_dir = str(tmp_path / "missing")
+    config.spelling_dictionary_min_frequency = 0
+
+    with pytest.raises(ConfigurationError):
+        SpellingPrefilter.from_config(config, Mock(spec=Logger))
+
+    config.spelling_prefilter_enabled = False
+    assert not SpellingPrefilter.from_config(config, Mock(spec=Logger)).enabled
+
+
+def test_disabled_prefilter_marks_everything_suspect():
+    """Without dictionaries no sentence is considered clean."""
+    assert not SpellingPrefilter({}).is_clean("The client had a good day.")
+
+
+def test_correct_spelling_sends_only_suspect_sentences():
+    """Clean sentences bypass the LLM and the savings are counted."""
+    config = Mock(spec=Config)
+    config.spelling_chunk_max_chars = 2000
+    config.spelling_max_parallel_chunks = 4
+    prefilter = SpellingPrefilter({"en": WORDS})
+    logger = Mock(spec=Logger)
+
+    with patch("src.services.spelling.corrector.LLMClient") as client_class:
+        service = SpellingCorrectorService(
+            logger, config, Mock(spec=HttpTransport), Mock(), prefilter
+        )
+    llm_client = client_class.return_value
+    llm_client.run_sync.return_value = Mock(
+        output='```json\n{"corrected_text": "It slept well."}\n```'
+    )
+
+    clean = "The client had a good day."
+    assert service.correct_spelling(clean).corrected_text == clean
+    llm_client.run_sync.assert_not_called()
+
+    result = service.correct_spelling("It slept wel.")
+    assert result.corrected_text == "It slept well."
+    llm_client.run_sync.assert_called_once_with("It slept wel.")
+
+    assert prefilter.stats.requests == 2
+    assert prefilter.stats.requests_skipped == 1
+    assert prefilter.stats.chars_skipped == len(clean)
+    logged = [call.args[0] for call in logger.info.call_args_list]
+    assert any(msg.startswith("Pre-filter skipped 1/1 sentences") for msg in logged)